@@ -1,6 +1,7 @@
 import logging
-from typing import Awaitable, Callable
+from typing import Any, Awaitable, Callable
 
+from conduit.client.catalog import CatalogDiff
 from conduit.protocol.common import CancelledNotification, ProgressNotification
 from conduit.protocol.logging import LoggingMessageNotification
 from conduit.protocol.prompts import (
@@ -41,6 +42,9 @@ class CallbackManager:
         self.cancelled_handler: (
             Callable[[CancelledNotification], Awaitable[None]] | None
         ) = None
+        self.catalog_changed_handler: (
+            Callable[[str, CatalogDiff[Any]], Awaitable[None]] | None
+        ) = None
         self.logger = logging.getLogger("conduit.client.callbacks")
 
     async def call_progress(
@@ -128,6 +132,20 @@ class CallbackManager:
                     f"Prompts: {prompts}"
                 )
 
+    async def call_catalog_changed(
+        self, server_id: str, diff: CatalogDiff[Any]
+    ) -> None:
+        """Invokes catalog changed callback. Catches and logs any errors."""
+        if self.catalog_changed_handler:
+            try:
+                await self.catalog_changed_handler(server_id, diff)
+            except Exception as e:
+                self.logger.warning(
+                    f"Catalog changed callback failed: {e}. "
+                    f"Server: {server_id}. "
+                    f"Diff: {diff}"
+                )
+
     async def call_logging_message(
         self, server_id: str, notification: LoggingMessageNotification
     ) -> None:
@@ -0,0 +1,179 @@
+"""Keyed, versioned snapshots of what a server offers.
+
+Each server gets a catalog per list type (tools, prompts, resources, resource
+templates), indexed by name or URI. Replacing a catalog's contents returns a
+CatalogDiff of what was added, removed, or changed, and bumps the catalog's
+version when anything did, so consumers can update incrementally instead of
+rebuilding from the full list.
+
+fetch_all_pages follows `next_cursor` until the server runs out of pages, so
+large servers aren't cut off at the first page.
+"""
+
+from dataclasses import dataclass, field
+from typing import Any, Awaitable, Callable, Generic, Iterator, TypeVar
+
+from conduit.protocol.base import Error, PaginatedRequest, PaginatedResult, Result
+from conduit.protocol.prompts import ListPromptsRequest, Prompt
+from conduit.protocol.resources import (
+    ListResourcesRequest,
+    ListResourceTemplatesRequest,
+    Resource,
+    ResourceTemplate,
+)
+from conduit.protocol.tools import ListToolsRequest, Tool
+
+T = TypeVar("T")
+
+
+@dataclass
+class CatalogDiff(Generic[T]):
+    """What changed when a catalog was replaced."""
+
+    kind: str  # "tools", "prompts", "resources" or "resource_templates"
+    version: int  # Catalog version after the change
+    added: list[T] = field(default_factory=list)
+    removed: list[T] = field(default_factory=list)
+    changed: list[T] = field(default_factory=list)  # New versions of changed items
+
+    @property
+    def empty(self) -> bool:
+        """True if nothing changed."""
+        return not (self.added or self.removed or self.changed)
+
+
+class Catalog(Generic[T]):
+    """One list type from one server, indexed by key."""
+
+    def __init__(self, kind: str, key: Callable[[T], str]) -> None:
+        """Initialize an empty catalog.
+
+        Args:
+            kind: List type, reported on diffs.
+            key: Returns an item's identity, e.g. a tool's name.
+        """
+        self.kind = kind
+        self.key = key
+        self.version = 0
+        self.loaded = False
+        self._items: dict[str, T] = {}
+
+    def get(self, key: str) -> T | None:
+        """Look up an item by key."""
+        return self._items.get(key)
+
+    def keys(self) -> list[str]:
+        """Keys of all items, in server order."""
+        return list(self._items.keys())
+
+    def items(self) -> list[T]:
+        """All items, in server order."""
+        return list(self._items.values())
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._items
+
+    def __iter__(self) -> Iterator[T]:
+        return iter(self._items.values())
+
+    def replace(self, items: list[T]) -> CatalogDiff[T]:
+        """Swap in a fresh listing and report what changed.
+
+        Items with duplicate keys keep the last occurrence. The version only
+        moves when the diff is non-empty.
+        """
+        new_items = {self.key(item): item for item in items}
+        added = [item for key, item in new_items.items() if key not in self._items]
+        removed = [item for key, item in self._items.items() if key not in new_items]
+        changed = [
+            item
+            for key, item in new_items.items()
+            if key in self._items and self._items[key] != item
+        ]
+
+        self._items = new_items
+        self.loaded = True
+        diff = CatalogDiff(self.kind, self.version, added, removed, changed)
+        if not diff.empty:
+            self.version += 1
+            diff.version = self.version
+        return diff
+
+
+@dataclass
+class ServerCatalogs:
+    """All catalogs for one server."""
+
+    tools: Catalog[Tool] = field(
+        default_factory=lambda: Catalog("tools", lambda tool: tool.name)
+    )
+    prompts: Catalog[Prompt] = field(
+        default_factory=lambda: Catalog("prompts", lambda prompt: prompt.name)
+    )
+    resources: Catalog[Resource] = field(
+        default_factory=lambda: Catalog("resources", lambda resource: resource.uri)
+    )
+    resource_templates: Catalog[ResourceTemplate] = field(
+        default_factory=lambda: Catalog(
+            "resource_templates", lambda template: template.uri_template
+        )
+    )
+
+    def get(self, kind: str) -> Catalog[Any]:
+        """Catalog for a list type.
+
+        Raises:
+            ValueError: If kind isn't a known list type.
+        """
+        if kind not in CATALOG_REQUESTS:
+            raise ValueError(f"Unknown catalog kind: {kind}")
+        return getattr(self, kind)
+
+
+# kind -> (list request type, attribute holding the items on its result)
+CATALOG_REQUESTS: dict[str, tuple[type[PaginatedRequest], str]] = {
+    "tools": (ListToolsRequest, "tools"),
+    "prompts": (ListPromptsRequest, "prompts"),
+    "resources": (ListResourcesRequest, "resources"),
+    "resource_templates": (ListResourceTemplatesRequest, "resource_templates"),
+}
+
+
+async def fetch_all_pages(
+    send: Callable[[PaginatedRequest], Awaitable[Result | Error]], kind: str
+) -> list[Any] | Error:
+    """Request every page of a list and concatenate the items.
+
+    Args:
+        send: Sends a request to the server and returns its response.
+        kind: List type to fetch, a key of CATALOG_REQUESTS.
+
+    Returns:
+        All items in server order, or the server's error. An error on any page
+        fails the whole fetch rather than returning a truncated list.
+
+    Raises:
+        RuntimeError: If the server hands back a cursor it already used.
+    """
+    request_type, items_attr = CATALOG_REQUESTS[kind]
+    items: list[Any] = []
+    seen_cursors: set[str] = set()
+    cursor: str | None = None
+
+    while True:
+        result = await send(request_type(cursor=cursor))
+        if isinstance(result, Error):
+            return result
+        if not isinstance(result, PaginatedResult):
+            raise RuntimeError(f"Unexpected response to {request_type.__name__}")
+        items.extend(getattr(result, items_attr))
+
+        cursor = result.next_cursor
+        if cursor is None:
+            return items
+        if cursor in seen_cursors:
+            raise RuntimeError(f"Server repeated pagination cursor {cursor!r}")
+        seen_cursors.add(cursor)
@@ -6,7 +6,6 @@ the session focused on protocol logic rather than message processing.
 
 import asyncio
 import logging
-import uuid
 from collections.abc import Coroutine
 from typing import Any, Awaitable, Callable, TypeVar
 
@@ -15,6 +14,7 @@ from conduit.client.server_manager import ServerManager
 from conduit.protocol.base import (
     INTERNAL_ERROR,
     METHOD_NOT_FOUND,
+    OVERLOADED,
     Error,
     Notification,
     Request,
@@ -29,6 +29,20 @@ from conduit.protocol.jsonrpc import (
     JSONRPCResponse,
 )
 from conduit.shared.message_parser import MessageParser
+from conduit.shared.middleware import chain_middleware
+from conduit.shared.priority import (
+    DROPPABLE_NOTIFICATIONS,
+    MessagePriority,
+    priority_for_method,
+)
+from conduit.shared.request_tracker import RequestId
+from conduit.shared.task_supervisor import TaskSupervisor
+from conduit.shared.timing_wheel import TimingWheel
+from conduit.shared.tracing import (
+    Tracer,
+    extract_trace_context,
+    inject_trace_context,
+)
 from conduit.transport.client import ClientTransport, ServerMessage
 
 TRequest = TypeVar("TRequest", bound=Request)
@@ -39,6 +53,12 @@ RequestHandler = Callable[[MessageContext, TRequest], Awaitable[TResult | Error]
 NotificationHandler = Callable[
     [MessageContext, TNotification], Coroutine[Any, Any, None]
 ]
+RequestMiddleware = Callable[
+    [MessageContext, TRequest, RequestHandler], Awaitable[TResult | Error]
+]
+NotificationMiddleware = Callable[
+    [MessageContext, TNotification, NotificationHandler], Awaitable[None]
+]
 
 
 class MessageCoordinator:
@@ -49,13 +69,27 @@ class MessageCoordinator:
     server context.
     """
 
-    def __init__(self, transport: ClientTransport, server_manager: ServerManager):
+    def __init__(
+        self,
+        transport: ClientTransport,
+        server_manager: ServerManager,
+        tracer: Tracer | None = None,
+        tasks: TaskSupervisor | None = None,
+    ):
         self.transport = transport
         self.server_manager = server_manager
+        self.tracer = tracer or Tracer()
+        self.tasks = tasks or TaskSupervisor()
         self.parser = MessageParser()
         self._request_handlers: dict[str, RequestHandler] = {}
         self._notification_handlers: dict[str, NotificationHandler] = {}
+        self._request_middleware: list[RequestMiddleware] = []
+        self._notification_middleware: list[NotificationMiddleware] = []
+        # method -> handler wrapped in middleware, rebuilt on registration
+        self._request_chains: dict[str, RequestHandler] = {}
+        self._notification_chains: dict[str, NotificationHandler] = {}
         self._message_loop_task: asyncio.Task[None] | None = None
+        self._request_timeouts = TimingWheel()
         self.logger = logging.getLogger("conduit.client.coordinator")
 
     # ================================
@@ -99,6 +133,7 @@ class MessageCoordinator:
                 pass
             self._message_loop_task = None
 
+        self.tasks.cancel_all()
         self.server_manager.cleanup_all_servers()
 
     # ================================
@@ -131,6 +166,7 @@ class MessageCoordinator:
         coordinator state.
         """
         self._message_loop_task = None
+        self.tasks.cancel_all()
         self.server_manager.cleanup_all_servers()
 
     # ================================
@@ -173,14 +209,21 @@ class MessageCoordinator:
         payload = server_message.payload
         server_id = server_message.server_id
 
-        if self.parser.is_valid_request(payload):
-            await self._handle_request(server_id, payload)
-        elif self.parser.is_valid_notification(payload):
-            await self._handle_notification(server_id, payload)
-        elif self.parser.is_valid_response(payload):
-            await self._handle_response(server_id, payload)
-        else:
-            self.logger.warning(f"Unknown message type from {server_id}: {payload}")
+        # Continue the server's trace if the message carries one in _meta.
+        parent = extract_trace_context(payload) if self.tracer.enabled else None
+        with self.tracer.start_span(
+            "mcp.client.receive",
+            parent=parent,
+            attributes={"mcp.server_id": server_id},
+        ):
+            if self.parser.is_valid_request(payload):
+                await self._handle_request(server_id, payload)
+            elif self.parser.is_valid_notification(payload):
+                await self._handle_notification(server_id, payload)
+            elif self.parser.is_valid_response(payload):
+                await self._handle_response(server_id, payload)
+            else:
+                self.logger.warning(f"Unknown message type from {server_id}: {payload}")
 
     # ================================
     # Handle requests
@@ -190,7 +233,8 @@ class MessageCoordinator:
         """Parses and routes an incoming request from the server."""
         request_id = payload["id"]
 
-        request_or_error = self.parser.parse_request(payload)
+        with self.tracer.start_span("mcp.parse"):
+            request_or_error = self.parser.parse_request(payload)
 
         if isinstance(request_or_error, Error):
             await self._send_error(server_id, request_id, request_or_error)
@@ -206,14 +250,17 @@ class MessageCoordinator:
     ) -> None:
         """Routes an incoming request to the appropriate handler.
 
-        Creates request context and tracks request.
+        Creates request context. Control-plane requests (ping, initialize) run
+        inline on the message loop; everything else runs in a tracked task under
+        the task supervisor. Past its task cap, the request is refused with a
+        retryable OVERLOADED error rather than parking the message loop.
 
         Args:
             server_id: ID of the server that sent the request
             request_id: ID of the request
             request: The request object
         """
-        handler = self._request_handlers.get(request.method)
+        handler = self._get_request_chain(request.method)
         if not handler:
             error = Error(
                 code=METHOD_NOT_FOUND,
@@ -233,10 +280,24 @@ class MessageCoordinator:
             self.logger.warning(f"Failed to build request context for {server_id}: {e}")
             return
 
-        task = asyncio.create_task(
+        if priority_for_method(request.method) is MessagePriority.CONTROL:
+            # Control-plane requests are cheap and time-sensitive. Handle them on
+            # the message loop so they never wait behind data-plane work.
+            await self._execute_request_handler(handler, context, request_id, request)
+            return
+
+        task = self.tasks.try_spawn(
             self._execute_request_handler(handler, context, request_id, request),
             name=f"handle_{request.method}_{request_id}",
         )
+        if task is None:
+            error = Error(
+                code=OVERLOADED,
+                message="Too many requests in flight. Retry later.",
+                data={"retryable": True},
+            )
+            await self._send_error(server_id, request_id, error)
+            return
 
         self.server_manager.track_request_from_server(
             server_id, request_id, request, task
@@ -254,24 +315,43 @@ class MessageCoordinator:
         request_id: str | int,
         request: Request,
     ) -> None:
-        """Executes handler and sends response back to server."""
-        try:
-            result_or_error = await handler(context, request)
+        """Executes handler and sends response back to server.
 
-            if isinstance(result_or_error, Error):
-                response = JSONRPCError.from_error(result_or_error, request_id)
-            else:
-                response = JSONRPCResponse.from_result(result_or_error, request_id)
-
-            await self.transport.send(context.server_id, response.to_wire())
-
-        except Exception:
-            error = Error(
-                code=INTERNAL_ERROR,
-                message="Request handler failed",
-                data={"request": request},
-            )
-            await self._send_error(context.server_id, request_id, error)
+        Traces the handler, serialize, and send stages.
+        """
+        with self.tracer.start_span(
+            f"mcp.client.request {request.method}",
+            attributes={
+                "mcp.method": request.method,
+                "mcp.request_id": request_id,
+                "mcp.server_id": context.server_id,
+            },
+        ) as span:
+            try:
+                with self.tracer.start_span("mcp.handler"):
+                    result_or_error = await handler(context, request)
+
+                with self.tracer.start_span("mcp.serialize"):
+                    if isinstance(result_or_error, Error):
+                        span.set_attribute("mcp.error_code", result_or_error.code)
+                        response = JSONRPCError.from_error(result_or_error, request_id)
+                    else:
+                        response = JSONRPCResponse.from_result(
+                            result_or_error, request_id
+                        )
+                    wire_response = response.to_wire()
+
+                with self.tracer.start_span("mcp.send"):
+                    await self.transport.send(context.server_id, wire_response)
+
+            except Exception as e:
+                span.record_error(e)
+                error = Error(
+                    code=INTERNAL_ERROR,
+                    message="Request handler failed",
+                    data={"request": request},
+                )
+                await self._send_error(context.server_id, request_id, error)
 
     # ================================
     # Handle notifications
@@ -281,7 +361,8 @@ class MessageCoordinator:
         self, server_id: str, payload: dict[str, Any]
     ) -> None:
         """Parses and routes an incoming notification from the server."""
-        notification = self.parser.parse_notification(payload)
+        with self.tracer.start_span("mcp.parse"):
+            notification = self.parser.parse_notification(payload)
         if notification is None:
             return
 
@@ -295,12 +376,14 @@ class MessageCoordinator:
         """Routes an incoming notification to the appropriate handler.
 
         Creates request context. Fails silently if we can't build the context.
+        Control-plane notifications (e.g. cancellations) run inline on the message
+        loop; everything else is queued on the server's ordered notification lane.
 
         Args:
             server_id: ID of the server that sent the notification
             notification: The notification object
         """
-        handler = self._notification_handlers.get(notification.method)
+        handler = self._get_notification_chain(notification.method)
         if not handler:
             self.logger.info(f"No handler for notification: {notification.method}")
             return
@@ -314,17 +397,29 @@ class MessageCoordinator:
             )
             return
 
-        task = asyncio.create_task(
-            handler(context, notification),
-            name=f"notify_{notification.method}_{server_id}",
-        )
+        if priority_for_method(notification.method) is MessagePriority.CONTROL:
+            # Run control-plane notifications inline so that, for example, a
+            # cancellation takes effect before we read the next message.
+            await self._execute_notification_handler(handler, context, notification)
+            return
 
-        task.add_done_callback(self._on_notification_done)
+        self.tasks.submit_ordered(
+            server_id,
+            self._execute_notification_handler(handler, context, notification),
+            droppable=notification.method in DROPPABLE_NOTIFICATIONS,
+        )
 
-    def _on_notification_done(self, task: asyncio.Task[None]) -> None:
-        """Handle completed notification tasks."""
-        if task.exception():
-            self.logger.exception(f"Notification handler failed: {task.exception()}")
+    async def _execute_notification_handler(
+        self,
+        handler: NotificationHandler,
+        context: MessageContext,
+        notification: Notification,
+    ) -> None:
+        """Runs a notification handler, logging any failure."""
+        try:
+            await handler(context, notification)
+        except Exception as e:
+            self.logger.exception(f"Notification handler failed: {e}")
 
     # ================================
     # Handle responses
@@ -381,8 +476,15 @@ class MessageCoordinator:
     ) -> Result | Error:
         """Send a request to the server and wait for a response.
 
-        Handles timeouts with automatic cancellation except for initialization
+        Request IDs are integers from a counter shared by all servers, so one is
+        never reused, even after the server resets. Timeouts run on a shared
+        timing wheel and trigger automatic cancellation except for initialization
         requests.
+        Cancelling the awaiting task cancels the request on the server too.
+        Response times are recorded on the server manager.
+
+        When tracing is enabled, the request carries the current trace context in
+        its _meta so the server's handling joins the same trace.
 
         Args:
             request: The request object to send
@@ -398,25 +500,61 @@ class MessageCoordinator:
         if not self.running:
             raise RuntimeError("Cannot send request: coordinator is not running")
 
-        request_id = str(uuid.uuid4())
-        jsonrpc_request = JSONRPCRequest.from_request(request, request_id)
-        future: asyncio.Future[Result | Error] = asyncio.Future()
+        request_id = self.server_manager.next_request_id()
+        future: asyncio.Future[Result | Error] = (
+            asyncio.get_running_loop().create_future()
+        )
 
         self.server_manager.track_request_to_server(
             server_id, request_id, request, future
         )
+        timer_id = self._request_timeouts.schedule(
+            timeout, lambda: _expire_future(future)
+        )
 
-        try:
-            await self.transport.send(server_id, jsonrpc_request.to_wire())
-            return await asyncio.wait_for(future, timeout)
-        except asyncio.TimeoutError:
-            await self._handle_request_timeout(server_id, request_id, request)
-            raise
-        finally:
-            self.server_manager.remove_request_to_server(server_id, request_id)
-
-    async def _handle_request_timeout(
-        self, server_id: str, request_id: str, request: Request
+        with self.tracer.start_span(
+            f"mcp.client.send_request {request.method}",
+            attributes={
+                "mcp.method": request.method,
+                "mcp.request_id": request_id,
+                "mcp.server_id": server_id,
+            },
+        ) as span:
+            try:
+                with self.tracer.start_span("mcp.serialize"):
+                    wire_request = JSONRPCRequest.from_request(
+                        inject_trace_context(request, span), request_id
+                    ).to_wire()
+                with self.tracer.start_span("mcp.send"):
+                    await self.transport.send(server_id, wire_request)
+                sent_at = asyncio.get_running_loop().time()
+                response = await future
+                self.server_manager.record_response_time(
+                    server_id,
+                    request.method,
+                    asyncio.get_running_loop().time() - sent_at,
+                )
+                return response
+            except asyncio.TimeoutError:
+                await self._cancel_on_server(
+                    server_id, request_id, request, "Request timed out"
+                )
+                raise
+            except asyncio.CancelledError:
+                # Cancelling us cancels the future too; a result means it was
+                # answered after all.
+                answered = future.done() and not future.cancelled()
+                if self.running and not answered:
+                    await self._cancel_on_server(
+                        server_id, request_id, request, "Request cancelled"
+                    )
+                raise
+            finally:
+                self._request_timeouts.cancel(timer_id)
+                self.server_manager.remove_request_to_server(server_id, request_id)
+
+    async def _cancel_on_server(
+        self, server_id: str, request_id: RequestId, request: Request, reason: str
     ) -> None:
         """Sends a cancellation notification to a server.
 
@@ -427,7 +565,7 @@ class MessageCoordinator:
         try:
             cancelled_notification = CancelledNotification(
                 request_id=request_id,
-                reason="Request timed out",
+                reason=reason,
             )
             await self.send_notification(server_id, cancelled_notification)
         except Exception as e:
@@ -461,12 +599,66 @@ class MessageCoordinator:
     def register_request_handler(self, method: str, handler: RequestHandler) -> None:
         """Register a request handler."""
         self._request_handlers[method] = handler
+        self._request_chains.pop(method, None)
 
     def register_notification_handler(
         self, method: str, handler: NotificationHandler
     ) -> None:
         """Register a notification handler."""
         self._notification_handlers[method] = handler
+        self._notification_chains.pop(method, None)
+
+    # ================================
+    # Middleware
+    # ================================
+
+    def add_request_middleware(self, middleware: RequestMiddleware) -> None:
+        """Add middleware around every request handler.
+
+        Middleware is called as `middleware(context, request, call_next)` and
+        returns the result or error to send back. The first middleware added is
+        the outermost. Return without awaiting `call_next` to short-circuit the
+        handler.
+
+        Args:
+            middleware: Async callable taking (context, request, call_next)
+        """
+        self._request_middleware.append(middleware)
+        self._request_chains.clear()
+
+    def add_notification_middleware(self, middleware: NotificationMiddleware) -> None:
+        """Add middleware around every notification handler.
+
+        Middleware is called as `middleware(context, notification, call_next)`.
+        The first middleware added is the outermost.
+
+        Args:
+            middleware: Async callable taking (context, notification, call_next)
+        """
+        self._notification_middleware.append(middleware)
+        self._notification_chains.clear()
+
+    def _get_request_chain(self, method: str) -> RequestHandler | None:
+        """Returns the handler for a method wrapped in request middleware."""
+        chain = self._request_chains.get(method)
+        if chain is None:
+            handler = self._request_handlers.get(method)
+            if handler is None:
+                return None
+            chain = chain_middleware(handler, self._request_middleware)
+            self._request_chains[method] = chain
+        return chain
+
+    def _get_notification_chain(self, method: str) -> NotificationHandler | None:
+        """Returns the handler for a method wrapped in notification middleware."""
+        chain = self._notification_chains.get(method)
+        if chain is None:
+            handler = self._notification_handlers.get(method)
+            if handler is None:
+                return None
+            chain = chain_middleware(handler, self._notification_middleware)
+            self._notification_chains[method] = chain
+        return chain
 
     # ================================
     # Helpers
@@ -477,3 +669,9 @@ class MessageCoordinator:
         """Send error response to server."""
         response = JSONRPCError.from_error(error, request_id)
         await self.transport.send(server_id, response.to_wire())
+
+
+def _expire_future(future: asyncio.Future[Result | Error]) -> None:
+    """Fails a pending request future with a timeout."""
+    if not future.done():
+        future.set_exception(asyncio.TimeoutError())
@@ -0,0 +1,44 @@
+"""Recent response times for one server and request method.
+
+Keeps a fixed number of the latest samples rather than a histogram, so
+quantiles track the server's current behaviour: a replica that recovers from a
+slow spell stops looking slow once its old samples roll out of the window.
+"""
+
+import math
+from collections import deque
+
+
+class LatencyWindow:
+    """The most recent response times of one server and method, in seconds."""
+
+    def __init__(self, max_samples: int = 256) -> None:
+        """Initialize an empty window.
+
+        Args:
+            max_samples: Samples kept. Older ones are dropped first.
+        """
+        if max_samples < 1:
+            raise ValueError("max_samples must be at least 1")
+        self._samples: deque[float] = deque(maxlen=max_samples)
+
+    def record(self, seconds: float) -> None:
+        """Add a response time."""
+        self._samples.append(seconds)
+
+    def quantile(self, q: float) -> float | None:
+        """Nearest-rank quantile of the window, or None if it is empty.
+
+        Args:
+            q: Quantile between 0 and 1, e.g. 0.95 for p95.
+        """
+        if not 0 <= q <= 1:
+            raise ValueError("q must be between 0 and 1")
+        if not self._samples:
+            return None
+        ordered = sorted(self._samples)
+        rank = max(math.ceil(q * len(ordered)), 1)
+        return ordered[rank - 1]
+
+    def __len__(self) -> int:
+        return len(self._samples)
@@ -1,9 +1,22 @@
+import asyncio
+import itertools
 import logging
+import time
+from dataclasses import dataclass, field
 from typing import Awaitable, Callable
 
 from conduit.client.message_context import MessageContext
 from conduit.protocol.sampling import CreateMessageRequest, CreateMessageResult
 
+# Priority a request gets when the server states no speed preference.
+DEFAULT_SAMPLING_PRIORITY = 0.5
+
+# Every this many seconds a request waits, its priority rises by a full unit.
+# Keeps low-priority requests from waiting forever behind a steady stream of
+# urgent ones. Aging in whole steps leaves equal priorities equal, so servers
+# keep taking turns.
+PRIORITY_AGING_SECONDS = 10.0
+
 
 class SamplingNotConfiguredError(Exception):
     """Raised when sampling is requested but no handler is configured."""
@@ -11,11 +24,186 @@ class SamplingNotConfiguredError(Exception):
     pass
 
 
+@dataclass
+class SamplingSchedulerStats:
+    """Counters for a SamplingScheduler."""
+
+    submitted: int = 0
+    started: int = 0
+    dropped: int = 0  # Cancelled while still queued
+    queued: int = 0
+    running: int = 0
+    tokens_in_flight: int = 0
+    total_queue_time: float = 0.0
+    max_queue_time: float = 0.0
+
+    @property
+    def mean_queue_time(self) -> float:
+        """Average seconds a started request spent queued."""
+        return self.total_queue_time / self.started if self.started else 0.0
+
+
+@dataclass(eq=False)
+class _Waiter:
+    server_id: str
+    priority: float
+    tokens: int
+    enqueued_at: float
+    order: int
+    granted: asyncio.Future[None] = field(
+        default_factory=lambda: asyncio.get_running_loop().create_future()
+    )
+
+
+class SamplingScheduler:
+    """Admission control in front of the sampling handler.
+
+    Limits how many sampling requests run at once and, optionally, how many
+    tokens (by max_tokens) they may ask for between them. Waiting requests are
+    ordered by priority, taken from the server's ModelPreferences.speed_priority
+    and raised the longer a request waits. Among equal priorities, servers take
+    turns, so one chatty server can't crowd out the others. Requests cancelled
+    while queued leave the queue without ever reaching the handler.
+    """
+
+    def __init__(
+        self, max_concurrency: int = 4, max_tokens_in_flight: int | None = None
+    ) -> None:
+        """Initialize the scheduler.
+
+        Args:
+            max_concurrency: Sampling requests allowed to run at once.
+            max_tokens_in_flight: Cap on the summed max_tokens of running
+                requests. A request larger than the cap runs alone.
+        """
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency must be at least 1")
+        self.max_concurrency = max_concurrency
+        self.max_tokens_in_flight = max_tokens_in_flight
+        self._queues: dict[str, list[_Waiter]] = {}
+        self._last_served: dict[str, int] = {}
+        self._order = itertools.count()
+        self._dispatches = itertools.count(1)
+        self._stats = SamplingSchedulerStats()
+
+    def stats(self) -> SamplingSchedulerStats:
+        """Snapshot of the scheduler's counters."""
+        return SamplingSchedulerStats(**vars(self._stats))
+
+    async def run(
+        self,
+        server_id: str,
+        request: CreateMessageRequest,
+        handler: Callable[[CreateMessageRequest], Awaitable[CreateMessageResult]],
+    ) -> CreateMessageResult:
+        """Wait for a slot, then run the handler on the request."""
+        waiter = await self._acquire(server_id, request)
+        try:
+            return await handler(request)
+        finally:
+            self._release(waiter)
+
+    # ================================
+    # Queueing
+    # ================================
+
+    async def _acquire(self, server_id: str, request: CreateMessageRequest) -> _Waiter:
+        preferences = request.preferences
+        priority = DEFAULT_SAMPLING_PRIORITY
+        if preferences is not None and preferences.speed_priority is not None:
+            priority = preferences.speed_priority
+
+        waiter = _Waiter(
+            server_id,
+            priority,
+            request.max_tokens,
+            time.monotonic(),
+            next(self._order),
+        )
+        self._queues.setdefault(server_id, []).append(waiter)
+        self._stats.submitted += 1
+        self._stats.queued += 1
+        self._dispatch()
+
+        try:
+            await waiter.granted
+        except asyncio.CancelledError:
+            if waiter.granted.cancelled():
+                self._remove(waiter)
+                self._stats.queued -= 1
+                self._stats.dropped += 1
+                # It may have been the head holding back requests that fit
+                self._dispatch()
+            else:
+                self._release(waiter)  # Granted as we were cancelled
+            raise
+        return waiter
+
+    def _release(self, waiter: _Waiter) -> None:
+        self._stats.running -= 1
+        self._stats.tokens_in_flight -= waiter.tokens
+        self._dispatch()
+
+    def _dispatch(self) -> None:
+        """Start queued requests while there is room."""
+        while self._stats.running < self.max_concurrency:
+            waiter = self._next_waiter()
+            if waiter is None:
+                return
+            if not self._fits(waiter.tokens):
+                return  # Wait for tokens rather than skip and starve big requests
+
+            self._remove(waiter)
+            self._last_served[waiter.server_id] = next(self._dispatches)
+            queue_time = time.monotonic() - waiter.enqueued_at
+            self._stats.queued -= 1
+            self._stats.started += 1
+            self._stats.running += 1
+            self._stats.tokens_in_flight += waiter.tokens
+            self._stats.total_queue_time += queue_time
+            self._stats.max_queue_time = max(self._stats.max_queue_time, queue_time)
+            waiter.granted.set_result(None)
+
+    def _next_waiter(self) -> _Waiter | None:
+        """Request that should run next, or None if nothing is queued.
+
+        Aging changes the order as time passes, so each server's queue is
+        scanned rather than kept sorted.
+        """
+        now = time.monotonic()
+        best: tuple[float, int] | None = None
+        best_waiter = None
+        for server_id, queue in self._queues.items():
+            # Within a server: highest aged priority, then first come
+            head = min(queue, key=lambda w: (-self._aged(w, now), w.order))
+            # Across servers: highest aged priority, then served longest ago
+            key = (-self._aged(head, now), self._last_served.get(server_id, 0))
+            if best is None or key < best:
+                best, best_waiter = key, head
+        return best_waiter
+
+    def _aged(self, waiter: _Waiter, now: float) -> float:
+        waited = now - waiter.enqueued_at
+        return waiter.priority + waited // PRIORITY_AGING_SECONDS
+
+    def _remove(self, waiter: _Waiter) -> None:
+        queue = self._queues[waiter.server_id]
+        queue.remove(waiter)
+        if not queue:
+            del self._queues[waiter.server_id]
+
+    def _fits(self, tokens: int) -> bool:
+        if self.max_tokens_in_flight is None or self._stats.running == 0:
+            return True
+        return self._stats.tokens_in_flight + tokens <= self.max_tokens_in_flight
+
+
 class SamplingManager:
-    def __init__(self):
+    def __init__(self, scheduler: SamplingScheduler | None = None):
         self.sampling_handler: (
             Callable[[CreateMessageRequest], Awaitable[CreateMessageResult]] | None
         ) = None
+        self.scheduler = scheduler
         self.logger = logging.getLogger("conduit.client.protocol.sampling")
 
     async def handle_create_message(
@@ -23,6 +211,8 @@ class SamplingManager:
     ) -> CreateMessageResult:
         """Sample the host LLM for the server.
 
+        With a scheduler, the request waits its turn before the handler runs.
+
         Args:
             context: The request context with server state and helpers.
             request: The create message request.
@@ -35,4 +225,8 @@ class SamplingManager:
         """
         if self.sampling_handler is None:
             raise SamplingNotConfiguredError("No sampling handler registered")
-        return await self.sampling_handler(request)
+        if self.scheduler is None:
+            return await self.sampling_handler(request)
+        return await self.scheduler.run(
+            context.server_id, request, self.sampling_handler
+        )
@@ -0,0 +1,318 @@
+"""Client-side cache of resource contents.
+
+Entries are keyed by (server_id, uri) and filled lazily: the first read fetches
+the resource, later reads are served from memory until the entry goes stale.
+ResourceUpdatedNotifications mark entries stale rather than re-reading
+straight away.
+
+Each entry has at most one fetch in flight. Reads that arrive while it runs
+share it, and invalidations that arrive while it runs cause exactly one
+trailing fetch, so a burst of update notifications costs two reads, not one
+per notification.
+
+Contents are held within a byte budget. The least recently used entries are
+evicted first; entries with active watchers are kept.
+"""
+
+import asyncio
+import logging
+from collections import OrderedDict
+from collections.abc import AsyncIterator
+from dataclasses import dataclass, field
+from typing import Awaitable, Callable
+
+from conduit.protocol.base import Error
+from conduit.protocol.content import TextResourceContents
+from conduit.protocol.resources import ReadResourceResult
+
+ResourceKey = tuple[str, str]  # (server_id, uri)
+
+# Fetches started back to back when invalidations keep landing mid-fetch.
+# After this many, the last content is served and the entry stays stale.
+MAX_FETCHES_PER_REFRESH = 3
+
+logger = logging.getLogger(__name__)
+
+
+class ResourceReadError(Exception):
+    """The server answered a resource read with an error."""
+
+    def __init__(self, server_id: str, uri: str, error: Error):
+        self.server_id = server_id
+        self.uri = uri
+        self.error = error
+        super().__init__(
+            f"Server {server_id} failed to read {uri}: {error.message} "
+            f"(code {error.code})"
+        )
+
+
+@dataclass
+class ResourceCacheStats:
+    """Counters for a ResourceCache."""
+
+    hits: int = 0
+    misses: int = 0
+    coalesced: int = 0  # Reads that joined a fetch already in flight
+    trailing_fetches: int = 0  # Extra fetches caused by mid-fetch invalidation
+    evictions: int = 0
+
+
+@dataclass(eq=False)
+class _Entry:
+    result: ReadResourceResult | None = None
+    size: int = 0
+    stale: bool = True
+    generation: int = 0  # Bumped by every invalidation
+    fetch_task: asyncio.Task[ReadResourceResult] | None = None
+    watchers: list[asyncio.Queue[ReadResourceResult | None]] = field(
+        default_factory=list
+    )
+
+
+class ResourceCache:
+    """Caches resource contents per (server_id, uri) within a byte budget."""
+
+    def __init__(
+        self,
+        fetch: Callable[[str, str], Awaitable[ReadResourceResult]],
+        max_bytes: int = 32 * 1024 * 1024,
+    ) -> None:
+        """Initialize an empty cache.
+
+        Args:
+            fetch: Reads a resource from a server. Raises on failure.
+            max_bytes: Budget for cached contents, measured as text bytes plus
+                base64 blob characters.
+        """
+        if max_bytes < 0:
+            raise ValueError("max_bytes must not be negative")
+        self._fetch = fetch
+        self.max_bytes = max_bytes
+        self.stats = ResourceCacheStats()
+        self._entries: OrderedDict[ResourceKey, _Entry] = OrderedDict()
+        self._bytes = 0
+
+    @property
+    def bytes_used(self) -> int:
+        """Size of the cached contents."""
+        return self._bytes
+
+    def __len__(self) -> int:
+        return sum(1 for entry in self._entries.values() if entry.result is not None)
+
+    def __contains__(self, key: object) -> bool:
+        entry = self._entries.get(key)  # type: ignore[arg-type]
+        return entry is not None and entry.result is not None
+
+    def is_stale(self, server_id: str, uri: str) -> bool:
+        """True unless the cache holds current content for the resource."""
+        entry = self._entries.get((server_id, uri))
+        return entry is None or entry.stale
+
+    def is_watched(self, server_id: str, uri: str) -> bool:
+        """True if someone is iterating watch() for the resource."""
+        entry = self._entries.get((server_id, uri))
+        return entry is not None and bool(entry.watchers)
+
+    # ================================
+    # Reads
+    # ================================
+
+    async def get(self, server_id: str, uri: str) -> ReadResourceResult:
+        """Return the resource's contents, fetching them if needed.
+
+        Raises:
+            Exception: Whatever the fetch raised.
+        """
+        key = (server_id, uri)
+        entry = self._entries.get(key)
+        if entry is not None and not entry.stale and entry.result is not None:
+            self.stats.hits += 1
+            self._entries.move_to_end(key)
+            return entry.result
+
+        self.stats.misses += 1
+        return await asyncio.shield(self.refresh(server_id, uri))
+
+    def refresh(self, server_id: str, uri: str) -> asyncio.Task[ReadResourceResult]:
+        """Start fetching the resource, or join the fetch already in flight.
+
+        Returns:
+            A task that resolves to the fresh contents.
+        """
+        key = (server_id, uri)
+        entry = self._entries.get(key)
+        if entry is None:
+            entry = _Entry()
+            self._entries[key] = entry
+
+        if entry.fetch_task is not None and not entry.fetch_task.done():
+            self.stats.coalesced += 1
+            return entry.fetch_task
+
+        task = asyncio.create_task(
+            self._run_fetch(key, entry), name=f"resource_fetch_{uri}"
+        )
+        entry.fetch_task = task
+        task.add_done_callback(lambda t: self._on_fetch_done(key, entry, t))
+        return task
+
+    async def watch(
+        self, server_id: str, uri: str
+    ) -> AsyncIterator[ReadResourceResult]:
+        """Yield the resource's contents now and after every change.
+
+        Readers that fall behind skip to the latest contents. The iteration
+        ends when the server is removed from the cache. Fetch failures are
+        logged and skipped.
+        """
+        key = (server_id, uri)
+        entry = self._entries.get(key)
+        if entry is None:
+            entry = _Entry()
+            self._entries[key] = entry
+
+        updates: asyncio.Queue[ReadResourceResult | None] = asyncio.Queue(maxsize=1)
+        entry.watchers.append(updates)
+        try:
+            if not entry.stale and entry.result is not None:
+                yield entry.result
+            else:
+                self.refresh(server_id, uri)
+            while True:
+                result = await updates.get()
+                if result is None:
+                    return
+                yield result
+        finally:
+            if updates in entry.watchers:
+                entry.watchers.remove(updates)
+            self._prune(key, entry)
+            self._evict()
+
+    # ================================
+    # Invalidation
+    # ================================
+
+    def invalidate(self, server_id: str, uri: str) -> None:
+        """Mark a resource's cached contents as out of date.
+
+        Watched resources are re-fetched right away; others on their next read.
+        """
+        key = (server_id, uri)
+        entry = self._entries.get(key)
+        if entry is None:
+            return
+        entry.stale = True
+        entry.generation += 1
+        if entry.watchers:
+            self.refresh(server_id, uri)
+
+    def remove_server(self, server_id: str) -> None:
+        """Drop every entry for a server and end its watches."""
+        for key in [key for key in self._entries if key[0] == server_id]:
+            entry = self._entries.pop(key)
+            self._bytes -= entry.size
+            if entry.fetch_task is not None:
+                entry.fetch_task.cancel()
+            for updates in entry.watchers:
+                _publish(updates, None)
+
+    def clear(self) -> None:
+        """Drop every entry and end every watch."""
+        for server_id in {key[0] for key in self._entries}:
+            self.remove_server(server_id)
+
+    # ================================
+    # Internals
+    # ================================
+
+    async def _run_fetch(self, key: ResourceKey, entry: _Entry) -> ReadResourceResult:
+        for attempt in range(MAX_FETCHES_PER_REFRESH):
+            if attempt:
+                self.stats.trailing_fetches += 1
+            generation = entry.generation
+            result = await self._fetch(*key)
+            if entry.generation == generation:
+                break
+
+        self._store(key, entry, result, stale=entry.generation != generation)
+        for updates in entry.watchers:
+            _publish(updates, result)
+        return result
+
+    def _on_fetch_done(
+        self, key: ResourceKey, entry: _Entry, task: asyncio.Task[ReadResourceResult]
+    ) -> None:
+        if entry.fetch_task is task:
+            entry.fetch_task = None
+        if not task.cancelled() and task.exception() is not None:
+            logger.info(
+                f"Failed to read resource {key[1]} from {key[0]}: {task.exception()!r}"
+            )
+        self._prune(key, entry)
+
+    def _prune(self, key: ResourceKey, entry: _Entry) -> None:
+        """Drop an entry that holds nothing and has nobody waiting on it."""
+        if (
+            self._entries.get(key) is entry
+            and entry.result is None
+            and entry.fetch_task is None
+            and not entry.watchers
+        ):
+            del self._entries[key]
+
+    def _store(
+        self,
+        key: ResourceKey,
+        entry: _Entry,
+        result: ReadResourceResult,
+        stale: bool,
+    ) -> None:
+        if self._entries.get(key) is not entry:
+            return  # Removed while fetching
+        self._bytes -= entry.size
+        entry.result = result
+        entry.size = _content_size(result)
+        entry.stale = stale
+        self._bytes += entry.size
+        self._entries.move_to_end(key)
+        self._evict()
+
+    def _evict(self) -> None:
+        """Drop least recently used contents until the budget holds."""
+        if self._bytes <= self.max_bytes:
+            return
+        for key in list(self._entries):
+            if self._bytes <= self.max_bytes:
+                break
+            entry = self._entries[key]
+            if entry.watchers or entry.result is None:
+                continue
+            self._bytes -= entry.size
+            self.stats.evictions += 1
+            if entry.fetch_task is None:
+                del self._entries[key]
+            else:
+                entry.result, entry.size, entry.stale = None, 0, True
+
+
+def _publish(
+    updates: asyncio.Queue[ReadResourceResult | None],
+    result: ReadResourceResult | None,
+) -> None:
+    """Hand the latest contents to a watcher, replacing any it hasn't read."""
+    if updates.full():
+        updates.get_nowait()
+    updates.put_nowait(result)
+
+
+def _content_size(result: ReadResourceResult) -> int:
+    size = 0
+    for content in result.contents:
+        if isinstance(content, TextResourceContents):
+            size += len(content.text.encode())
+        else:
+            size += len(content.blob)
+    return size
@@ -0,0 +1,181 @@
+"""Several connections to one logical server, with client-side balancing.
+
+A ServerGroup names a set of member servers that offer the same thing, such as
+four copies of one stdio server. Each member is an ordinary connected server
+with its own ServerState and handshake; the group only decides which member
+takes the next request.
+
+Policies:
+
+- "round_robin": members in turn.
+- "least_outstanding": the member with the fewest requests awaiting an answer.
+- "p2c": power of two choices; the less loaded of two random members. Close to
+  least_outstanding in practice, without every caller piling onto the same
+  member when they read the same load at once.
+
+Members whose recent failure rate (timeouts, transport errors, internal
+errors) reaches the threshold are ejected for a cool-off period that doubles
+with each consecutive ejection. If every member is ejected, the group routes to
+all of them rather than refusing work.
+"""
+
+import logging
+import random
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Callable, Literal
+
+BalancingPolicy = Literal["round_robin", "least_outstanding", "p2c"]
+
+logger = logging.getLogger(__name__)
+
+
+class EmptyServerGroupError(LookupError):
+    """The group has no members to route a request to."""
+
+    def __init__(self, group_id: str):
+        self.group_id = group_id
+        super().__init__(f"Server group {group_id} has no members")
+
+
+@dataclass(eq=False)
+class _Member:
+    server_id: str
+    outcomes: deque[bool] = field(default_factory=deque)  # True for success
+    ejected_until: float = 0.0
+    ejections: int = 0  # Consecutive; reset once the member proves healthy
+
+
+class ServerGroup:
+    """Spreads requests for one logical server across its member servers."""
+
+    def __init__(
+        self,
+        group_id: str,
+        member_ids: list[str],
+        outstanding: Callable[[str], int],
+        policy: BalancingPolicy = "least_outstanding",
+        failure_threshold: float = 0.5,
+        min_requests: int = 5,
+        window: int = 20,
+        ejection_time: float = 10.0,
+        max_ejection_time: float = 300.0,
+    ) -> None:
+        """Initialize a group.
+
+        Args:
+            group_id: Name of the logical server.
+            member_ids: Connected servers that make up the group.
+            outstanding: Returns how many requests a member has in flight.
+            policy: How to pick the member for each request.
+            failure_threshold: Failure rate over the window that ejects a member.
+            min_requests: Outcomes needed before a member can be ejected.
+            window: Recent outcomes considered per member.
+            ejection_time: First cool-off period in seconds.
+            max_ejection_time: Cap on the doubling cool-off period.
+        """
+        if policy not in ("round_robin", "least_outstanding", "p2c"):
+            raise ValueError(f"Unknown balancing policy: {policy}")
+        if not 0 < failure_threshold <= 1:
+            raise ValueError("failure_threshold must be in (0, 1]")
+        if not 0 < min_requests <= window:
+            raise ValueError("Need 0 < min_requests <= window")
+        self.group_id = group_id
+        self.policy = policy
+        self.failure_threshold = failure_threshold
+        self.min_requests = min_requests
+        self.window = window
+        self.ejection_time = ejection_time
+        self.max_ejection_time = max_ejection_time
+        self._outstanding = outstanding
+        self._members: dict[str, _Member] = {}
+        self._next = 0
+        for server_id in member_ids:
+            self.add_member(server_id)
+
+    # ================================
+    # Membership
+    # ================================
+
+    @property
+    def member_ids(self) -> list[str]:
+        """Every member, ejected or not."""
+        return list(self._members)
+
+    def add_member(self, server_id: str) -> None:
+        """Start routing to a connected server."""
+        if server_id not in self._members:
+            self._members[server_id] = _Member(
+                server_id, outcomes=deque(maxlen=self.window)
+            )
+
+    def remove_member(self, server_id: str) -> None:
+        """Stop routing to a server."""
+        self._members.pop(server_id, None)
+
+    def healthy_member_ids(self) -> list[str]:
+        """Members that aren't ejected."""
+        return [member.server_id for member in self._healthy_members()]
+
+    def is_ejected(self, server_id: str) -> bool:
+        """True while a member is cooling off after too many failures."""
+        member = self._members.get(server_id)
+        return member is not None and member.ejected_until > time.monotonic()
+
+    # ================================
+    # Routing
+    # ================================
+
+    def choose(self) -> str:
+        """Pick the member for the next request.
+
+        Raises:
+            EmptyServerGroupError: If the group has no members.
+        """
+        candidates = self._healthy_members() or list(self._members.values())
+        if not candidates:
+            raise EmptyServerGroupError(self.group_id)
+
+        if self.policy == "p2c" and len(candidates) > 1:
+            first, second = random.sample(candidates, 2)
+            if self._outstanding(second.server_id) < self._outstanding(first.server_id):
+                return second.server_id
+            return first.server_id
+
+        # Rotate the starting point so ties don't always go to the first member
+        start = self._next % len(candidates)
+        self._next += 1
+        rotated = candidates[start:] + candidates[:start]
+        if self.policy == "least_outstanding":
+            return min(rotated, key=lambda m: self._outstanding(m.server_id)).server_id
+        return rotated[0].server_id
+
+    def record(self, server_id: str, ok: bool) -> None:
+        """Report how a request to a member went. Ejects unhealthy members."""
+        member = self._members.get(server_id)
+        if member is None:
+            return
+        member.outcomes.append(ok)
+        if len(member.outcomes) < self.min_requests:
+            return
+
+        failure_rate = member.outcomes.count(False) / len(member.outcomes)
+        if failure_rate >= self.failure_threshold:
+            self._eject(member, failure_rate)
+        elif len(member.outcomes) == self.window:
+            member.ejections = 0
+
+    def _healthy_members(self) -> list[_Member]:
+        now = time.monotonic()
+        return [m for m in self._members.values() if m.ejected_until <= now]
+
+    def _eject(self, member: _Member, failure_rate: float) -> None:
+        cool_off = min(self.ejection_time * 2**member.ejections, self.max_ejection_time)
+        member.ejected_until = time.monotonic() + cool_off
+        member.ejections += 1
+        member.outcomes.clear()  # Start afresh when it comes back
+        logger.warning(
+            f"Ejected {member.server_id} from server group {self.group_id} for "
+            f"{cool_off:.1f}s (failure rate {failure_rate:.0%})"
+        )
@@ -1,12 +1,14 @@
 import asyncio
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 
+from conduit.client.catalog import ServerCatalogs
+from conduit.client.latency import LatencyWindow
 from conduit.protocol.base import Error, Request, Result
 from conduit.protocol.initialization import Implementation, ServerCapabilities
 from conduit.protocol.prompts import Prompt
 from conduit.protocol.resources import Resource, ResourceTemplate
 from conduit.protocol.tools import Tool
-from conduit.shared.request_tracker import RequestTracker
+from conduit.shared.request_tracker import RequestId, RequestTracker
 
 
 @dataclass
@@ -23,6 +25,10 @@ class ServerState:
     resources: list[Resource] | None = None
     resource_templates: list[ResourceTemplate] | None = None
     prompts: list[Prompt] | None = None
+    catalogs: ServerCatalogs = field(default_factory=ServerCatalogs)
+
+    # Health: method -> recent response times
+    latency: dict[str, LatencyWindow] = field(default_factory=dict)
 
 
 class ServerManager:
@@ -103,6 +109,21 @@ class ServerManager:
         server_state.instructions = instructions
         server_state.initialized = True
 
+    def reset_server(self, server_id: str) -> None:
+        """Forget a server's protocol session, e.g. after its process restarted.
+
+        Requests the old session never answered resolve with an error and work
+        for its requests is cancelled. The server stays registered, keeps its
+        catalogs and latency history, and is marked uninitialized.
+
+        Args:
+            server_id: Server identifier
+        """
+        self.request_tracker.cleanup_peer(server_id)
+        server_state = self.get_server(server_id)
+        if server_state is not None:
+            server_state.initialized = False
+
     def is_protocol_initialized(self, server_id: str) -> bool:
         """Check if a specific server has completed MCP initialization.
 
@@ -122,10 +143,18 @@ class ServerManager:
     # Outbound requests
     # ================================
 
+    def next_request_id(self) -> int:
+        """Allocate the ID for our next request to a server.
+
+        Returns:
+            An integer request ID, never used before for any server.
+        """
+        return self.request_tracker.next_request_id()
+
     def track_request_to_server(
         self,
         server_id: str,
-        request_id: str,
+        request_id: RequestId,
         request: Request,
         future: asyncio.Future[Result | Error],
     ) -> None:
@@ -149,7 +178,7 @@ class ServerManager:
         )
 
     def get_request_to_server(
-        self, server_id: str, request_id: str
+        self, server_id: str, request_id: RequestId
     ) -> tuple[Request, asyncio.Future[Result | Error]] | None:
         """Get a pending request to the server.
 
@@ -164,7 +193,7 @@ class ServerManager:
         return self.request_tracker.get_outbound_request(server_id, request_id)
 
     def resolve_request_to_server(
-        self, server_id: str, request_id: str, result_or_error: Result | Error
+        self, server_id: str, request_id: RequestId, result_or_error: Result | Error
     ) -> None:
         """Resolve a pending request to the server.
 
@@ -179,7 +208,7 @@ class ServerManager:
             server_id, request_id, result_or_error
         )
 
-    def remove_request_to_server(self, server_id: str, request_id: str) -> None:
+    def remove_request_to_server(self, server_id: str, request_id: RequestId) -> None:
         """Stop tracking a request to the server.
 
         Args:
@@ -188,6 +217,56 @@ class ServerManager:
         """
         self.request_tracker.remove_outbound_request(server_id, request_id)
 
+    def outstanding_requests(self, server_id: str) -> int:
+        """Count our requests the server hasn't answered yet.
+
+        Args:
+            server_id: Server identifier
+        """
+        return self.request_tracker.count_outbound_requests(server_id)
+
+    def record_response_time(self, server_id: str, method: str, seconds: float) -> None:
+        """Record how long a server took to answer one of our requests.
+
+        Response times are kept per method, since a tools/call or sampling
+        round-trip can take orders of magnitude longer than a ping.
+
+        Args:
+            server_id: Server identifier
+            method: The request's method
+            seconds: Time from sending the request to receiving the response
+        """
+        server_state = self.get_server(server_id)
+        if server_state is None:
+            return
+        window = server_state.latency.get(method)
+        if window is None:
+            window = server_state.latency[method] = LatencyWindow()
+        window.record(seconds)
+
+    def response_time_quantile(
+        self, server_id: str, method: str, q: float, min_samples: int = 1
+    ) -> float | None:
+        """Quantile of a server's recent response times for one method.
+
+        Args:
+            server_id: Server identifier
+            method: The request method to look at
+            q: Quantile between 0 and 1, e.g. 0.95 for p95
+            min_samples: Fewest samples worth estimating from
+
+        Returns:
+            The quantile in seconds, or None if the server is unknown or has
+            answered fewer than min_samples requests for the method.
+        """
+        server_state = self.get_server(server_id)
+        if server_state is None:
+            return None
+        window = server_state.latency.get(method)
+        if window is None or len(window) < min_samples:
+            return None
+        return window.quantile(q)
+
     # ================================
     # Inbound requests
     # ================================
@@ -195,7 +274,7 @@ class ServerManager:
     def track_request_from_server(
         self,
         server_id: str,
-        request_id: str | int,
+        request_id: RequestId,
         request: Request,
         task: asyncio.Task[None],
     ) -> None:
@@ -217,7 +296,7 @@ class ServerManager:
         self.request_tracker.track_inbound_request(server_id, request_id, request, task)
 
     def get_request_from_server(
-        self, server_id: str, request_id: str | int
+        self, server_id: str, request_id: RequestId
     ) -> tuple[Request, asyncio.Task[None]] | None:
         """Get a pending request from the server.
 
@@ -230,7 +309,7 @@ class ServerManager:
         """
         return self.request_tracker.get_inbound_request(server_id, request_id)
 
-    def cancel_request_from_server(self, server_id: str, request_id: str | int) -> None:
+    def cancel_request_from_server(self, server_id: str, request_id: RequestId) -> None:
         """Cancel a request from the server.
 
         Args:
@@ -239,7 +318,7 @@ class ServerManager:
         """
         self.request_tracker.cancel_inbound_request(server_id, request_id)
 
-    def remove_request_from_server(self, server_id: str, request_id: str | int) -> None:
+    def remove_request_from_server(self, server_id: str, request_id: RequestId) -> None:
         """Stop tracking a request from the server.
 
         Args:
@@ -9,19 +9,33 @@ Key components:
 import asyncio
 import logging
 import sys
+import time
+from contextlib import aclosing
 from dataclasses import dataclass
-from typing import Any, cast
+from typing import Any, AsyncIterator, cast
 
 from conduit.client.callbacks import CallbackManager
-from conduit.client.coordinator import MessageCoordinator
+from conduit.client.catalog import ServerCatalogs, fetch_all_pages
+from conduit.client.coordinator import (
+    MessageCoordinator,
+    NotificationMiddleware,
+    RequestMiddleware,
+)
 from conduit.client.message_context import MessageContext
 from conduit.client.protocol.elicitation import (
     ElicitationManager,
     ElicitationNotConfiguredError,
 )
 from conduit.client.protocol.roots import RootsManager
-from conduit.client.protocol.sampling import SamplingManager, SamplingNotConfiguredError
+from conduit.client.protocol.sampling import (
+    SamplingManager,
+    SamplingNotConfiguredError,
+    SamplingScheduler,
+)
+from conduit.client.resource_cache import ResourceCache, ResourceReadError
+from conduit.client.server_group import BalancingPolicy, ServerGroup
 from conduit.client.server_manager import ServerManager
+from conduit.client.tool_index import CollisionPolicy, ToolIndex, UnknownToolError
 from conduit.protocol.base import (
     INTERNAL_ERROR,
     METHOD_NOT_FOUND,
@@ -47,31 +61,50 @@ from conduit.protocol.initialization import (
 )
 from conduit.protocol.logging import LoggingMessageNotification
 from conduit.protocol.prompts import (
-    ListPromptsRequest,
-    ListPromptsResult,
     PromptListChangedNotification,
 )
 from conduit.protocol.resources import (
-    ListResourcesRequest,
-    ListResourcesResult,
-    ListResourceTemplatesRequest,
-    ListResourceTemplatesResult,
     ReadResourceRequest,
     ReadResourceResult,
     Resource,
     ResourceListChangedNotification,
     ResourceTemplate,
     ResourceUpdatedNotification,
+    SubscribeRequest,
+    UnsubscribeRequest,
 )
 from conduit.protocol.roots import ListRootsRequest, ListRootsResult
 from conduit.protocol.sampling import CreateMessageRequest, CreateMessageResult
 from conduit.protocol.tools import (
-    ListToolsRequest,
-    ListToolsResult,
+    CallToolRequest,
+    CallToolResult,
     ToolListChangedNotification,
 )
+from conduit.shared.debounce import Debouncer, DebounceStats
+from conduit.shared.task_supervisor import TaskSupervisor
+from conduit.shared.tracing import Tracer
 from conduit.transport.client import ClientTransport
 
+# Read-only requests that are safe to send to several replicas at once.
+# tools/call qualifies only for tools annotated read-only or idempotent.
+HEDGEABLE_METHODS = frozenset(
+    {
+        "ping",
+        "tools/list",
+        "prompts/list",
+        "prompts/get",
+        "resources/list",
+        "resources/templates/list",
+        "resources/read",
+        "completion/complete",
+    }
+)
+
+# Hedge delay used until the primary has answered enough requests to estimate
+# a latency quantile from.
+DEFAULT_HEDGE_DELAY = 0.05
+MIN_HEDGE_SAMPLES = 20
+
 
 class InvalidProtocolVersionError(Exception):
     pass
@@ -86,28 +119,107 @@ class ServerInitializationError(Exception):
         super().__init__(f"Server '{server_id}' initialization failed: {message}")
 
 
+class ConnectServersError(Exception):
+    """Raised when connect_servers couldn't connect some of the servers."""
+
+    def __init__(self, errors: dict[str, Exception], connected: list[str]):
+        self.errors = errors
+        self.connected = connected
+        details = "; ".join(f"{server_id}: {e}" for server_id, e in errors.items())
+        super().__init__(
+            f"Failed to connect {len(errors)} of {len(errors) + len(connected)} "
+            f"servers: {details}"
+        )
+
+
 @dataclass
 class ClientConfig:
     client_info: Implementation
     capabilities: ClientCapabilities
     protocol_version: str = PROTOCOL_VERSION
+    max_handler_tasks: int = 1024
+    max_notification_backlog: int = 256
+    tool_collision_policy: CollisionPolicy = "error"
+    resource_cache_bytes: int = 32 * 1024 * 1024
+    list_changed_debounce: float = 0.1
+    list_changed_max_delay: float = 1.0
+    sampling_concurrency: int = 4
+    sampling_token_budget: int | None = None
+
+
+@dataclass
+class BroadcastResult:
+    """One server's outcome from ClientSession.broadcast_request."""
+
+    server_id: str
+    response: Result | Error | None = None
+    exception: Exception | None = None  # e.g. TimeoutError, ConnectionError
+    elapsed: float = 0.0  # Seconds from send to outcome, excluding queueing
+
+    @property
+    def ok(self) -> bool:
+        """True if the server answered with a result."""
+        return isinstance(self.response, Result)
+
+
+@dataclass
+class HedgedResult:
+    """The winning answer from ClientSession.send_hedged_request."""
+
+    server_id: str  # Replica that answered first
+    response: Result | Error
+    attempts: int  # Replicas the request was sent to, including the primary
 
 
 class ClientSession:
-    def __init__(self, transport: ClientTransport, config: ClientConfig):
+    def __init__(
+        self,
+        transport: ClientTransport,
+        config: ClientConfig,
+        tracer: Tracer | None = None,
+    ):
         self.transport = transport
         self.client_config = config
+        self.tracer = tracer or Tracer()
 
         self.server_manager = ServerManager()
         self.callbacks = CallbackManager()
 
         # Domain managers
         self.roots = RootsManager()
-        self.sampling = SamplingManager()
+        self.sampling = SamplingManager(
+            SamplingScheduler(
+                max_concurrency=config.sampling_concurrency,
+                max_tokens_in_flight=config.sampling_token_budget,
+            )
+        )
         self.elicitation = ElicitationManager()
+        self.tool_index = ToolIndex(config.tool_collision_policy)
+        self.resource_cache = ResourceCache(
+            self._fetch_resource, max_bytes=config.resource_cache_bytes
+        )
+        self._pending_resource_updates: set[tuple[str, str]] = set()
+        self._list_refresher: Debouncer[tuple[str, str]] = Debouncer(
+            self._run_list_refresh,
+            delay=config.list_changed_debounce,
+            max_delay=config.list_changed_max_delay,
+        )
 
-        self._coordinator = MessageCoordinator(transport, self.server_manager)
+        # server_id -> in-flight connect, shared by concurrent callers
+        self._connecting: dict[str, asyncio.Task[None]] = {}
+        self.server_groups: dict[str, ServerGroup] = {}
+
+        self._coordinator = MessageCoordinator(
+            transport,
+            self.server_manager,
+            self.tracer,
+            TaskSupervisor(
+                max_tasks=config.max_handler_tasks,
+                max_lane_backlog=config.max_notification_backlog,
+            ),
+        )
         self._register_handlers()
+        transport.restart_handler = self._on_server_restarted
 
         # Configure logging if not already configured
         if not logging.getLogger().handlers:
@@ -144,6 +256,12 @@ class ClientSession:
 
         # Clean up domain managers
         self.roots.cleanup_server(server_id)
+        self.tool_index.remove_server(server_id)
+        self.resource_cache.remove_server(server_id)
+        for group in self.server_groups.values():
+            group.remove_member(server_id)
+        for kind in ("tools", "prompts", "resources"):
+            self._list_refresher.cancel((server_id, kind))
 
         # Clean up server manager
         self.server_manager.cleanup_server(server_id)
@@ -174,6 +292,19 @@ class ClientSession:
 
         await self.transport.close()
 
+    async def disconnect_server_group(self, group_id: str) -> None:
+        """Forget a server group and disconnect all of its members.
+
+        Args:
+            group_id: ID of the group to disconnect
+        """
+        group = self.server_groups.pop(group_id, None)
+        if group is None:
+            return
+        await asyncio.gather(
+            *(self.disconnect_server(server_id) for server_id in group.member_ids)
+        )
+
     # ================================
     # Initialization
     # ================================
@@ -189,17 +320,136 @@ class ClientSession:
             timeout: How long to wait for the server to respond (seconds).
                 Defaults to 30 seconds.
 
+        Concurrent calls for the same server_id share one handshake. Cancelling a
+        caller doesn't cancel the handshake the others are waiting on.
+
         Raises:
             TimeoutError: Server didn't respond within the timeout period.
             InvalidProtocolVersionError: Server uses an incompatible protocol version.
             ConnectionError: Network failure or server rejected the handshake.
         """
-        # Note: This check doesn't prevent concurrent initialization attempts
-        # for the same server_id. Multiple calls will result in redundant work
-        # but both will succeed and reach the same final state.
         if self.server_manager.is_protocol_initialized(server_id):
             return
 
+        connecting = self._connecting.get(server_id)
+        if connecting is None:
+            connecting = asyncio.create_task(
+                self._connect_server(server_id, connection_info, timeout),
+                name=f"connect_{server_id}",
+            )
+            self._connecting[server_id] = connecting
+            connecting.add_done_callback(
+                lambda task: self._on_connect_done(server_id, task)
+            )
+        await asyncio.shield(connecting)
+
+    def _on_connect_done(self, server_id: str, task: asyncio.Task[None]) -> None:
+        if self._connecting.get(server_id) is task:
+            del self._connecting[server_id]
+        if not task.cancelled():
+            task.exception()  # Retrieved even if every caller was cancelled
+
+    async def connect_servers(
+        self,
+        servers: dict[str, dict[str, Any]],
+        timeout: float = 30.0,
+        max_concurrency: int = 8,
+    ) -> None:
+        """Connect to many servers concurrently.
+
+        Every server is attempted even if some fail. Servers that connect stay
+        connected when others fail.
+
+        Args:
+            servers: Maps server_id to its transport-specific connection details.
+            timeout: Per-server handshake timeout in seconds.
+            max_concurrency: Maximum number of handshakes in flight at once.
+
+        Raises:
+            ValueError: If max_concurrency is not positive.
+            ConnectServersError: If any server failed to connect. Carries the
+                error for each failed server and the IDs of those that connected.
+        """
+        if max_concurrency <= 0:
+            raise ValueError("max_concurrency must be positive")
+
+        slots = asyncio.Semaphore(max_concurrency)
+
+        async def connect_one(server_id: str, connection_info: dict[str, Any]) -> None:
+            async with slots:
+                await self.connect_server(server_id, connection_info, timeout)
+
+        outcomes = await asyncio.gather(
+            *(connect_one(sid, info) for sid, info in servers.items()),
+            return_exceptions=True,
+        )
+
+        errors: dict[str, Exception] = {}
+        connected: list[str] = []
+        for server_id, outcome in zip(servers, outcomes):
+            if isinstance(outcome, asyncio.CancelledError):
+                raise outcome
+            if isinstance(outcome, Exception):
+                errors[server_id] = outcome
+            else:
+                connected.append(server_id)
+        if errors:
+            raise ConnectServersError(errors, connected)
+
+    async def connect_server_group(
+        self,
+        group_id: str,
+        members: dict[str, dict[str, Any]],
+        policy: BalancingPolicy = "least_outstanding",
+        timeout: float = 30.0,
+    ) -> ServerGroup:
+        """Connect several replicas of one server and balance requests over them.
+
+        Each member is connected like any other server, with its own handshake
+        and ServerState. Send through the group with send_group_request. The
+        group is formed from the members that connect; ones that fail are
+        logged and left out.
+
+        Args:
+            group_id: Name for the logical server.
+            members: Maps each member's server_id to its connection details.
+            policy: "least_outstanding", "p2c", or "round_robin".
+            timeout: Per-member handshake timeout in seconds.
+
+        Returns:
+            ServerGroup: The group, also kept in server_groups.
+
+        Raises:
+            ValueError: If the group already exists or has no members.
+            ConnectServersError: If no member could connect.
+        """
+        if group_id in self.server_groups:
+            raise ValueError(f"Server group {group_id} already exists")
+        if not members:
+            raise ValueError("A server group needs at least one member")
+
+        try:
+            await self.connect_servers(members, timeout)
+            connected = list(members)
+        except ConnectServersError as e:
+            if not e.connected:
+                raise
+            self.logger.warning(f"Server group {group_id} formed without some: {e}")
+            connected = e.connected
+
+        group = ServerGroup(
+            group_id,
+            connected,
+            outstanding=self.server_manager.outstanding_requests,
+            policy=policy,
+        )
+        self.server_groups[group_id] = group
+        return group
+
+    async def _connect_server(
+        self, server_id: str, connection_info: dict[str, Any], timeout: float
+    ) -> None:
+        """Register the server and run the handshake. See connect_server."""
         await self._start()
 
         try:
@@ -263,6 +513,61 @@ class ClientSession:
             instructions=response.instructions,
         )
 
+    async def reinitialize_server(self, server_id: str, timeout: float = 30.0) -> None:
+        """Run the MCP handshake again with a connected server.
+
+        For when the server's process or session was replaced, as when the
+        transport restarts a crashed server. Requests the old process never
+        answered resolve with an error. Cached resource content is dropped,
+        and catalogs fetched before are refetched in the background.
+
+        Args:
+            server_id: ID of the server to reinitialize
+            timeout: How long to wait for the server to respond (seconds).
+
+        Raises:
+            ValueError: If the server isn't connected.
+            TimeoutError: Server didn't respond within the timeout period.
+            ServerInitializationError: Server rejected the handshake.
+            InvalidProtocolVersionError: Server now uses an incompatible
+                protocol version.
+        """
+        state = self.server_manager.get_server(server_id)
+        if state is None:
+            raise ValueError(f"Server {server_id} is not connected")
+
+        self.server_manager.reset_server(server_id)
+        self.resource_cache.remove_server(server_id)
+        try:
+            await asyncio.wait_for(
+                self._do_initialize_server(server_id, timeout), timeout
+            )
+        except asyncio.TimeoutError:
+            raise TimeoutError(
+                f"Reinitializing {server_id} timed out after {timeout}s"
+            ) from None
+
+        fetched = {
+            "tools": state.tools is not None,
+            "prompts": state.prompts is not None,
+            "resources": state.resources is not None
+            or state.resource_templates is not None,
+        }
+        for kind, was_fetched in fetched.items():
+            if was_fetched:
+                self._list_refresher.trigger((server_id, kind))
+
+    async def _on_server_restarted(self, server_id: str) -> None:
+        """Redo the handshake with a server the transport restarted."""
+        if server_id in self._connecting:
+            return  # The connect's own handshake is still running
+        if self.server_manager.get_server(server_id) is None:
+            return
+        try:
+            await self.reinitialize_server(server_id)
+        except Exception as e:
+            self.logger.warning(f"Failed to reinitialize server {server_id}: {e}")
+
     def _create_init_request(self) -> InitializeRequest:
         """Creates an InitializeRequest with client info and capabilities.
 
@@ -409,7 +714,11 @@ class ClientSession:
     async def _handle_prompts_list_changed(
         self, context: MessageContext, notification: PromptListChangedNotification
     ) -> None:
-        """Fetches the updated prompts list and calls the registered callback.
+        """Schedules a debounced refresh of the prompts list."""
+        self._list_refresher.trigger((context.server_id, "prompts"))
+
+    async def _refresh_prompts_list(self, server_id: str) -> None:
+        """Refreshes the prompts catalog and calls the registered callback.
 
         Note:
             Only calls the callback if the request succeeds with valid results.
@@ -417,95 +726,113 @@ class ClientSession:
             disrupting the session.
         """
         try:
-            list_prompts_result = await self.send_request(
-                context.server_id, ListPromptsRequest()
-            )
-            if isinstance(list_prompts_result, ListPromptsResult):
-                server_state = self.server_manager.get_server(context.server_id)
-                if server_state is not None:
-                    server_state.prompts = list_prompts_result.prompts
-                await self.callbacks.call_prompts_changed(
-                    context.server_id, list_prompts_result.prompts
-                )
+            prompts = await self._refresh_catalog(server_id, "prompts")
+            if prompts is not None:
+                await self.callbacks.call_prompts_changed(server_id, prompts)
         except Exception as e:
             self.logger.info(
                 f"Failed to handle prompts list changed notification from server "
-                f"{context.server_id}: {e!r}"
+                f"{server_id}: {e!r}"
             )
 
     async def _handle_resources_list_changed(
         self, context: MessageContext, notification: ResourceListChangedNotification
     ) -> None:
-        """Fetches the updated resources/templates and calls the registered callback.
+        """Schedules a debounced refresh of the resource and template lists."""
+        self._list_refresher.trigger((context.server_id, "resources"))
+
+    async def _refresh_resources_list(self, server_id: str) -> None:
+        """Refreshes the resource and template catalogs and calls the callback.
+
+        Both lists are fetched concurrently.
 
         Note:
             Calls the callback when at least one request succeeds. Passes empty lists
             for failed requests. If both requests fail, the callback is not called.
         """
+        resources_outcome, templates_outcome = await asyncio.gather(
+            self._refresh_catalog(server_id, "resources"),
+            self._refresh_catalog(server_id, "resource_templates"),
+            return_exceptions=True,
+        )
+
         resources: list[Resource] = []
         templates: list[ResourceTemplate] = []
-        server_state = self.server_manager.get_server(context.server_id)
-
-        try:
-            list_resources_result = await self.send_request(
-                context.server_id, ListResourcesRequest()
-            )
-            if isinstance(list_resources_result, ListResourcesResult):
-                resources = list_resources_result.resources
-                if server_state is not None:
-                    server_state.resources = resources
-        except Exception as e:
+        if isinstance(resources_outcome, BaseException):
             self.logger.info(
                 f"Failed to handle resources list changed notification from server "
-                f"{context.server_id}: {e!r}"
-            )
-
-        try:
-            list_templates_result = await self.send_request(
-                context.server_id, ListResourceTemplatesRequest()
+                f"{server_id}: {resources_outcome!r}"
             )
-            if isinstance(list_templates_result, ListResourceTemplatesResult):
-                templates = list_templates_result.resource_templates
-                if server_state is not None:
-                    server_state.resource_templates = templates
-        except Exception as e:
+        elif resources_outcome is not None:
+            resources = resources_outcome
+        if isinstance(templates_outcome, BaseException):
             self.logger.info(
                 f"Failed to handle resource templates list changed notification from "
-                f"server {context.server_id}: {e!r}"
+                f"server {server_id}: {templates_outcome!r}"
             )
+        elif templates_outcome is not None:
+            templates = templates_outcome
 
         if resources or templates:
-            await self.callbacks.call_resources_changed(
-                context.server_id, resources, templates
-            )
+            await self.callbacks.call_resources_changed(server_id, resources, templates)
 
     async def _handle_resources_updated(
         self, context: MessageContext, notification: ResourceUpdatedNotification
     ) -> None:
-        """Reads the updated resource content and calls the registered callback.
+        """Marks the cached content stale and re-reads it if anyone is listening.
+
+        With a resource updated callback registered, the re-read runs in the
+        background and bursts of notifications for one URI share it, so the
+        callback sees the latest content without blocking the server's
+        notification lane. Watched resources are re-read by the cache itself.
+        Otherwise the content is re-read on its next access.
 
         Note:
             Only calls the callback if the resource read succeeds. Failed requests are
             silently ignored to avoid disrupting the session.
         """
+        server_id, uri = context.server_id, notification.uri
+        self.resource_cache.invalidate(server_id, uri)
+
+        if self.callbacks.resource_updated_handler is None:
+            return
+        if (server_id, uri) in self._pending_resource_updates:
+            return  # The pending delivery will pick up this change
+        self._pending_resource_updates.add((server_id, uri))
+        self._coordinator.tasks.spawn(
+            self._deliver_resource_update(server_id, uri),
+            name=f"resource_updated_{uri}",
+        )
+
+    async def _deliver_resource_update(self, server_id: str, uri: str) -> None:
+        """Re-reads a resource once, then calls the updated callback.
+
+        Invalidations landing mid-read already cause a bounded trailing fetch in
+        the cache, so the result is delivered whether or not it stayed cached:
+        retrying until the entry is fresh would loop forever on a resource too
+        large to cache, or one that keeps changing.
+        """
         try:
-            read_resource_result = await self.send_request(
-                context.server_id, ReadResourceRequest(uri=notification.uri)
-            )
-            if isinstance(read_resource_result, ReadResourceResult):
-                await self.callbacks.call_resource_updated(
-                    context.server_id, notification.uri, read_resource_result
-                )
+            result = await self.resource_cache.refresh(server_id, uri)
         except Exception as e:
             self.logger.info(
                 f"Failed to handle resources updated notification from server "
-                f"{context.server_id}: {e!r}"
+                f"{server_id}: {e!r}"
             )
+            return
+        finally:
+            self._pending_resource_updates.discard((server_id, uri))
+
+        await self.callbacks.call_resource_updated(server_id, uri, result)
 
     async def _handle_tools_list_changed(
         self, context: MessageContext, notification: ToolListChangedNotification
     ) -> None:
-        """Fetches the updated tools list and calls the registered callback.
+        """Schedules a debounced refresh of the tools list."""
+        self._list_refresher.trigger((context.server_id, "tools"))
+
+    async def _refresh_tools_list(self, server_id: str) -> None:
+        """Refreshes the tools catalog and calls the registered callback.
 
         Note:
             Only calls the callback if the request succeeds with valid results.
@@ -513,28 +840,191 @@ class ClientSession:
             disrupting the session.
         """
         try:
-            list_tools_result = await self.send_request(
-                context.server_id, ListToolsRequest()
-            )
-            if isinstance(list_tools_result, ListToolsResult):
-                server_state = self.server_manager.get_server(context.server_id)
-                if server_state is not None:
-                    server_state.tools = list_tools_result.tools
-                await self.callbacks.call_tools_changed(
-                    context.server_id, list_tools_result.tools
-                )
+            tools = await self._refresh_catalog(server_id, "tools")
+            if tools is not None:
+                await self.callbacks.call_tools_changed(server_id, tools)
         except Exception as e:
             self.logger.info(
                 f"Failed to handle tools list changed notification from server "
-                f"{context.server_id}: {e!r}"
+                f"{server_id}: {e!r}"
             )
 
+    async def _run_list_refresh(self, key: tuple[str, str]) -> None:
+        """Runs the refresh a debounced list_changed burst asked for."""
+        server_id, kind = key
+        if kind == "tools":
+            await self._refresh_tools_list(server_id)
+        elif kind == "prompts":
+            await self._refresh_prompts_list(server_id)
+        else:
+            await self._refresh_resources_list(server_id)
+
+    def list_refresh_stats(self) -> DebounceStats:
+        """Counters for list_changed refetches, including suppressed ones."""
+        return self._list_refresher.stats()
+
     async def _handle_logging_message(
         self, context: MessageContext, notification: LoggingMessageNotification
     ) -> None:
         """Calls the registered callback for logging messages."""
         await self.callbacks.call_logging_message(context.server_id, notification)
 
+    # ================================
+    # Catalogs
+    # ================================
+
+    async def refresh_catalogs(self, server_id: str) -> ServerCatalogs:
+        """Fetch every list the server advertises, concurrently per list type.
+
+        Follows pagination to the end of each list, updates the server's
+        catalogs, and reports non-empty diffs to the catalog changed callback.
+        Lists that fail to load keep their previous contents.
+
+        Args:
+            server_id: The server to refresh.
+
+        Returns:
+            The server's catalogs.
+
+        Raises:
+            ValueError: If the server isn't initialized.
+        """
+        server_state = self.server_manager.get_server(server_id)
+        if server_state is None or not server_state.initialized:
+            raise ValueError(f"Server {server_id} is not initialized")
+
+        capabilities = server_state.capabilities
+        kinds: list[str] = []
+        if capabilities is not None and capabilities.tools is not None:
+            kinds.append("tools")
+        if capabilities is not None and capabilities.prompts is not None:
+            kinds.append("prompts")
+        if capabilities is not None and capabilities.resources is not None:
+            kinds.extend(["resources", "resource_templates"])
+
+        outcomes = await asyncio.gather(
+            *(self._refresh_catalog(server_id, kind) for kind in kinds),
+            return_exceptions=True,
+        )
+        for kind, outcome in zip(kinds, outcomes):
+            if isinstance(outcome, BaseException) or outcome is None:
+                self.logger.info(
+                    f"Failed to fetch {kind} from server {server_id}: {outcome!r}"
+                )
+        return server_state.catalogs
+
+    async def _refresh_catalog(self, server_id: str, kind: str) -> list[Any] | None:
+        """Fetch all pages of one list and apply it to the server's catalog.
+
+        Returns:
+            The full list, or None if the server answered with an error.
+
+        Raises:
+            Exception: Whatever sending the requests raised.
+        """
+        fetched = await fetch_all_pages(
+            lambda request: self.send_request(server_id, request), kind
+        )
+        if isinstance(fetched, Error):
+            return None
+
+        server_state = self.server_manager.get_server(server_id)
+        if server_state is not None:
+            diff = server_state.catalogs.get(kind).replace(fetched)
+            setattr(server_state, kind, fetched)
+            if kind == "tools":
+                self.tool_index.update_server(server_id, fetched)
+            if not diff.empty:
+                await self.callbacks.call_catalog_changed(server_id, diff)
+        return fetched
+
+    # ================================
+    # Resources
+    # ================================
+
+    async def read_resource(self, server_id: str, uri: str) -> ReadResourceResult:
+        """Read a resource, served from the cache while it's current.
+
+        Args:
+            server_id: The server that owns the resource.
+            uri: The resource URI.
+
+        Returns:
+            ReadResourceResult: The resource contents.
+
+        Raises:
+            ResourceReadError: If the server answered with an error.
+            ConnectionError: If the transport fails.
+            TimeoutError: If server doesn't respond within timeout.
+        """
+        return await self.resource_cache.get(server_id, uri)
+
+    async def watch_resource(
+        self, server_id: str, uri: str
+    ) -> AsyncIterator[ReadResourceResult]:
+        """Yield a resource's contents now and whenever the server updates it.
+
+        Subscribes to the resource while the first watcher is active, if the
+        server supports subscriptions, and unsubscribes after the last one
+        leaves. Ends when the server disconnects.
+
+            async for contents in session.watch_resource("files", uri):
+                render(contents)
+
+        Args:
+            server_id: The server that owns the resource.
+            uri: The resource URI.
+
+        Yields:
+            ReadResourceResult: The latest contents. Slow readers skip to the
+                newest version.
+        """
+        subscribe = self._supports_resource_subscriptions(
+            server_id
+        ) and not self.resource_cache.is_watched(server_id, uri)
+        if subscribe:
+            await self._send_subscription(server_id, SubscribeRequest(uri=uri))
+        try:
+            async with aclosing(self.resource_cache.watch(server_id, uri)) as updates:
+                async for contents in updates:
+                    yield contents
+        finally:
+            if self._supports_resource_subscriptions(
+                server_id
+            ) and not self.resource_cache.is_watched(server_id, uri):
+                await self._send_subscription(server_id, UnsubscribeRequest(uri=uri))
+
+    async def _fetch_resource(self, server_id: str, uri: str) -> ReadResourceResult:
+        """Read a resource from the server for the cache."""
+        result = await self.send_request(server_id, ReadResourceRequest(uri=uri))
+        if isinstance(result, Error):
+            raise ResourceReadError(server_id, uri, result)
+        return cast(ReadResourceResult, result)
+
+    def _supports_resource_subscriptions(self, server_id: str) -> bool:
+        server_state = self.server_manager.get_server(server_id)
+        if server_state is None or server_state.capabilities is None:
+            return False
+        resources = server_state.capabilities.resources
+        return resources is not None and bool(resources.subscribe)
+
+    async def _send_subscription(
+        self, server_id: str, request: SubscribeRequest | UnsubscribeRequest
+    ) -> None:
+        """Sends a (un)subscribe request. Failures are logged, not raised."""
+        try:
+            result = await self.send_request(server_id, request)
+            if isinstance(result, Error):
+                self.logger.info(
+                    f"Server {server_id} refused {request.method} for "
+                    f"{request.uri}: {result.message}"
+                )
+        except Exception as e:
+            self.logger.info(
+                f"Failed to send {request.method} for {request.uri} to server "
+                f"{server_id}: {e!r}"
+            )
+
     # ================================
     # Send messages
     # ================================
@@ -571,6 +1061,303 @@ class ClientSession:
 
         return await self._coordinator.send_request(server_id, request, timeout)
 
+    async def call_tool(
+        self,
+        name: str,
+        arguments: dict[str, Any] | None = None,
+        timeout: float = 30.0,
+    ) -> CallToolResult | Error:
+        """Call a tool on whichever connected server offers it.
+
+        Looks the name up in tool_index, which follows every server's tools
+        catalog. Pass a qualified name (server ID, separator, tool name) to pick
+        a server when several offer the same tool. On a miss, servers that
+        advertise tools but haven't had them fetched yet, as right after
+        connect_server, are asked for their tools and the name is looked up
+        again.
+
+        Args:
+            name: Bare or qualified tool name.
+            arguments: Tool arguments.
+            timeout: Maximum time to wait for response in seconds (default 30s).
+
+        Returns:
+            CallToolResult | Error: The server's response.
+
+        Raises:
+            UnknownToolError: If no indexed server offers the tool.
+            AmbiguousToolError: If the bare name is shared and the collision
+                policy is "error".
+            ConnectionError: If the transport fails.
+            TimeoutError: If server doesn't respond within timeout.
+        """
+        try:
+            server_id, tool = self.tool_index.resolve(name)
+        except UnknownToolError:
+            if not await self._fetch_unlisted_tools():
+                raise
+            server_id, tool = self.tool_index.resolve(name)
+        result = await self.send_request(
+            server_id, CallToolRequest(name=tool.name, arguments=arguments), timeout
+        )
+        return cast(CallToolResult | Error, result)
+
+    async def _fetch_unlisted_tools(self) -> bool:
+        """Fetch tools from initialized servers whose tools were never listed.
+
+        Returns:
+            True if any server was asked.
+        """
+        server_ids = []
+        for server_id in self.server_manager.get_server_ids():
+            server_state = self.server_manager.get_server(server_id)
+            if (
+                server_state is not None
+                and server_state.initialized
+                and server_state.tools is None
+                and server_state.capabilities is not None
+                and server_state.capabilities.tools is not None
+            ):
+                server_ids.append(server_id)
+
+        outcomes = await asyncio.gather(
+            *(self._refresh_catalog(server_id, "tools") for server_id in server_ids),
+            return_exceptions=True,
+        )
+        for server_id, outcome in zip(server_ids, outcomes):
+            if isinstance(outcome, BaseException) or outcome is None:
+                self.logger.info(
+                    f"Failed to fetch tools from server {server_id}: {outcome!r}"
+                )
+        return bool(server_ids)
+
+    async def broadcast_request(
+        self,
+        request: Request,
+        server_ids: list[str] | None = None,
+        timeout: float = 30.0,
+        max_concurrency: int = 16,
+    ) -> AsyncIterator[BroadcastResult]:
+        """Send the same request to many servers and yield outcomes as they land.
+
+        At most max_concurrency requests are outstanding at once, and each one
+        gets its own timeout once sent, so total latency is bounded by the
+        slowest servers under the cap rather than the sum over servers. Failures
+        (timeouts, transport errors, uninitialized servers) are reported per
+        server and never stop the rest.
+
+            async for outcome in session.broadcast_request(ListToolsRequest()):
+                if outcome.ok:
+                    ...
+
+        Leaving the loop early cancels requests still outstanding, once the
+        generator is closed. Wrap it in contextlib.aclosing() to close it
+        promptly.
+
+        Args:
+            request: The request to send to every server.
+            server_ids: Servers to target. Defaults to every initialized server.
+            timeout: Per-server response deadline in seconds (default 30s).
+            max_concurrency: Maximum requests outstanding at once.
+
+        Yields:
+            BroadcastResult: One per server, in completion order.
+
+        Raises:
+            ValueError: If max_concurrency is not positive.
+        """
+        if max_concurrency <= 0:
+            raise ValueError("max_concurrency must be positive")
+
+        await self._start()
+
+        if server_ids is None:
+            server_ids = [
+                server_id
+                for server_id in self.server_manager.get_server_ids()
+                if self.server_manager.is_protocol_initialized(server_id)
+            ]
+
+        slots = asyncio.Semaphore(max_concurrency)
+        outcomes: asyncio.Queue[BroadcastResult] = asyncio.Queue()
+
+        async def send_one(server_id: str) -> None:
+            async with slots:
+                started = time.perf_counter()
+                try:
+                    response = await self.send_request(server_id, request, timeout)
+                    outcome = BroadcastResult(server_id, response=response)
+                except Exception as e:
+                    outcome = BroadcastResult(server_id, exception=e)
+                outcome.elapsed = time.perf_counter() - started
+            outcomes.put_nowait(outcome)
+
+        tasks = [
+            asyncio.create_task(send_one(server_id), name=f"broadcast_{server_id}")
+            for server_id in server_ids
+        ]
+        try:
+            for _ in tasks:
+                yield await outcomes.get()
+        finally:
+            for task in tasks:
+                task.cancel()
+
+    async def send_group_request(
+        self, group_id: str, request: Request, timeout: float = 30.0
+    ) -> Result | Error:
+        """Send a request to whichever member of a server group the policy picks.
+
+        Timeouts, transport errors, and internal error responses count against
+        the member's health; members that fail too often are ejected for a
+        while.
+
+        Args:
+            group_id: The group to send the request to.
+            request: The request to send.
+            timeout: Maximum time to wait for response in seconds (default 30s).
+
+        Returns:
+            Result | Error: The member's response.
+
+        Raises:
+            ValueError: If the group doesn't exist.
+            EmptyServerGroupError: If the group has no members left.
+            ConnectionError: If the transport fails.
+            TimeoutError: If the member doesn't respond within timeout.
+        """
+        group = self.server_groups.get(group_id)
+        if group is None:
+            raise ValueError(f"Unknown server group: {group_id}")
+
+        server_id = group.choose()
+        try:
+            response = await self.send_request(server_id, request, timeout)
+        except (TimeoutError, ConnectionError):
+            group.record(server_id, ok=False)
+            raise
+        failed = isinstance(response, Error) and response.code == INTERNAL_ERROR
+        group.record(server_id, ok=not failed)
+        return response
+
+    async def send_hedged_request(
+        self,
+        request: Request,
+        server_ids: list[str],
+        delay: float | None = None,
+        quantile: float = 0.95,
+        timeout: float = 30.0,
+    ) -> HedgedResult:
+        """Send a read-only request to replicas and take the fastest answer.
+
+        The request goes to server_ids[0] first. If no answer has arrived after
+        the hedge delay, it also goes to the next replica, and so on down the
+        list. The first answer wins, including error responses; requests still
+        outstanding are cancelled on their servers with a CancelledNotification.
+        A replica that fails (timeout, transport error) hands over to the next
+        one straight away.
+
+        Without an explicit delay, the hedge fires at the primary's recent
+        response time quantile (p95 by default) for the request's method, so
+        only the slowest few percent of requests pay for a second send. Until
+        the primary has answered MIN_HEDGE_SAMPLES requests of that method,
+        DEFAULT_HEDGE_DELAY is used.
+
+        Args:
+            request: A read-only request. See HEDGEABLE_METHODS.
+            server_ids: Replicas of one logical server, primary first.
+            delay: Seconds to wait before each hedge. Defaults to the
+                primary's latency quantile.
+            quantile: Latency quantile to derive the delay from.
+            timeout: Overall deadline in seconds (default 30s).
+
+        Returns:
+            HedgedResult: The first answer and the replica that gave it.
+
+        Raises:
+            ValueError: If the request isn't safe to repeat, server_ids is
+                empty, or a replica isn't initialized.
+            Exception: What the last replica raised, if none answered.
+        """
+        if not server_ids:
+            raise ValueError("send_hedged_request needs at least one server")
+        self._check_hedgeable(request, server_ids[0])
+        for server_id in server_ids:
+            if not self.server_manager.is_protocol_initialized(server_id):
+                raise ValueError(f"Cannot hedge to uninitialized server {server_id}")
+        await self._start()
+
+        if delay is None:
+            delay = self.server_manager.response_time_quantile(
+                server_ids[0], request.method, quantile, min_samples=MIN_HEDGE_SAMPLES
+            )
+            if delay is None:
+                delay = DEFAULT_HEDGE_DELAY
+
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + timeout
+        outstanding: dict[asyncio.Task[Result | Error], str] = {}
+        launched = 0
+
+        def launch_next() -> None:
+            nonlocal launched
+            server_id = server_ids[launched]
+            launched += 1
+            remaining = max(deadline - loop.time(), 0.0)
+            task = asyncio.create_task(
+                self._coordinator.send_request(server_id, request, remaining),
+                name=f"hedge_{request.method}_{server_id}",
+            )
+            outstanding[task] = server_id
+
+        launch_next()
+        last_exception: BaseException | None = None
+        try:
+            while outstanding:
+                can_hedge = launched < len(server_ids)
+                done, _ = await asyncio.wait(
+                    outstanding,
+                    timeout=delay if can_hedge else None,
+                    return_when=asyncio.FIRST_COMPLETED,
+                )
+                if not done:
+                    launch_next()
+                    continue
+                for task in done:
+                    server_id = outstanding.pop(task)
+                    if task.exception() is None:
+                        return HedgedResult(server_id, task.result(), launched)
+                    last_exception = task.exception()
+                    self.logger.debug(
+                        f"Hedged {request.method} to {server_id} failed: "
+                        f"{last_exception!r}"
+                    )
+                if launched < len(server_ids):
+                    launch_next()
+        finally:
+            for task in outstanding:
+                task.cancel()
+
+        assert last_exception is not None
+        raise last_exception
+
+    def _check_hedgeable(self, request: Request, server_id: str) -> None:
+        """Raise ValueError unless the request is safe to send twice."""
+        if request.method in HEDGEABLE_METHODS:
+            return
+        if isinstance(request, CallToolRequest):
+            server_state = self.server_manager.get_server(server_id)
+            if server_state is not None:
+                tool = server_state.catalogs.tools.get(request.name)
+                hints = tool.annotations if tool is not None else None
+                if hints is not None and (
+                    hints.read_only_hint or hints.idempotent_hint
+                ):
+                    return
+        raise ValueError(
+            f"Refusing to hedge {request.method}: it may not be safe to repeat"
+        )
+
     async def send_notification(
         self, server_id: str, notification: Notification
     ) -> None:
@@ -587,6 +1374,24 @@ class ClientSession:
 
         await self._coordinator.send_notification(server_id, notification)
 
+    # ================================
+    # Middleware
+    # ================================
+
+    def add_request_middleware(self, middleware: RequestMiddleware) -> None:
+        """Add middleware around every request handler.
+
+        See MessageCoordinator.add_request_middleware.
+        """
+        self._coordinator.add_request_middleware(middleware)
+
+    def add_notification_middleware(self, middleware: NotificationMiddleware) -> None:
+        """Add middleware around every notification handler.
+
+        See MessageCoordinator.add_notification_middleware.
+        """
+        self._coordinator.add_notification_middleware(middleware)
+
     # ================================
     # Register handlers
     # ================================
@@ -0,0 +1,185 @@
+"""Tools from every connected server, addressable by name.
+
+Every tool is reachable by its qualified name, `<server_id><separator><tool>`.
+A tool is also reachable by its bare name when only one server offers it. When
+several servers offer the same name, the collision policy decides who owns the
+bare name:
+
+- "first": the server that started offering it first.
+- "last": the server that started offering it most recently.
+- "error": nobody; resolving the bare name raises AmbiguousToolError.
+
+A server's place is set when a name first appears in its tool list. Refreshing
+a list that still contains the name keeps the place; dropping the name and
+offering it again moves the server to the back.
+
+Lookups are dict hits. Updates cost time proportional to the tools of the
+server being updated.
+"""
+
+from dataclasses import dataclass
+from typing import Literal
+
+from conduit.protocol.tools import Tool
+
+CollisionPolicy = Literal["first", "last", "error"]
+
+
+class UnknownToolError(LookupError):
+    """No connected server offers a tool by this name."""
+
+    def __init__(self, name: str):
+        self.name = name
+        super().__init__(f"Unknown tool: {name}")
+
+
+class AmbiguousToolError(LookupError):
+    """Several servers offer this tool and the policy won't pick one."""
+
+    def __init__(self, name: str, server_ids: list[str]):
+        self.name = name
+        self.server_ids = server_ids
+        super().__init__(
+            f"Tool {name} is offered by several servers ({', '.join(server_ids)}). "
+            "Use a qualified name."
+        )
+
+
+@dataclass(frozen=True)
+class IndexedTool:
+    """A tool and the server that offers it."""
+
+    server_id: str
+    tool: Tool
+    exposed_name: str  # Bare name if this server owns it, else qualified
+
+
+class ToolIndex:
+    """Name-to-server index over the tools of all connected servers."""
+
+    def __init__(
+        self, collision_policy: CollisionPolicy = "error", separator: str = "__"
+    ) -> None:
+        """Initialize an empty index.
+
+        Args:
+            collision_policy: Who gets a bare name several servers share.
+            separator: Joins server ID and tool name in qualified names.
+        """
+        if collision_policy not in ("first", "last", "error"):
+            raise ValueError(f"Unknown collision policy: {collision_policy}")
+        self.collision_policy = collision_policy
+        self.separator = separator
+        self._by_server: dict[str, dict[str, Tool]] = {}
+        self._qualified: dict[str, tuple[str, Tool]] = {}
+        # bare name -> servers offering it, in the order they started to
+        self._owners: dict[str, list[str]] = {}
+
+    # ================================
+    # Maintenance
+    # ================================
+
+    def update_server(self, server_id: str, tools: list[Tool]) -> None:
+        """Replace the tools indexed for a server."""
+        old_tools = self._by_server.get(server_id, {})
+        new_tools = {tool.name: tool for tool in tools}
+
+        for name in old_tools.keys() - new_tools.keys():
+            self._drop(server_id, name)
+        for name, tool in new_tools.items():
+            if name not in old_tools:
+                self._owners.setdefault(name, []).append(server_id)
+            self._qualified[self.qualify(server_id, name)] = (server_id, tool)
+
+        if new_tools:
+            self._by_server[server_id] = new_tools
+        else:
+            self._by_server.pop(server_id, None)
+
+    def remove_server(self, server_id: str) -> None:
+        """Forget every tool from a server."""
+        for name in self._by_server.pop(server_id, {}):
+            self._drop(server_id, name)
+
+    def _drop(self, server_id: str, name: str) -> None:
+        self._qualified.pop(self.qualify(server_id, name), None)
+        owners = self._owners.get(name)
+        if owners is None:
+            return
+        owners.remove(server_id)
+        if not owners:
+            del self._owners[name]
+
+    # ================================
+    # Lookup
+    # ================================
+
+    def qualify(self, server_id: str, name: str) -> str:
+        """Qualified name for a server's tool."""
+        return f"{server_id}{self.separator}{name}"
+
+    def resolve(self, name: str) -> tuple[str, Tool]:
+        """Find the server and tool for a bare or qualified name.
+
+        Bare names win over qualified names that happen to look the same.
+
+        Returns:
+            (server_id, tool)
+
+        Raises:
+            UnknownToolError: If no server offers the tool.
+            AmbiguousToolError: If the bare name is shared and the policy is
+                "error".
+        """
+        owner = self._bare_owner(name)
+        if owner is not None:
+            return owner, self._by_server[owner][name]
+        qualified = self._qualified.get(name)
+        if qualified is not None:
+            return qualified
+        raise UnknownToolError(name)
+
+    def get(self, name: str) -> tuple[str, Tool] | None:
+        """Like resolve(), but returns None instead of raising."""
+        try:
+            return self.resolve(name)
+        except LookupError:
+            return None
+
+    def tools(self) -> list[IndexedTool]:
+        """Every indexed tool, with the name to present it under."""
+        entries = []
+        for server_id, tools in self._by_server.items():
+            for name, tool in tools.items():
+                owns_name = self._owner_or_none(name) == server_id
+                exposed = name if owns_name else self.qualify(server_id, name)
+                entries.append(IndexedTool(server_id, tool, exposed))
+        return entries
+
+    def server_ids_for(self, name: str) -> list[str]:
+        """Servers offering a bare tool name, in the order they started to."""
+        return list(self._owners.get(name, ()))
+
+    def __len__(self) -> int:
+        return len(self._qualified)
+
+    def __contains__(self, name: object) -> bool:
+        return isinstance(name, str) and self.get(name) is not None
+
+    def _bare_owner(self, name: str) -> str | None:
+        owners = self._owners.get(name)
+        if owners and len(owners) > 1 and self.collision_policy == "error":
+            raise AmbiguousToolError(name, list(owners))
+        return self._owner_or_none(name)
+
+    def _owner_or_none(self, name: str) -> str | None:
+        owners = self._owners.get(name)
+        if not owners:
+            return None
+        if len(owners) == 1:
+            return owners[0]
+        if self.collision_policy == "first":
+            return owners[0]
+        if self.collision_policy == "last":
+            return owners[-1]
+        return None
@@ -344,6 +344,8 @@ INVALID_PARAMS = -32602
 INTERNAL_ERROR = -32603
 # Custom error codes
 PROTOCOL_VERSION_MISMATCH = -32001
+SERVER_DRAINING = -32002  # Retryable: the server is shutting down
+OVERLOADED = -32003  # Retryable: too many requests in flight
 
 
 class Error(ProtocolModel):
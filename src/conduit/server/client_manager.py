@@ -4,7 +4,7 @@ from dataclasses import dataclass
 from conduit.protocol.base import Error, Request, Result
 from conduit.protocol.initialization import ClientCapabilities, Implementation
 from conduit.protocol.roots import Root
-from conduit.shared.request_tracker import RequestTracker
+from conduit.shared.request_tracker import RequestId, RequestTracker
 
 
 @dataclass
@@ -82,10 +82,18 @@ class ClientManager:
     # Outbound requests
     # ================================
 
+    def next_request_id(self) -> int:
+        """Allocate the ID for our next request to a client.
+
+        Returns:
+            An integer request ID, never used before for any client.
+        """
+        return self.request_tracker.next_request_id()
+
     def track_request_to_client(
         self,
         client_id: str,
-        request_id: str,
+        request_id: RequestId,
         request: Request,
         future: asyncio.Future[Result | Error],
     ) -> None:
@@ -109,7 +117,7 @@ class ClientManager:
         )
 
     def get_request_to_client(
-        self, client_id: str, request_id: str
+        self, client_id: str, request_id: RequestId
     ) -> tuple[Request, asyncio.Future[Result | Error]] | None:
         """Get a pending request without removing it.
 
@@ -123,7 +131,7 @@ class ClientManager:
         return self.request_tracker.get_outbound_request(client_id, request_id)
 
     def resolve_request_to_client(
-        self, client_id: str, request_id: str, result_or_error: Result | Error
+        self, client_id: str, request_id: RequestId, result_or_error: Result | Error
     ) -> None:
         """Resolve a pending request with a result or error.
 
@@ -136,7 +144,7 @@ class ClientManager:
             client_id, request_id, result_or_error
         )
 
-    def remove_request_to_client(self, client_id: str, request_id: str) -> None:
+    def remove_request_to_client(self, client_id: str, request_id: RequestId) -> None:
         """Stop tracking a request to the client.
 
         Args:
@@ -152,7 +160,7 @@ class ClientManager:
     def track_request_from_client(
         self,
         client_id: str,
-        request_id: str | int,
+        request_id: RequestId,
         request: Request,
         task: asyncio.Task[None],
     ) -> None:
@@ -173,7 +181,7 @@ class ClientManager:
         self.request_tracker.track_inbound_request(client_id, request_id, request, task)
 
     def get_request_from_client(
-        self, client_id: str, request_id: str | int
+        self, client_id: str, request_id: RequestId
     ) -> tuple[Request, asyncio.Task[None]] | None:
         """Get a request from client without removing it.
 
@@ -186,7 +194,7 @@ class ClientManager:
         """
         return self.request_tracker.get_inbound_request(client_id, request_id)
 
-    def cancel_request_from_client(self, client_id: str, request_id: str | int) -> None:
+    def cancel_request_from_client(self, client_id: str, request_id: RequestId) -> None:
         """Cancel a request from the client.
 
         Args:
@@ -195,7 +203,7 @@ class ClientManager:
         """
         self.request_tracker.cancel_inbound_request(client_id, request_id)
 
-    def remove_request_from_client(self, client_id: str, request_id: str | int) -> None:
+    def remove_request_from_client(self, client_id: str, request_id: RequestId) -> None:
         """Stop tracking a request from the client.
 
         Cancels the request as well.
@@ -6,13 +6,15 @@ the session focused on protocol logic rather than message processing.
 
 import asyncio
 import logging
-import uuid
+import time
 from collections.abc import Coroutine
 from typing import Any, Awaitable, Callable, TypeVar
 
 from conduit.protocol.base import (
     INTERNAL_ERROR,
     METHOD_NOT_FOUND,
+    OVERLOADED,
+    SERVER_DRAINING,
     Error,
     Notification,
     Request,
@@ -27,7 +29,22 @@ from conduit.protocol.jsonrpc import (
 )
 from conduit.server.client_manager import ClientManager
 from conduit.server.message_context import MessageContext
+from conduit.server.metrics import ServerMetrics
 from conduit.shared.message_parser import MessageParser
+from conduit.shared.middleware import chain_middleware
+from conduit.shared.priority import (
+    DROPPABLE_NOTIFICATIONS,
+    MessagePriority,
+    priority_for_method,
+)
+from conduit.shared.request_tracker import RequestId
+from conduit.shared.task_supervisor import TaskSupervisor
+from conduit.shared.timing_wheel import TimingWheel
+from conduit.shared.tracing import (
+    Tracer,
+    extract_trace_context,
+    inject_trace_context,
+)
 from conduit.transport.server import ClientMessage, ServerTransport, TransportContext
 
 TRequest = TypeVar("TRequest", bound=Request)
@@ -38,6 +55,12 @@ RequestHandler = Callable[[MessageContext, TRequest], Awaitable[TResult | Error]
 NotificationHandler = Callable[
     [MessageContext, TNotification], Coroutine[Any, Any, None]
 ]
+RequestMiddleware = Callable[
+    [MessageContext, TRequest, RequestHandler], Awaitable[TResult | Error]
+]
+NotificationMiddleware = Callable[
+    [MessageContext, TNotification, NotificationHandler], Awaitable[None]
+]
 
 
 class MessageCoordinator:
@@ -48,15 +71,50 @@ class MessageCoordinator:
     Keeps the session focused on protocol logic.
     """
 
-    def __init__(self, transport: ServerTransport, client_manager: ClientManager):
+    def __init__(
+        self,
+        transport: ServerTransport,
+        client_manager: ClientManager,
+        metrics: ServerMetrics | None = None,
+        tracer: Tracer | None = None,
+        tasks: TaskSupervisor | None = None,
+    ):
         self.transport = transport
         self.client_manager = client_manager
+        self.metrics = metrics or ServerMetrics()
+        self.tracer = tracer or Tracer()
+        self.tasks = tasks or TaskSupervisor()
+        self._register_metrics()
         self.parser = MessageParser()
         self._request_handlers: dict[str, RequestHandler] = {}
         self._notification_handlers: dict[str, NotificationHandler] = {}
+        self._request_middleware: list[RequestMiddleware] = []
+        self._notification_middleware: list[NotificationMiddleware] = []
+        # method -> handler wrapped in middleware, rebuilt on registration
+        self._request_chains: dict[str, RequestHandler] = {}
+        self._notification_chains: dict[str, NotificationHandler] = {}
         self._message_loop_task: asyncio.Task[None] | None = None
+        self._request_timeouts = TimingWheel()
+        self._draining = False
         self.logger = logging.getLogger("conduit.server.coordinator")
 
+    def _register_metrics(self) -> None:
+        """Backs coordinator gauges with the state that already tracks them."""
+        self.metrics.active_clients.set_function(self.client_manager.client_count)
+        self.metrics.handler_tasks.set_function(lambda: self.tasks.live_tasks)
+        self.metrics.queued_notifications.set_function(
+            lambda: self.tasks.stats().queued_in_lanes
+        )
+        self.metrics.rejected_requests.set_function(
+            lambda: self.tasks.stats().rejected_tasks
+        )
+        self.metrics.overflow_tasks.set_function(
+            lambda: self.tasks.stats().overflow_tasks
+        )
+        self.metrics.dropped_notifications.set_function(
+            lambda: self.tasks.stats().dropped_from_lanes
+        )
+
     # ================================
     # Lifecycle
     # ================================
@@ -98,8 +156,27 @@ class MessageCoordinator:
                 pass
             self._message_loop_task = None
 
+        self.tasks.cancel_all()
         self.client_manager.cleanup_all_clients()
 
+    @property
+    def draining(self) -> bool:
+        """True once start_draining() has been called."""
+        return self._draining
+
+    def start_draining(self) -> None:
+        """Refuse new requests while letting in-flight work finish.
+
+        New requests (other than ping) get a retryable SERVER_DRAINING error.
+        Responses and notifications are still processed, so handlers waiting on
+        the client can complete.
+        """
+        self._draining = True
+
+    async def wait_until_idle(self) -> None:
+        """Wait for every in-flight handler task and notification lane to finish."""
+        await self.tasks.wait_idle()
+
     # ================================
     # Message loop
     # ================================
@@ -132,6 +209,7 @@ class MessageCoordinator:
         """
         self._message_loop_task = None
 
+        self.tasks.cancel_all()
         self.client_manager.cleanup_all_clients()
 
     # ================================
@@ -177,14 +255,21 @@ class MessageCoordinator:
         payload = client_message.payload
         client_id = client_message.client_id
 
-        if self.parser.is_valid_request(payload):
-            await self._handle_request(client_id, payload)
-        elif self.parser.is_valid_notification(payload):
-            await self._handle_notification(client_id, payload)
-        elif self.parser.is_valid_response(payload):
-            await self._handle_response(client_id, payload)
-        else:
-            self.logger.info(f"Unknown message type from {client_id}: {payload}")
+        # Continue the client's trace if the message carries one in _meta.
+        parent = extract_trace_context(payload) if self.tracer.enabled else None
+        with self.tracer.start_span(
+            "mcp.server.receive",
+            parent=parent,
+            attributes={"mcp.client_id": client_id},
+        ):
+            if self.parser.is_valid_request(payload):
+                await self._handle_request(client_id, payload)
+            elif self.parser.is_valid_notification(payload):
+                await self._handle_notification(client_id, payload)
+            elif self.parser.is_valid_response(payload):
+                await self._handle_response(client_id, payload)
+            else:
+                self.logger.info(f"Unknown message type from {client_id}: {payload}")
 
     # ================================
     # Handle requests
@@ -196,7 +281,8 @@ class MessageCoordinator:
 
         self._ensure_client_registered(client_id)
 
-        request_or_error = self.parser.parse_request(payload)
+        with self.tracer.start_span("mcp.parse"):
+            request_or_error = self.parser.parse_request(payload)
 
         if isinstance(request_or_error, Error):
             transport_context = TransportContext(originating_request_id=request_id)
@@ -215,7 +301,11 @@ class MessageCoordinator:
     ) -> None:
         """Routes an incoming request to the appropriate handler.
 
-        Creates request context and tracks request.
+        Creates request context. Control-plane requests (ping, initialize) run
+        inline on the message loop; everything else runs in a tracked task under
+        the task supervisor. Past its task cap, the request is refused with a
+        retryable OVERLOADED error rather than parking the message loop.
+        While draining, everything but ping is refused with a retryable error.
 
         Args:
             client_id: ID of the client that sent the request
@@ -223,7 +313,16 @@ class MessageCoordinator:
             request: The request object
         """
         transport_context = TransportContext(originating_request_id=request_id)
-        handler = self._request_handlers.get(request.method)
+        if self._draining and request.method != "ping":
+            error = Error(
+                code=SERVER_DRAINING,
+                message="Server is shutting down. Retry on another instance.",
+                data={"retryable": True},
+            )
+            await self._send_error(client_id, request_id, error, transport_context)
+            return
+
+        handler = self._get_request_chain(request.method)
         if not handler:
             error = Error(
                 code=METHOD_NOT_FOUND,
@@ -243,10 +342,24 @@ class MessageCoordinator:
             self.logger.warning(f"Failed to build request context for {client_id}: {e}")
             return
 
-        task = asyncio.create_task(
+        if priority_for_method(request.method) is MessagePriority.CONTROL:
+            # Control-plane requests are cheap and time-sensitive. Handle them on
+            # the message loop so they never wait behind data-plane work.
+            await self._execute_request_handler(handler, context, request_id, request)
+            return
+
+        task = self.tasks.try_spawn(
             self._execute_request_handler(handler, context, request_id, request),
             name=f"handle_{request.method}_{client_id}_{request_id}",
         )
+        if task is None:
+            error = Error(
+                code=OVERLOADED,
+                message="Too many requests in flight. Retry later.",
+                data={"retryable": True},
+            )
+            await self._send_error(client_id, request_id, error, transport_context)
+            return
 
         self.client_manager.track_request_from_client(
             client_id, request_id, request, task
@@ -264,37 +377,76 @@ class MessageCoordinator:
         request_id: str | int,
         request: Request,
     ) -> None:
-        """Executes handler and sends response back to client."""
-        transport_context = TransportContext(originating_request_id=request_id)
-
-        try:
-            result_or_error = await handler(context, request)
+        """Executes handler and sends response back to client.
 
-            if isinstance(result_or_error, Error):
-                response = JSONRPCError.from_error(result_or_error, request_id)
-            else:
-                response = JSONRPCResponse.from_result(result_or_error, request_id)
-
-            await self.transport.send(
-                context.client_id,
-                response.to_wire(),
-                transport_context=transport_context,
-            )
+        Records per-method request count, error count, in-flight gauge, and
+        latency in the coordinator's metrics, and traces the handler, serialize,
+        and send stages.
+        """
+        transport_context = TransportContext(originating_request_id=request_id)
+        method = request.method
+        self.metrics.requests.inc(method)
+        self.metrics.requests_in_flight.inc(method)
+        started = time.perf_counter()
+
+        with self.tracer.start_span(
+            f"mcp.server.request {method}",
+            attributes={
+                "mcp.method": method,
+                "mcp.request_id": request_id,
+                "mcp.client_id": context.client_id,
+            },
+        ) as span:
+            try:
+                with self.tracer.start_span("mcp.handler"):
+                    result_or_error = await handler(context, request)
+
+                with self.tracer.start_span("mcp.serialize"):
+                    if isinstance(result_or_error, Error):
+                        self.metrics.request_errors.inc(method)
+                        span.set_attribute("mcp.error_code", result_or_error.code)
+                        response = JSONRPCError.from_error(result_or_error, request_id)
+                    else:
+                        response = JSONRPCResponse.from_result(
+                            result_or_error, request_id
+                        )
+                    wire_response = response.to_wire()
+
+                with self.tracer.start_span("mcp.send"):
+                    await self.transport.send(
+                        context.client_id,
+                        wire_response,
+                        transport_context=transport_context,
+                    )
 
-        except Exception as e:
-            self.logger.exception(
-                f"Handler failed for {request.method} from {context}: {e}"
-            )
-            error = Error(
-                code=INTERNAL_ERROR,
-                message=f"Handler execution failed: {str(e)}",
-            )
-            response = JSONRPCError.from_error(error, request_id)
-            await self.transport.send(
-                context.client_id,
-                response.to_wire(),
-                transport_context=transport_context,
-            )
+            except Exception as e:
+                self.metrics.request_errors.inc(method)
+                span.record_error(e)
+                self.logger.exception(
+                    f"Handler failed for {request.method} from {context}: {e}"
+                )
+                error = Error(
+                    code=INTERNAL_ERROR,
+                    message=f"Handler execution failed: {str(e)}",
+                )
+                response = JSONRPCError.from_error(error, request_id)
+                try:
+                    await self.transport.send(
+                        context.client_id,
+                        response.to_wire(),
+                        transport_context=transport_context,
+                    )
+                except Exception as send_error:
+                    # E.g. the client left and its request stream is gone
+                    self.logger.warning(
+                        f"Couldn't send error response for {request.method} to "
+                        f"{context}: {send_error}"
+                    )
+            finally:
+                self.metrics.requests_in_flight.dec(method)
+                self.metrics.request_duration.observe(
+                    method, value=time.perf_counter() - started
+                )
 
     # ================================
     # Handle notifications
@@ -304,7 +456,8 @@ class MessageCoordinator:
         self, client_id: str, payload: dict[str, Any]
     ) -> None:
         """Parses and routes an incoming notification to the appropriate handler."""
-        notification = self.parser.parse_notification(payload)
+        with self.tracer.start_span("mcp.parse"):
+            notification = self.parser.parse_notification(payload)
         if notification is None:
             return
 
@@ -318,12 +471,15 @@ class MessageCoordinator:
         """Routes an incoming notification to the appropriate handler.
 
         Creates request context. Fails silently if we can't build the context.
+        Control-plane notifications (e.g. cancellations) run inline on the message
+        loop; everything else is queued on the client's ordered notification lane.
 
         Args:
             client_id: ID of the client that sent the notification
             notification: The notification object
         """
-        handler = self._notification_handlers.get(notification.method)
+        self.metrics.notifications.inc(notification.method)
+        handler = self._get_notification_chain(notification.method)
         if not handler:
             self.logger.info(f"No handler for notification: {notification.method}")
             return
@@ -338,20 +494,29 @@ class MessageCoordinator:
             )
             return
 
-        task = asyncio.create_task(
-            handler(context, notification),
-            name=f"notify_{notification.method}_{client_id}",
-        )
-
-        task.add_done_callback(self._on_notification_done)
+        if priority_for_method(notification.method) is MessagePriority.CONTROL:
+            # Run control-plane notifications inline so that, for example, a
+            # cancellation takes effect before we read the next message.
+            await self._execute_notification_handler(handler, context, notification)
+            return
 
-    def _on_notification_done(self, task: asyncio.Task[None]) -> None:
-        """Handles completed notification tasks.
+        self.tasks.submit_ordered(
+            client_id,
+            self._execute_notification_handler(handler, context, notification),
+            droppable=notification.method in DROPPABLE_NOTIFICATIONS,
+        )
 
-        Logs an error if the notification handler fails.
-        """
-        if task.exception():
-            self.logger.exception(f"Notification handler failed: {task.exception()}")
+    async def _execute_notification_handler(
+        self,
+        handler: NotificationHandler,
+        context: MessageContext,
+        notification: Notification,
+    ) -> None:
+        """Runs a notification handler, logging any failure."""
+        try:
+            await handler(context, notification)
+        except Exception as e:
+            self.logger.exception(f"Notification handler failed: {e}")
 
     # ================================
     # Handle responses
@@ -410,8 +575,12 @@ class MessageCoordinator:
     ) -> Result | Error:
         """Send a request to a specific client and wait for response.
 
-        Generates a unique request ID, sends the request, and waits for the
-        client's response. Handles timeouts with automatic cancellation.
+        Allocates a never-reused integer request ID, sends the request, and
+        waits for the client's response. Timeouts run on a shared timing wheel
+        rather than one timer per request, and trigger automatic cancellation.
+
+        When tracing is enabled, the request carries the current trace context in
+        its _meta so the client's handling joins the same trace.
 
         Args:
             client_id: ID of the client to send the request to
@@ -429,27 +598,45 @@ class MessageCoordinator:
         if not self.running:
             raise RuntimeError("Cannot send request: coordinator is not running")
 
-        # Prepare the request
-        request_id = str(uuid.uuid4())
-        jsonrpc_request = JSONRPCRequest.from_request(request, request_id)
-        future: asyncio.Future[Result | Error] = asyncio.Future()
-
         # Set up tracking
         self._ensure_client_registered(client_id)
+        request_id = self.client_manager.next_request_id()
+        future: asyncio.Future[Result | Error] = (
+            asyncio.get_running_loop().create_future()
+        )
         self.client_manager.track_request_to_client(
             client_id, request_id, request, future
         )
+        timer_id = self._request_timeouts.schedule(
+            timeout, lambda: _expire_future(future)
+        )
 
-        try:
-            await self.transport.send(client_id, jsonrpc_request.to_wire())
-            return await asyncio.wait_for(future, timeout)
-        except asyncio.TimeoutError:
-            await self._handle_request_timeout(client_id, request_id)
-            raise
-        finally:
-            self.client_manager.remove_request_to_client(client_id, request_id)
-
-    async def _handle_request_timeout(self, client_id: str, request_id: str) -> None:
+        with self.tracer.start_span(
+            f"mcp.server.send_request {request.method}",
+            attributes={
+                "mcp.method": request.method,
+                "mcp.request_id": request_id,
+                "mcp.client_id": client_id,
+            },
+        ) as span:
+            try:
+                with self.tracer.start_span("mcp.serialize"):
+                    wire_request = JSONRPCRequest.from_request(
+                        inject_trace_context(request, span), request_id
+                    ).to_wire()
+                with self.tracer.start_span("mcp.send"):
+                    await self.transport.send(client_id, wire_request)
+                return await future
+            except asyncio.TimeoutError:
+                await self._handle_request_timeout(client_id, request_id)
+                raise
+            finally:
+                self._request_timeouts.cancel(timer_id)
+                self.client_manager.remove_request_to_client(client_id, request_id)
+
+    async def _handle_request_timeout(
+        self, client_id: str, request_id: RequestId
+    ) -> None:
         """Cleans up and notifies client when request times out."""
 
         try:
@@ -495,6 +682,7 @@ class MessageCoordinator:
             handler: Async function that takes (client_id, typed_request) and handles it
         """
         self._request_handlers[method] = handler
+        self._request_chains.pop(method, None)
 
     def register_notification_handler(
         self, method: str, handler: NotificationHandler
@@ -507,6 +695,59 @@ class MessageCoordinator:
                 handles it
         """
         self._notification_handlers[method] = handler
+        self._notification_chains.pop(method, None)
+
+    # ================================
+    # Middleware
+    # ================================
+
+    def add_request_middleware(self, middleware: RequestMiddleware) -> None:
+        """Add middleware around every request handler.
+
+        Middleware is called as `middleware(context, request, call_next)` and
+        returns the result or error to send back. The first middleware added is
+        the outermost. Return without awaiting `call_next` to short-circuit the
+        handler.
+
+        Args:
+            middleware: Async callable taking (context, request, call_next)
+        """
+        self._request_middleware.append(middleware)
+        self._request_chains.clear()
+
+    def add_notification_middleware(self, middleware: NotificationMiddleware) -> None:
+        """Add middleware around every notification handler.
+
+        Middleware is called as `middleware(context, notification, call_next)`.
+        The first middleware added is the outermost.
+
+        Args:
+            middleware: Async callable taking (context, notification, call_next)
+        """
+        self._notification_middleware.append(middleware)
+        self._notification_chains.clear()
+
+    def _get_request_chain(self, method: str) -> RequestHandler | None:
+        """Returns the handler for a method wrapped in request middleware."""
+        chain = self._request_chains.get(method)
+        if chain is None:
+            handler = self._request_handlers.get(method)
+            if handler is None:
+                return None
+            chain = chain_middleware(handler, self._request_middleware)
+            self._request_chains[method] = chain
+        return chain
+
+    def _get_notification_chain(self, method: str) -> NotificationHandler | None:
+        """Returns the handler for a method wrapped in notification middleware."""
+        chain = self._notification_chains.get(method)
+        if chain is None:
+            handler = self._notification_handlers.get(method)
+            if handler is None:
+                return None
+            chain = chain_middleware(handler, self._notification_middleware)
+            self._notification_chains[method] = chain
+        return chain
 
     # ================================
     # Helpers
@@ -529,3 +770,9 @@ class MessageCoordinator:
         await self.transport.send(
             client_id, response.to_wire(), transport_context=transport_context
         )
+
+
+def _expire_future(future: asyncio.Future[Result | Error]) -> None:
+    """Fails a pending request future with a timeout."""
+    if not future.done():
+        future.set_exception(asyncio.TimeoutError())
@@ -0,0 +1,94 @@
+"""Standard server metrics.
+
+Groups the metrics a server session records so the coordinator, domain
+managers, and user code agree on names and labels. All of them live in a
+MetricsRegistry that can be shared with the transport and exported with
+`registry.render_prometheus()`.
+"""
+
+from conduit.shared.metrics import MetricsRegistry
+
+
+class ServerMetrics:
+    """Metrics recorded by a server session.
+
+    Per-method metrics are labeled by MCP method (e.g. "tools/call"); per-tool
+    metrics are labeled by tool name.
+    """
+
+    def __init__(self, registry: MetricsRegistry | None = None):
+        self.registry = registry or MetricsRegistry()
+
+        # Requests from clients
+        self.requests = self.registry.counter(
+            "mcp_server_requests_total",
+            "Requests handled, by method.",
+            ("method",),
+        )
+        self.request_errors = self.registry.counter(
+            "mcp_server_request_errors_total",
+            "Requests that returned an error or raised, by method.",
+            ("method",),
+        )
+        self.request_duration = self.registry.histogram(
+            "mcp_server_request_duration_seconds",
+            "Time from dispatch to response, by method.",
+            ("method",),
+        )
+        self.requests_in_flight = self.registry.gauge(
+            "mcp_server_requests_in_flight",
+            "Requests currently being handled, by method.",
+            ("method",),
+        )
+
+        # Notifications from clients
+        self.notifications = self.registry.counter(
+            "mcp_server_notifications_total",
+            "Notifications received, by method.",
+            ("method",),
+        )
+
+        # Tools
+        self.tool_calls = self.registry.counter(
+            "mcp_server_tool_calls_total",
+            "Tool calls executed, by tool.",
+            ("tool",),
+        )
+        self.tool_errors = self.registry.counter(
+            "mcp_server_tool_errors_total",
+            "Tool calls that failed, by tool.",
+            ("tool",),
+        )
+        self.tool_duration = self.registry.histogram(
+            "mcp_server_tool_duration_seconds",
+            "Tool execution time, by tool.",
+            ("tool",),
+        )
+
+        # Handler tasks
+        self.handler_tasks = self.registry.gauge(
+            "mcp_server_handler_tasks",
+            "Live handler tasks, notification lane workers included.",
+        )
+        self.queued_notifications = self.registry.gauge(
+            "mcp_server_queued_notifications",
+            "Notifications waiting in per-client lanes.",
+        )
+        self.rejected_requests = self.registry.counter(
+            "mcp_server_rejected_requests_total",
+            "Requests refused as overloaded because handler tasks were at the cap.",
+        )
+        self.overflow_tasks = self.registry.counter(
+            "mcp_server_overflow_tasks_total",
+            "Lane workers and internal tasks started past the handler task cap.",
+        )
+        self.dropped_notifications = self.registry.counter(
+            "mcp_server_dropped_notifications_total",
+            "Log and progress notifications dropped from full client lanes.",
+        )
+
+        # Clients
+        self.active_clients = self.registry.gauge(
+            "mcp_server_active_clients",
+            "Clients with state on the server.",
+        )
@@ -1,6 +1,7 @@
 """Client-aware tool manager for multi-client server sessions."""
 
 import logging
+import time
 from copy import deepcopy
 from typing import TYPE_CHECKING, Awaitable, Callable
 
@@ -12,6 +13,7 @@ from conduit.protocol.tools import (
     ListToolsResult,
     Tool,
 )
+from conduit.server.metrics import ServerMetrics
 
 if TYPE_CHECKING:
     from conduit.server.message_context import MessageContext
@@ -24,7 +26,8 @@ class ToolManager:
     Manages protocol tool registration and execution for a server.
     """
 
-    def __init__(self):
+    def __init__(self, metrics: ServerMetrics | None = None):
+        self.metrics = metrics or ServerMetrics()
         self.global_tools: dict[str, Tool] = {}
         self.global_handlers: dict[str, ToolHandler] = {}
 
@@ -196,7 +199,8 @@ class ToolManager:
         """Execute a tool call request for a specific client.
 
         Tool execution failures return CallToolResult with is_error=True so the LLM
-        can see what went wrong and potentially recover.
+        can see what went wrong and potentially recover. Records per-tool call
+        count, error count, and execution time.
 
         Args:
             context: Rich request context with client state and helpers
@@ -208,22 +212,30 @@ class ToolManager:
         Raises:
             KeyError: If the requested tool is not registered for this client
         """
+        if (
+            context.client_id in self.client_handlers
+            and request.name in self.client_handlers[context.client_id]
+        ):
+            handler = self.client_handlers[context.client_id][request.name]
+        elif request.name in self.global_handlers:
+            handler = self.global_handlers[request.name]
+        else:
+            raise KeyError(f"Tool '{request.name}' not found")
+
+        self.metrics.tool_calls.inc(request.name)
+        started = time.perf_counter()
         try:
-            if (
-                context.client_id in self.client_handlers
-                and request.name in self.client_handlers[context.client_id]
-            ):
-                handler = self.client_handlers[context.client_id][request.name]
-            elif request.name in self.global_handlers:
-                handler = self.global_handlers[request.name]
-            else:
-                raise KeyError(f"Tool '{request.name}' not found")
-
-            return await handler(context, request)
-        except KeyError:
-            raise
+            result = await handler(context, request)
+            if result.is_error:
+                self.metrics.tool_errors.inc(request.name)
+            return result
         except Exception as e:
+            self.metrics.tool_errors.inc(request.name)
             return CallToolResult(
                 content=[TextContent(text=f"Tool execution failed: {str(e)}")],
                 is_error=True,
             )
+        finally:
+            self.metrics.tool_duration.observe(
+                request.name, value=time.perf_counter() - started
+            )
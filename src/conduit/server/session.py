@@ -5,6 +5,7 @@ and notifications, then registers them with a message coordinator to handle
 the full protocol lifecycle.
 """
 
+import asyncio
 import logging
 import sys
 from dataclasses import dataclass
@@ -66,8 +67,13 @@ from conduit.protocol.tools import (
 )
 from conduit.server.callbacks import CallbackManager
 from conduit.server.client_manager import ClientManager
-from conduit.server.coordinator import MessageCoordinator
+from conduit.server.coordinator import (
+    MessageCoordinator,
+    NotificationMiddleware,
+    RequestMiddleware,
+)
 from conduit.server.message_context import MessageContext
+from conduit.server.metrics import ServerMetrics
 from conduit.server.protocol.completions import (
     CompletionManager,
     CompletionNotConfiguredError,
@@ -76,6 +82,9 @@ from conduit.server.protocol.logging import LoggingManager
 from conduit.server.protocol.prompts import PromptManager
 from conduit.server.protocol.resources import ResourceManager
 from conduit.server.protocol.tools import ToolManager
+from conduit.shared.metrics import MetricsRegistry
+from conduit.shared.task_supervisor import TaskSupervisor
+from conduit.shared.tracing import Tracer
 from conduit.transport.server import ServerTransport
 
 
@@ -85,6 +94,8 @@ class ServerConfig:
     info: Implementation
     instructions: str | None = None
     protocol_version: str = PROTOCOL_VERSION
+    max_handler_tasks: int = 1024
+    max_notification_backlog: int = 256
 
 
 DEFAULT_CONFIG = ServerConfig(
@@ -110,7 +121,13 @@ DEFAULT_CONFIG = ServerConfig(
 class ServerSession:
     """MCP server session handling protocol conversations with clients."""
 
-    def __init__(self, transport: ServerTransport, config: ServerConfig | None = None):
+    def __init__(
+        self,
+        transport: ServerTransport,
+        config: ServerConfig | None = None,
+        metrics: MetricsRegistry | None = None,
+        tracer: Tracer | None = None,
+    ):
         """Initialize the server session.
 
         Registers all protocol handlers with the message processor.
@@ -119,17 +136,25 @@ class ServerSession:
             transport: The transport layer to use for client connections
                 (e.g., stdio, streamable HTTP, etc.)
             config: The server configuration
+            metrics: Registry to record metrics in. Pass the same registry to the
+                transport to export both together. Defaults to a private one.
+            tracer: Tracer for message handling spans. Defaults to a no-op
+                tracer; give it a SpanExporter to record traces.
         """
 
         # Transport and config
         self.transport = transport
         self.server_config = config or DEFAULT_CONFIG
 
+        # Metrics
+        self.metrics = ServerMetrics(metrics)
+        self.tracer = tracer or Tracer()
+
         # Client manager
         self.client_manager = ClientManager()
 
         # Domain managers
-        self.tools = ToolManager()
+        self.tools = ToolManager(self.metrics)
         self.resources = ResourceManager()
         self.prompts = PromptManager()
         self.logging = LoggingManager()
@@ -137,7 +162,16 @@ class ServerSession:
         self.callbacks = CallbackManager()
 
         # Coordinator
-        self._coordinator = MessageCoordinator(transport, self.client_manager)
+        self._coordinator = MessageCoordinator(
+            transport,
+            self.client_manager,
+            self.metrics,
+            self.tracer,
+            TaskSupervisor(
+                max_tasks=self.server_config.max_handler_tasks,
+                max_lane_backlog=self.server_config.max_notification_backlog,
+            ),
+        )
 
         # Configure logging if not already configured
         if not logging.getLogger().handlers:
@@ -150,6 +184,7 @@ class ServerSession:
 
         # Register handlers
         self._register_handlers()
+        transport.disconnect_handler = self._on_client_disconnected
 
     # ================================
     # Lifecycle
@@ -179,6 +214,10 @@ class ServerSession:
         # Clean up client manager
         self.client_manager.cleanup_client(client_id)
 
+    async def _on_client_disconnected(self, client_id: str) -> None:
+        """Drop the state of a client the transport disconnected."""
+        await self._cleanup_client(client_id)
+
     async def disconnect_client(self, client_id: str) -> None:
         """Disconnect a client and clean up all state."""
         await self._cleanup_client(client_id)
@@ -197,6 +236,42 @@ class ServerSession:
 
         await self.transport.close()
 
+    async def drain(self, timeout: float = 30.0) -> bool:
+        """Finish in-flight work, then shut down. For zero-downtime restarts.
+
+        Stops accepting new requests (clients get a retryable SERVER_DRAINING
+        error, or 503 with Retry-After on HTTP), waits for in-flight handlers and
+        queued notifications to finish, flushes pending responses to clients,
+        then disconnects all clients and closes the transport. Work still running
+        at the deadline is cancelled.
+
+        Args:
+            timeout: Seconds to wait for in-flight work before shutting down.
+
+        Returns:
+            True if everything finished before the deadline, False if work had
+            to be cancelled.
+        """
+        self._coordinator.start_draining()
+        await self.transport.start_draining()
+
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + timeout
+        drained = True
+        try:
+            await asyncio.wait_for(self._coordinator.wait_until_idle(), timeout)
+            await asyncio.wait_for(
+                self.transport.flush(), max(deadline - loop.time(), 0)
+            )
+        except asyncio.TimeoutError:
+            drained = False
+            self.logger.warning(
+                f"Drain deadline of {timeout}s reached; cancelling remaining work"
+            )
+
+        await self.disconnect_all_clients()
+        return drained
+
     # ================================
     # Initialization
     # ================================
@@ -622,6 +697,24 @@ class ServerSession:
         await self._start()
         await self._coordinator.send_notification(client_id, notification)
 
+    # ================================
+    # Middleware
+    # ================================
+
+    def add_request_middleware(self, middleware: RequestMiddleware) -> None:
+        """Add middleware around every request handler.
+
+        See MessageCoordinator.add_request_middleware.
+        """
+        self._coordinator.add_request_middleware(middleware)
+
+    def add_notification_middleware(self, middleware: NotificationMiddleware) -> None:
+        """Add middleware around every notification handler.
+
+        See MessageCoordinator.add_notification_middleware.
+        """
+        self._coordinator.add_notification_middleware(middleware)
+
     # ================================
     # Register handlers
     # ================================
@@ -0,0 +1,149 @@
+"""Per-key trailing-edge debouncing for refresh work.
+
+A server that changes its tool list in a loop sends a list_changed notification
+per change. Refetching on each one means N overlapping fetches of the same list.
+The Debouncer collapses a burst into one run per key: it waits until triggers
+stop arriving for `delay` seconds (or `max_delay` has passed since the first),
+then runs once. Triggers that arrive while a run is in flight schedule exactly
+one trailing run after it, so the last change is never missed and at most one
+run per key is in flight.
+"""
+
+import asyncio
+import logging
+from collections.abc import Hashable
+from dataclasses import dataclass
+from typing import Awaitable, Callable, Generic, TypeVar
+
+K = TypeVar("K", bound=Hashable)
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class DebounceStats:
+    """Counters for a Debouncer."""
+
+    triggers: int = 0
+    runs: int = 0
+    suppressed: int = 0  # Triggers folded into a run another trigger scheduled
+    pending_keys: int = 0
+
+
+@dataclass(eq=False)
+class _KeyState:
+    first_trigger: float
+    timer: asyncio.TimerHandle | None = None
+    task: asyncio.Task[None] | None = None
+    dirty: bool = False  # Triggered while running; run again afterwards
+
+
+class Debouncer(Generic[K]):
+    """Runs an async callback per key, at most once per burst of triggers."""
+
+    def __init__(
+        self,
+        run: Callable[[K], Awaitable[None]],
+        delay: float = 0.1,
+        max_delay: float = 1.0,
+    ) -> None:
+        """Initialize the debouncer.
+
+        Args:
+            run: Called with the key once a burst settles. Failures are logged.
+            delay: Quiet period that ends a burst, in seconds.
+            max_delay: Longest a burst can postpone its run, in seconds.
+        """
+        if delay < 0 or max_delay < delay:
+            raise ValueError("Need 0 <= delay <= max_delay")
+        self._run = run
+        self.delay = delay
+        self.max_delay = max_delay
+        self._states: dict[K, _KeyState] = {}
+        self._idle_changed = asyncio.Event()
+        self._triggers = 0
+        self._runs = 0
+        self._suppressed = 0
+
+    def stats(self) -> DebounceStats:
+        """Snapshot of the debouncer's counters."""
+        return DebounceStats(
+            triggers=self._triggers,
+            runs=self._runs,
+            suppressed=self._suppressed,
+            pending_keys=len(self._states),
+        )
+
+    def trigger(self, key: K) -> None:
+        """Ask for a run for this key. Returns immediately."""
+        self._triggers += 1
+        loop = asyncio.get_running_loop()
+        state = self._states.get(key)
+
+        if state is None:
+            state = _KeyState(first_trigger=loop.time())
+            self._states[key] = state
+            state.timer = loop.call_later(self.delay, self._start, key, state)
+            return
+
+        if state.timer is not None:
+            self._suppressed += 1
+            state.timer.cancel()
+            fire_at = min(
+                loop.time() + self.delay, state.first_trigger + self.max_delay
+            )
+            state.timer = loop.call_at(fire_at, self._start, key, state)
+            return
+
+        # A run is in flight
+        if state.dirty:
+            self._suppressed += 1
+        state.dirty = True
+
+    def cancel(self, key: K) -> None:
+        """Drop pending and in-flight work for a key."""
+        state = self._states.pop(key, None)
+        if state is None:
+            return
+        if state.timer is not None:
+            state.timer.cancel()
+        if state.task is not None:
+            state.task.cancel()
+        self._idle_changed.set()
+
+    def cancel_all(self) -> None:
+        """Drop pending and in-flight work for every key."""
+        for key in list(self._states):
+            self.cancel(key)
+
+    async def wait_idle(self) -> None:
+        """Wait until no key has pending or in-flight work."""
+        while self._states:
+            self._idle_changed.clear()
+            await self._idle_changed.wait()
+
+    def _start(self, key: K, state: _KeyState) -> None:
+        state.timer = None
+        self._runs += 1
+        state.task = asyncio.create_task(
+            self._run_key(key, state), name=f"debounced_{key}"
+        )
+
+    async def _run_key(self, key: K, state: _KeyState) -> None:
+        try:
+            await self._run(key)
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logger.exception(f"Debounced run for {key} failed: {e}")
+        finally:
+            state.task = None
+            if self._states.get(key) is state:
+                if state.dirty:
+                    state.dirty = False
+                    loop = asyncio.get_running_loop()
+                    state.first_trigger = loop.time()
+                    state.timer = loop.call_later(self.delay, self._start, key, state)
+                else:
+                    del self._states[key]
+                    self._idle_changed.set()
@@ -0,0 +1,331 @@
+"""In-process metrics with Prometheus text export.
+
+A deliberately small subset of the Prometheus data model: counters, gauges,
+and histograms, each optionally split by label values. Recording a sample is a
+dict lookup and an addition, so instrumentation can stay on in production.
+
+Metrics live in a MetricsRegistry. Read them from Python through the metric
+objects, or render the whole registry in the Prometheus text exposition format
+for scraping.
+"""
+
+import bisect
+import math
+from typing import Callable, TypeVar
+
+LabelValues = tuple[str, ...]
+
+DEFAULT_LATENCY_BUCKETS = (
+    0.001,
+    0.0025,
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+    30.0,
+)
+
+
+class Metric:
+    """Base class for a named metric with an optional set of label names."""
+
+    type_name = "untyped"
+
+    def __init__(
+        self, name: str, documentation: str, labelnames: tuple[str, ...] = ()
+    ) -> None:
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = labelnames
+
+    def _check_labels(self, label_values: LabelValues) -> None:
+        if len(label_values) != len(self.labelnames):
+            raise ValueError(
+                f"{self.name} expects labels {self.labelnames}, got {label_values}"
+            )
+
+    def render(self) -> list[str]:
+        """Render this metric's samples in Prometheus text format."""
+        raise NotImplementedError
+
+    def _format_labels(
+        self, label_values: LabelValues, extra: tuple[tuple[str, str], ...] = ()
+    ) -> str:
+        pairs = list(zip(self.labelnames, label_values)) + list(extra)
+        if not pairs:
+            return ""
+        rendered = ",".join(f'{k}="{_escape_label(v)}"' for k, v in pairs)
+        return "{" + rendered + "}"
+
+
+TMetric = TypeVar("TMetric", bound=Metric)
+
+
+class Counter(Metric):
+    """A monotonically increasing count, such as requests handled."""
+
+    type_name = "counter"
+
+    def __init__(
+        self, name: str, documentation: str, labelnames: tuple[str, ...] = ()
+    ) -> None:
+        super().__init__(name, documentation, labelnames)
+        self._values: dict[LabelValues, float] = {}
+        self._function: Callable[[], float] | None = None
+
+    def inc(self, *label_values: str, amount: float = 1.0) -> None:
+        """Increase the counter for the given label values.
+
+        Raises:
+            ValueError: If amount is negative.
+        """
+        if amount < 0:
+            raise ValueError("Counters can only increase")
+        self._values[label_values] = self._values.get(label_values, 0.0) + amount
+
+    def remove(self, *label_values: str) -> None:
+        """Drop the series for the given label values, e.g. for a departed peer."""
+        self._values.pop(label_values, None)
+
+    def set_function(self, function: Callable[[], float]) -> None:
+        """Read the count on demand from a component that already tracks it.
+
+        Raises:
+            ValueError: If the counter has labels.
+        """
+        if self.labelnames:
+            raise ValueError("Only unlabeled counters can be backed by a function")
+        self._function = function
+
+    def value(self, *label_values: str) -> float:
+        """Current count for the given label values."""
+        if self._function is not None:
+            return float(self._function())
+        return self._values.get(label_values, 0.0)
+
+    def render(self) -> list[str]:
+        if self._function is not None:
+            return [f"{self.name} {_format_value(self.value())}"]
+        return [
+            f"{self.name}{self._format_labels(labels)} {_format_value(value)}"
+            for labels, value in self._values.items()
+        ]
+
+
+class Gauge(Metric):
+    """A value that goes up and down, such as requests in flight.
+
+    An unlabeled gauge can be backed by a function that is called at read time,
+    which suits values another component already tracks (e.g. session counts).
+    """
+
+    type_name = "gauge"
+
+    def __init__(
+        self, name: str, documentation: str, labelnames: tuple[str, ...] = ()
+    ) -> None:
+        super().__init__(name, documentation, labelnames)
+        self._values: dict[LabelValues, float] = {}
+        self._function: Callable[[], float] | None = None
+
+    def set(self, *label_values: str, value: float) -> None:
+        """Set the gauge for the given label values."""
+        self._values[label_values] = value
+
+    def inc(self, *label_values: str, amount: float = 1.0) -> None:
+        """Increase the gauge for the given label values."""
+        self._values[label_values] = self._values.get(label_values, 0.0) + amount
+
+    def dec(self, *label_values: str, amount: float = 1.0) -> None:
+        """Decrease the gauge for the given label values."""
+        self._values[label_values] = self._values.get(label_values, 0.0) - amount
+
+    def remove(self, *label_values: str) -> None:
+        """Drop the series for the given label values, e.g. for a departed peer."""
+        self._values.pop(label_values, None)
+
+    def set_function(self, function: Callable[[], float]) -> None:
+        """Compute the gauge's value on demand.
+
+        Raises:
+            ValueError: If the gauge has labels.
+        """
+        if self.labelnames:
+            raise ValueError("Only unlabeled gauges can be backed by a function")
+        self._function = function
+
+    def value(self, *label_values: str) -> float:
+        """Current value for the given label values."""
+        if self._function is not None:
+            return float(self._function())
+        return self._values.get(label_values, 0.0)
+
+    def render(self) -> list[str]:
+        if self._function is not None:
+            return [f"{self.name} {_format_value(self.value())}"]
+        return [
+            f"{self.name}{self._format_labels(labels)} {_format_value(value)}"
+            for labels, value in self._values.items()
+        ]
+
+
+class Histogram(Metric):
+    """Distribution of observed values, such as request latencies in seconds."""
+
+    type_name = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: tuple[str, ...] = (),
+        buckets: tuple[float, ...] = DEFAULT_LATENCY_BUCKETS,
+    ) -> None:
+        super().__init__(name, documentation, labelnames)
+        self.buckets = tuple(sorted(buckets))
+        # labels -> per-bucket counts (non-cumulative, last slot is +Inf)
+        self._bucket_counts: dict[LabelValues, list[int]] = {}
+        self._sums: dict[LabelValues, float] = {}
+
+    def observe(self, *label_values: str, value: float) -> None:
+        """Record one observation for the given label values."""
+        counts = self._bucket_counts.get(label_values)
+        if counts is None:
+            counts = [0] * (len(self.buckets) + 1)
+            self._bucket_counts[label_values] = counts
+            self._sums[label_values] = 0.0
+        counts[bisect.bisect_left(self.buckets, value)] += 1
+        self._sums[label_values] += value
+
+    def count(self, *label_values: str) -> int:
+        """Number of observations for the given label values."""
+        return sum(self._bucket_counts.get(label_values, ()))
+
+    def sum(self, *label_values: str) -> float:
+        """Sum of observations for the given label values."""
+        return self._sums.get(label_values, 0.0)
+
+    def quantile(self, q: float, *label_values: str) -> float | None:
+        """Estimate a quantile from the bucket counts.
+
+        Returns the upper bound of the bucket containing the quantile, or None if
+        there are no observations.
+        """
+        counts = self._bucket_counts.get(label_values)
+        if not counts:
+            return None
+        rank = q * sum(counts)
+        cumulative = 0
+        for bound, bucket_count in zip(self.buckets + (math.inf,), counts):
+            cumulative += bucket_count
+            if cumulative >= rank and bucket_count:
+                return bound
+        return math.inf
+
+    def render(self) -> list[str]:
+        lines: list[str] = []
+        for labels, counts in self._bucket_counts.items():
+            cumulative = 0
+            for bound, bucket_count in zip(self.buckets + (math.inf,), counts):
+                cumulative += bucket_count
+                le = "+Inf" if bound == math.inf else _format_value(bound)
+                label_str = self._format_labels(labels, (("le", le),))
+                lines.append(f"{self.name}_bucket{label_str} {cumulative}")
+            label_str = self._format_labels(labels)
+            lines.append(
+                f"{self.name}_sum{label_str} {_format_value(self._sums[labels])}"
+            )
+            lines.append(f"{self.name}_count{label_str} {cumulative}")
+        return lines
+
+
+class MetricsRegistry:
+    """Owns a set of metrics and renders them for export.
+
+    Registering a metric under a name that already exists returns the existing
+    metric, so several components can share one registry without coordinating.
+    """
+
+    def __init__(self) -> None:
+        self._metrics: dict[str, Metric] = {}
+
+    def counter(
+        self, name: str, documentation: str, labelnames: tuple[str, ...] = ()
+    ) -> Counter:
+        """Get or create a counter."""
+        return self._register(Counter, name, documentation, labelnames)
+
+    def gauge(
+        self, name: str, documentation: str, labelnames: tuple[str, ...] = ()
+    ) -> Gauge:
+        """Get or create a gauge."""
+        return self._register(Gauge, name, documentation, labelnames)
+
+    def histogram(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: tuple[str, ...] = (),
+        buckets: tuple[float, ...] = DEFAULT_LATENCY_BUCKETS,
+    ) -> Histogram:
+        """Get or create a histogram."""
+        existing = self._metrics.get(name)
+        if existing is None:
+            histogram = Histogram(name, documentation, labelnames, buckets)
+            self._metrics[name] = histogram
+            return histogram
+        if not isinstance(existing, Histogram):
+            raise ValueError(f"Metric {name} is already registered as another type")
+        return existing
+
+    def get(self, name: str) -> Metric | None:
+        """Look up a metric by name."""
+        return self._metrics.get(name)
+
+    def names(self) -> list[str]:
+        """Names of all registered metrics."""
+        return list(self._metrics.keys())
+
+    def render_prometheus(self) -> str:
+        """Render every metric in the Prometheus text exposition format."""
+        lines: list[str] = []
+        for metric in self._metrics.values():
+            lines.append(f"# HELP {metric.name} {metric.documentation}")
+            lines.append(f"# TYPE {metric.name} {metric.type_name}")
+            lines.extend(metric.render())
+        return "\n".join(lines) + "\n"
+
+    def _register(
+        self,
+        metric_class: type[TMetric],
+        name: str,
+        documentation: str,
+        labelnames: tuple[str, ...],
+    ) -> TMetric:
+        existing = self._metrics.get(name)
+        if existing is None:
+            metric = metric_class(name, documentation, labelnames)
+            self._metrics[name] = metric
+            return metric
+        if type(existing) is not metric_class:
+            raise ValueError(f"Metric {name} is already registered as another type")
+        return existing
+
+
+def _format_value(value: float) -> str:
+    if value == math.inf:
+        return "+Inf"
+    if float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
+
+
+def _escape_label(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
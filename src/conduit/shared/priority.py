@@ -0,0 +1,42 @@
+"""Priority classes for inbound MCP messages.
+
+Control-plane messages keep a connection healthy: cancellations, pings, the
+initialization handshake, and responses to requests we sent. They are cheap to
+handle and lose their value if they wait behind long-running tool calls, so the
+coordinators dispatch them directly on the message loop. Everything else is
+data-plane work and goes through the regular task-based dispatch path.
+"""
+
+from enum import IntEnum
+
+CONTROL_REQUEST_METHODS = frozenset({"ping", "initialize"})
+CONTROL_NOTIFICATION_METHODS = frozenset(
+    {"notifications/cancelled", "notifications/initialized"}
+)
+
+# Notifications that only report on work in progress. Losing some under
+# overload is acceptable; losing a cancellation or list change isn't.
+DROPPABLE_NOTIFICATIONS = frozenset({"notifications/message", "notifications/progress"})
+
+
+class MessagePriority(IntEnum):
+    """Dispatch priority for an inbound message. Lower values go first."""
+
+    CONTROL = 0
+    DATA = 1
+
+
+def priority_for_method(method: str | None) -> MessagePriority:
+    """Classify a message by its JSON-RPC method.
+
+    Args:
+        method: The message's method, or None for responses.
+
+    Returns:
+        CONTROL for responses and control-plane methods, DATA otherwise.
+    """
+    if method is None:
+        return MessagePriority.CONTROL
+    if method in CONTROL_REQUEST_METHODS or method in CONTROL_NOTIFICATION_METHODS:
+        return MessagePriority.CONTROL
+    return MessagePriority.DATA
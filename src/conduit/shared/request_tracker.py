@@ -21,6 +21,8 @@ class RequestTracker:
         self._inbound_requests: dict[
             str, dict[RequestId, tuple[Request, asyncio.Task[None]]]
         ] = {}
+        # Last outbound request ID we allocated, to any peer
+        self._last_request_id = 0
 
     def _ensure_peer_tracking(self, peer_id: str) -> None:
         """Ensure tracking dicts exist for a peer."""
@@ -33,6 +35,22 @@ class RequestTracker:
     # COMMANDS
     # ==================
 
+    def next_request_id(self) -> int:
+        """Allocate the ID for our next outbound request, to any peer.
+
+        IDs are integers from one counter shared by every peer, so they keep
+        increasing across cleanup_peer(). An ID is never reused for a peer after
+        a reset or reconnect, and a late response to a request from the old
+        connection can't resolve a new one. Integers are cheaper to generate,
+        hash, and serialize than UUID strings. One counter, rather than one per
+        peer, also means nothing is left behind for peers that are gone.
+
+        Returns:
+            A request ID that has never been used before.
+        """
+        self._last_request_id += 1
+        return self._last_request_id
+
     def track_outbound_request(
         self,
         peer_id: str,
@@ -208,6 +226,14 @@ class RequestTracker:
         """
         return list(self._outbound_requests.get(peer_id, {}).keys())
 
+    def count_outbound_requests(self, peer_id: str) -> int:
+        """Count requests we sent to a peer that are still awaiting an answer.
+
+        Args:
+            peer_id: The ID of the peer we sent requests to.
+        """
+        return len(self._outbound_requests.get(peer_id, ()))
+
     def get_peer_inbound_request_ids(self, peer_id: str) -> list[RequestId]:
         """Get all IDs for requests we received from a specific peer.
 
@@ -0,0 +1,238 @@
+"""Bounded supervision for handler tasks.
+
+The coordinators run data-plane handlers in background tasks. Left unbounded, a
+flood of notifications or requests turns into tens of thousands of live tasks.
+The supervisor caps how many request handler tasks exist at once: past the cap,
+try_spawn() refuses new work and the coordinator answers the request with a
+retryable error, so the peer backs off instead of our heap growing.
+
+Nothing here ever waits for capacity. The caller is the shared message loop,
+which is also what reads responses. Handlers waiting on their peer (sampling,
+elicitation, roots/list, nested requests) can only finish once the loop
+delivers those responses, so a loop parked on the cap until one of them
+finished would deadlock every peer on the coordinator.
+
+Notifications go through ordered lanes, one per peer: a single worker task
+drains each lane in arrival order and exits when the lane is empty. A burst of
+progress notifications from one peer costs one task, not one per message.
+
+A full lane never blocks the caller either. Droppable items (log
+and progress notifications) are discarded once a lane is full, and anything
+else is queued past the cap: losing a list change or an initialization would
+leave the peers disagreeing about state. Lane workers, and tasks started with
+spawn(), are admitted past the task cap and counted as overflow.
+"""
+
+import asyncio
+import logging
+from collections import deque
+from collections.abc import Coroutine, Hashable
+from dataclasses import dataclass
+from typing import Any, TypeVar
+
+T = TypeVar("T")
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class TaskStats:
+    """Point-in-time counters for a TaskSupervisor."""
+
+    live_tasks: int
+    peak_tasks: int
+    lanes: int
+    queued_in_lanes: int
+    rejected_tasks: int
+    overflow_tasks: int
+    dropped_from_lanes: int
+
+
+class TaskSupervisor:
+    """Caps live handler tasks and runs per-peer notification lanes."""
+
+    def __init__(self, max_tasks: int = 1024, max_lane_backlog: int = 256) -> None:
+        """Initialize the supervisor.
+
+        Args:
+            max_tasks: Live tasks, lane workers included, past which
+                try_spawn() refuses new work.
+            max_lane_backlog: Queued items per lane past which droppable items
+                are discarded.
+        """
+        if max_tasks <= 0:
+            raise ValueError("max_tasks must be positive")
+        if max_lane_backlog <= 0:
+            raise ValueError("max_lane_backlog must be positive")
+
+        self.max_tasks = max_tasks
+        self.max_lane_backlog = max_lane_backlog
+        self._tasks: set[asyncio.Task[Any]] = set()
+        self._lanes: dict[Hashable, deque[Coroutine[Any, Any, Any]]] = {}
+        self._lane_workers: dict[Hashable, asyncio.Task[None]] = {}
+        self._task_finished = asyncio.Event()
+        self._peak_tasks = 0
+        self._rejected_tasks = 0
+        self._overflow_tasks = 0
+        self._dropped_from_lanes = 0
+        self._overflowing: set[Hashable] = set()  # Lanes that dropped items
+
+    # ================================
+    # Stats
+    # ================================
+
+    @property
+    def live_tasks(self) -> int:
+        """Number of tasks currently running under the supervisor."""
+        return len(self._tasks)
+
+    def stats(self) -> TaskStats:
+        """Snapshot of the supervisor's counters."""
+        return TaskStats(
+            live_tasks=len(self._tasks),
+            peak_tasks=self._peak_tasks,
+            lanes=len(self._lanes),
+            queued_in_lanes=sum(len(lane) for lane in self._lanes.values()),
+            rejected_tasks=self._rejected_tasks,
+            overflow_tasks=self._overflow_tasks,
+            dropped_from_lanes=self._dropped_from_lanes,
+        )
+
+    # ================================
+    # Spawning
+    # ================================
+
+    def try_spawn(
+        self, coro: Coroutine[Any, Any, T], name: str | None = None
+    ) -> asyncio.Task[T] | None:
+        """Run a coroutine in a supervised task, unless at the task cap.
+
+        Args:
+            coro: Coroutine to run. Closed without running if refused.
+            name: Optional task name.
+
+        Returns:
+            The running task, or None if the supervisor is at its cap.
+        """
+        if len(self._tasks) >= self.max_tasks:
+            coro.close()
+            self._rejected_tasks += 1
+            return None
+        return self._start_task(coro, name)
+
+    def spawn(
+        self, coro: Coroutine[Any, Any, T], name: str | None = None
+    ) -> asyncio.Task[T]:
+        """Run a coroutine in a supervised task, past the cap if need be.
+
+        For work the caller can't refuse or retry. Tasks started past the cap
+        are counted as overflow.
+
+        Args:
+            coro: Coroutine to run.
+            name: Optional task name.
+
+        Returns:
+            The running task.
+        """
+        return self._start_task(coro, name)
+
+    def submit_ordered(
+        self,
+        lane_key: Hashable,
+        coro: Coroutine[Any, Any, Any],
+        droppable: bool = False,
+    ) -> bool:
+        """Queue a coroutine to run after earlier work in the same lane.
+
+        Lane items run one at a time, in submission order. Failures are logged
+        and don't stop the lane. Never waits (see the module docstring).
+
+        Args:
+            lane_key: Identifies the lane, e.g. a client or server ID.
+            coro: Coroutine to run.
+            droppable: Whether the item may be discarded when the lane is full.
+
+        Returns:
+            False if the item was discarded, True if it was queued.
+        """
+        lane_length = len(self._lanes.get(lane_key, ()))
+        if lane_length >= self.max_lane_backlog:
+            if droppable:
+                coro.close()
+                self._dropped_from_lanes += 1
+                if lane_key not in self._overflowing:
+                    self._overflowing.add(lane_key)
+                    logger.warning(
+                        f"Lane {lane_key} is {lane_length} items behind; "
+                        "dropping its log and progress notifications"
+                    )
+                return False
+
+        self._lanes.setdefault(lane_key, deque()).append(coro)
+        if lane_key not in self._lane_workers:
+            self._lane_workers[lane_key] = self._start_task(
+                self._drain_lane(lane_key), name=f"lane_{lane_key}"
+            )
+        return True
+
+    async def wait_idle(self) -> None:
+        """Wait until every supervised task, lane workers included, has finished.
+
+        Work submitted while waiting extends the wait.
+        """
+        while self._tasks:
+            self._task_finished.clear()
+            await self._task_finished.wait()
+
+    def cancel_all(self) -> None:
+        """Cancel every supervised task and drop queued lane work."""
+        for lane in self._lanes.values():
+            for coro in lane:
+                coro.close()
+        self._lanes.clear()
+        self._lane_workers.clear()
+        self._overflowing.clear()
+        for task in list(self._tasks):
+            task.cancel()
+
+    # ================================
+    # Internals
+    # ================================
+
+    def _start_task(
+        self, coro: Coroutine[Any, Any, T], name: str | None
+    ) -> asyncio.Task[T]:
+        if len(self._tasks) >= self.max_tasks:
+            self._overflow_tasks += 1
+        task = asyncio.create_task(coro, name=name)
+        self._tasks.add(task)
+        self._peak_tasks = max(self._peak_tasks, len(self._tasks))
+        task.add_done_callback(self._on_task_done)
+        return task
+
+    def _on_task_done(self, task: asyncio.Task[Any]) -> None:
+        self._tasks.discard(task)
+        self._task_finished.set()
+
+    async def _drain_lane(self, lane_key: Hashable) -> None:
+        """Run queued coroutines for a lane until it's empty."""
+        lane = self._lanes.get(lane_key)
+        try:
+            while lane:
+                coro = lane.popleft()
+                try:
+                    await coro
+                except asyncio.CancelledError:
+                    raise
+                except Exception as e:
+                    logger.exception(f"Task in lane {lane_key} failed: {e}")
+        finally:
+            self._overflowing.discard(lane_key)
+            if lane is not None and self._lanes.get(lane_key) is lane:
+                if lane:
+                    for coro in lane:
+                        coro.close()
+                del self._lanes[lane_key]
+            if self._lane_workers.get(lane_key) is asyncio.current_task():
+                del self._lane_workers[lane_key]
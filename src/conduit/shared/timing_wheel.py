@@ -0,0 +1,181 @@
+"""Hashed timing wheel for request timeouts.
+
+Every outbound request needs a timeout, but almost none of them fire. Giving
+each request its own timer (or an `asyncio.wait_for` wrapper task) costs a heap
+entry and a task per request. The wheel instead hashes timers into a fixed ring
+of slots and keeps a single event loop callback armed, for the earliest tick
+that has a timer due. Ticks with nothing due are skipped, so a lone 30 second
+timeout costs one wakeup, not one per tick. Each wakeup expires everything due
+in one pass.
+
+Timers fire at most one tick late, which is fine for timeouts measured in
+seconds.
+"""
+
+import asyncio
+import heapq
+import itertools
+import logging
+import math
+from typing import Callable
+
+TimerId = int
+
+logger = logging.getLogger(__name__)
+
+
+class TimingWheel:
+    """Schedules many coarse-grained timers behind one event loop callback."""
+
+    def __init__(self, tick: float = 0.01, slots: int = 512) -> None:
+        """Initialize the wheel.
+
+        Args:
+            tick: Resolution of the wheel in seconds.
+            slots: Number of buckets in the ring. Timers further out than
+                tick * slots simply stay in their bucket for extra rotations.
+        """
+        if tick <= 0:
+            raise ValueError("tick must be positive")
+        if slots <= 0:
+            raise ValueError("slots must be positive")
+
+        self.tick = tick
+        # slot -> timer_id -> (deadline_tick, callback)
+        self._slots: list[dict[TimerId, tuple[int, Callable[[], None]]]] = [
+            {} for _ in range(slots)
+        ]
+        self._timer_slots: dict[TimerId, int] = {}  # timer_id -> slot
+        # Deadline ticks with pending timers, earliest first. Entries for ticks
+        # whose timers were all cancelled linger until they reach the top.
+        self._deadline_ticks: list[int] = []
+        self._pending_per_tick: dict[int, int] = {}  # deadline_tick -> timers
+        self._armed_tick: int | None = None
+        self._timer_ids = itertools.count(1)
+        self._origin = 0.0
+        self._current_tick = 0
+        self._handle: asyncio.TimerHandle | None = None
+
+    def __len__(self) -> int:
+        """Number of pending timers."""
+        return len(self._timer_slots)
+
+    def schedule(self, delay: float, callback: Callable[[], None]) -> TimerId:
+        """Run a callback after roughly `delay` seconds.
+
+        Must be called from a running event loop.
+
+        Args:
+            delay: Seconds to wait before firing.
+            callback: Synchronous callable to run when the timer expires.
+
+        Returns:
+            An ID that can be passed to cancel().
+        """
+        loop = asyncio.get_running_loop()
+        now = loop.time()
+
+        if not self._timer_slots:
+            # Re-anchor an idle wheel so ticks line up with the current time.
+            self._origin = now
+            self._current_tick = 0
+            self._deadline_ticks.clear()
+
+        deadline_tick = max(
+            self._current_tick + 1,
+            math.ceil((now + delay - self._origin) / self.tick),
+        )
+        slot = deadline_tick % len(self._slots)
+        timer_id = next(self._timer_ids)
+
+        self._slots[slot][timer_id] = (deadline_tick, callback)
+        self._timer_slots[timer_id] = slot
+        pending = self._pending_per_tick.get(deadline_tick, 0)
+        if pending == 0:
+            heapq.heappush(self._deadline_ticks, deadline_tick)
+        self._pending_per_tick[deadline_tick] = pending + 1
+
+        if self._armed_tick is None or deadline_tick < self._armed_tick:
+            self._arm(loop, deadline_tick)
+        return timer_id
+
+    def cancel(self, timer_id: TimerId) -> bool:
+        """Cancel a pending timer.
+
+        Safe to call multiple times.
+
+        Returns:
+            True if the timer was pending, False if it already fired or was
+            cancelled.
+        """
+        slot = self._timer_slots.pop(timer_id, None)
+        if slot is None:
+            return False
+
+        deadline_tick, _ = self._slots[slot].pop(timer_id)
+        pending = self._pending_per_tick[deadline_tick] - 1
+        if pending:
+            self._pending_per_tick[deadline_tick] = pending
+        else:
+            del self._pending_per_tick[deadline_tick]
+
+        if not self._timer_slots and self._handle is not None:
+            self._handle.cancel()
+            self._handle = None
+            self._armed_tick = None
+        return True
+
+    def _arm(self, loop: asyncio.AbstractEventLoop, tick: int) -> None:
+        """Wake up at the given tick, replacing any earlier arrangement."""
+        if self._handle is not None:
+            self._handle.cancel()
+        self._handle = loop.call_at(
+            self._origin + tick * self.tick, self._advance, loop
+        )
+        self._armed_tick = tick
+
+    def _earliest_pending_tick(self) -> int | None:
+        """The earliest tick with a timer due, dropping stale heap entries."""
+        while self._deadline_ticks:
+            tick = self._deadline_ticks[0]
+            if tick in self._pending_per_tick:
+                return tick
+            heapq.heappop(self._deadline_ticks)
+        return None
+
+    def _advance(self, loop: asyncio.AbstractEventLoop) -> None:
+        """Expire every timer due up to the current time."""
+        # The loop may run us a hair early (it rounds by its clock resolution), so
+        # always reach the tick we were armed for.
+        target_tick = max(
+            math.floor((loop.time() - self._origin) / self.tick),
+            self._armed_tick or 0,
+            self._current_tick,
+        )
+        self._handle = None
+        self._armed_tick = None
+
+        expired: list[Callable[[], None]] = []
+        while self._deadline_ticks and self._deadline_ticks[0] <= target_tick:
+            tick = heapq.heappop(self._deadline_ticks)
+            if self._pending_per_tick.pop(tick, 0) == 0:
+                continue  # Every timer for this tick was cancelled
+            bucket = self._slots[tick % len(self._slots)]
+            for timer_id, (deadline_tick, callback) in list(bucket.items()):
+                if deadline_tick == tick:
+                    del bucket[timer_id]
+                    del self._timer_slots[timer_id]
+                    expired.append(callback)
+        self._current_tick = target_tick
+
+        for callback in expired:
+            try:
+                callback()
+            except Exception as e:
+                logger.exception(f"Timer callback failed: {e}")
+
+        next_tick = self._earliest_pending_tick()
+        if next_tick is not None and (
+            self._armed_tick is None or next_tick < self._armed_tick
+        ):
+            self._arm(loop, next_tick)
@@ -0,0 +1,293 @@
+"""Span hooks and trace context propagation.
+
+The coordinators open spans around the stages of handling a message: receive,
+parse, handler execution, serialize, and send. Trace context travels in the
+request's `_meta` (`Request.metadata["traceparent"]`, W3C trace-context format),
+so a client call, the server handler, and any nested request back to the client
+(e.g. sampling) all land in one trace.
+
+Tracing is off by default. A Tracer without an exporter hands out a shared no-op
+span, so the hooks cost an attribute lookup per stage. Plug in a SpanExporter to
+ship finished spans anywhere (OpenTelemetry, logs, a test list).
+"""
+
+import contextvars
+import logging
+import secrets
+import time
+from abc import ABC, abstractmethod
+from dataclasses import dataclass, field
+from types import TracebackType
+from typing import Any
+
+from conduit.protocol.base import Request
+
+TRACEPARENT_KEY = "traceparent"
+
+logger = logging.getLogger(__name__)
+
+_current_span: contextvars.ContextVar["Span | None"] = contextvars.ContextVar(
+    "conduit_current_span", default=None
+)
+
+
+@dataclass(frozen=True)
+class SpanContext:
+    """Identifies a span within a trace."""
+
+    trace_id: str  # 32 lowercase hex chars
+    span_id: str  # 16 lowercase hex chars
+    sampled: bool = True
+
+    def to_traceparent(self) -> str:
+        """Format as a W3C traceparent header value."""
+        flags = "01" if self.sampled else "00"
+        return f"00-{self.trace_id}-{self.span_id}-{flags}"
+
+    @classmethod
+    def from_traceparent(cls, value: Any) -> "SpanContext | None":
+        """Parse a W3C traceparent value.
+
+        Returns:
+            The span context, or None if the value is missing or malformed.
+        """
+        if not isinstance(value, str):
+            return None
+        parts = value.strip().split("-")
+        if len(parts) != 4:
+            return None
+        version, trace_id, span_id, flags = parts
+        if (
+            len(version) != 2
+            or len(trace_id) != 32
+            or len(span_id) != 16
+            or len(flags) != 2
+            or not _is_hex(version + trace_id + span_id + flags)
+            or trace_id == "0" * 32
+            or span_id == "0" * 16
+        ):
+            return None
+        return cls(
+            trace_id=trace_id.lower(),
+            span_id=span_id.lower(),
+            sampled=bool(int(flags, 16) & 0x01),
+        )
+
+
+@dataclass(eq=False)
+class Span:
+    """A timed operation within a trace.
+
+    Use as a context manager to make it the current span while the block runs;
+    spans started inside the block (or in tasks created inside it) become its
+    children. The span ends and is exported when the block exits.
+    """
+
+    name: str
+    context: SpanContext
+    parent_span_id: str | None = None
+    attributes: dict[str, Any] = field(default_factory=dict)
+    start_time: float = field(default_factory=time.time)
+    end_time: float | None = None
+    error: str | None = None
+    _tracer: "Tracer | None" = field(default=None, repr=False)
+    _token: contextvars.Token | None = field(default=None, repr=False)
+
+    @property
+    def duration(self) -> float | None:
+        """Seconds between start and end, or None if the span is still open."""
+        if self.end_time is None:
+            return None
+        return self.end_time - self.start_time
+
+    def set_attribute(self, key: str, value: Any) -> None:
+        """Attach an attribute to the span."""
+        self.attributes[key] = value
+
+    def record_error(self, error: BaseException | str) -> None:
+        """Mark the span as failed."""
+        self.error = error if isinstance(error, str) else repr(error)
+
+    def end(self) -> None:
+        """End the span and hand it to the exporter. Safe to call multiple times."""
+        if self.end_time is not None:
+            return
+        self.end_time = time.time()
+        if self._tracer is not None:
+            self._tracer._export(self)
+
+    def __enter__(self) -> "Span":
+        self._token = _current_span.set(self)
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        if exc is not None:
+            self.record_error(exc)
+        if self._token is not None:
+            _current_span.reset(self._token)
+            self._token = None
+        self.end()
+
+
+class _NoopSpan(Span):
+    """Span handed out when tracing is disabled. Records nothing."""
+
+    def set_attribute(self, key: str, value: Any) -> None:
+        pass
+
+    def record_error(self, error: BaseException | str) -> None:
+        pass
+
+    def end(self) -> None:
+        pass
+
+    def __enter__(self) -> "Span":
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        pass
+
+
+NOOP_SPAN: Span = _NoopSpan(
+    name="noop", context=SpanContext(trace_id="0" * 32, span_id="0" * 16)
+)
+
+
+class SpanExporter(ABC):
+    """Receives finished spans."""
+
+    @abstractmethod
+    def export(self, span: Span) -> None:
+        """Handle a finished span.
+
+        Called synchronously on the event loop, so hand off slow work (network
+        I/O) rather than doing it here.
+        """
+        ...
+
+
+class InMemorySpanExporter(SpanExporter):
+    """Keeps finished spans in a list. Handy for tests and debugging."""
+
+    def __init__(self) -> None:
+        self.spans: list[Span] = []
+
+    def export(self, span: Span) -> None:
+        self.spans.append(span)
+
+    def clear(self) -> None:
+        """Forget all collected spans."""
+        self.spans.clear()
+
+
+class Tracer:
+    """Creates spans and sends finished ones to an exporter.
+
+    Without an exporter the tracer is disabled and every span is NOOP_SPAN.
+    """
+
+    def __init__(self, exporter: SpanExporter | None = None) -> None:
+        self.exporter = exporter
+
+    @property
+    def enabled(self) -> bool:
+        """True if spans are being recorded."""
+        return self.exporter is not None
+
+    def start_span(
+        self,
+        name: str,
+        parent: SpanContext | None = None,
+        attributes: dict[str, Any] | None = None,
+    ) -> Span:
+        """Start a span.
+
+        Args:
+            name: Operation name, e.g. "mcp.server tools/call".
+            parent: Remote parent context. Defaults to the current span.
+            attributes: Initial attributes.
+
+        Returns:
+            The new span. Use it as a context manager, or call end() yourself.
+        """
+        if self.exporter is None:
+            return NOOP_SPAN
+
+        if parent is None:
+            current = _current_span.get()
+            if current is not None and current is not NOOP_SPAN:
+                parent = current.context
+
+        if parent is not None:
+            context = SpanContext(parent.trace_id, _new_span_id(), parent.sampled)
+            parent_span_id: str | None = parent.span_id
+        else:
+            context = SpanContext(secrets.token_hex(16), _new_span_id())
+            parent_span_id = None
+
+        return Span(
+            name=name,
+            context=context,
+            parent_span_id=parent_span_id,
+            attributes=dict(attributes) if attributes else {},
+            _tracer=self,
+        )
+
+    def _export(self, span: Span) -> None:
+        if self.exporter is None or not span.context.sampled:
+            return
+        try:
+            self.exporter.export(span)
+        except Exception as e:
+            logger.exception(f"Span exporter failed: {e}")
+
+
+def current_span() -> Span | None:
+    """The span active in the current task, if any."""
+    return _current_span.get()
+
+
+def extract_trace_context(payload: dict[str, Any]) -> SpanContext | None:
+    """Read trace context from a raw JSON-RPC message's `params._meta`.
+
+    Returns:
+        The remote parent, or None if the message carries no valid context.
+    """
+    params = payload.get("params")
+    if not isinstance(params, dict):
+        return None
+    meta = params.get("_meta")
+    if not isinstance(meta, dict):
+        return None
+    return SpanContext.from_traceparent(meta.get(TRACEPARENT_KEY))
+
+
+def inject_trace_context(request: Request, span: Span) -> Request:
+    """Return a copy of the request that carries the span's trace context.
+
+    The caller's request object is left untouched. Requests are returned as-is
+    when the span is the no-op span.
+    """
+    if span is NOOP_SPAN:
+        return request
+    metadata = dict(request.metadata or {})
+    metadata[TRACEPARENT_KEY] = span.context.to_traceparent()
+    return request.model_copy(update={"metadata": metadata})
+
+
+def _new_span_id() -> str:
+    return secrets.token_hex(8)
+
+
+def _is_hex(value: str) -> bool:
+    return all(c in "0123456789abcdefABCDEF" for c in value)
@@ -2,7 +2,7 @@
 
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
-from typing import Any, AsyncIterator
+from typing import Any, AsyncIterator, Awaitable, Callable
 
 
 @dataclass
@@ -23,6 +23,12 @@ class ClientTransport(ABC):
     on message passing - server lifecycle is managed by the session layer.
     """
 
+    # Called with a server_id after the transport replaced a server's
+    # connection on its own, such as by restarting a crashed stdio server. The
+    # new connection needs the MCP handshake again. Transports that never do
+    # this don't call it.
+    restart_handler: Callable[[str], Awaitable[None]] | None = None
+
     @abstractmethod
     async def add_server(self, server_id: str, connection_info: dict[str, Any]) -> None:
         """Register how to reach a server (doesn't connect yet).
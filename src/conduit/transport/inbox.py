@@ -0,0 +1,175 @@
+"""Per-server bounded message queues for client transports.
+
+A client transport reads from many servers and hands their messages to one
+consumer. With a single shared queue, one server flooding logs or progress
+grows memory without bound and pushes every other server's responses to the
+back of the line. The ServerInbox keeps a queue per server instead:
+
+- The consumer takes one message per server in turn, so a busy server can't
+  delay the others.
+- Past the high-water mark, log and progress notifications from that server
+  are dropped and counted.
+- At the limit, put() waits for room. The transport's reader for that server
+  is the one waiting, so it stops reading the server's stdout or SSE stream
+  and the backpressure reaches the server.
+- Responses are always accepted. Their number is bounded by the requests we
+  sent, and holding one back could stall the very caller that frees room.
+"""
+
+import asyncio
+import logging
+from collections import deque
+from dataclasses import dataclass, field
+
+from conduit.shared.priority import DROPPABLE_NOTIFICATIONS
+from conduit.transport.client import ServerMessage
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class ServerInboxStats:
+    """Counters for a ServerInbox."""
+
+    queued: int = 0
+    dropped_notifications: int = 0
+    blocked_puts: int = 0  # Puts that had to wait for room
+
+
+@dataclass(eq=False)
+class _ServerQueue:
+    messages: deque[ServerMessage] = field(default_factory=deque)
+    has_room: asyncio.Event = field(default_factory=asyncio.Event)
+    overflowing: bool = False  # Past the high-water mark since last drained
+
+    def __post_init__(self) -> None:
+        self.has_room.set()
+
+
+class ServerInbox:
+    """Bounded per-server queues merged fairly for a single consumer."""
+
+    def __init__(
+        self, max_messages_per_server: int = 1024, high_water: int | None = None
+    ) -> None:
+        """Initialize an empty inbox.
+
+        Args:
+            max_messages_per_server: Messages a server can have queued before
+                put() waits for room.
+            high_water: Queue length past which droppable notifications are
+                discarded. Defaults to three quarters of the limit.
+        """
+        if max_messages_per_server < 1:
+            raise ValueError("max_messages_per_server must be at least 1")
+        if high_water is None:
+            high_water = max(max_messages_per_server * 3 // 4, 1)
+        if not 0 < high_water <= max_messages_per_server:
+            raise ValueError("Need 0 < high_water <= max_messages_per_server")
+        self.max_messages_per_server = max_messages_per_server
+        self.high_water = high_water
+        self._queues: dict[str, _ServerQueue] = {}
+        self._ready: deque[str] = deque()  # Servers with messages, in turn order
+        self._not_empty = asyncio.Event()
+        self._dropped: dict[str, int] = {}
+        self._stats = ServerInboxStats()
+
+    def stats(self) -> ServerInboxStats:
+        """Snapshot of the inbox's counters."""
+        return ServerInboxStats(**vars(self._stats))
+
+    def dropped(self, server_id: str) -> int:
+        """Notifications dropped from one server."""
+        return self._dropped.get(server_id, 0)
+
+    def qsize(self, server_id: str | None = None) -> int:
+        """Messages queued for one server, or for all of them."""
+        if server_id is None:
+            return self._stats.queued
+        queue = self._queues.get(server_id)
+        return len(queue.messages) if queue is not None else 0
+
+    def empty(self) -> bool:
+        return self._stats.queued == 0
+
+    # ================================
+    # Producers
+    # ================================
+
+    async def put(self, message: ServerMessage) -> None:
+        """Queue a message, waiting while its server's queue is full.
+
+        Droppable notifications past the high-water mark return straight away
+        without being queued.
+        """
+        server_id = message.server_id
+        queue = self._queues.get(server_id)
+        if queue is None:
+            queue = self._queues[server_id] = _ServerQueue()
+
+        payload = message.payload
+        is_response = "id" in payload and "method" not in payload
+        if not is_response:
+            if len(queue.messages) >= self.high_water:
+                if payload.get("method") in DROPPABLE_NOTIFICATIONS:
+                    self._drop(server_id, queue)
+                    return
+            while len(queue.messages) >= self.max_messages_per_server:
+                self._stats.blocked_puts += 1
+                queue.has_room.clear()
+                await queue.has_room.wait()
+                if self._queues.get(server_id) is not queue:
+                    return  # Server removed while we waited
+
+        self._append(server_id, queue, message)
+
+    def remove_server(self, server_id: str) -> None:
+        """Discard a server's queued messages and release its waiting puts."""
+        queue = self._queues.pop(server_id, None)
+        self._dropped.pop(server_id, None)
+        if queue is None:
+            return
+        self._stats.queued -= len(queue.messages)
+        queue.messages.clear()
+        queue.has_room.set()
+        if server_id in self._ready:
+            self._ready.remove(server_id)
+
+    def _append(self, server_id: str, queue: _ServerQueue, message: ServerMessage):
+        if not queue.messages:
+            self._ready.append(server_id)
+        queue.messages.append(message)
+        self._stats.queued += 1
+        self._not_empty.set()
+
+    def _drop(self, server_id: str, queue: _ServerQueue) -> None:
+        self._stats.dropped_notifications += 1
+        self._dropped[server_id] = self._dropped.get(server_id, 0) + 1
+        if not queue.overflowing:
+            queue.overflowing = True
+            logger.warning(
+                f"Server '{server_id}' is sending faster than we consume; "
+                "dropping its log and progress notifications"
+            )
+
+    # ================================
+    # Consumer
+    # ================================
+
+    async def get(self) -> ServerMessage:
+        """Take the next message, visiting servers in turn."""
+        while not self._ready:
+            self._not_empty.clear()
+            await self._not_empty.wait()
+
+        server_id = self._ready.popleft()
+        queue = self._queues[server_id]
+        message = queue.messages.popleft()
+        self._stats.queued -= 1
+        if queue.messages:
+            self._ready.append(server_id)
+        if len(queue.messages) < self.max_messages_per_server:
+            queue.has_room.set()
+        if queue.overflowing and len(queue.messages) < self.high_water // 2:
+            queue.overflowing = False
+        return message
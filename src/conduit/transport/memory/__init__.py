@@ -0,0 +1,4 @@
+from conduit.transport.memory.client import MemoryClientTransport
+from conduit.transport.memory.server import MemoryServerTransport
+
+__all__ = ["MemoryClientTransport", "MemoryServerTransport"]
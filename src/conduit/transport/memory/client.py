@@ -0,0 +1,120 @@
+import asyncio
+import logging
+import time
+from dataclasses import dataclass
+from typing import Any, AsyncIterator
+
+from conduit.transport.client import ClientTransport, ServerMessage
+from conduit.transport.memory.server import MemoryServerTransport
+from conduit.transport.memory.shared import copy_message
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class MemoryConnection:
+    """A registered in-memory server and our client ID on it, once attached."""
+
+    server: MemoryServerTransport
+    client_id: str | None = None
+
+
+class MemoryClientTransport(ClientTransport):
+    """In-process client transport for servers in the same event loop.
+
+    Register servers with connection_info={"server": MemoryServerTransport}.
+    Like the stdio transport, the connection is made on the first send.
+    """
+
+    def __init__(self, serialize: bool = False) -> None:
+        """Initialize the memory client transport.
+
+        Args:
+            serialize: Round-trip every outbound message through JSON, so the
+                server sees exactly what a wire transport would deliver.
+        """
+        self.serialize = serialize
+        self._servers: dict[str, MemoryConnection] = {}
+        self._message_queue: asyncio.Queue[ServerMessage] = asyncio.Queue()
+
+    async def add_server(self, server_id: str, connection_info: dict[str, Any]) -> None:
+        """Register how to reach a server (doesn't connect yet).
+
+        Args:
+            server_id: Unique identifier for this server connection
+            connection_info: Transport-specific connection details
+                Expected keys:
+                - "server": MemoryServerTransport - The server's transport
+
+        Raises:
+            ValueError: If connection_info is invalid
+        """
+        server = connection_info.get("server")
+        if not isinstance(server, MemoryServerTransport):
+            raise ValueError(
+                "connection_info must contain a 'server' MemoryServerTransport"
+            )
+        self._servers[server_id] = MemoryConnection(server=server)
+        logger.debug(f"Registered in-memory server '{server_id}'")
+
+    async def send(self, server_id: str, message: dict[str, Any]) -> None:
+        """Send message to specific server.
+
+        Args:
+            server_id: Target server connection ID
+            message: JSON-RPC message to send
+
+        Raises:
+            ValueError: If server_id is not registered, or serialization fails
+            ConnectionError: If the server closed or dropped this client
+        """
+        connection = self._servers.get(server_id)
+        if connection is None:
+            raise ValueError(f"Server '{server_id}' is not registered")
+
+        if connection.client_id is None:
+            connection.client_id = connection.server._attach(
+                lambda payload: self._deliver(server_id, payload)
+            )
+        connection.server._receive(
+            connection.client_id, copy_message(message, self.serialize)
+        )
+
+    def _deliver(self, server_id: str, payload: dict[str, Any]) -> None:
+        """Queue a message from a server."""
+        self._message_queue.put_nowait(
+            ServerMessage(server_id=server_id, payload=payload, timestamp=time.time())
+        )
+
+    def server_messages(self) -> AsyncIterator[ServerMessage]:
+        """Stream of messages from all servers with explicit server context.
+
+        Yields:
+            ServerMessage: Message with server ID and metadata
+        """
+        return self._message_queue_iterator()
+
+    async def _message_queue_iterator(self) -> AsyncIterator[ServerMessage]:
+        """Async iterator that yields messages from the multiplexed queue."""
+        while True:
+            yield await self._message_queue.get()
+
+    async def disconnect_server(self, server_id: str) -> None:
+        """Disconnect from specific server.
+
+        Safe to call multiple times - no-op if server is not registered.
+
+        Args:
+            server_id: Server connection ID to disconnect
+        """
+        connection = self._servers.pop(server_id, None)
+        if connection is None:
+            return
+        if connection.client_id is not None:
+            connection.server._detach(connection.client_id)
+        logger.debug(f"Disconnected from in-memory server '{server_id}'")
+
+    async def close(self) -> None:
+        """Close the transport and clean up all resources."""
+        for server_id in list(self._servers):
+            await self.disconnect_server(server_id)
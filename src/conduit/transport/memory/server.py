@@ -0,0 +1,130 @@
+import asyncio
+import logging
+import time
+from itertools import count
+from typing import Any, AsyncIterator, Callable
+
+from conduit.transport.memory.shared import copy_message
+from conduit.transport.server import ClientMessage, ServerTransport, TransportContext
+
+logger = logging.getLogger(__name__)
+
+Deliver = Callable[[dict[str, Any]], None]
+
+
+class MemoryServerTransport(ServerTransport):
+    """In-process server transport for clients in the same event loop.
+
+    Pair it with MemoryClientTransport by passing this transport as the
+    "server" connection info. Messages are handed over as dicts, with no JSON
+    encoding and no I/O, so embedding a server costs a queue put per message.
+
+    Payloads are shared between the two sides unless serialize is set. The
+    coordinators build a fresh dict for every message and never mutate what
+    they receive, so this is safe for ServerSession and ClientSession.
+    """
+
+    def __init__(self, serialize: bool = False) -> None:
+        """Initialize the memory server transport.
+
+        Args:
+            serialize: Round-trip every outbound message through JSON, so the
+                client sees exactly what a wire transport would deliver.
+        """
+        self.serialize = serialize
+        self._clients: dict[str, Deliver] = {}
+        self._message_queue: asyncio.Queue[ClientMessage | None] = asyncio.Queue()
+        self._client_ids = count(1)
+        self._closed = False
+
+    # ================================
+    # Client side of the pairing
+    # ================================
+
+    def _attach(self, deliver: Deliver) -> str:
+        """Connect a client. Returns the client ID messages will carry.
+
+        Raises:
+            ConnectionError: If the transport is closed
+        """
+        if self._closed:
+            raise ConnectionError("Memory server transport is closed")
+        client_id = f"memory-client-{next(self._client_ids)}"
+        self._clients[client_id] = deliver
+        logger.debug(f"Attached in-memory client '{client_id}'")
+        return client_id
+
+    def _detach(self, client_id: str) -> None:
+        """Forget a client. No-op if it isn't connected."""
+        self._clients.pop(client_id, None)
+
+    def _receive(self, client_id: str, message: dict[str, Any]) -> None:
+        """Queue a message from a client.
+
+        Raises:
+            ConnectionError: If the client isn't connected
+        """
+        if client_id not in self._clients:
+            raise ConnectionError(f"Client '{client_id}' is not connected")
+        self._message_queue.put_nowait(
+            ClientMessage(client_id=client_id, payload=message, timestamp=time.time())
+        )
+
+    # ================================
+    # ServerTransport
+    # ================================
+
+    async def send(
+        self,
+        client_id: str,
+        message: dict[str, Any],
+        transport_context: TransportContext | None = None,
+    ) -> None:
+        """Send message to a connected client.
+
+        Args:
+            client_id: Target client connection ID
+            message: JSON-RPC message to send
+            transport_context: Ignored, there is one channel per client
+
+        Raises:
+            ValueError: If client_id is not connected, or serialization fails
+        """
+        deliver = self._clients.get(client_id)
+        if deliver is None:
+            raise ValueError(f"Client '{client_id}' is not connected")
+        deliver(copy_message(message, self.serialize))
+
+    def client_messages(self) -> AsyncIterator[ClientMessage]:
+        """Stream of messages from all clients with explicit client context.
+
+        Ends when the transport is closed.
+
+        Yields:
+            ClientMessage: Message with client ID and metadata
+        """
+        return self._message_queue_iterator()
+
+    async def _message_queue_iterator(self) -> AsyncIterator[ClientMessage]:
+        """Async iterator that yields messages from the queue."""
+        while True:
+            message = await self._message_queue.get()
+            if message is None:
+                return
+            yield message
+
+    async def disconnect_client(self, client_id: str) -> None:
+        """Disconnect specific client.
+
+        Args:
+            client_id: Client connection ID to disconnect
+        """
+        self._detach(client_id)
+
+    async def close(self) -> None:
+        """Disconnect every client and end the message stream."""
+        if self._closed:
+            return
+        self._closed = True
+        self._clients.clear()
+        self._message_queue.put_nowait(None)
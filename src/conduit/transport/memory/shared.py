@@ -0,0 +1,23 @@
+import json
+from typing import Any
+
+
+def copy_message(message: dict[str, Any], serialize: bool) -> dict[str, Any]:
+    """Prepare a message for hand-over to the other side of a memory transport.
+
+    Args:
+        message: JSON-RPC message to hand over
+        serialize: Round-trip the message through JSON instead of passing it as-is
+
+    Returns:
+        The message itself, or a decoded copy when serialize is set
+
+    Raises:
+        ValueError: If serialize is set and the message isn't JSON-serializable
+    """
+    if not serialize:
+        return message
+    try:
+        return json.loads(json.dumps(message, separators=(",", ":")))
+    except (TypeError, ValueError) as e:
+        raise ValueError(f"Failed to serialize message to JSON: {e}") from e
@@ -2,7 +2,7 @@
 
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
-from typing import Any, AsyncIterator
+from typing import Any, AsyncIterator, Awaitable, Callable
 
 
 @dataclass
@@ -28,6 +28,12 @@ class ServerTransport(ABC):
     on message passing - client lifecycle is managed by the session layer.
     """
 
+    # Called with a client_id after the transport dropped a client on its own,
+    # such as an HTTP session that expired or was deleted by the client. The
+    # session layer should drop that client's state. Transports that never do
+    # this don't call it.
+    disconnect_handler: Callable[[str], Awaitable[None]] | None = None
+
     @abstractmethod
     async def send(
         self,
@@ -67,6 +73,23 @@ class ServerTransport(ABC):
         """
         ...
 
+    async def start_draining(self) -> None:
+        """Stop accepting new client requests ahead of a shutdown.
+
+        Transports that can refuse work at the connection level (e.g. HTTP 503)
+        should do so here. Responses and notifications from clients must still
+        be delivered so in-flight handlers can finish. Default is a no-op.
+        """
+        return None
+
+    async def flush(self) -> None:
+        """Wait until queued outbound messages have been handed to clients.
+
+        Called during a drain after in-flight handlers finish, under the drain
+        deadline. Default is a no-op.
+        """
+        return None
+
     @abstractmethod
     async def close(self) -> None:
         """Close the transport and clean up all resources.
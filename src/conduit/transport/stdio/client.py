@@ -1,11 +1,29 @@
 import asyncio
 import logging
 import time
-from dataclasses import dataclass
+from collections import deque
+from dataclasses import dataclass, field
 from typing import Any, AsyncIterator
 
+from conduit.shared.metrics import MetricsRegistry
 from conduit.transport.client import ClientTransport, ServerMessage
-from conduit.transport.stdio.shared import parse_json_message, serialize_message
+from conduit.transport.inbox import ServerInbox, ServerInboxStats
+from conduit.transport.stdio.pool import WarmPool, WarmPoolStats
+from conduit.transport.stdio.resources import (
+    ProcessUsage,
+    ResourceLimits,
+    ServerAtLimitError,
+    read_process_usage,
+)
+from conduit.transport.stdio.shared import (
+    DEFAULT_MAX_MESSAGE_SIZE,
+    FrameWriter,
+    FrameWriterStats,
+    LineFramer,
+    MessageTooLargeError,
+    parse_json_message,
+    serialize_message,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -16,6 +34,22 @@ class ServerProcess:
 
     server_command: list[str]
     process: asyncio.subprocess.Process | None = None
+    framer: LineFramer | None = None
+    writer: FrameWriter | None = None
+
+    # Supervision
+    restart: bool = False  # Restart on its own when it dies
+    stopping: bool = False  # Being disconnected; don't restart it
+    crash_looping: bool = False  # Gave up restarting after too many crashes
+    crashes: deque[float] = field(default_factory=deque)  # Recent, monotonic
+    restarts: int = 0
+    restart_task: asyncio.Task[None] | None = None
+
+    # Resource accounting
+    limits: ResourceLimits | None = None  # Overrides the transport's limits
+    usage: ProcessUsage | None = None  # Latest sample
+    sampled_at: float = 0.0
+    over_limit: str | None = None  # Why new requests are refused, if they are
 
     @property
     def is_running(self) -> bool:
@@ -29,17 +63,95 @@ class StdioClientTransport(ClientTransport):
     Manages multiple server subprocesses, each identified by a server_id.
     Supports lazy connection - servers are registered but not spawned until
     the first message is sent to them.
+
+    Spare processes can be kept running ahead of need with prewarm(), and
+    servers registered with "restart" are restarted when they die: after a
+    delay that doubles with each recent crash, and not at all once they crash
+    more than max_restarts times within restart_window seconds. The
+    restart_handler is then called so the session can redo the handshake.
+
+    While any server runs, each one's memory, CPU time, open fds, and stdin
+    and inbox backlogs are sampled from /proc every sample_interval seconds
+    into `metrics`. A server over its ResourceLimits is restarted or refused
+    new requests, as the limits say.
     """
 
-    def __init__(self) -> None:
+    def __init__(
+        self,
+        max_queued_per_server: int = 1024,
+        max_message_size: int = DEFAULT_MAX_MESSAGE_SIZE,
+        restart_backoff: float = 0.5,
+        max_restart_backoff: float = 30.0,
+        max_restarts: int = 5,
+        restart_window: float = 60.0,
+        metrics: MetricsRegistry | None = None,
+        sample_interval: float | None = 5.0,
+        limits: ResourceLimits | None = None,
+    ) -> None:
         """Initialize multi-server stdio transport.
 
-        No parameters needed in constructor - servers are registered
-        individually via add_server().
+        Servers are registered individually via add_server().
+
+        Args:
+            max_queued_per_server: Unconsumed messages a server may have queued
+                before we stop reading its stdout. See ServerInbox.
+            max_message_size: Longest message in bytes to accept from a server.
+                Longer ones are skipped with a warning.
+            restart_backoff: Delay before the first restart of a crashed server.
+            max_restart_backoff: Cap on the doubling restart delay.
+            max_restarts: Crashes within restart_window that are restarted.
+                One more and the server is left down.
+            restart_window: Seconds a crash counts against a server.
+            metrics: Registry to record per-server resource usage in.
+            sample_interval: Seconds between resource samples. None turns
+                sampling, and with it the limits, off.
+            limits: Resource limits for every server. The "limits" key of a
+                server's connection_info overrides them.
         """
+        self.max_message_size = max_message_size
+        self.restart_backoff = restart_backoff
+        self.max_restart_backoff = max_restart_backoff
+        self.max_restarts = max_restarts
+        self.restart_window = restart_window
         self._servers: dict[str, ServerProcess] = {}
-        self._message_queue: asyncio.Queue[ServerMessage] = asyncio.Queue()
+        self._inbox = ServerInbox(max_queued_per_server)
         self._reader_tasks: dict[str, asyncio.Task] = {}
+        self._pool = WarmPool(self._create_process)
+        self.metrics = metrics or MetricsRegistry()
+        self.sample_interval = sample_interval
+        self.limits = limits
+        self._sampler: asyncio.Task[None] | None = None
+        self._register_metrics()
+
+    def _register_metrics(self) -> None:
+        """Register per-server resource metrics in the registry."""
+        labels = ("server",)
+        self._rss = self.metrics.gauge(
+            "mcp_stdio_server_rss_bytes", "Resident memory of the server.", labels
+        )
+        self._cpu = self.metrics.gauge(
+            "mcp_stdio_server_cpu_seconds",
+            "CPU time the current server process has used.",
+            labels,
+        )
+        self._open_fds = self.metrics.gauge(
+            "mcp_stdio_server_open_fds", "Open file descriptors.", labels
+        )
+        self._stdin_backlog = self.metrics.gauge(
+            "mcp_stdio_server_stdin_backlog_bytes",
+            "Bytes written to the server that its stdin hasn't taken yet.",
+            labels,
+        )
+        self._inbox_depth = self.metrics.gauge(
+            "mcp_stdio_server_inbox_depth",
+            "Messages from the server waiting to be consumed.",
+            labels,
+        )
+        self._limit_actions = self.metrics.counter(
+            "mcp_stdio_server_limit_actions_total",
+            "Restarts and refusals triggered by resource limits.",
+            ("server", "action"),
+        )
 
     async def add_server(self, server_id: str, connection_info: dict[str, Any]) -> None:
         """Register how to reach a server (doesn't connect yet).
@@ -49,6 +161,11 @@ class StdioClientTransport(ClientTransport):
             connection_info: Transport-specific connection details
                 Expected keys:
                 - "command": list[str] - Command to spawn the server subprocess
+                Optional keys:
+                - "restart": bool - Restart the server when it dies
+                - "spares": int - Spare processes of the command to keep
+                  running, as with prewarm()
+                - "limits": ResourceLimits - Limits for this server
 
         Raises:
             ValueError: If connection_info is invalid
@@ -63,8 +180,23 @@ class StdioClientTransport(ClientTransport):
         if not all(isinstance(item, str) for item in server_command):
             raise ValueError("'command' must be a non-empty list of strings")
 
-        server_process = ServerProcess(server_command=server_command)
+        restart = connection_info.get("restart", False)
+        if not isinstance(restart, bool):
+            raise ValueError("'restart' must be a bool")
+        spares = connection_info.get("spares", 0)
+        if not isinstance(spares, int) or spares < 0:
+            raise ValueError("'spares' must be a non-negative int")
+
+        limits = connection_info.get("limits")
+        if limits is not None and not isinstance(limits, ResourceLimits):
+            raise ValueError("'limits' must be a ResourceLimits")
+
+        server_process = ServerProcess(
+            server_command=server_command, restart=restart, limits=limits
+        )
         self._servers[server_id] = server_process
+        if spares:
+            self.prewarm(server_command, spares)
         logger.debug(f"Registered server '{server_id}' with command: {server_command}")
 
     async def send(self, server_id: str, message: dict[str, Any]) -> None:
@@ -78,12 +210,17 @@ class StdioClientTransport(ClientTransport):
 
         Raises:
             ValueError: If server_id is not registered
+            ServerAtLimitError: If message is a request and the server is over
+                its resource limits
             ConnectionError: If connection cannot be established or send fails
         """
         if server_id not in self._servers:
             raise ValueError(f"Server '{server_id}' is not registered")
 
         server_process = self._servers[server_id]
+        is_request = "method" in message and "id" in message
+        if server_process.over_limit is not None and is_request:
+            raise ServerAtLimitError(server_id, server_process.over_limit)
 
         await self._ensure_server_running(server_id, server_process)
 
@@ -108,25 +245,54 @@ class StdioClientTransport(ClientTransport):
         """Ensure server is spawned and running, spawn if needed."""
         if server_process.is_running:
             return
+        if server_process.crash_looping:
+            raise ConnectionError(
+                f"Server '{server_id}' keeps crashing; it won't be restarted"
+            )
+        if server_process.restart_task is not None:
+            raise ConnectionError(f"Server '{server_id}' is restarting")
+
+        await self._start_server(server_id, server_process)
 
+    async def _start_server(
+        self, server_id: str, server_process: ServerProcess
+    ) -> None:
+        """Spawn the server and start reading from it."""
         await self._spawn_server(server_id, server_process)
+        self._start_sampler()
 
+        process = server_process.process
         task = asyncio.create_task(
             self._read_from_server(server_id, server_process),
             name=f"reader_task_{server_id}",
         )
         task.add_done_callback(
             lambda t: asyncio.create_task(
-                self._on_reader_done(server_id, server_process, t)
+                self._on_reader_done(server_id, server_process, process, t)
             )
         )
         self._reader_tasks[server_id] = task
 
     async def _on_reader_done(
-        self, server_id: str, server_process: ServerProcess, task: asyncio.Task
+        self,
+        server_id: str,
+        server_process: ServerProcess,
+        process: asyncio.subprocess.Process | None,
+        task: asyncio.Task,
     ) -> None:
-        """Handle reader task completion - always mark server as dead."""
-        if server_id in self._reader_tasks:
+        """Handle reader task completion - mark its process's server as dead.
+
+        Runs a loop iteration or more after the reader finished, by which time
+        the server may have been restarted. A reader that has been replaced, or
+        whose process has, leaves the new ones alone.
+
+        Args:
+            server_id: The server the reader belonged to.
+            server_process: The server's state.
+            process: The process the reader was reading from.
+            task: The finished reader task.
+        """
+        if self._reader_tasks.get(server_id) is task:
             del self._reader_tasks[server_id]
 
         if task.cancelled():
@@ -138,13 +304,37 @@ class StdioClientTransport(ClientTransport):
         else:
             logger.debug(f"Reader task for server '{server_id}' completed normally")
 
+        if server_process.process is not process:
+            return  # Already replaced by a restart
         await self._mark_server_dead(server_id, server_process)
 
     async def _mark_server_dead(
         self, server_id: str, server_process: ServerProcess
     ) -> None:
-        """Handle server death - cleanup state but keep registration."""
+        """Handle server death - cleanup state but keep registration.
+
+        Servers registered with "restart" are restarted after a backoff.
+        """
+        if server_process.stopping:
+            return  # disconnect_server is shutting it down
+        process = server_process.process
         server_process.process = None
+        server_process.framer = None
+        if server_process.writer is not None:
+            server_process.writer.close()
+            server_process.writer = None
+        if process is not None and process.returncode is None:
+            # We won't read from it again, so don't leave it running
+            try:
+                process.kill()
+            except ProcessLookupError:
+                pass
+        if (
+            process is not None
+            and server_process.restart
+            and not server_process.stopping
+        ):
+            self._schedule_restart(server_id, server_process)
 
         if server_id in self._reader_tasks:
             self._reader_tasks[server_id].cancel()
@@ -164,11 +354,19 @@ class StdioClientTransport(ClientTransport):
                 f"Starting server subprocess '{server_id}': "
                 f"{server_process.server_command}"
             )
-            server_process.process = await asyncio.create_subprocess_exec(
-                *server_process.server_command,
-                stdin=asyncio.subprocess.PIPE,
-                stdout=asyncio.subprocess.PIPE,
-                stderr=None,
+            process = self._pool.take(server_process.server_command)
+            if process is None:
+                process = await self._create_process(server_process.server_command)
+            server_process.process = process
+            server_process.framer = LineFramer(
+                server_process.process.stdout,  # type: ignore[arg-type]
+                self.max_message_size,
+            )
+            stdin = server_process.process.stdin
+            server_process.writer = FrameWriter(
+                stdin.write,  # type: ignore[union-attr]
+                stdin.drain,  # type: ignore[union-attr]
+                name=server_id,
             )
 
             logger.debug(
@@ -181,30 +379,242 @@ class StdioClientTransport(ClientTransport):
             server_process.process = None
             raise ConnectionError(f"Failed to start server '{server_id}': {e}") from e
 
+    @staticmethod
+    async def _create_process(command: list[str]) -> asyncio.subprocess.Process:
+        return await asyncio.create_subprocess_exec(
+            *command,
+            stdin=asyncio.subprocess.PIPE,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=None,
+        )
+
+    # ================================
+    # Warm pool
+    # ================================
+
+    def prewarm(self, command: list[str], count: int = 1) -> None:
+        """Keep spare processes of a command running ahead of need.
+
+        Servers with this command, including restarts of crashed ones, take a
+        spare instead of waiting for a fresh process to start. Each spare
+        taken is replaced in the background. Spares run no handshake until a
+        server takes them.
+
+        Args:
+            command: Command the servers are spawned with.
+            count: Spares to keep. 0 stops keeping spares.
+        """
+        self._pool.set_target(command, count)
+
+    def warm_pool_stats(self) -> WarmPoolStats:
+        """Spares ready, started, and how often spawns found one."""
+        return self._pool.stats()
+
+    # ================================
+    # Supervision
+    # ================================
+
+    def _schedule_restart(self, server_id: str, server_process: ServerProcess) -> None:
+        """Count a crash and restart the server after a backoff."""
+        now = time.monotonic()
+        crashes = server_process.crashes
+        crashes.append(now)
+        while now - crashes[0] > self.restart_window:
+            crashes.popleft()
+
+        if len(crashes) > self.max_restarts:
+            server_process.crash_looping = True
+            logger.error(
+                f"Server '{server_id}' crashed {len(crashes)} times within "
+                f"{self.restart_window:.0f}s; not restarting it"
+            )
+            return
+
+        delay = min(
+            self.restart_backoff * 2 ** (len(crashes) - 1), self.max_restart_backoff
+        )
+        logger.warning(f"Server '{server_id}' exited; restarting in {delay:.1f}s")
+        server_process.restart_task = asyncio.create_task(
+            self._restart_server(server_id, server_process, delay),
+            name=f"restart_{server_id}",
+        )
+
+    async def _restart_server(
+        self, server_id: str, server_process: ServerProcess, delay: float
+    ) -> None:
+        await asyncio.sleep(delay)
+        try:
+            await self._start_server(server_id, server_process)
+        except ConnectionError:
+            server_process.restart_task = None
+            self._schedule_restart(server_id, server_process)  # Counts as a crash
+            return
+        server_process.restart_task = None
+        await self._on_restarted(server_id, server_process)
+
+    async def _on_restarted(
+        self, server_id: str, server_process: ServerProcess
+    ) -> None:
+        server_process.restarts += 1
+        logger.info(f"Restarted server '{server_id}'")
+
+        if self.restart_handler is not None:
+            try:
+                await self.restart_handler(server_id)
+            except Exception as e:
+                logger.warning(f"Restart handler failed for server '{server_id}': {e}")
+
+    # ================================
+    # Resource accounting
+    # ================================
+
+    def resource_usage(self, server_id: str) -> ProcessUsage | None:
+        """Latest resource sample of a server, or None if it has none yet."""
+        server_process = self._servers.get(server_id)
+        return server_process.usage if server_process is not None else None
+
+    def sample_resources(self) -> None:
+        """Sample every running server now and enforce its limits."""
+        for server_id, server_process in list(self._servers.items()):
+            self._sample_server(server_id, server_process)
+
+    def _start_sampler(self) -> None:
+        if self.sample_interval is None:
+            return
+        if self._sampler is not None and not self._sampler.done():
+            return
+        self._sampler = asyncio.create_task(
+            self._sample_loop(), name="stdio_resource_sampler"
+        )
+
+    async def _sample_loop(self) -> None:
+        """Sample while any server runs; the next spawn starts it again."""
+        while any(sp.is_running for sp in self._servers.values()):
+            await asyncio.sleep(self.sample_interval)  # type: ignore[arg-type]
+            self.sample_resources()
+
+    def _sample_server(self, server_id: str, server_process: ServerProcess) -> None:
+        process = server_process.process
+        if process is None or process.returncode is not None:
+            return
+        usage = read_process_usage(process.pid)
+        if usage is None:
+            return
+
+        now = time.monotonic()
+        previous = server_process.usage
+        if previous is not None and previous.pid == usage.pid:
+            elapsed = now - server_process.sampled_at
+            if elapsed > 0:
+                used = usage.cpu_seconds - previous.cpu_seconds
+                usage.cpu_percent = 100 * used / elapsed
+        usage.stdin_backlog_bytes = self._stdin_backlog_bytes(server_process)
+        usage.inbox_depth = self._inbox.qsize(server_id)
+        server_process.usage, server_process.sampled_at = usage, now
+
+        self._rss.set(server_id, value=usage.rss_bytes)
+        self._cpu.set(server_id, value=usage.cpu_seconds)
+        self._open_fds.set(server_id, value=usage.open_fds)
+        self._stdin_backlog.set(server_id, value=usage.stdin_backlog_bytes)
+        self._inbox_depth.set(server_id, value=usage.inbox_depth)
+        self._enforce_limits(server_id, server_process, usage)
+
+    @staticmethod
+    def _stdin_backlog_bytes(server_process: ServerProcess) -> int:
+        backlog = 0
+        if server_process.writer is not None:
+            backlog += server_process.writer.buffered_bytes
+        process = server_process.process
+        if process is not None and process.stdin is not None:
+            backlog += process.stdin.transport.get_write_buffer_size()
+        return backlog
+
+    def _enforce_limits(
+        self, server_id: str, server_process: ServerProcess, usage: ProcessUsage
+    ) -> None:
+        limits = server_process.limits or self.limits
+        if limits is None or server_process.restart_task is not None:
+            return
+
+        reason = limits.exceeded(usage)
+        if reason is None:
+            if server_process.over_limit is not None:
+                logger.info(f"Server '{server_id}' is back under its limits")
+                server_process.over_limit = None
+            return
+
+        if limits.action == "refuse":
+            if server_process.over_limit is None:
+                logger.warning(f"Server '{server_id}' {reason}; refusing new requests")
+                self._limit_actions.inc(server_id, "refuse")
+            server_process.over_limit = reason
+            return
+
+        logger.warning(f"Server '{server_id}' {reason}; restarting it")
+        self._limit_actions.inc(server_id, "restart")
+        server_process.over_limit = reason
+        server_process.restart_task = asyncio.create_task(
+            self._restart_over_limit(server_id, server_process),
+            name=f"restart_{server_id}",
+        )
+
+    async def _restart_over_limit(
+        self, server_id: str, server_process: ServerProcess
+    ) -> None:
+        """Shut the server down gracefully and start a fresh process."""
+        server_process.stopping = True  # Its exit isn't a crash
+        try:
+            await self._stop_server(server_id, server_process)
+            server_process.stopping = False
+            await self._start_server(server_id, server_process)
+        except ConnectionError as e:
+            logger.error(f"Failed to restart server '{server_id}': {e}")
+            return
+        finally:
+            server_process.restart_task = None
+            server_process.over_limit = None
+        await self._on_restarted(server_id, server_process)
+
     async def _write_to_server_stdin(
         self, server_process: ServerProcess, data: bytes
     ) -> None:
-        """Write data to a server's stdin."""
+        """Queue data for a server's stdin.
+
+        Sends to one server within an event loop iteration share a single
+        write. A broken pipe is reported by the next send after it.
+        """
 
         try:
-            server_process.process.stdin.write(data)  # type: ignore[union-attr]
-            await server_process.process.stdin.drain()  # type: ignore[union-attr]
-        except (BrokenPipeError, ConnectionResetError) as e:
+            await server_process.writer.write(data)  # type: ignore[union-attr]
+        except ConnectionError as e:
             raise ConnectionError("Server process closed connection") from e
 
+    def writer_stats(self, server_id: str) -> FrameWriterStats | None:
+        """Frames and writes to a server's stdin, or None if it isn't running."""
+        server_process = self._servers.get(server_id)
+        if server_process is None or server_process.writer is None:
+            return None
+        return server_process.writer.stats()
+
     def server_messages(self) -> AsyncIterator[ServerMessage]:
         """Stream of messages from all servers with explicit server context.
 
+        Servers take turns, one message each.
+
         Yields:
             ServerMessage: Message with server ID and metadata
         """
         return self._message_queue_iterator()
 
+    def inbox_stats(self) -> ServerInboxStats:
+        """Queued, dropped, and backpressured message counts."""
+        return self._inbox.stats()
+
     async def _message_queue_iterator(self) -> AsyncIterator[ServerMessage]:
-        """Async iterator that yields messages from the multiplexed queue."""
+        """Async iterator that yields messages from the per-server queues."""
         while True:
             try:
-                message = await self._message_queue.get()
+                message = await self._inbox.get()
                 yield message
             except Exception as e:
                 logger.error(f"Error reading from message queue: {e}")
@@ -215,14 +625,21 @@ class StdioClientTransport(ClientTransport):
     ) -> None:
         """Background task to read messages from one server."""
         while server_process.is_running:
-            line = await self._read_line_from_server_stdout(server_process)
+            try:
+                line = await self._read_message_from_server(server_process)
+            except MessageTooLargeError as e:
+                logger.warning(f"Server '{server_id}': {e}")
+                continue
             if line is None:
                 logger.debug(f"Server '{server_id}' closed stdout")
                 break
 
             message = parse_json_message(line)
             if message is None:
-                logger.warning(f"Invalid JSON from server '{server_id}': {line}")
+                if line.strip():
+                    logger.warning(
+                        f"Invalid JSON from server '{server_id}': {line[:200]!r}"
+                    )
                 continue
 
             server_message = ServerMessage(
@@ -231,28 +648,32 @@ class StdioClientTransport(ClientTransport):
                 timestamp=time.time(),
             )
 
-            await self._message_queue.put(server_message)
-            logger.debug(f"Received message from server '{server_id}': {line.strip()}")
+            # Waits while this server's queue is full, which stops us reading
+            # its stdout until the consumer catches up
+            await self._inbox.put(server_message)
+            logger.debug(
+                f"Received message from server '{server_id}' ({len(line)} bytes)"
+            )
 
-    async def _read_line_from_server_stdout(
+    async def _read_message_from_server(
         self, server_process: ServerProcess
-    ) -> str | None:
-        """Read one line from a server's stdout.
+    ) -> bytes | None:
+        """Read one newline-delimited message from a server's stdout.
 
         Returns:
-            Decoded line string, or None if EOF
+            The message bytes, or None if EOF
 
         Raises:
+            MessageTooLargeError: If the message was over the size limit
             ConnectionError: If read fails
         """
-        if server_process.process is None:
+        if server_process.process is None or server_process.framer is None:
             raise ConnectionError("Server process is not running")
 
         try:
-            line_bytes = await server_process.process.stdout.readline()  # type: ignore[union-attr]
-            if not line_bytes:
-                return None
-            return line_bytes.decode("utf-8")
+            return await server_process.framer.read_message()
+        except MessageTooLargeError:
+            raise
         except Exception as e:
             raise ConnectionError(f"Failed to read from server stdout: {e}") from e
 
@@ -268,6 +689,35 @@ class StdioClientTransport(ClientTransport):
             return
 
         server_process = self._servers[server_id]
+        server_process.stopping = True
+        if server_process.restart_task is not None:
+            server_process.restart_task.cancel()
+            server_process.restart_task = None
+
+        await self._stop_server(server_id, server_process)
+
+        del self._servers[server_id]
+        self._inbox.remove_server(server_id)
+        for gauge in (
+            self._rss,
+            self._cpu,
+            self._open_fds,
+            self._stdin_backlog,
+            self._inbox_depth,
+        ):
+            gauge.remove(server_id)
+        self._limit_actions.remove(server_id, "refuse")
+        self._limit_actions.remove(server_id, "restart")
+        logger.debug(f"Disconnected from server '{server_id}'")
+
+    async def _stop_server(self, server_id: str, server_process: ServerProcess) -> None:
+        """Flush, stop reading, and shut down the server's process."""
+        if server_process.writer is not None:
+            # Let queued messages reach the server before it's shut down
+            try:
+                await asyncio.wait_for(server_process.writer.flush(), timeout=5.0)
+            except (ConnectionError, asyncio.TimeoutError):
+                pass
 
         if server_id in self._reader_tasks:
             self._reader_tasks[server_id].cancel()
@@ -279,9 +729,6 @@ class StdioClientTransport(ClientTransport):
 
         await self._shutdown_server_process(server_id, server_process)
 
-        del self._servers[server_id]
-        logger.debug(f"Disconnected from server '{server_id}'")
-
     async def _shutdown_server_process(
         self, server_id: str, server_process: ServerProcess
     ) -> None:
@@ -291,6 +738,10 @@ class StdioClientTransport(ClientTransport):
 
         logger.debug(f"Starting graceful shutdown for server '{server_id}'")
 
+        if server_process.writer is not None:
+            server_process.writer.close()
+            server_process.writer = None
+
         try:
             # Step 1: Close stdin to signal shutdown
             if (
@@ -350,3 +801,7 @@ class StdioClientTransport(ClientTransport):
         """Close the transport and clean up all resources."""
         for server_id in list(self._servers):
             await self.disconnect_server(server_id)
+        await self._pool.close()
+        if self._sampler is not None:
+            self._sampler.cancel()
+            self._sampler = None
@@ -0,0 +1,158 @@
+"""Server processes spawned ahead of need.
+
+Starting a stdio server means starting an interpreter and importing its
+dependencies, often one to three seconds before it can answer anything. A
+WarmPool keeps spare processes of a command already running, so connecting a
+server or restarting a crashed one takes a process that has done that work.
+Each spare taken is replaced in the background.
+
+Spares aren't sent the MCP handshake: it carries the client's capabilities and
+its result belongs to the server that ends up using the process, so the
+session runs it once the spare is assigned.
+"""
+
+import asyncio
+import logging
+from collections import deque
+from dataclasses import dataclass
+from typing import Awaitable, Callable
+
+logger = logging.getLogger(__name__)
+
+Process = asyncio.subprocess.Process
+
+
+@dataclass
+class WarmPoolStats:
+    """Counters for a WarmPool."""
+
+    hits: int = 0  # Spawns served by a spare
+    misses: int = 0  # Spawns of a pooled command with no spare ready
+    spawned: int = 0  # Spares started
+    ready: int = 0  # Spares currently waiting
+
+
+class WarmPool:
+    """Keeps a target number of spare processes running per command."""
+
+    def __init__(self, spawn: Callable[[list[str]], Awaitable[Process]]) -> None:
+        """Initialize an empty pool.
+
+        Args:
+            spawn: Starts a process for a command, with piped stdin and stdout.
+        """
+        self._spawn = spawn
+        self._targets: dict[tuple[str, ...], int] = {}
+        self._spares: dict[tuple[str, ...], deque[Process]] = {}
+        self._fillers: dict[tuple[str, ...], asyncio.Task[None]] = {}
+        self._stats = WarmPoolStats()
+
+    def stats(self) -> WarmPoolStats:
+        """Snapshot of the pool's counters."""
+        stats = WarmPoolStats(**vars(self._stats))
+        stats.ready = sum(len(spares) for spares in self._spares.values())
+        return stats
+
+    def set_target(self, command: list[str], count: int) -> None:
+        """Keep count spare processes of a command running.
+
+        Spares beyond a lowered target are stopped. A target of 0 stops pooling
+        the command.
+        """
+        if count < 0:
+            raise ValueError("count must not be negative")
+        key = tuple(command)
+        if count == 0:
+            self._targets.pop(key, None)
+        else:
+            self._targets[key] = count
+
+        spares = self._spares.setdefault(key, deque())
+        while len(spares) > count:
+            self._discard(spares.pop())
+        if not spares:
+            del self._spares[key]
+        self._refill(key)
+
+    def take(self, command: list[str]) -> Process | None:
+        """A running spare for the command, or None if none is ready."""
+        key = tuple(command)
+        if key not in self._targets:
+            return None
+
+        spares = self._spares.get(key)
+        process = None
+        while spares:
+            candidate = spares.popleft()
+            if candidate.returncode is None:
+                process = candidate
+                break
+            logger.debug(f"Discarding spare {candidate.pid} that exited early")
+
+        if process is None:
+            self._stats.misses += 1
+        else:
+            self._stats.hits += 1
+        self._refill(key)
+        return process
+
+    async def close(self) -> None:
+        """Stop refilling and shut down every spare."""
+        fillers = list(self._fillers.values())
+        for filler in fillers:
+            filler.cancel()
+        await asyncio.gather(*fillers, return_exceptions=True)
+        self._targets.clear()
+
+        spares = [p for spares in self._spares.values() for p in spares]
+        self._spares.clear()
+        await asyncio.gather(*(_stop(p) for p in spares))
+
+    # ================================
+    # Filling
+    # ================================
+
+    def _refill(self, key: tuple[str, ...]) -> None:
+        if key in self._fillers:
+            return
+        if len(self._spares.get(key, ())) >= self._targets.get(key, 0):
+            return
+        filler = asyncio.create_task(self._fill(key), name=f"warm_pool_{key[0]}")
+        self._fillers[key] = filler
+        filler.add_done_callback(lambda _: self._fillers.pop(key, None))
+
+    async def _fill(self, key: tuple[str, ...]) -> None:
+        while len(self._spares.get(key, ())) < self._targets.get(key, 0):
+            try:
+                process = await self._spawn(list(key))
+            except Exception as e:
+                # Don't retry in a loop; the next take() tries again
+                logger.warning(f"Failed to start a spare for {list(key)}: {e}")
+                return
+            if key not in self._targets:
+                self._discard(process)  # Target dropped while we spawned
+                return
+            self._spares.setdefault(key, deque()).append(process)
+            self._stats.spawned += 1
+
+    def _discard(self, process: Process) -> None:
+        task = asyncio.create_task(_stop(process), name=f"stop_spare_{process.pid}")
+        task.add_done_callback(lambda t: t.cancelled() or t.exception())
+
+
+async def _stop(process: Process, timeout: float = 2.0) -> None:
+    """Close a spare's stdin and wait for it to exit, killing it if it won't."""
+    if process.returncode is not None:
+        return
+    if process.stdin is not None and not process.stdin.is_closing():
+        process.stdin.close()
+    try:
+        await asyncio.wait_for(process.wait(), timeout)
+        return
+    except asyncio.TimeoutError:
+        pass
+    try:
+        process.kill()
+    except ProcessLookupError:
+        return
+    await process.wait()
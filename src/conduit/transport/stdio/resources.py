@@ -0,0 +1,93 @@
+"""Resource usage of stdio server processes, read from /proc.
+
+Sampling a process reads two small /proc files: its stat line for CPU time and
+resident memory, and its fd directory for open descriptors. Both are served
+from kernel memory, so a sample costs microseconds and can run on the event
+loop. On systems without /proc, sampling returns None and limits never fire.
+"""
+
+import os
+from dataclasses import dataclass
+from typing import Literal
+
+LimitAction = Literal["restart", "refuse"]
+
+_CLOCK_TICKS = os.sysconf("SC_CLK_TCK") if hasattr(os, "sysconf") else 100
+_PAGE_SIZE = os.sysconf("SC_PAGE_SIZE") if hasattr(os, "sysconf") else 4096
+
+
+@dataclass
+class ProcessUsage:
+    """One sample of a server process's resource usage."""
+
+    pid: int
+    rss_bytes: int
+    cpu_seconds: float  # User plus system time since the process started
+    open_fds: int
+    cpu_percent: float = 0.0  # Over the interval since the previous sample
+    stdin_backlog_bytes: int = 0  # Written by us, not yet taken by the pipe
+    inbox_depth: int = 0  # Messages from the server we haven't consumed
+
+
+@dataclass
+class ResourceLimits:
+    """Usage past which a server is restarted or refused new requests.
+
+    Unset limits aren't checked. "restart" shuts the server down gracefully
+    and starts a fresh process. "refuse" fails new requests to it until a
+    later sample is back under every limit; responses and notifications
+    still go through.
+    """
+
+    max_rss_bytes: int | None = None
+    max_cpu_percent: float | None = None
+    max_open_fds: int | None = None
+    max_stdin_backlog_bytes: int | None = None
+    action: LimitAction = "refuse"
+
+    def __post_init__(self) -> None:
+        if self.action not in ("restart", "refuse"):
+            raise ValueError(f"Unknown limit action: {self.action}")
+
+    def exceeded(self, usage: ProcessUsage) -> str | None:
+        """Describe the first limit the usage is over, or None."""
+        checks = (
+            ("RSS", usage.rss_bytes, self.max_rss_bytes),
+            ("CPU %", usage.cpu_percent, self.max_cpu_percent),
+            ("open fds", usage.open_fds, self.max_open_fds),
+            ("stdin backlog", usage.stdin_backlog_bytes, self.max_stdin_backlog_bytes),
+        )
+        for name, value, limit in checks:
+            if limit is not None and value > limit:
+                return f"{name} {value:g} over limit {limit:g}"
+        return None
+
+
+class ServerAtLimitError(ConnectionError):
+    """A server over its resource limits refused a new request."""
+
+    def __init__(self, server_id: str, reason: str):
+        self.server_id = server_id
+        self.reason = reason
+        super().__init__(f"Server '{server_id}' is over its resource limits: {reason}")
+
+
+def read_process_usage(pid: int) -> ProcessUsage | None:
+    """Sample a process from /proc, or None if it's gone or /proc is missing."""
+    try:
+        with open(f"/proc/{pid}/stat", "rb") as f:
+            stat = f.read()
+        open_fds = len(os.listdir(f"/proc/{pid}/fd"))
+    except OSError:
+        return None
+
+    # The command name may contain spaces and parentheses; fields resume
+    # after the last ')'. utime and stime are fields 14 and 15, rss is 24.
+    fields = stat[stat.rindex(b")") + 2 :].split()
+    utime, stime, rss_pages = int(fields[11]), int(fields[12]), int(fields[21])
+    return ProcessUsage(
+        pid=pid,
+        rss_bytes=rss_pages * _PAGE_SIZE,
+        cpu_seconds=(utime + stime) / _CLOCK_TICKS,
+        open_fds=open_fds,
+    )
@@ -1,10 +1,38 @@
 import asyncio
+import os
+import stat
 import sys
 import time
 from typing import Any, AsyncIterator
 
 from conduit.transport.server import ClientMessage, ServerTransport, TransportContext
-from conduit.transport.stdio.shared import parse_json_message, serialize_message
+from conduit.transport.stdio.shared import (
+    DEFAULT_MAX_MESSAGE_SIZE,
+    FrameWriter,
+    FrameWriterStats,
+    LineFramer,
+    MessageTooLargeError,
+    parse_json_message,
+    serialize_message,
+)
+
+
+async def _no_drain() -> None:
+    pass
+
+
+def _is_pipe(stream: Any) -> bool:
+    """True if an asyncio pipe transport can take over the stream.
+
+    Only FIFOs and sockets qualify. connect_write_pipe() would also take a
+    terminal, but it sets O_NONBLOCK on it, and a tty usually shares its open
+    file with stderr, whose plain writes would then fail with BlockingIOError.
+    """
+    try:
+        mode = os.fstat(stream.fileno()).st_mode
+    except (OSError, ValueError):
+        return False
+    return stat.S_ISFIFO(mode) or stat.S_ISSOCK(mode)
 
 
 class StdioServerTransport(ServerTransport):
@@ -14,13 +42,21 @@ class StdioServerTransport(ServerTransport):
     The client manages our process lifecycle by launching us as a subprocess.
     """
 
-    def __init__(self) -> None:
+    def __init__(self, max_message_size: int = DEFAULT_MAX_MESSAGE_SIZE) -> None:
         """Initialize stdio server transport.
 
         Sets up async stdin reader for the single client connection.
+
+        Args:
+            max_message_size: Longest message in bytes to accept from the
+                client. Longer ones are skipped with a warning.
         """
         self._client_id = "stdio-client"
+        self.max_message_size = max_message_size
         self._stdin_reader: asyncio.StreamReader | None = None
+        self._framer: LineFramer | None = None
+        self._writer: FrameWriter | None = None
+        self._writer_lock = asyncio.Lock()
 
     async def _setup_stdin_reader(self) -> None:
         """Set up async stdin reader using protocol."""
@@ -30,6 +66,40 @@ class StdioServerTransport(ServerTransport):
         self._stdin_reader = asyncio.StreamReader()
         protocol = asyncio.StreamReaderProtocol(self._stdin_reader)
         await asyncio.get_event_loop().connect_read_pipe(lambda: protocol, sys.stdin)
+        self._framer = LineFramer(self._stdin_reader, self.max_message_size)
+
+    async def _setup_stdout_writer(self) -> FrameWriter:
+        """Set up the coalescing stdout writer.
+
+        Writes go through a non-blocking pipe transport when stdout is a pipe
+        or socket, as it is when a client launched us. Anything else, such as
+        a file or a terminal, gets blocking writes, still one per batch of
+        frames.
+        """
+        async with self._writer_lock:
+            if self._writer is not None:
+                return self._writer
+
+            if not _is_pipe(sys.stdout):
+                self._writer = FrameWriter(self._write_stdout_blocking, _no_drain)
+                return self._writer
+
+            loop = asyncio.get_running_loop()
+            transport, protocol = await loop.connect_write_pipe(
+                asyncio.streams.FlowControlMixin, sys.stdout
+            )
+
+            # Drain only once everything is handed to the OS, so nothing is left
+            # buffered in the transport when we exit after a send.
+            transport.set_write_buffer_limits(high=0)
+            stdout = asyncio.StreamWriter(transport, protocol, None, loop)
+            self._writer = FrameWriter(stdout.write, stdout.drain)
+            return self._writer
+
+    @staticmethod
+    def _write_stdout_blocking(data: bytes) -> None:
+        sys.stdout.buffer.write(data)
+        sys.stdout.buffer.flush()
 
     async def send(
         self,
@@ -39,6 +109,9 @@ class StdioServerTransport(ServerTransport):
     ) -> None:
         """Send message to the client via stdout.
 
+        The message is queued for the stdout writer, which sends everything
+        queued in one event loop iteration with a single write.
+
         Args:
             client_id: Ignored for stdio (always 1:1 relationship)
             message: JSON-RPC message to send
@@ -46,16 +119,19 @@ class StdioServerTransport(ServerTransport):
 
         Raises:
             ValueError: If message is invalid
-            ConnectionError: If stdout is closed or write fails
+            ConnectionError: If stdout is closed or an earlier write failed
         """
+        frame = (serialize_message(message) + "\n").encode("utf-8")
+        writer = self._writer or await self._setup_stdout_writer()
         try:
-            json_str = serialize_message(message)
-            print(json_str, file=sys.stdout, flush=True)
-        except ValueError:
-            raise
-        except Exception as e:
+            await writer.write(frame)
+        except ConnectionError as e:
             raise ConnectionError(f"Failed to send message: {e}") from e
 
+    def writer_stats(self) -> FrameWriterStats | None:
+        """Frames and writes to stdout so far, or None before the first send."""
+        return self._writer.stats() if self._writer is not None else None
+
     def client_messages(self) -> AsyncIterator[ClientMessage]:
         """Stream of messages from the client with explicit client context.
 
@@ -70,19 +146,22 @@ class StdioServerTransport(ServerTransport):
 
         try:
             while True:
-                line_bytes = await self._stdin_reader.readline()
+                try:
+                    line = await self._framer.read_message()  # type: ignore[union-attr]
+                except MessageTooLargeError as e:
+                    print(f"Warning: {e}", file=sys.stderr)
+                    continue
 
-                if not line_bytes:
+                if line is None:
                     sys.exit(0)
 
-                line = line_bytes.decode("utf-8")
-
                 message = parse_json_message(line)
                 if message is None:
-                    print(
-                        f"Warning: Invalid JSON received: {line.strip()}",
-                        file=sys.stderr,
-                    )
+                    if line.strip():
+                        print(
+                            f"Warning: Invalid JSON received: {line[:200]!r}",
+                            file=sys.stderr,
+                        )
                     continue
 
                 client_message = ClientMessage(
@@ -101,6 +180,7 @@ class StdioServerTransport(ServerTransport):
         Args:
             client_id: Ignored for stdio (always 1:1 relationship)
         """
+        await self._flush_stdout()
         try:
             sys.stdout.close()
         except Exception:
@@ -110,9 +190,19 @@ class StdioServerTransport(ServerTransport):
 
     async def close(self) -> None:
         """Close the transport and clean up all resources."""
+        await self._flush_stdout()
         try:
             sys.stdout.close()
         except Exception:
             pass
 
         sys.exit(0)
+
+    async def _flush_stdout(self) -> None:
+        """Let queued messages reach stdout before we close it."""
+        if self._writer is None:
+            return
+        try:
+            await asyncio.wait_for(self._writer.flush(), timeout=5.0)
+        except (ConnectionError, asyncio.TimeoutError):
+            pass
@@ -1,12 +1,252 @@
+import asyncio
 import json
-from typing import Any
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable
 
+# Largest message we accept by default. Generous enough for multi-megabyte
+# tool results; a guard against runaway peers rather than a protocol limit.
+DEFAULT_MAX_MESSAGE_SIZE = 256 * 1024 * 1024
 
-def parse_json_message(line: str) -> dict[str, Any] | None:
+# How much to ask the pipe for at a time.
+READ_CHUNK_SIZE = 256 * 1024
+
+
+class MessageTooLargeError(ValueError):
+    """A peer sent a message over the size limit. It was skipped."""
+
+    def __init__(self, size: int, max_size: int):
+        self.size = size
+        self.max_size = max_size
+        super().__init__(
+            f"Skipped a message of at least {size} bytes (limit {max_size})"
+        )
+
+
+class LineFramer:
+    """Splits a byte stream into newline-delimited messages of any size.
+
+    StreamReader.readline() fails on lines longer than the reader's limit
+    (64 KiB by default), and raising the limit also raises how much the reader
+    buffers before it stops reading from the pipe. This reads fixed-size chunks
+    into one growing buffer instead, and remembers how far it has already
+    searched for a newline, so each byte is scanned once however many chunks a
+    message spans.
+    """
+
+    def __init__(
+        self,
+        reader: asyncio.StreamReader,
+        max_message_size: int = DEFAULT_MAX_MESSAGE_SIZE,
+    ) -> None:
+        """Initialize the framer.
+
+        Args:
+            reader: Stream to read from.
+            max_message_size: Longest message, in bytes, to accept. Longer
+                ones are discarded and reported with MessageTooLargeError.
+        """
+        self._reader = reader
+        self.max_message_size = max_message_size
+        self._buffer = bytearray()
+        self._scanned = 0  # Bytes of _buffer known to hold no newline
+
+    async def read_message(self) -> bytes | None:
+        """Return the next message without its newline, or None at EOF.
+
+        A final message with no trailing newline is returned at EOF.
+
+        Raises:
+            MessageTooLargeError: If the next message was over the limit. It
+                has been skipped; the next call reads the one after it.
+        """
+        while True:
+            newline = self._buffer.find(b"\n", self._scanned)
+            if newline != -1:
+                message = None
+                if newline <= self.max_message_size:
+                    with memoryview(self._buffer) as view:
+                        message = bytes(view[:newline])
+                # Deleting from the front of a bytearray doesn't move the rest
+                del self._buffer[: newline + 1]
+                self._scanned = 0
+                if message is None:
+                    raise MessageTooLargeError(newline, self.max_message_size)
+                return message
+
+            self._scanned = len(self._buffer)
+            if self._scanned > self.max_message_size:
+                await self._skip_rest_of_message()
+
+            chunk = await self._reader.read(READ_CHUNK_SIZE)
+            if not chunk:
+                if not self._buffer:
+                    return None
+                message = bytes(self._buffer)
+                self._buffer.clear()
+                self._scanned = 0
+                return message
+            self._buffer += chunk
+
+    async def _skip_rest_of_message(self) -> None:
+        """Discard an oversized message up to and including its newline."""
+        skipped = len(self._buffer)
+        self._buffer.clear()
+        self._scanned = 0
+        while True:
+            chunk = await self._reader.read(READ_CHUNK_SIZE)
+            if not chunk:
+                break
+            newline = chunk.find(b"\n")
+            if newline != -1:
+                skipped += newline
+                self._buffer += chunk[newline + 1 :]
+                break
+            skipped += len(chunk)
+        raise MessageTooLargeError(skipped, self.max_message_size)
+
+
+@dataclass
+class FrameWriterStats:
+    """Counters for a FrameWriter."""
+
+    frames: int = 0
+    writes: int = 0
+    bytes_written: int = 0
+    blocked_writes: int = 0  # Writes that waited for the queue to empty
+
+
+class FrameWriter:
+    """Coalesces frames for one pipe into as few writes as possible.
+
+    write() queues a frame and returns without touching the pipe. A writer
+    task takes everything queued and hands it to the pipe in one write, so
+    frames queued in the same event loop iteration share a syscall. While the
+    task waits on drain() for the pipe to empty, new frames pile up and go out
+    together next. Once more than max_buffered bytes are queued, write() waits
+    too, which carries the pipe's backpressure back to the senders.
+
+    As with StreamWriter, a failed write is reported by the next call. After
+    that the writer stays broken.
+    """
+
+    def __init__(
+        self,
+        write: Callable[[bytes], None],
+        drain: Callable[[], Awaitable[None]],
+        name: str = "stdio",
+        max_buffered: int = 1024 * 1024,
+    ) -> None:
+        """Initialize the writer. Its task starts on the first write.
+
+        Args:
+            write: Hands bytes to the pipe.
+            drain: Waits until the pipe can take more.
+            name: Used in the writer task's name.
+            max_buffered: Queued bytes past which write() waits.
+        """
+        self._write = write
+        self._drain = drain
+        self._name = name
+        self.max_buffered = max_buffered
+        self._frames: list[bytes] = []
+        self._buffered = 0
+        self._wakeup = asyncio.Event()
+        self._has_room = asyncio.Event()
+        self._has_room.set()
+        self._idle = asyncio.Event()  # Nothing queued or being written
+        self._idle.set()
+        self._task: asyncio.Task[None] | None = None
+        self._error: ConnectionError | None = None
+        self._stats = FrameWriterStats()
+
+    def stats(self) -> FrameWriterStats:
+        """Snapshot of the writer's counters."""
+        return FrameWriterStats(**vars(self._stats))
+
+    @property
+    def buffered_bytes(self) -> int:
+        """Bytes queued and not yet handed to the pipe."""
+        return self._buffered
+
+    async def write(self, frame: bytes) -> None:
+        """Queue a frame, waiting only if too much is queued already.
+
+        Raises:
+            ConnectionError: If an earlier write failed or the writer was closed.
+        """
+        if self._error is not None:
+            raise self._error
+        if self._task is None:
+            self._task = asyncio.create_task(
+                self._run(), name=f"frame_writer_{self._name}"
+            )
+        self._frames.append(frame)
+        self._buffered += len(frame)
+        self._idle.clear()
+        self._wakeup.set()
+
+        if self._buffered > self.max_buffered:
+            self._stats.blocked_writes += 1
+            self._has_room.clear()
+            await self._has_room.wait()
+            if self._error is not None:
+                raise self._error
+
+    async def flush(self) -> None:
+        """Wait until everything queued has been handed to the pipe.
+
+        Raises:
+            ConnectionError: If a write failed or the writer was closed.
+        """
+        await self._idle.wait()
+        if self._error is not None:
+            raise self._error
+
+    def close(self) -> None:
+        """Stop the writer and discard anything not yet written."""
+        if self._error is None:
+            self._error = ConnectionError("Writer closed")
+        if self._task is not None:
+            self._task.cancel()
+        self._release_waiters()
+
+    async def _run(self) -> None:
+        while True:
+            await self._wakeup.wait()
+            self._wakeup.clear()
+            if not self._frames:
+                continue
+            frames, self._frames = self._frames, []
+            self._buffered = 0
+            self._has_room.set()
+
+            data = frames[0] if len(frames) == 1 else b"".join(frames)
+            try:
+                self._write(data)
+                await self._drain()
+            except Exception as e:
+                self._error = ConnectionError(f"Write failed: {e}")
+                self._error.__cause__ = e
+                self._release_waiters()
+                return
+            self._stats.frames += len(frames)
+            self._stats.writes += 1
+            self._stats.bytes_written += len(data)
+            if not self._frames:
+                self._idle.set()
+
+    def _release_waiters(self) -> None:
+        self._frames = []
+        self._buffered = 0
+        self._has_room.set()
+        self._idle.set()
+
+
+def parse_json_message(line: str | bytes) -> dict[str, Any] | None:
     """Parse a line as JSON message.
 
     Args:
-        line: Raw line from client stdin
+        line: Raw line from the peer, as text or UTF-8 bytes
 
     Returns:
         Parsed message dict, or None if invalid/should be ignored
@@ -20,7 +260,7 @@ def parse_json_message(line: str) -> dict[str, Any] | None:
         if not isinstance(message, dict):
             return None
         return message
-    except json.JSONDecodeError as e:
+    except (json.JSONDecodeError, UnicodeDecodeError):
         return None
 
 
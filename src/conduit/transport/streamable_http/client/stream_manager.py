@@ -9,6 +9,7 @@ import httpx
 from httpx_sse import aconnect_sse
 
 from conduit.transport.client import ServerMessage
+from conduit.transport.inbox import ServerInbox
 
 logger = logging.getLogger(__name__)
 
@@ -30,7 +31,7 @@ class StreamManager:
         self,
         server_id: str,
         response: httpx.Response,
-        message_queue: asyncio.Queue[ServerMessage],
+        message_queue: ServerInbox,
     ) -> asyncio.Task:
         """Start listening to an SSE stream from an HTTP response.
 
@@ -128,7 +129,7 @@ class StreamManager:
         self,
         server_id: str,
         response: httpx.Response,
-        message_queue: asyncio.Queue[ServerMessage],
+        message_queue: ServerInbox,
     ) -> None:
         """Listen to SSE events from an HTTP response stream.
 
@@ -162,7 +163,7 @@ class StreamManager:
         self,
         server_id: str,
         sse_event: Any,
-        message_queue: asyncio.Queue[ServerMessage],
+        message_queue: ServerInbox,
     ) -> None:
         """Process a single SSE event and queue the message.
 
@@ -185,6 +186,8 @@ class StreamManager:
                 else None,
             )
 
+            # Waits while this server's queue is full, which pauses reading
+            # the stream until the consumer catches up
             await message_queue.put(server_message)
 
             logger.debug(
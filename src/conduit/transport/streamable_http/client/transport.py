@@ -8,6 +8,7 @@ import httpx
 
 from conduit.protocol.base import PROTOCOL_VERSION
 from conduit.transport.client import ClientTransport, ServerMessage
+from conduit.transport.inbox import ServerInbox, ServerInboxStats
 from conduit.transport.streamable_http.client.stream_manager import StreamManager
 
 logger = logging.getLogger(__name__)
@@ -23,12 +24,17 @@ class HttpClientTransport(ClientTransport):
     - Multiple concurrent server connections
     """
 
-    def __init__(self) -> None:
-        """Initialize HTTP client transport."""
+    def __init__(self, max_queued_per_server: int = 1024) -> None:
+        """Initialize HTTP client transport.
+
+        Args:
+            max_queued_per_server: Unconsumed messages a server may have queued
+                before we stop reading its SSE streams. See ServerInbox.
+        """
         self._servers: dict[str, dict[str, Any]] = {}
         self._sessions: dict[str, str] = {}  # server_id -> session_id
         self._http_client = httpx.AsyncClient()
-        self._message_queue: asyncio.Queue[ServerMessage] = asyncio.Queue()
+        self._inbox = ServerInbox(max_queued_per_server)
         self._stream_manager = StreamManager(self._http_client)
 
     # ================================
@@ -116,14 +122,19 @@ class HttpClientTransport(ClientTransport):
     def server_messages(self) -> AsyncIterator[ServerMessage]:
         """Stream of messages from all servers with explicit server context.
 
-        Yields messages from the internal queue as they arrive from HTTP responses
-        and SSE streams. This is the main way consumers get messages from servers.
+        Yields messages from the internal queues as they arrive from HTTP
+        responses and SSE streams, one per server in turn. This is the main way
+        consumers get messages from servers.
 
         Yields:
             ServerMessage: Message with server ID and metadata
         """
         return self._message_queue_iterator()
 
+    def inbox_stats(self) -> ServerInboxStats:
+        """Queued, dropped, and backpressured message counts."""
+        return self._inbox.stats()
+
     async def disconnect_server(self, server_id: str) -> None:
         """Disconnect from specific server.
 
@@ -144,8 +155,9 @@ class HttpClientTransport(ClientTransport):
         if server_id in self._sessions:
             await self._terminate_session(server_id)
 
-        # Remove server configuration
+        # Remove server configuration and anything it left unconsumed
         del self._servers[server_id]
+        self._inbox.remove_server(server_id)
         logger.debug(f"Disconnected from server '{server_id}'")
 
     async def close(self) -> None:
@@ -197,11 +209,11 @@ class HttpClientTransport(ClientTransport):
                     payload=response_data,
                     timestamp=asyncio.get_event_loop().time(),
                 )
-                await self._message_queue.put(server_message)
+                await self._inbox.put(server_message)
 
             elif "text/event-stream" in content_type:
                 await self._stream_manager.start_stream_listener(
-                    server_id, response, message_queue=self._message_queue
+                    server_id, response, message_queue=self._inbox
                 )
 
         elif response.status_code == 202:
@@ -278,7 +290,7 @@ class HttpClientTransport(ClientTransport):
 
             # Stream manager just handles the resulting stream
             await self._stream_manager.start_stream_listener(
-                server_id, response, message_queue=self._message_queue
+                server_id, response, message_queue=self._inbox
             )
 
         except Exception as e:
@@ -413,7 +425,7 @@ class HttpClientTransport(ClientTransport):
         """
         while True:
             try:
-                message = await self._message_queue.get()
+                message = await self._inbox.get()
                 yield message
             except Exception as e:
                 logger.error(f"Error reading from message queue: {e}")
@@ -1,6 +1,7 @@
 """Session management for streamable HTTP transport."""
 
 import logging
+import time
 import uuid
 
 logger = logging.getLogger(__name__)
@@ -9,12 +10,35 @@ logger = logging.getLogger(__name__)
 class SessionManager:
     """Manages client sessions and their lifecycle.
 
-    Maintains a simple mapping from session IDs to client IDs.
+    Maps session IDs to client IDs and back, so both lookups are a dict hit.
+    The transport looks up the session for every message it sends.
     Session IDs are UUIDs that comply with the MCP streamable HTTP spec.
+
+    Sessions are also kept in order of last activity, so finding the least
+    recently used one, or every idle one, never scans active sessions. Ending
+    sessions is up to the transport, which owns the rest of their state.
     """
 
-    def __init__(self) -> None:
+    def __init__(
+        self, idle_timeout: float | None = None, max_sessions: int | None = None
+    ) -> None:
+        """Initialize an empty manager.
+
+        Args:
+            idle_timeout: Seconds without activity after which a session is
+                idle. None means sessions never go idle.
+            max_sessions: Sessions allowed at once. None means no cap.
+        """
+        if idle_timeout is not None and idle_timeout <= 0:
+            raise ValueError("idle_timeout must be positive")
+        if max_sessions is not None and max_sessions < 1:
+            raise ValueError("max_sessions must be at least 1")
+        self.idle_timeout = idle_timeout
+        self.max_sessions = max_sessions
         self._sessions: dict[str, str] = {}  # session_id -> client_id
+        self._clients: dict[str, str] = {}  # client_id -> session_id
+        # session_id -> last activity, least recently active first
+        self._last_seen: dict[str, float] = {}
 
     # ================================
     # Creation
@@ -30,6 +54,8 @@ class SessionManager:
         session_id = str(uuid.uuid4())
 
         self._sessions[session_id] = client_id
+        self._clients[client_id] = session_id
+        self._last_seen[session_id] = time.monotonic()
 
         logger.debug(f"Created session {session_id} for client {client_id}")
         return client_id, session_id
@@ -50,10 +76,42 @@ class SessionManager:
 
         Returns None if client doesn't have a session.
         """
-        for session_id, stored_client_id in self._sessions.items():
-            if stored_client_id == client_id:
-                return session_id
-        return None
+        return self._clients.get(client_id)
+
+    def session_count(self) -> int:
+        """Number of active sessions."""
+        return len(self._sessions)
+
+    # ================================
+    # Activity
+    # ================================
+
+    def touch(self, session_id: str) -> None:
+        """Record activity on a session, making it the most recently used."""
+        if self._last_seen.pop(session_id, None) is not None:
+            self._last_seen[session_id] = time.monotonic()
+
+    def is_full(self) -> bool:
+        """True if creating a session would go over max_sessions."""
+        return self.max_sessions is not None and len(self._sessions) >= (
+            self.max_sessions
+        )
+
+    def least_recently_used(self) -> str | None:
+        """The session with the oldest activity, or None if there are none."""
+        return next(iter(self._last_seen), None)
+
+    def idle_sessions(self) -> list[str]:
+        """Sessions with no activity for idle_timeout, oldest first."""
+        if self.idle_timeout is None:
+            return []
+        cutoff = time.monotonic() - self.idle_timeout
+        idle = []
+        for session_id, last_seen in self._last_seen.items():
+            if last_seen > cutoff:
+                break  # Everything after this is more recent
+            idle.append(session_id)
+        return idle
 
     # ================================
     # Existence
@@ -74,6 +132,8 @@ class SessionManager:
         """
         client_id = self._sessions.pop(session_id, None)
         if client_id is not None:
+            del self._clients[client_id]
+            del self._last_seen[session_id]
             logger.debug(f"Terminated session {session_id} for client {client_id}")
             return True
         return False
@@ -81,4 +141,6 @@ class SessionManager:
     def terminate_all_sessions(self) -> None:
         """Terminate all sessions."""
         self._sessions.clear()
+        self._clients.clear()
+        self._last_seen.clear()
         logger.debug("Terminated all sessions")
@@ -5,24 +5,55 @@ from typing import Any, AsyncIterator
 
 logger = logging.getLogger(__name__)
 
+# json.dumps builds a new encoder on every call when given separators
+_encoder = json.JSONEncoder(separators=(",", ":"))
+
+# Comment frame sent on idle streams. Clients ignore it, but it keeps proxies
+# from timing the connection out.
+HEARTBEAT_FRAME = b": ping\n\n"
+
+
+def _encode_data(message: dict[str, Any]) -> bytes:
+    """Encode a message as the data line of an SSE event, ready to send."""
+    return b"data: " + _encoder.encode(message).encode() + b"\n\n"
+
 
 class SSEStream:
-    """Manages a single SSE stream with proper lifecycle."""
+    """Manages a single SSE stream with proper lifecycle.
 
-    def __init__(self, stream_id: str, client_id: str, request_id: str | int):
+    Events are queued already encoded and carry an `id:` of the form
+    `<stream_id>:<n>`, so a client can tell the server the last one it saw.
+    With a heartbeat interval, a comment frame goes out whenever the stream has
+    been idle that long.
+    """
+
+    def __init__(
+        self,
+        stream_id: str,
+        client_id: str,
+        request_id: str | int,
+        heartbeat_interval: float | None = None,
+    ):
         self.stream_id = stream_id
         self.client_id = client_id
         self.request_id = request_id
-        self._message_queue: asyncio.Queue[dict[str, Any]] = asyncio.Queue()
+        self.heartbeat_interval = heartbeat_interval
+        self._id_prefix = f"id: {stream_id}:".encode()
+        self._next_event_id = 1
+        # (encoded event, is response); None closes the stream
+        self._message_queue: asyncio.Queue[tuple[bytes, bool] | None] = asyncio.Queue()
 
     async def send_message(self, message: dict[str, Any]) -> None:
         """Send message on this stream."""
-        await self._message_queue.put(message)
+        data = _encode_data(message)
+        event = b"%s%d\n%s" % (self._id_prefix, self._next_event_id, data)
+        self._next_event_id += 1
+        await self._message_queue.put((event, self.is_response(message)))
 
     async def close(self) -> None:
         """Explicitly close the stream."""
         # Send sentinel to stop the generator
-        await self._message_queue.put({"__close__": True})
+        await self._message_queue.put(None)
         logger.debug(f"Manually closed stream {self.stream_id}")
 
     def is_response(self, message: dict[str, Any]) -> bool:
@@ -37,29 +68,31 @@ class SSEStream:
         has_error = "error" in message
         return has_valid_id and (has_result ^ has_error)
 
-    async def event_generator(self) -> AsyncIterator[str]:
+    async def event_generator(self) -> AsyncIterator[bytes]:
         """Generate SSE events for this stream.
 
         Automatically closes after sending a response.
 
         Yields:
-            str: SSE event data
+            bytes: An encoded SSE event or heartbeat
         """
         try:
             while True:
-                message = await self._message_queue.get()
+                item = await self._next_item()
+                if item is HEARTBEAT_FRAME:
+                    yield HEARTBEAT_FRAME
+                    continue
 
                 # Check for explicit close sentinel
-                if message.get("__close__"):
+                if item is None:
                     logger.debug(f"Stream {self.stream_id} closed via sentinel")
                     break
 
-                # Format as SSE event
-                event_data = json.dumps(message, separators=(",", ":"))
-                yield f"data: {event_data}\n\n"
+                event, is_response = item
+                yield event
 
                 # Auto-close after sending response
-                if self.is_response(message):
+                if is_response:
                     logger.debug(
                         f"Response sent on stream {self.stream_id}, auto-closing"
                     )
@@ -69,3 +102,13 @@ class SSEStream:
             logger.error(f"Error in stream {self.stream_id}: {e}")
         finally:
             logger.debug(f"Stream {self.stream_id} generator finished")
+
+    async def _next_item(self) -> tuple[bytes, bool] | bytes | None:
+        """Next queued item, or HEARTBEAT_FRAME if none came in time."""
+        if self.heartbeat_interval is None or not self._message_queue.empty():
+            return await self._message_queue.get()
+        try:
+            async with asyncio.timeout(self.heartbeat_interval):
+                return await self._message_queue.get()
+        except TimeoutError:
+            return HEARTBEAT_FRAME
@@ -1,6 +1,6 @@
 import logging
 import uuid
-from typing import Any
+from typing import Any, Callable
 
 from conduit.transport.streamable_http.server.sse_stream import SSEStream
 
@@ -8,22 +8,52 @@ logger = logging.getLogger(__name__)
 
 
 class StreamManager:
-    """Manages multiple SSE streams with routing and cleanup."""
+    """Manages multiple SSE streams with routing and cleanup.
 
-    def __init__(self):
+    Streams are indexed by client, by stream ID, and by the (client, request ID)
+    pair they answer, so routing a message never scans other streams.
+    """
+
+    def __init__(
+        self,
+        heartbeat_interval: float | None = None,
+        on_stream_removed: Callable[[SSEStream], None] | None = None,
+    ):
+        """Initialize with no streams.
+
+        Args:
+            heartbeat_interval: Seconds a stream can sit idle before it sends a
+                heartbeat comment. None sends none.
+            on_stream_removed: Called once for each stream after it is removed,
+                however that happens.
+        """
+        self.heartbeat_interval = heartbeat_interval
+        self.on_stream_removed = on_stream_removed
         self._client_streams: dict[
             str, set[SSEStream]
         ] = {}  # client_id -> set of streams
+        self._streams: dict[str, SSEStream] = {}  # stream_id -> stream
+        self._request_streams: dict[
+            tuple[str, str | int], SSEStream
+        ] = {}  # (client_id, request_id) -> request stream
 
     async def create_stream(
         self, client_id: str, request_id: str | None = None
     ) -> SSEStream:
         """Create and register a new stream."""
         stream_id = str(uuid.uuid4())
-        stream = SSEStream(stream_id, client_id, request_id or "GET")
-
-        # Track by client
+        stream = SSEStream(
+            stream_id,
+            client_id,
+            "GET" if request_id is None else request_id,
+            self.heartbeat_interval,
+        )
+
+        # Track by client, by ID, and by the request it answers
         self._client_streams.setdefault(client_id, set()).add(stream)
+        self._streams[stream_id] = stream
+        if request_id is not None:
+            self._request_streams[(client_id, request_id)] = stream
 
         logger.debug(f"Created stream {stream_id} for client {client_id}")
         return stream
@@ -47,16 +77,13 @@ class StreamManager:
         Returns:
             True if message was sent, False otherwise
         """
-        streams = self._client_streams.get(client_id, set())
-
-        if originating_request_id:
-            for stream in streams:
-                if stream.request_id == originating_request_id:
-                    return await self._send_to_stream(
-                        stream, message, auto_cleanup=True
-                    )
+        if originating_request_id is not None:
+            stream = self._request_streams.get((client_id, originating_request_id))
+            if stream is not None:
+                return await self._send_to_stream(stream, message, auto_cleanup=True)
         else:
             # Use any available stream (first one)
+            streams = self._client_streams.get(client_id)
             if streams:
                 stream = next(iter(streams))
                 return await self._send_to_stream(stream, message, auto_cleanup=False)
@@ -84,25 +111,43 @@ class StreamManager:
 
     def get_stream_by_id(self, stream_id: str) -> SSEStream | None:
         """Get stream by exact stream ID."""
-        for streams in self._client_streams.values():
-            for stream in streams:
-                if stream.stream_id == stream_id:
-                    return stream
-        return None
+        return self._streams.get(stream_id)
+
+    def has_streams(self, client_id: str) -> bool:
+        """True if the client has any open stream."""
+        return client_id in self._client_streams
+
+    def discard_stream(self, stream: SSEStream) -> None:
+        """Forget a stream whose connection has ended, without closing it."""
+        self._untrack(stream)
+
+    def stream_count(self) -> int:
+        """Number of open streams across all clients."""
+        return len(self._streams)
 
     async def _cleanup_stream(self, stream: SSEStream) -> None:
         """Clean up a single stream."""
         # Close the stream (sends sentinel)
         await stream.close()
-
-        # Remove from client tracking
-        if stream.client_id in self._client_streams:
-            self._client_streams[stream.client_id].discard(stream)
-            if not self._client_streams[stream.client_id]:
-                del self._client_streams[stream.client_id]
-
+        self._untrack(stream)
         logger.debug(f"Cleaned up stream {stream.stream_id}")
 
+    def _untrack(self, stream: SSEStream) -> None:
+        """Remove a stream from every index."""
+        if self._streams.get(stream.stream_id) is not stream:
+            return  # Already removed
+        del self._streams[stream.stream_id]
+        client_streams = self._client_streams[stream.client_id]
+        client_streams.discard(stream)
+        if not client_streams:
+            del self._client_streams[stream.client_id]
+        key = (stream.client_id, stream.request_id)
+        if self._request_streams.get(key) is stream:
+            del self._request_streams[key]
+
+        if self.on_stream_removed is not None:
+            self.on_stream_removed(stream)
+
     async def close_all_streams(self) -> None:
         """Close all streams."""
         for streams in list(self._client_streams.values()):
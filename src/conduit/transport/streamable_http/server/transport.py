@@ -18,22 +18,54 @@ import asyncio
 import json
 import logging
 import time
-from typing import Any, AsyncIterator
+from typing import Any, AsyncIterator, Callable
 
 import uvicorn
 from starlette.applications import Starlette
 from starlette.requests import Request
-from starlette.responses import Response, StreamingResponse
+from starlette.responses import PlainTextResponse, Response, StreamingResponse
 from starlette.routing import Route
+from starlette.types import Receive, Scope, Send
 
 from conduit.protocol.base import PROTOCOL_VERSION
 from conduit.shared.message_parser import MessageParser
+from conduit.shared.metrics import MetricsRegistry
 from conduit.transport.server import ClientMessage, ServerTransport, TransportContext
 from conduit.transport.streamable_http.server.session_manager import SessionManager
+from conduit.transport.streamable_http.server.sse_stream import SSEStream
 from conduit.transport.streamable_http.server.stream_manager import StreamManager
 
 logger = logging.getLogger(__name__)
 
+# Seconds clients should wait before retrying a request refused during a drain.
+DRAIN_RETRY_AFTER = 1
+
+# Longest wait between sweeps for idle sessions.
+MAX_SWEEP_INTERVAL = 60.0
+
+
+class _SSEResponse(StreamingResponse):
+    """Streaming response that calls on_close once Starlette is done with it.
+
+    The body generator's own cleanup only runs if Starlette started iterating
+    it. When the client disconnects before the body starts, or sending fails,
+    on_close still runs.
+    """
+
+    def __init__(
+        self, content: AsyncIterator[bytes], on_close: Callable[[], None], **kwargs: Any
+    ) -> None:
+        super().__init__(content, **kwargs)
+        self._on_close = on_close
+        self.started = False
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        self.started = True
+        try:
+            await super().__call__(scope, receive, send)
+        finally:
+            self._on_close()
+
 
 class HttpServerTransport(ServerTransport):
     """HTTP server transport supporting multiple client connections.
@@ -52,19 +84,59 @@ class HttpServerTransport(ServerTransport):
     Stream Types:
         - Request streams: client:request:123 (ephemeral, auto-close)
         - Server streams: client:server:abc (persistent, server-initiated)
+
+    Session expiry:
+        A session with no requests and no open stream for `session_idle_timeout`
+        seconds is ended by a background sweep. Past `max_sessions`, creating a
+        session ends the least recently active one. Ending a session closes its
+        streams and calls `disconnect_handler`, so the session layer drops the
+        client's state too. The client gets 404 and starts a new session.
+
+    Metrics:
+        Active sessions, active streams, inbound queue depth, bytes in/out, and
+        sessions ended by expiry are recorded in `metrics`. Set `metrics_path` to
+        serve the registry in Prometheus text format (e.g. GET /metrics).
     """
 
     def __init__(
-        self, endpoint_path: str = "/mcp", host: str = "127.0.0.1", port: int = 8000
+        self,
+        endpoint_path: str = "/mcp",
+        host: str = "127.0.0.1",
+        port: int = 8000,
+        metrics: MetricsRegistry | None = None,
+        metrics_path: str | None = None,
+        session_idle_timeout: float | None = 3600.0,
+        max_sessions: int | None = None,
+        sse_heartbeat_interval: float | None = 15.0,
     ) -> None:
-        """Initialize HTTP server transport."""
+        """Initialize HTTP server transport.
+
+        Args:
+            endpoint_path: Path of the MCP endpoint.
+            host: Interface to bind.
+            port: Port to bind.
+            metrics: Registry to record transport metrics in. Share it with the
+                ServerSession to export everything from one place.
+            metrics_path: If set, serve the registry at this path.
+            session_idle_timeout: Seconds of inactivity after which a session is
+                ended. None keeps sessions until the client deletes them.
+            max_sessions: Sessions allowed at once; the least recently active
+                is ended to make room. None means no cap.
+            sse_heartbeat_interval: Seconds an SSE stream can sit idle before a
+                heartbeat comment is sent, so proxies don't cut it. None sends
+                none.
+        """
         self.endpoint_path = endpoint_path
         self.host = host
         self.port = port
+        self.metrics = metrics or MetricsRegistry()
 
         # Core managers - will inject these in the future as needed
-        self._session_manager = SessionManager()
-        self._stream_manager = StreamManager()
+        self._session_manager = SessionManager(session_idle_timeout, max_sessions)
+        self._stream_manager = StreamManager(
+            sse_heartbeat_interval, on_stream_removed=self._on_stream_removed
+        )
+        self._sweeper: asyncio.Task[None] | None = None
 
         # Message parser - always default
         self._message_parser = MessageParser()
@@ -72,18 +144,53 @@ class HttpServerTransport(ServerTransport):
         # Message queue for client messages
         self._message_queue: asyncio.Queue[ClientMessage] = asyncio.Queue()
 
+        # Drain state: request streams still being written to clients
+        self._draining = False
+        # stream_id -> (stream, its response)
+        self._open_request_streams: dict[str, tuple[SSEStream, _SSEResponse]] = {}
+        self._request_streams_closed = asyncio.Event()
+
+        self._register_metrics()
+
         # HTTP server setup
-        self._app = Starlette(
-            routes=[
-                Route(
-                    endpoint_path,
-                    self._handle_mcp_endpoint,
-                    methods=["POST", "GET", "DELETE"],
-                )
-            ]
-        )
+        routes = [
+            Route(
+                endpoint_path,
+                self._handle_mcp_endpoint,
+                methods=["POST", "GET", "DELETE"],
+            )
+        ]
+        if metrics_path is not None:
+            routes.append(
+                Route(metrics_path, self._handle_metrics_endpoint, methods=["GET"])
+            )
+        self._app = Starlette(routes=routes)
         self._server = None
 
+    def _register_metrics(self) -> None:
+        """Register transport metrics in the registry."""
+        self.metrics.gauge(
+            "mcp_http_active_sessions", "Sessions with a live Mcp-Session-Id."
+        ).set_function(lambda: self._session_manager.session_count())
+        self.metrics.gauge("mcp_http_active_streams", "Open SSE streams.").set_function(
+            lambda: self._stream_manager.stream_count()
+        )
+        self.metrics.gauge(
+            "mcp_http_inbound_queue_depth",
+            "Client messages waiting for the session to read them.",
+        ).set_function(lambda: self._message_queue.qsize())
+        self._bytes_in = self.metrics.counter(
+            "mcp_http_received_bytes_total", "Request body bytes received."
+        )
+        self._bytes_out = self.metrics.counter(
+            "mcp_http_sent_bytes_total", "SSE bytes sent to clients."
+        )
+        self._sessions_expired = self.metrics.counter(
+            "mcp_http_sessions_expired_total",
+            "Sessions ended by the server, by reason (idle or capacity).",
+            ("reason",),
+        )
+
     # ================================
     # Lifecycle
     # ================================
@@ -97,12 +204,19 @@ class HttpServerTransport(ServerTransport):
 
         # Start server in background task
         asyncio.create_task(self._server.serve())
+        if self._session_manager.idle_timeout is not None:
+            self._sweeper = asyncio.create_task(
+                self._sweep_loop(), name="http_session_sweeper"
+            )
         logger.info(
             f"HTTP server started on {self.host}:{self.port}{self.endpoint_path}"
         )
 
     async def stop(self) -> None:
         """Stop the HTTP server."""
+        if self._sweeper is not None:
+            self._sweeper.cancel()
+            self._sweeper = None
         if self._server:
             self._server.should_exit = True
             await self._server.shutdown()
@@ -147,11 +261,30 @@ class HttpServerTransport(ServerTransport):
         """Stream of messages from all clients."""
         return self._message_queue_iterator()
 
+    async def start_draining(self) -> None:
+        """Refuse new requests with 503 and a Retry-After header.
+
+        Notifications and responses are still accepted so in-flight handlers
+        can finish.
+        """
+        self._draining = True
+
+    async def flush(self) -> None:
+        """Wait until every request stream has written its response.
+
+        A stream whose connection failed, or that was removed before its
+        response was ever served, counts as done.
+        """
+        while self._open_request_streams:
+            self._request_streams_closed.clear()
+            await self._request_streams_closed.wait()
+
     async def disconnect_client(self, client_id: str) -> None:
-        """Disconnect specific client."""
+        """Disconnect specific client, ending its session and closing its streams."""
         session_id = self._session_manager.get_session_id(client_id)
         if session_id:
             self._session_manager.terminate_session(session_id)
+        await self._stream_manager.cleanup_client_streams(client_id)
 
     async def close(self) -> None:
         """Close the transport and clean up all resources.
@@ -185,12 +318,23 @@ class HttpServerTransport(ServerTransport):
             logger.error(f"Error handling MCP request: {e}")
             return Response("Internal server error", status_code=500)
 
+    async def _handle_metrics_endpoint(self, request: Request) -> Response:
+        """Serve the metrics registry in Prometheus text format."""
+        return PlainTextResponse(
+            self.metrics.render_prometheus(),
+            media_type="text/plain; version=0.0.4",
+        )
+
     async def _handle_post_request(self, request: Request) -> Response:
         """Handle HTTP POST request with JSON-RPC message."""
         headers_error = self._validate_protocol_headers(request)
         if headers_error:
             return headers_error
 
+        content_length = request.headers.get("content-length", "")
+        if content_length.isdigit():
+            self._bytes_in.inc(amount=int(content_length))
+
         try:
             message_data = await request.json()
             if not isinstance(message_data, dict):
@@ -207,6 +351,17 @@ class HttpServerTransport(ServerTransport):
         if jsonrpc_error:
             return jsonrpc_error
 
+        if (
+            self._draining
+            and self._is_mcp_request(message_data)
+            and message_data["method"] != "ping"  # Health checks still answered
+        ):
+            return Response(
+                "Server is shutting down",
+                status_code=503,
+                headers={"Retry-After": str(DRAIN_RETRY_AFTER)},
+            )
+
         session_error = self._validate_session(request, message_data)
         if session_error:
             return session_error
@@ -248,6 +403,7 @@ class HttpServerTransport(ServerTransport):
         client_id = self._session_manager.get_client_id(session_id)
         if not client_id:
             return Response("Invalid or expired session", status_code=404)
+        self._session_manager.touch(session_id)
 
         headers = self._build_server_stream_headers(request, session_id)
 
@@ -257,8 +413,11 @@ class HttpServerTransport(ServerTransport):
                 f"Created server stream {stream.stream_id} for client {client_id}"
             )
 
-            return StreamingResponse(
-                stream.event_generator(),
+            # Forgotten once its connection ends, so it no longer keeps the
+            # session alive
+            return _SSEResponse(
+                self._stream_events(stream.event_generator()),
+                on_close=lambda: self._stream_manager.discard_stream(stream),
                 media_type="text/event-stream",
                 headers=headers,
             )
@@ -272,7 +431,7 @@ class HttpServerTransport(ServerTransport):
         if not session_id:
             return Response("Missing session ID", status_code=400)
 
-        if not self._session_manager.terminate_session(session_id):
+        if not await self._end_session(session_id):
             return Response("Session not found", status_code=404)
 
         return Response(status_code=200)
@@ -397,6 +556,12 @@ class HttpServerTransport(ServerTransport):
         )
 
         if is_initialize:
+            while self._session_manager.is_full():
+                oldest = self._session_manager.least_recently_used()
+                if oldest is None:
+                    break
+                logger.info(f"Ending session {oldest} to stay under max_sessions")
+                await self._end_session(oldest, reason="capacity")
             client_id, session_id = self._session_manager.create_session()
             return client_id, session_id
         else:
@@ -406,8 +571,69 @@ class HttpServerTransport(ServerTransport):
             client_id = self._session_manager.get_client_id(session_id)
             if not client_id:
                 raise ValueError("Client not found for session")
+            self._session_manager.touch(session_id)
             return client_id, session_id
 
+    async def _end_session(self, session_id: str, reason: str | None = None) -> bool:
+        """End a session and everything the transport holds for its client.
+
+        Closes the client's streams and tells the session layer through
+        disconnect_handler.
+
+        Args:
+            session_id: The session to end.
+            reason: Why the server ended it, for metrics. None when the client
+                asked (DELETE).
+
+        Returns:
+            True if the session existed.
+        """
+        client_id = self._session_manager.get_client_id(session_id)
+        if client_id is None:
+            return False
+        self._session_manager.terminate_session(session_id)
+        await self._stream_manager.cleanup_client_streams(client_id)
+        if reason is not None:
+            self._sessions_expired.inc(reason)
+
+        if self.disconnect_handler is not None:
+            try:
+                await self.disconnect_handler(client_id)
+            except Exception as e:
+                logger.warning(f"Disconnect handler failed for client {client_id}: {e}")
+        return True
+
+    async def expire_idle_sessions(self) -> int:
+        """End every session idle for longer than the idle timeout.
+
+        A session with an open stream isn't idle; its activity is refreshed
+        instead.
+
+        Returns:
+            The number of sessions ended.
+        """
+        expired = 0
+        for session_id in self._session_manager.idle_sessions():
+            client_id = self._session_manager.get_client_id(session_id)
+            if client_id is not None and self._stream_manager.has_streams(client_id):
+                self._session_manager.touch(session_id)
+                continue
+            logger.info(f"Ending idle session {session_id}")
+            if await self._end_session(session_id, reason="idle"):
+                expired += 1
+        return expired
+
+    async def _sweep_loop(self) -> None:
+        idle_timeout = self._session_manager.idle_timeout
+        assert idle_timeout is not None
+        interval = min(idle_timeout / 2, MAX_SWEEP_INTERVAL)
+        while True:
+            await asyncio.sleep(interval)
+            try:
+                await self.expire_idle_sessions()
+            except Exception as e:
+                logger.error(f"Error expiring idle sessions: {e}")
+
     # ================================
     # Stream Management
     # ================================
@@ -424,16 +650,43 @@ class HttpServerTransport(ServerTransport):
         """
         try:
             stream = await self._stream_manager.create_stream(client_id, request_id)
-
-            return StreamingResponse(
-                stream.event_generator(),
+            response = _SSEResponse(
+                self._stream_events(stream.event_generator()),
+                on_close=lambda: self._release_request_stream(stream),
                 media_type="text/event-stream",
                 headers=headers,
             )
+            # Count the stream now, not when Starlette starts iterating it, so a
+            # flush() right after this POST was accepted still waits for it
+            self._open_request_streams[stream.stream_id] = (stream, response)
+            return response
         except Exception as e:
             logger.error(f"Failed to create request stream for client {client_id}: {e}")
             return Response("Internal server error", status_code=500)
 
+    def _release_request_stream(self, stream: SSEStream) -> None:
+        """Stop counting a request stream as open and forget it.
+
+        Runs once its response is done with, whether or not the body was
+        written. A stream the client left before its answer is forgotten too,
+        so it doesn't keep the session from expiring. Safe to call more than
+        once.
+        """
+        if self._open_request_streams.pop(stream.stream_id, None) is not None:
+            self._request_streams_closed.set()
+        self._stream_manager.discard_stream(stream)
+
+    def _on_stream_removed(self, stream: SSEStream) -> None:
+        """Release a request stream removed before Starlette called its response.
+
+        That happens once it was answered or its session ended, and nothing
+        else would release it. A response Starlette is serving is released when
+        it finishes instead, after the answer is written.
+        """
+        entry = self._open_request_streams.get(stream.stream_id)
+        if entry is not None and not entry[1].started:
+            self._release_request_stream(stream)
+
     # ================================
     # Response Builders
     # ================================
@@ -470,6 +723,14 @@ class HttpServerTransport(ServerTransport):
         """Check if message is an MCP request (has method field and id)."""
         return self._message_parser.is_valid_request(message_data)
 
+    async def _stream_events(
+        self, events: AsyncIterator[bytes]
+    ) -> AsyncIterator[bytes]:
+        """Pass SSE events through, counting the bytes sent."""
+        async for event in events:
+            self._bytes_out.inc(amount=len(event))
+            yield event
+
     async def _message_queue_iterator(self) -> AsyncIterator[ClientMessage]:
         """Async iterator that yields messages from the queue."""
         while True:
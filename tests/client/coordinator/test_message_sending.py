@@ -213,6 +213,80 @@ class TestRequestSending:
             coordinator.server_manager.get_request_to_server(server_id, "req-1") is None
         )
 
+    async def test_allocates_sequential_integer_request_ids(
+        self, coordinator, mock_transport
+    ):
+        # Arrange
+        await coordinator.start()
+        server_id = "server1"
+        coordinator.server_manager.register_server(server_id)
+        await mock_transport.add_server(server_id, {})
+
+        # Act - send two requests and let them time out quickly
+        tasks = [
+            asyncio.create_task(
+                coordinator.send_request(server_id, PingRequest(), timeout=0.02)
+            )
+            for _ in range(2)
+        ]
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+        # Assert
+        sent_ids = [
+            message["id"]
+            for message in mock_transport.sent_messages[server_id]
+            if message.get("method") == "ping"
+        ]
+        assert sent_ids == [1, 2]
+
+    async def test_cancelling_the_caller_cancels_the_request_on_the_server(
+        self, coordinator, mock_transport, yield_loop
+    ):
+        # Arrange
+        await coordinator.start()
+        server_id = "server1"
+        coordinator.server_manager.register_server(server_id)
+        await mock_transport.add_server(server_id, {})
+        request_task = asyncio.create_task(
+            coordinator.send_request(server_id, ListToolsRequest())
+        )
+        await yield_loop()
+
+        # Act
+        request_task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await request_task
+
+        # Assert
+        request_message, cancellation = mock_transport.sent_messages[server_id]
+        assert cancellation["method"] == "notifications/cancelled"
+        assert cancellation["params"]["requestId"] == request_message["id"]
+        assert cancellation["params"]["reason"] == "Request cancelled"
+
+    async def test_records_response_time_on_the_server(
+        self, coordinator, mock_transport, yield_loop
+    ):
+        # Arrange
+        await coordinator.start()
+        server_id = "server1"
+        coordinator.server_manager.register_server(server_id)
+        await mock_transport.add_server(server_id, {})
+        request_task = asyncio.create_task(
+            coordinator.send_request(server_id, PingRequest())
+        )
+        await yield_loop()
+
+        # Act
+        request_id = mock_transport.sent_messages[server_id][0]["id"]
+        mock_transport.add_server_message(
+            server_id, {"jsonrpc": "2.0", "id": request_id, "result": {}}
+        )
+        await request_task
+
+        # Assert
+        latency = coordinator.server_manager.get_server(server_id).latency
+        assert len(latency["ping"]) == 1
+
 
 class TestNotificationSending:
     async def test_send_fails_when_not_running(self, coordinator):
@@ -0,0 +1,36 @@
+from conduit.protocol.common import EmptyResult
+
+
+class TestRequestMiddleware:
+    async def test_middleware_wraps_server_request_handler(
+        self, coordinator, mock_transport, yield_loop
+    ):
+        # Arrange
+        calls = []
+        server_id = "server1"
+        coordinator.server_manager.register_server(server_id)
+        await mock_transport.add_server(server_id, {})
+
+        async def handler(context, request):
+            calls.append("handler")
+            return EmptyResult()
+
+        async def observe(context, request, call_next):
+            calls.append(f"before {request.method}")
+            result = await call_next(context, request)
+            calls.append("after")
+            return result
+
+        coordinator.register_request_handler("roots/list", handler)
+        coordinator.add_request_middleware(observe)
+        await coordinator.start()
+
+        # Act
+        mock_transport.add_server_message(
+            server_id, {"jsonrpc": "2.0", "id": 1, "method": "roots/list"}
+        )
+        await yield_loop()
+
+        # Assert
+        assert calls == ["before roots/list", "handler", "after"]
+        assert mock_transport.sent_messages[server_id][0]["result"] == {}
@@ -68,3 +68,49 @@ class TestNotificationHandling:
 
         # Assert - should handle gracefully (no exceptions raised)
         assert True
+
+    async def test_cancellation_runs_before_handle_returns(self, coordinator):
+        """Control-plane notifications are handled inline, not in a task."""
+        # Arrange
+        server_id = "test_server"
+        coordinator.server_manager.register_server(server_id)
+        mock_handler = AsyncMock()
+        coordinator.register_notification_handler(
+            "notifications/cancelled", mock_handler
+        )
+        payload = {
+            "jsonrpc": "2.0",
+            "method": "notifications/cancelled",
+            "params": {"requestId": "test-request-123"},
+        }
+
+        # Act - no yield to the event loop
+        await coordinator._handle_notification(server_id, payload)
+
+        # Assert
+        mock_handler.assert_awaited_once()
+
+    async def test_notifications_from_one_server_share_a_lane(
+        self, coordinator, yield_loop
+    ):
+        # Arrange
+        server_id = "test_server"
+        coordinator.server_manager.register_server(server_id)
+        mock_handler = AsyncMock()
+        coordinator.register_notification_handler(
+            "notifications/progress", mock_handler
+        )
+        payload = {
+            "jsonrpc": "2.0",
+            "method": "notifications/progress",
+            "params": {"progressToken": "token", "progress": 1},
+        }
+
+        # Act
+        for _ in range(10):
+            await coordinator._handle_notification(server_id, payload)
+
+        # Assert - one lane worker instead of a task per notification
+        assert coordinator.tasks.live_tasks == 1
+        await yield_loop()
+        assert mock_handler.await_count == 10
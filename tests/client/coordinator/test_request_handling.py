@@ -1,9 +1,10 @@
 import asyncio
 
 from conduit.client.message_context import MessageContext
-from conduit.protocol.base import INTERNAL_ERROR, METHOD_NOT_FOUND
+from conduit.protocol.base import INTERNAL_ERROR, METHOD_NOT_FOUND, OVERLOADED
 from conduit.protocol.common import EmptyResult, PingRequest
 from conduit.protocol.elicitation import ElicitRequest, ElicitResult
+from conduit.shared.task_supervisor import TaskSupervisor
 
 
 class TestRequestHandling:
@@ -281,3 +282,63 @@ class TestRequestHandling:
 
         error = response["error"]
         assert error["code"] == METHOD_NOT_FOUND
+
+    async def test_ping_is_answered_inline(self, coordinator, mock_transport):
+        """Control-plane requests respond without spawning a handler task."""
+
+        # Arrange
+        async def ping_handler(
+            context: MessageContext, request: PingRequest
+        ) -> EmptyResult:
+            return EmptyResult()
+
+        await mock_transport.add_server("server-1", {})
+        coordinator.server_manager.register_server("server-1")
+        coordinator.register_request_handler("ping", ping_handler)
+        payload = {"jsonrpc": "2.0", "id": "ping-1", "method": "ping"}
+
+        # Act - no yield to the event loop
+        await coordinator._handle_request("server-1", payload)
+
+        # Assert
+        responses = mock_transport.sent_messages["server-1"]
+        assert responses == [{"jsonrpc": "2.0", "id": "ping-1", "result": {}}]
+
+    async def test_refuses_requests_past_the_task_cap(
+        self, coordinator, mock_transport
+    ):
+        # Arrange
+        coordinator.tasks = TaskSupervisor(max_tasks=1)
+        release = asyncio.Event()
+
+        async def blocking_handler(context, request):
+            await release.wait()
+            return ElicitResult(action="cancel")
+
+        await mock_transport.add_server("server-1", {})
+        coordinator.server_manager.register_server("server-1")
+        coordinator.register_request_handler("elicitation/create", blocking_handler)
+        payloads = [
+            {
+                "jsonrpc": "2.0",
+                "id": request_id,
+                "method": "elicitation/create",
+                "params": {
+                    "message": "Name?",
+                    "requestedSchema": {"type": "object", "properties": {}},
+                },
+            }
+            for request_id in (1, 2)
+        ]
+
+        # Act - returns without waiting for the first handler
+        for payload in payloads:
+            await asyncio.wait_for(
+                coordinator._handle_request("server-1", payload), timeout=1.0
+            )
+
+        # Assert
+        (refusal,) = mock_transport.sent_messages["server-1"]
+        assert refusal["id"] == 2
+        assert refusal["error"]["code"] == OVERLOADED
+        release.set()
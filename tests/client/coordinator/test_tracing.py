@@ -0,0 +1,73 @@
+import asyncio
+
+from conduit.protocol.common import EmptyResult, PingRequest
+from conduit.shared.tracing import InMemorySpanExporter, SpanContext, Tracer
+
+TRACE_ID = "4bf92f3577b34da6a3ce929d0e0e4736"
+SPAN_ID = "00f067aa0ba902b7"
+
+
+class TestTracing:
+    async def test_send_request_injects_trace_context(
+        self, coordinator, mock_transport, yield_loop
+    ):
+        # Arrange
+        exporter = InMemorySpanExporter()
+        coordinator.tracer = Tracer(exporter)
+        server_id = "server1"
+        coordinator.server_manager.register_server(server_id)
+        await mock_transport.add_server(server_id, {})
+        await coordinator.start()
+        request = PingRequest()
+
+        # Act
+        request_task = asyncio.create_task(
+            coordinator.send_request(server_id, request, timeout=1.0)
+        )
+        await yield_loop()
+        sent = mock_transport.sent_messages[server_id][0]
+        mock_transport.add_server_message(
+            server_id, {"jsonrpc": "2.0", "id": sent["id"], "result": {}}
+        )
+        await request_task
+
+        # Assert
+        context = SpanContext.from_traceparent(sent["params"]["_meta"]["traceparent"])
+        send_span = next(
+            span for span in exporter.spans if span.name.startswith("mcp.client.send")
+        )
+        assert context == send_span.context
+        assert request.metadata is None
+
+    async def test_request_from_server_joins_server_trace(
+        self, coordinator, mock_transport, yield_loop
+    ):
+        # Arrange
+        exporter = InMemorySpanExporter()
+        coordinator.tracer = Tracer(exporter)
+        server_id = "server1"
+        coordinator.server_manager.register_server(server_id)
+        await mock_transport.add_server(server_id, {})
+
+        async def handler(context, request):
+            return EmptyResult()
+
+        coordinator.register_request_handler("roots/list", handler)
+        await coordinator.start()
+
+        # Act
+        mock_transport.add_server_message(
+            server_id,
+            {
+                "jsonrpc": "2.0",
+                "id": 7,
+                "method": "roots/list",
+                "params": {"_meta": {"traceparent": f"00-{TRACE_ID}-{SPAN_ID}-01"}},
+            },
+        )
+        await yield_loop()
+
+        # Assert
+        names = {span.name for span in exporter.spans}
+        assert {"mcp.client.receive", "mcp.client.request roots/list"} <= names
+        assert all(span.context.trace_id == TRACE_ID for span in exporter.spans)
@@ -1,11 +1,37 @@
+import asyncio
 from unittest.mock import AsyncMock
 
 import pytest
 
 from conduit.client.message_context import MessageContext
-from conduit.client.protocol.sampling import SamplingManager, SamplingNotConfiguredError
+from conduit.client.protocol.sampling import (
+    PRIORITY_AGING_SECONDS,
+    SamplingManager,
+    SamplingNotConfiguredError,
+    SamplingScheduler,
+)
 from conduit.protocol.content import TextContent
-from conduit.protocol.sampling import CreateMessageRequest, CreateMessageResult
+from conduit.protocol.sampling import (
+    CreateMessageRequest,
+    CreateMessageResult,
+    ModelPreferences,
+)
+
+
+async def yield_loop(seconds: float = 0.01) -> None:
+    await asyncio.sleep(seconds)
+
+
+def make_request(max_tokens: int = 100, speed: float | None = None):
+    preferences = None if speed is None else ModelPreferences(speed_priority=speed)
+    return CreateMessageRequest(
+        messages=[], max_tokens=max_tokens, preferences=preferences
+    )
+
+
+RESULT = CreateMessageResult(
+    role="assistant", content=TextContent(text="Hello!"), model="gpt-4o"
+)
 
 
 class TestSamplingManager:
@@ -52,3 +78,206 @@ class TestSamplingManager:
         # Assert
         handler.assert_awaited_once_with(request)
         assert result is expected_result
+
+    async def test_handle_create_message_goes_through_scheduler(self):
+        # Arrange
+        scheduler = SamplingScheduler(max_concurrency=1)
+        manager = SamplingManager(scheduler)
+        manager.sampling_handler = AsyncMock(return_value=RESULT)
+
+        # Act
+        result = await manager.handle_create_message(self.context, make_request())
+
+        # Assert
+        assert result is RESULT
+        assert scheduler.stats().started == 1
+
+
+class GatedHandler:
+    """Sampling handler that holds each request until the test releases it."""
+
+    def __init__(self):
+        self.started: list[CreateMessageRequest] = []
+        self.release = asyncio.Event()
+
+    async def __call__(self, request: CreateMessageRequest) -> CreateMessageResult:
+        self.started.append(request)
+        await self.release.wait()
+        return RESULT
+
+
+class TestSamplingScheduler:
+    async def test_limits_concurrency(self):
+        # Arrange
+        scheduler = SamplingScheduler(max_concurrency=2)
+        handler = GatedHandler()
+
+        # Act
+        runs = [
+            asyncio.create_task(scheduler.run("s", make_request(), handler))
+            for _ in range(5)
+        ]
+        await yield_loop()
+
+        # Assert
+        assert len(handler.started) == 2
+        assert scheduler.stats().queued == 3
+        handler.release.set()
+        await asyncio.gather(*runs)
+        stats = scheduler.stats()
+        assert stats.started == 5
+        assert stats.running == 0
+        assert stats.max_queue_time > 0
+
+    async def test_servers_take_turns(self):
+        # Arrange - a slot is held while both servers queue up
+        scheduler = SamplingScheduler(max_concurrency=1)
+        blocker = GatedHandler()
+        blocking = asyncio.create_task(scheduler.run("x", make_request(), blocker))
+        await yield_loop()
+        order = []
+
+        async def record(server_id):
+            async def handler(request):
+                order.append(server_id)
+                return RESULT
+
+            await scheduler.run(server_id, make_request(), handler)
+
+        runs = [asyncio.create_task(record("chatty")) for _ in range(3)]
+        await yield_loop()
+        runs.append(asyncio.create_task(record("quiet")))
+        await yield_loop()
+
+        # Act
+        blocker.release.set()
+        await asyncio.gather(blocking, *runs)
+
+        # Assert - "quiet" arrived last but doesn't wait for all of "chatty"
+        assert order[:2] == ["chatty", "quiet"]
+
+    async def test_higher_speed_priority_runs_first(self):
+        # Arrange
+        scheduler = SamplingScheduler(max_concurrency=1)
+        blocker = GatedHandler()
+        blocking = asyncio.create_task(scheduler.run("x", make_request(), blocker))
+        await yield_loop()
+        handler = GatedHandler()
+        handler.release.set()
+
+        # Act
+        runs = [
+            asyncio.create_task(scheduler.run("a", make_request(speed=0.1), handler)),
+            asyncio.create_task(scheduler.run("b", make_request(speed=0.9), handler)),
+        ]
+        await yield_loop()
+        blocker.release.set()
+        await asyncio.gather(blocking, *runs)
+
+        # Assert
+        speeds = [r.preferences.speed_priority for r in handler.started]
+        assert speeds == [0.9, 0.1]
+
+    async def test_token_budget_holds_back_requests_that_dont_fit(self):
+        # Arrange
+        scheduler = SamplingScheduler(max_concurrency=4, max_tokens_in_flight=1000)
+        handler = GatedHandler()
+
+        # Act
+        runs = [
+            asyncio.create_task(scheduler.run("s", make_request(600), handler))
+            for _ in range(2)
+        ]
+        await yield_loop()
+
+        # Assert
+        assert len(handler.started) == 1
+        assert scheduler.stats().tokens_in_flight == 600
+        handler.release.set()
+        await asyncio.gather(*runs)
+
+    async def test_oversized_request_runs_alone(self):
+        # Arrange
+        scheduler = SamplingScheduler(max_tokens_in_flight=100)
+        handler = GatedHandler()
+        handler.release.set()
+
+        # Act
+        await scheduler.run("s", make_request(5000), handler)
+
+        # Assert
+        assert scheduler.stats().started == 1
+
+    async def test_cancelled_requests_are_dropped_from_the_queue(self):
+        # Arrange
+        scheduler = SamplingScheduler(max_concurrency=1)
+        handler = GatedHandler()
+        running = asyncio.create_task(scheduler.run("s", make_request(), handler))
+        queued = asyncio.create_task(scheduler.run("s", make_request(), handler))
+        await yield_loop()
+
+        # Act
+        queued.cancel()
+        await yield_loop()
+        handler.release.set()
+        await running
+
+        # Assert
+        assert len(handler.started) == 1
+        stats = scheduler.stats()
+        assert stats.dropped == 1
+        assert stats.queued == 0
+        assert stats.running == 0
+
+    async def test_waiting_request_overtakes_newer_urgent_ones_from_its_server(self):
+        # Arrange - a low-priority request has waited a full aging step
+        scheduler = SamplingScheduler(max_concurrency=1)
+        blocker = GatedHandler()
+        blocking = asyncio.create_task(scheduler.run("x", make_request(), blocker))
+        await yield_loop()
+        handler = GatedHandler()
+        handler.release.set()
+        runs = [
+            asyncio.create_task(scheduler.run("s", make_request(speed=0.1), handler))
+        ]
+        await yield_loop()
+        for waiter in scheduler._queues["s"]:
+            waiter.enqueued_at -= PRIORITY_AGING_SECONDS
+
+        # Act
+        runs += [
+            asyncio.create_task(scheduler.run("s", make_request(speed=0.9), handler))
+            for _ in range(2)
+        ]
+        await yield_loop()
+        blocker.release.set()
+        await asyncio.gather(blocking, *runs)
+
+        # Assert
+        speeds = [r.preferences.speed_priority for r in handler.started]
+        assert speeds == [0.1, 0.9, 0.9]
+
+    async def test_cancelling_the_head_starts_requests_that_fit(self):
+        # Arrange - a queued request too big for the budget holds back a small one
+        scheduler = SamplingScheduler(max_concurrency=4, max_tokens_in_flight=1000)
+        handler = GatedHandler()
+        running = asyncio.create_task(scheduler.run("s", make_request(600), handler))
+        await yield_loop()
+        big = asyncio.create_task(
+            scheduler.run("s", make_request(600, speed=0.9), handler)
+        )
+        small = asyncio.create_task(
+            scheduler.run("s", make_request(100, speed=0.1), handler)
+        )
+        await yield_loop()
+        assert len(handler.started) == 1
+
+        # Act
+        big.cancel()
+        await yield_loop()
+
+        # Assert
+        assert [r.max_tokens for r in handler.started] == [600, 100]
+        assert scheduler.stats().queued == 0
+        handler.release.set()
+        await asyncio.gather(running, small)
@@ -0,0 +1,157 @@
+import asyncio
+from contextlib import aclosing
+from unittest.mock import AsyncMock
+
+import pytest
+
+from conduit.client.session import ClientConfig, ClientSession
+from conduit.protocol.base import INTERNAL_ERROR, Error
+from conduit.protocol.common import EmptyResult, PingRequest
+from conduit.protocol.initialization import ClientCapabilities, Implementation
+from conduit.protocol.tools import ListToolsRequest
+
+
+class TestBroadcastRequest:
+    def setup_method(self):
+        self.session = ClientSession(
+            AsyncMock(),
+            ClientConfig(
+                client_info=Implementation(name="test-client", version="1.0.0"),
+                capabilities=ClientCapabilities(),
+            ),
+        )
+        self.session._coordinator.start = AsyncMock()
+        self.delays: dict[str, float] = {}
+        self.failures: dict[str, Exception] = {}
+        self.in_flight = 0
+        self.peak_in_flight = 0
+        self.cancelled: list[str] = []
+        self.session._coordinator.send_request = self.fake_send_request
+
+    async def fake_send_request(self, server_id, request, timeout):
+        self.in_flight += 1
+        self.peak_in_flight = max(self.peak_in_flight, self.in_flight)
+        try:
+            await asyncio.sleep(self.delays.get(server_id, 0))
+            if server_id in self.failures:
+                raise self.failures[server_id]
+            return EmptyResult()
+        except asyncio.CancelledError:
+            self.cancelled.append(server_id)
+            raise
+        finally:
+            self.in_flight -= 1
+
+    def add_servers(self, *server_ids: str) -> None:
+        for server_id in server_ids:
+            self.session.server_manager.register_server(server_id)
+            self.session.server_manager.get_server(server_id).initialized = True
+
+    async def test_yields_outcomes_in_completion_order(self):
+        # Arrange
+        self.add_servers("slow", "fast")
+        self.delays = {"slow": 0.05, "fast": 0}
+
+        # Act
+        outcomes = [o async for o in self.session.broadcast_request(PingRequest())]
+
+        # Assert
+        assert [o.server_id for o in outcomes] == ["fast", "slow"]
+        assert all(o.ok for o in outcomes)
+        assert outcomes[1].elapsed >= 0.04
+
+    async def test_defaults_to_initialized_servers(self):
+        # Arrange
+        self.add_servers("ready")
+        self.session.server_manager.register_server("pending")
+
+        # Act
+        outcomes = [o async for o in self.session.broadcast_request(PingRequest())]
+
+        # Assert
+        assert [o.server_id for o in outcomes] == ["ready"]
+
+    async def test_reports_failures_per_server(self):
+        # Arrange
+        self.add_servers("ok", "timeout", "error")
+        self.failures = {"timeout": TimeoutError("too slow")}
+        error = Error(code=INTERNAL_ERROR, message="boom")
+
+        async def send_request(server_id, request, timeout):
+            if server_id == "error":
+                return error
+            return await self.fake_send_request(server_id, request, timeout)
+
+        self.session._coordinator.send_request = send_request
+
+        # Act
+        outcomes = {
+            o.server_id: o
+            async for o in self.session.broadcast_request(
+                ListToolsRequest(), server_ids=["ok", "timeout", "error", "unknown"]
+            )
+        }
+
+        # Assert
+        assert outcomes["ok"].ok
+        assert isinstance(outcomes["timeout"].exception, TimeoutError)
+        assert outcomes["error"].response is error
+        assert not outcomes["error"].ok
+        assert isinstance(outcomes["unknown"].exception, ValueError)
+
+    async def test_caps_outstanding_requests(self):
+        # Arrange
+        server_ids = [f"server-{i}" for i in range(10)]
+        self.add_servers(*server_ids)
+        self.delays = {server_id: 0.01 for server_id in server_ids}
+
+        # Act
+        outcomes = [
+            o
+            async for o in self.session.broadcast_request(
+                PingRequest(), max_concurrency=3
+            )
+        ]
+
+        # Assert
+        assert len(outcomes) == 10
+        assert self.peak_in_flight == 3
+
+    async def test_passes_per_server_timeout(self):
+        # Arrange
+        self.add_servers("server-1")
+        self.session._coordinator.send_request = AsyncMock(return_value=EmptyResult())
+
+        # Act
+        outcomes = [
+            o async for o in self.session.broadcast_request(PingRequest(), timeout=2.5)
+        ]
+
+        # Assert
+        assert outcomes[0].ok
+        self.session._coordinator.send_request.assert_awaited_once_with(
+            "server-1", PingRequest(), 2.5
+        )
+
+    async def test_closing_early_cancels_outstanding_requests(self):
+        # Arrange
+        self.add_servers("fast", "slow")
+        self.delays = {"fast": 0, "slow": 10}
+
+        # Act
+        async with aclosing(self.session.broadcast_request(PingRequest())) as results:
+            async for outcome in results:
+                break
+        await asyncio.sleep(0)
+
+        # Assert
+        assert outcome.server_id == "fast"
+        assert self.cancelled == ["slow"]
+
+    async def test_rejects_non_positive_concurrency(self):
+        # Act & Assert
+        with pytest.raises(ValueError):
+            async for _ in self.session.broadcast_request(
+                PingRequest(), max_concurrency=0
+            ):
+                pass
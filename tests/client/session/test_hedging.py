@@ -0,0 +1,174 @@
+import asyncio
+from unittest.mock import AsyncMock
+
+import pytest
+
+from conduit.client.session import ClientConfig, ClientSession
+from conduit.protocol.base import INTERNAL_ERROR, Error
+from conduit.protocol.common import EmptyResult, PingRequest
+from conduit.protocol.initialization import ClientCapabilities, Implementation
+from conduit.protocol.tools import (
+    CallToolRequest,
+    CallToolResult,
+    JSONSchema,
+    Tool,
+    ToolAnnotations,
+)
+
+
+class TestHedgedRequest:
+    def setup_method(self):
+        self.session = ClientSession(
+            AsyncMock(),
+            ClientConfig(
+                client_info=Implementation(name="test-client", version="1.0.0"),
+                capabilities=ClientCapabilities(),
+            ),
+        )
+        self.session._coordinator.start = AsyncMock()
+        self.delays: dict[str, float] = {}
+        self.failures: dict[str, Exception] = {}
+        self.responses: dict[str, Error] = {}
+        self.sent: list[str] = []
+        self.cancelled: list[str] = []
+        self.session._coordinator.send_request = self.fake_send_request
+        for server_id in ("primary", "replica", "spare"):
+            self.session.server_manager.register_server(server_id)
+            self.session.server_manager.get_server(server_id).initialized = True
+
+    async def fake_send_request(self, server_id, request, timeout):
+        self.sent.append(server_id)
+        try:
+            await asyncio.sleep(self.delays.get(server_id, 0))
+        except asyncio.CancelledError:
+            self.cancelled.append(server_id)
+            raise
+        if server_id in self.failures:
+            raise self.failures[server_id]
+        return self.responses.get(server_id, EmptyResult())
+
+    async def test_fast_primary_is_not_hedged(self):
+        # Act
+        result = await self.session.send_hedged_request(
+            PingRequest(), ["primary", "replica"], delay=0.05
+        )
+
+        # Assert
+        assert result.server_id == "primary"
+        assert result.attempts == 1
+        assert self.sent == ["primary"]
+
+    async def test_slow_primary_loses_to_hedge_and_is_cancelled(self):
+        # Arrange
+        self.delays = {"primary": 1.0, "replica": 0}
+
+        # Act
+        result = await self.session.send_hedged_request(
+            PingRequest(), ["primary", "replica"], delay=0.01
+        )
+        await asyncio.sleep(0)
+
+        # Assert
+        assert result.server_id == "replica"
+        assert result.attempts == 2
+        assert self.cancelled == ["primary"]
+
+    async def test_error_response_counts_as_an_answer(self):
+        # Arrange
+        self.responses = {"primary": Error(code=INTERNAL_ERROR, message="boom")}
+
+        # Act
+        result = await self.session.send_hedged_request(
+            PingRequest(), ["primary", "replica"], delay=0.05
+        )
+
+        # Assert
+        assert isinstance(result.response, Error)
+        assert self.sent == ["primary"]
+
+    async def test_failed_replica_hands_over_straight_away(self):
+        # Arrange
+        self.failures = {"primary": ConnectionError("down")}
+
+        # Act
+        result = await self.session.send_hedged_request(
+            PingRequest(), ["primary", "replica"], delay=10.0
+        )
+
+        # Assert
+        assert result.server_id == "replica"
+
+    async def test_raises_last_failure_when_every_replica_fails(self):
+        # Arrange
+        self.failures = {
+            "primary": ConnectionError("down"),
+            "replica": TimeoutError("slow"),
+        }
+
+        # Act & Assert
+        with pytest.raises(TimeoutError):
+            await self.session.send_hedged_request(
+                PingRequest(), ["primary", "replica"], delay=0.01
+            )
+
+    async def test_default_delay_follows_primary_p95(self):
+        # Arrange - the primary usually answers in 10ms
+        for _ in range(50):
+            self.session.server_manager.record_response_time("primary", "ping", 0.01)
+        self.delays = {"primary": 0.005}
+
+        # Act
+        result = await self.session.send_hedged_request(
+            PingRequest(), ["primary", "replica"]
+        )
+
+        # Assert - 5ms is inside the p95, so no hedge was sent
+        assert result.server_id == "primary"
+        assert self.sent == ["primary"]
+
+    async def test_slow_calls_of_other_methods_do_not_delay_the_hedge(self):
+        # Arrange - fast pings, but long tool calls on the same server
+        for _ in range(50):
+            self.session.server_manager.record_response_time("primary", "ping", 0.01)
+            self.session.server_manager.record_response_time(
+                "primary", "tools/call", 30.0
+            )
+        self.delays = {"primary": 1.0}
+
+        # Act
+        result = await self.session.send_hedged_request(
+            PingRequest(), ["primary", "replica"], timeout=0.5
+        )
+
+        # Assert - hedged at the ping p95, not the tools/call one
+        assert result.server_id == "replica"
+        assert self.sent == ["primary", "replica"]
+
+    async def test_refuses_requests_that_may_not_be_safe_to_repeat(self):
+        # Act & Assert
+        with pytest.raises(ValueError):
+            await self.session.send_hedged_request(
+                CallToolRequest(name="delete_everything"), ["primary", "replica"]
+            )
+        assert self.sent == []
+
+    async def test_allows_tool_calls_annotated_read_only(self):
+        # Arrange
+        tool = Tool(
+            name="search",
+            input_schema=JSONSchema(),
+            annotations=ToolAnnotations(read_only_hint=True),
+        )
+        server_state = self.session.server_manager.get_server("primary")
+        server_state.catalogs.tools.replace([tool])
+        self.session._coordinator.send_request = AsyncMock(
+            return_value=CallToolResult(content=[])
+        )
+
+        # Act
+        result = await self.session.send_hedged_request(
+            CallToolRequest(name="search"), ["primary", "replica"]
+        )
+
+        # Assert
+        assert result.server_id == "primary"
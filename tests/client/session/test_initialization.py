@@ -6,9 +6,16 @@ import pytest
 from conduit.client.session import (
     ClientConfig,
     ClientSession,
+    ConnectServersError,
     InvalidProtocolVersionError,
 )
-from conduit.protocol.base import METHOD_NOT_FOUND, PROTOCOL_VERSION
+from conduit.protocol.base import (
+    INTERNAL_ERROR,
+    METHOD_NOT_FOUND,
+    PROTOCOL_VERSION,
+    Error,
+)
+from conduit.protocol.common import PingRequest
 from conduit.protocol.initialization import (
     ClientCapabilities,
     Implementation,
@@ -260,3 +267,167 @@ class TestInitialization:
         # Assert - server should be cleaned up
         assert self.session.server_manager.get_server(server_id) is None
         assert server_id not in self.transport.registered_servers
+
+
+class TestConcurrentConnect:
+    def setup_method(self):
+        self.transport = MockClientTransport()
+        self.session = ClientSession(
+            self.transport,
+            ClientConfig(
+                client_info=Implementation(name="test-client", version="1.0.0"),
+                capabilities=ClientCapabilities(),
+            ),
+        )
+        self.handshakes: list[str] = []
+        self.in_flight = 0
+        self.peak_in_flight = 0
+        self.failing: set[str] = set()
+        self.session._do_initialize_server = self.fake_handshake
+
+    async def fake_handshake(self, server_id, timeout):
+        self.handshakes.append(server_id)
+        self.in_flight += 1
+        self.peak_in_flight = max(self.peak_in_flight, self.in_flight)
+        try:
+            await asyncio.sleep(0.01)
+            if server_id in self.failing:
+                raise RuntimeError("handshake refused")
+            self.session.server_manager.get_server(server_id).initialized = True
+        finally:
+            self.in_flight -= 1
+
+    async def test_concurrent_connects_share_one_handshake(self):
+        # Act
+        await asyncio.gather(
+            self.session.connect_server("server-1", {}),
+            self.session.connect_server("server-1", {}),
+            self.session.connect_server("server-1", {}),
+        )
+
+        # Assert
+        assert self.handshakes == ["server-1"]
+        assert self.session.server_manager.is_protocol_initialized("server-1")
+        assert self.session._connecting == {}
+
+    async def test_cancelling_one_caller_keeps_the_shared_handshake(self):
+        # Arrange
+        first = asyncio.create_task(self.session.connect_server("server-1", {}))
+        second = asyncio.create_task(self.session.connect_server("server-1", {}))
+        await asyncio.sleep(0)
+
+        # Act
+        first.cancel()
+        await second
+
+        # Assert
+        assert self.handshakes == ["server-1"]
+        assert self.session.server_manager.is_protocol_initialized("server-1")
+
+    async def test_connect_servers_runs_handshakes_under_the_cap(self):
+        # Arrange
+        servers = {f"server-{i}": {} for i in range(6)}
+
+        # Act
+        await self.session.connect_servers(servers, max_concurrency=2)
+
+        # Assert
+        assert sorted(self.handshakes) == sorted(servers)
+        assert self.peak_in_flight == 2
+
+    async def test_connect_servers_aggregates_failures(self):
+        # Arrange
+        self.failing = {"bad-1", "bad-2"}
+        servers = {"good": {}, "bad-1": {}, "bad-2": {}}
+
+        # Act
+        with pytest.raises(ConnectServersError) as exc_info:
+            await self.session.connect_servers(servers)
+
+        # Assert
+        assert set(exc_info.value.errors) == {"bad-1", "bad-2"}
+        assert isinstance(exc_info.value.errors["bad-1"], ConnectionError)
+        assert exc_info.value.connected == ["good"]
+        assert self.session.server_manager.is_protocol_initialized("good")
+        assert self.session.server_manager.get_server("bad-1") is None
+
+
+class TestReinitialize:
+    def setup_method(self):
+        self.transport = MockClientTransport()
+        self.session = ClientSession(
+            self.transport,
+            ClientConfig(
+                client_info=Implementation(name="test-client", version="1.0.0"),
+                capabilities=ClientCapabilities(),
+                list_changed_debounce=0.0,
+            ),
+        )
+
+    async def answer_initialize(self, server_id: str, yield_loop) -> None:
+        """Responds to the latest initialize request sent to the server."""
+        await yield_loop()
+        init = [
+            m
+            for m in self.transport.sent_messages[server_id]
+            if m.get("method") == "initialize"
+        ][-1]
+        response = deepcopy(TestInitialization.init_response_matching_protocol)
+        response["id"] = init["id"]
+        self.transport.add_server_message(server_id, response)
+
+    async def connect(self, server_id: str, yield_loop) -> None:
+        connect_task = asyncio.create_task(self.session.connect_server(server_id, {}))
+        await self.answer_initialize(server_id, yield_loop)
+        await connect_task
+
+    async def test_restart_handler_redoes_the_handshake(self, yield_loop):
+        # Arrange
+        await self.connect("server-1", yield_loop)
+        pending = asyncio.create_task(
+            self.session.send_request("server-1", PingRequest(), timeout=5.0)
+        )
+        await yield_loop()
+
+        # Act - the transport reports it restarted the server
+        restart = asyncio.create_task(self.transport.restart_handler("server-1"))
+        await self.answer_initialize("server-1", yield_loop)
+        await restart
+
+        # Assert
+        methods = [m.get("method") for m in self.transport.sent_messages["server-1"]]
+        assert methods.count("initialize") == 2
+        assert methods[-1] == "notifications/initialized"
+        assert self.session.server_manager.is_protocol_initialized("server-1")
+        # The old process never answered; the request fails instead of hanging
+        outcome = await pending
+        assert isinstance(outcome, Error)
+        assert outcome.code == INTERNAL_ERROR
+
+        await self.session.disconnect_all_servers()
+
+    async def test_refetches_catalogs_that_were_fetched_before(self, yield_loop):
+        # Arrange
+        await self.connect("server-1", yield_loop)
+        self.session.server_manager.get_server("server-1").tools = []
+        refreshed: list[tuple[str, str]] = []
+
+        async def record_refresh(key: tuple[str, str]) -> None:
+            refreshed.append(key)
+
+        self.session._list_refresher._run = record_refresh
+
+        # Act
+        reinit = asyncio.create_task(self.session.reinitialize_server("server-1"))
+        await self.answer_initialize("server-1", yield_loop)
+        await reinit
+        await self.session._list_refresher.wait_idle()
+
+        # Assert
+        assert refreshed == [("server-1", "tools")]
+
+        await self.session.disconnect_all_servers()
+
+    async def test_rejects_unknown_server(self):
+        with pytest.raises(ValueError):
+            await self.session.reinitialize_server("nope")
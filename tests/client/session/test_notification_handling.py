@@ -1,6 +1,8 @@
+import asyncio
 from unittest.mock import AsyncMock, Mock
 
 from conduit.client.message_context import MessageContext
+from conduit.client.resource_cache import MAX_FETCHES_PER_REFRESH
 from conduit.client.session import ClientConfig, ClientSession
 from conduit.protocol.base import METHOD_NOT_FOUND, Error, Request
 from conduit.protocol.common import (
@@ -8,7 +10,12 @@ from conduit.protocol.common import (
     ProgressNotification,
 )
 from conduit.protocol.content import TextResourceContents
-from conduit.protocol.initialization import ClientCapabilities, Implementation
+from conduit.protocol.initialization import (
+    ClientCapabilities,
+    Implementation,
+    ServerCapabilities,
+    ToolsCapability,
+)
 from conduit.protocol.logging import LoggingMessageNotification
 from conduit.protocol.prompts import (
     ListPromptsRequest,
@@ -43,6 +50,7 @@ class TestNotificationHandling:
         self.config = ClientConfig(
             client_info=Implementation(name="test-client", version="1.0.0"),
             capabilities=ClientCapabilities(),
+            list_changed_debounce=0.0,
         )
         self.session = ClientSession(self.transport, self.config)
         self.session.server_manager.register_server("server_id")
@@ -150,6 +158,7 @@ class TestPromptsListChangedHandling(TestNotificationHandling):
 
         # Act
         await self.session._handle_prompts_list_changed(self.context, notification)
+        await self.session._list_refresher.wait_idle()
 
         # Assert
         self.session.send_request.assert_awaited_once()
@@ -172,6 +181,7 @@ class TestPromptsListChangedHandling(TestNotificationHandling):
 
         # Act
         await self.session._handle_prompts_list_changed(self.context, notification)
+        await self.session._list_refresher.wait_idle()
 
         # Assert
         self.session.send_request.assert_awaited_once()
@@ -192,6 +202,7 @@ class TestPromptsListChangedHandling(TestNotificationHandling):
 
         # Act
         await self.session._handle_prompts_list_changed(self.context, notification)
+        await self.session._list_refresher.wait_idle()
 
         # Assert
         self.session.send_request.assert_awaited_once()
@@ -224,6 +235,7 @@ class TestToolsListChangedHandling(TestNotificationHandling):
 
         # Act
         await self.session._handle_tools_list_changed(self.context, notification)
+        await self.session._list_refresher.wait_idle()
 
         # Assert
         self.session.send_request.assert_awaited_once()
@@ -246,6 +258,7 @@ class TestToolsListChangedHandling(TestNotificationHandling):
 
         # Act
         await self.session._handle_tools_list_changed(self.context, notification)
+        await self.session._list_refresher.wait_idle()
 
         # Assert
         self.session.send_request.assert_awaited_once()
@@ -266,6 +279,7 @@ class TestToolsListChangedHandling(TestNotificationHandling):
 
         # Act
         await self.session._handle_tools_list_changed(self.context, notification)
+        await self.session._list_refresher.wait_idle()
 
         # Assert
         self.session.send_request.assert_awaited_once()
@@ -286,10 +300,12 @@ class TestResourcesUpdatedHandling(TestNotificationHandling):
         )
 
         self.session.send_request = AsyncMock(return_value=read_result)
+        self.session.callbacks.resource_updated_handler = AsyncMock()
         self.session.callbacks.call_resource_updated = AsyncMock()
 
         # Act
         await self.session._handle_resources_updated(self.context, notification)
+        await self.session._coordinator.tasks.wait_idle()
 
         # Assert
         self.session.send_request.assert_awaited_once()
@@ -308,10 +324,12 @@ class TestResourcesUpdatedHandling(TestNotificationHandling):
         error_result = Error(code=METHOD_NOT_FOUND, message="Resource not found")
 
         self.session.send_request = AsyncMock(return_value=error_result)
+        self.session.callbacks.resource_updated_handler = AsyncMock()
         self.session.callbacks.call_resource_updated = AsyncMock()
 
         # Act
         await self.session._handle_resources_updated(self.context, notification)
+        await self.session._coordinator.tasks.wait_idle()
 
         # Assert
         self.session.send_request.assert_awaited_once()
@@ -325,15 +343,106 @@ class TestResourcesUpdatedHandling(TestNotificationHandling):
         self.session.send_request = AsyncMock(
             side_effect=ConnectionError("Network failure")
         )
+        self.session.callbacks.resource_updated_handler = AsyncMock()
         self.session.callbacks.call_resource_updated = AsyncMock()
 
         # Act
         await self.session._handle_resources_updated(self.context, notification)
+        await self.session._coordinator.tasks.wait_idle()
 
         # Assert
         self.session.send_request.assert_awaited_once()
         self.session.callbacks.call_resource_updated.assert_not_called()
 
+    async def test_burst_of_updates_shares_reads_and_reports_latest(self):
+        # Arrange
+        resource_uri = "file:///test/resource.txt"
+        version = 0
+        gate = asyncio.Event()
+
+        async def read(server_id, request):
+            await gate.wait()
+            return ReadResourceResult(
+                contents=[TextResourceContents(uri=resource_uri, text=str(version))]
+            )
+
+        self.session.send_request = AsyncMock(side_effect=read)
+        self.session.callbacks.resource_updated_handler = AsyncMock()
+        self.session.callbacks.call_resource_updated = AsyncMock()
+
+        # Act
+        for version in range(1, 21):
+            await self.session._handle_resources_updated(
+                self.context, ResourceUpdatedNotification(uri=resource_uri)
+            )
+        gate.set()
+        await self.session._coordinator.tasks.wait_idle()
+
+        # Assert
+        assert self.session.send_request.await_count == 1
+        self.session.callbacks.call_resource_updated.assert_awaited_once()
+        _, uri, result = self.session.callbacks.call_resource_updated.call_args[0]
+        assert result.contents[0].text == "20"
+
+    async def test_resource_too_large_to_cache_is_read_once(self):
+        # Arrange
+        resource_uri = "file:///test/resource.txt"
+        self.session.resource_cache.max_bytes = 10
+        read_result = ReadResourceResult(
+            contents=[TextResourceContents(uri=resource_uri, text="x" * 100)]
+        )
+        self.session.send_request = AsyncMock(return_value=read_result)
+        self.session.callbacks.resource_updated_handler = AsyncMock()
+        self.session.callbacks.call_resource_updated = AsyncMock()
+
+        # Act
+        await self.session._handle_resources_updated(
+            self.context, ResourceUpdatedNotification(uri=resource_uri)
+        )
+        await asyncio.wait_for(self.session._coordinator.tasks.wait_idle(), 1.0)
+
+        # Assert
+        self.session.send_request.assert_awaited_once()
+        self.session.callbacks.call_resource_updated.assert_awaited_once_with(
+            "server_id", resource_uri, read_result
+        )
+
+    async def test_invalidation_storm_stops_after_bounded_fetches(self):
+        # Arrange - every read sees another update land before it finishes
+        resource_uri = "file:///test/resource.txt"
+
+        async def read(server_id, request):
+            self.session.resource_cache.invalidate("server_id", resource_uri)
+            return ReadResourceResult(
+                contents=[TextResourceContents(uri=resource_uri, text="latest")]
+            )
+
+        self.session.send_request = AsyncMock(side_effect=read)
+        self.session.callbacks.resource_updated_handler = AsyncMock()
+        self.session.callbacks.call_resource_updated = AsyncMock()
+
+        # Act
+        await self.session._handle_resources_updated(
+            self.context, ResourceUpdatedNotification(uri=resource_uri)
+        )
+        await asyncio.wait_for(self.session._coordinator.tasks.wait_idle(), 1.0)
+
+        # Assert
+        assert self.session.send_request.await_count == MAX_FETCHES_PER_REFRESH
+        self.session.callbacks.call_resource_updated.assert_awaited_once()
+
+    async def test_without_listeners_only_marks_cache_stale(self):
+        # Arrange
+        self.session.send_request = AsyncMock()
+
+        # Act
+        await self.session._handle_resources_updated(
+            self.context, ResourceUpdatedNotification(uri="file:///a")
+        )
+
+        # Assert
+        self.session.send_request.assert_not_awaited()
+
 
 class TestResourcesListChangedHandling(TestNotificationHandling):
     async def test_updates_state_and_calls_callbacks_on_successful_refresh(self):
@@ -362,6 +471,7 @@ class TestResourcesListChangedHandling(TestNotificationHandling):
 
         # Act
         await self.session._handle_resources_list_changed(self.context, notification)
+        await self.session._list_refresher.wait_idle()
 
         # Assert
         assert self.session.send_request.await_count == 2
@@ -397,6 +507,7 @@ class TestResourcesListChangedHandling(TestNotificationHandling):
 
         # Act
         await self.session._handle_resources_list_changed(self.context, notification)
+        await self.session._list_refresher.wait_idle()
 
         # Assert
         assert self.session.send_request.await_count == 2
@@ -414,3 +525,100 @@ class TestResourcesListChangedHandling(TestNotificationHandling):
         self.session.callbacks.call_resources_changed.assert_awaited_once_with(
             self.context.server_id, resources, []
         )
+
+
+class TestCatalogRefresh(TestNotificationHandling):
+    async def test_tools_refresh_pages_through_all_results(self):
+        # Arrange
+        pages = {
+            None: ListToolsResult(
+                tools=[Tool(name="a", input_schema=JSONSchema())], next_cursor="p2"
+            ),
+            "p2": ListToolsResult(tools=[Tool(name="b", input_schema=JSONSchema())]),
+        }
+        self.session.send_request = AsyncMock(
+            side_effect=lambda server_id, request: pages[request.cursor]
+        )
+        self.session.callbacks.call_tools_changed = AsyncMock()
+
+        # Act
+        await self.session._handle_tools_list_changed(
+            self.context, ToolListChangedNotification()
+        )
+        await self.session._list_refresher.wait_idle()
+
+        # Assert
+        server_state = self.session.server_manager.get_server("server_id")
+        assert [t.name for t in server_state.tools] == ["a", "b"]
+        assert server_state.catalogs.tools.keys() == ["a", "b"]
+        assert self.session.tool_index.resolve("b")[0] == "server_id"
+        assert self.session.send_request.await_count == 2
+
+    async def test_reports_catalog_diffs_to_callback(self):
+        # Arrange
+        diffs = []
+
+        async def on_catalog_changed(server_id, diff):
+            diffs.append((server_id, diff))
+
+        self.session.callbacks.catalog_changed_handler = on_catalog_changed
+        first = ListPromptsResult(prompts=[Prompt(name="a"), Prompt(name="b")])
+        second = ListPromptsResult(prompts=[Prompt(name="b"), Prompt(name="c")])
+        self.session.send_request = AsyncMock(side_effect=[first, second, second])
+        notification = PromptListChangedNotification()
+
+        # Act
+        await self.session._handle_prompts_list_changed(self.context, notification)
+        await self.session._list_refresher.wait_idle()
+        await self.session._handle_prompts_list_changed(self.context, notification)
+        await self.session._list_refresher.wait_idle()
+        await self.session._handle_prompts_list_changed(self.context, notification)
+        await self.session._list_refresher.wait_idle()
+
+        # Assert
+        assert len(diffs) == 2  # The unchanged third listing reports nothing
+        server_id, diff = diffs[1]
+        assert server_id == "server_id"
+        assert diff.kind == "prompts"
+        assert diff.version == 2
+        assert [p.name for p in diff.added] == ["c"]
+        assert [p.name for p in diff.removed] == ["a"]
+
+    async def test_refresh_catalogs_fetches_advertised_lists(self):
+        # Arrange
+        self.session.server_manager.initialize_server(
+            "server_id",
+            capabilities=ServerCapabilities(tools=ToolsCapability()),
+            info=Implementation(name="server", version="1.0.0"),
+            protocol_version="2025-06-18",
+        )
+        result = ListToolsResult(tools=[Tool(name="a", input_schema=JSONSchema())])
+        self.session.send_request = AsyncMock(return_value=result)
+
+        # Act
+        catalogs = await self.session.refresh_catalogs("server_id")
+
+        # Assert
+        self.session.send_request.assert_awaited_once()
+        assert catalogs.tools.keys() == ["a"]
+        assert not catalogs.prompts.loaded
+
+    async def test_list_changed_storm_costs_one_refetch(self):
+        # Arrange
+        self.session._list_refresher.delay = 0.02
+        result = ListToolsResult(tools=[Tool(name="a", input_schema=JSONSchema())])
+        self.session.send_request = AsyncMock(return_value=result)
+        self.session.callbacks.call_tools_changed = AsyncMock()
+        notification = ToolListChangedNotification()
+
+        # Act
+        for _ in range(100):
+            await self.session._handle_tools_list_changed(self.context, notification)
+        await self.session._list_refresher.wait_idle()
+
+        # Assert
+        assert self.session.send_request.await_count == 1
+        self.session.callbacks.call_tools_changed.assert_awaited_once()
+        stats = self.session.list_refresh_stats()
+        assert stats.triggers == 100
+        assert stats.suppressed == 99
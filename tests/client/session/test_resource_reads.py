@@ -0,0 +1,108 @@
+from unittest.mock import AsyncMock
+
+import pytest
+
+from conduit.client.message_context import MessageContext
+from conduit.client.resource_cache import ResourceReadError
+from conduit.client.session import ClientConfig, ClientSession
+from conduit.protocol.base import METHOD_NOT_FOUND, Error
+from conduit.protocol.common import EmptyResult
+from conduit.protocol.content import TextResourceContents
+from conduit.protocol.initialization import (
+    ClientCapabilities,
+    Implementation,
+    ResourcesCapability,
+    ServerCapabilities,
+)
+from conduit.protocol.resources import (
+    ReadResourceRequest,
+    ReadResourceResult,
+    ResourceUpdatedNotification,
+    SubscribeRequest,
+    UnsubscribeRequest,
+)
+
+
+class TestResourceReads:
+    def setup_method(self):
+        self.session = ClientSession(
+            AsyncMock(),
+            ClientConfig(
+                client_info=Implementation(name="test-client", version="1.0.0"),
+                capabilities=ClientCapabilities(),
+            ),
+        )
+        self.session.server_manager.initialize_server(
+            "server_id",
+            capabilities=ServerCapabilities(
+                resources=ResourcesCapability(subscribe=True)
+            ),
+            info=Implementation(name="server", version="1.0.0"),
+            protocol_version="2025-06-18",
+        )
+        self.version = 0
+        self.sent = []
+        self.session.send_request = AsyncMock(side_effect=self.fake_send_request)
+
+    async def fake_send_request(self, server_id, request):
+        self.sent.append(request)
+        if isinstance(request, ReadResourceRequest):
+            return ReadResourceResult(
+                contents=[TextResourceContents(uri=request.uri, text=str(self.version))]
+            )
+        return EmptyResult()
+
+    async def test_read_resource_is_served_from_cache(self):
+        # Act
+        await self.session.read_resource("server_id", "file:///a")
+        result = await self.session.read_resource("server_id", "file:///a")
+
+        # Assert
+        assert result.contents[0].text == "0"
+        assert len(self.sent) == 1
+
+    async def test_read_resource_raises_on_server_error(self):
+        # Arrange
+        self.session.send_request = AsyncMock(
+            return_value=Error(code=METHOD_NOT_FOUND, message="nope")
+        )
+
+        # Act & Assert
+        with pytest.raises(ResourceReadError):
+            await self.session.read_resource("server_id", "file:///a")
+
+    async def test_watch_subscribes_and_follows_updates(self):
+        # Arrange
+        context = MessageContext(
+            server_id="server_id",
+            server_state=AsyncMock(),
+            server_manager=AsyncMock(),
+            transport=AsyncMock(),
+        )
+        watch = self.session.watch_resource("server_id", "file:///a")
+
+        # Act
+        first = await anext(watch)
+        self.version = 1
+        await self.session._handle_resources_updated(
+            context, ResourceUpdatedNotification(uri="file:///a")
+        )
+        second = await anext(watch)
+        await watch.aclose()
+
+        # Assert
+        assert [first.contents[0].text, second.contents[0].text] == ["0", "1"]
+        assert isinstance(self.sent[0], SubscribeRequest)
+        assert isinstance(self.sent[-1], UnsubscribeRequest)
+
+    async def test_disconnect_ends_watches(self):
+        # Arrange
+        watch = self.session.watch_resource("server_id", "file:///a")
+        await anext(watch)
+
+        # Act
+        await self.session.disconnect_server("server_id")
+
+        # Assert
+        with pytest.raises(StopAsyncIteration):
+            await anext(watch)
@@ -1,15 +1,26 @@
+import asyncio
 from unittest.mock import AsyncMock
 
 import pytest
 
 from conduit.client.session import ClientConfig, ClientSession
+from conduit.client.tool_index import UnknownToolError
+from conduit.protocol.base import PROTOCOL_VERSION
 from conduit.protocol.initialization import (
     ClientCapabilities,
     Implementation,
     InitializedNotification,
     InitializeRequest,
 )
-from conduit.protocol.tools import ListToolsRequest
+from conduit.protocol.tools import (
+    CallToolRequest,
+    CallToolResult,
+    JSONSchema,
+    ListToolsRequest,
+    Tool,
+)
+
+from .conftest import MockClientTransport
 
 
 class TestSendMessage:
@@ -94,3 +105,139 @@ class TestSendMessage:
         self.session._coordinator.send_notification.assert_awaited_once_with(
             server_id, notification
         )
+
+
+class TestCallTool:
+    def setup_method(self):
+        self.session = ClientSession(
+            AsyncMock(),
+            ClientConfig(
+                client_info=Implementation(name="test-client", version="1.0.0"),
+                capabilities=ClientCapabilities(),
+            ),
+        )
+        self.session._coordinator.start = AsyncMock()
+        self.session._coordinator.send_request = AsyncMock(
+            return_value=CallToolResult(content=[])
+        )
+        for server_id in ("files", "web"):
+            self.session.server_manager.register_server(server_id)
+            self.session.server_manager.get_server(server_id).initialized = True
+
+    async def test_routes_to_the_server_that_offers_the_tool(self):
+        # Arrange
+        self.session.tool_index.update_server(
+            "web", [Tool(name="fetch", input_schema=JSONSchema())]
+        )
+
+        # Act
+        await self.session.call_tool("fetch", {"url": "https://example.com"})
+
+        # Assert
+        server_id, request, _ = self.session._coordinator.send_request.call_args[0]
+        assert server_id == "web"
+        assert request == CallToolRequest(
+            name="fetch", arguments={"url": "https://example.com"}
+        )
+
+    async def test_qualified_name_sends_the_bare_tool_name(self):
+        # Arrange
+        for server_id in ("files", "web"):
+            self.session.tool_index.update_server(
+                server_id, [Tool(name="search", input_schema=JSONSchema())]
+            )
+
+        # Act
+        await self.session.call_tool("files__search")
+
+        # Assert
+        server_id, request, _ = self.session._coordinator.send_request.call_args[0]
+        assert server_id == "files"
+        assert request.name == "search"
+
+    async def test_unknown_tool_raises_without_sending(self):
+        # Act & Assert
+        with pytest.raises(UnknownToolError):
+            await self.session.call_tool("missing")
+        self.session._coordinator.send_request.assert_not_awaited()
+
+    async def test_disconnect_removes_server_tools(self):
+        # Arrange
+        self.session.tool_index.update_server(
+            "web", [Tool(name="fetch", input_schema=JSONSchema())]
+        )
+
+        # Act
+        await self.session.disconnect_server("web")
+
+        # Assert
+        assert "fetch" not in self.session.tool_index
+
+
+class TestCallToolAfterConnect:
+    def setup_method(self):
+        self.transport = MockClientTransport()
+        self.session = ClientSession(
+            self.transport,
+            ClientConfig(
+                client_info=Implementation(name="test-client", version="1.0.0"),
+                capabilities=ClientCapabilities(),
+            ),
+        )
+
+    async def answer(self, method: str, result: dict) -> None:
+        """Wait for the session to send a request, then answer it."""
+        while True:
+            for message in self.transport.get_sent_messages("server"):
+                if message.get("method") == method:
+                    self.transport.add_server_message(
+                        "server",
+                        {"jsonrpc": "2.0", "id": message["id"], "result": result},
+                    )
+                    return
+            await asyncio.sleep(0.001)
+
+    async def connect(self, capabilities: dict) -> None:
+        await asyncio.gather(
+            self.session.connect_server("server", {}),
+            self.answer(
+                "initialize",
+                {
+                    "protocolVersion": PROTOCOL_VERSION,
+                    "capabilities": capabilities,
+                    "serverInfo": {"name": "server", "version": "1.0.0"},
+                },
+            ),
+        )
+
+    async def test_call_tool_right_after_connect_lists_tools_first(self):
+        # Arrange
+        await self.connect({"tools": {}})
+        tools = {"tools": [{"name": "fetch", "inputSchema": {"type": "object"}}]}
+
+        # Act
+        result, _, _ = await asyncio.gather(
+            self.session.call_tool("fetch", timeout=1.0),
+            self.answer("tools/list", tools),
+            self.answer("tools/call", {"content": []}),
+        )
+
+        # Assert
+        assert result == CallToolResult(content=[])
+        assert "fetch" in self.session.tool_index
+        await self.session.disconnect_all_servers()
+
+    async def test_unknown_tool_raises_without_listing_tools_again(self):
+        # Arrange
+        await self.connect({"tools": {}})
+        await asyncio.gather(
+            self.session.refresh_catalogs("server"),
+            self.answer("tools/list", {"tools": []}),
+        )
+        self.transport.clear_sent_messages()
+
+        # Act & Assert
+        with pytest.raises(UnknownToolError):
+            await self.session.call_tool("missing")
+        assert self.transport.get_sent_messages("server") == []
+        await self.session.disconnect_all_servers()
@@ -0,0 +1,107 @@
+from unittest.mock import AsyncMock
+
+import pytest
+
+from conduit.client.session import ClientConfig, ClientSession, ConnectServersError
+from conduit.protocol.base import INTERNAL_ERROR, Error
+from conduit.protocol.common import EmptyResult, PingRequest
+from conduit.protocol.initialization import ClientCapabilities, Implementation
+
+
+class TestServerGroups:
+    def setup_method(self):
+        self.session = ClientSession(
+            AsyncMock(),
+            ClientConfig(
+                client_info=Implementation(name="test-client", version="1.0.0"),
+                capabilities=ClientCapabilities(),
+            ),
+        )
+        self.failing: set[str] = set()
+        self.session.connect_server = AsyncMock(side_effect=self.fake_connect)
+        self.session.send_request = AsyncMock(side_effect=self.fake_send_request)
+        self.sent_to: list[str] = []
+
+    async def fake_connect(self, server_id, connection_info, timeout):
+        if server_id in self.failing:
+            raise ConnectionError("refused")
+        self.session.server_manager.register_server(server_id)
+        self.session.server_manager.get_server(server_id).initialized = True
+
+    async def fake_send_request(self, server_id, request, timeout):
+        self.sent_to.append(server_id)
+        if server_id in self.failing:
+            return Error(code=INTERNAL_ERROR, message="boom")
+        return EmptyResult()
+
+    async def connect_group(self, policy="round_robin"):
+        members = {f"worker-{i}": {"command": ["server"]} for i in range(4)}
+        return await self.session.connect_server_group("workers", members, policy)
+
+    async def test_spreads_requests_across_members(self):
+        # Arrange
+        await self.connect_group()
+
+        # Act
+        for _ in range(8):
+            await self.session.send_group_request("workers", PingRequest())
+
+        # Assert
+        assert sorted(self.sent_to) == sorted([f"worker-{i}" for i in range(4)] * 2)
+
+    async def test_group_forms_from_members_that_connect(self):
+        # Arrange
+        self.failing = {"worker-1"}
+
+        # Act
+        group = await self.connect_group()
+
+        # Assert
+        assert group.member_ids == ["worker-0", "worker-2", "worker-3"]
+
+    async def test_raises_when_no_member_connects(self):
+        # Arrange
+        self.failing = {f"worker-{i}" for i in range(4)}
+
+        # Act & Assert
+        with pytest.raises(ConnectServersError):
+            await self.connect_group()
+        assert "workers" not in self.session.server_groups
+
+    async def test_internal_errors_eject_a_member(self):
+        # Arrange
+        group = await self.connect_group()
+        self.failing = {"worker-0"}
+
+        # Act
+        for _ in range(40):
+            await self.session.send_group_request("workers", PingRequest())
+
+        # Assert
+        assert group.is_ejected("worker-0")
+        assert self.sent_to.count("worker-0") == group.min_requests
+
+    async def test_disconnected_members_leave_the_group(self):
+        # Arrange
+        group = await self.connect_group()
+
+        # Act
+        await self.session.disconnect_server("worker-0")
+
+        # Assert
+        assert "worker-0" not in group.member_ids
+
+    async def test_disconnect_group_disconnects_every_member(self):
+        # Arrange
+        await self.connect_group()
+
+        # Act
+        await self.session.disconnect_server_group("workers")
+
+        # Assert
+        assert "workers" not in self.session.server_groups
+        assert self.session.server_manager.server_count() == 0
+
+    async def test_unknown_group_raises(self):
+        with pytest.raises(ValueError):
+            await self.session.send_group_request("nope", PingRequest())
@@ -0,0 +1,96 @@
+import pytest
+
+from conduit.client.catalog import Catalog, ServerCatalogs, fetch_all_pages
+from conduit.protocol.base import METHOD_NOT_FOUND, Error
+from conduit.protocol.tools import JSONSchema, ListToolsResult, Tool
+
+
+def tool(name: str, description: str = "") -> Tool:
+    return Tool(name=name, description=description, input_schema=JSONSchema())
+
+
+class TestCatalog:
+    def test_replace_reports_added_removed_and_changed(self):
+        # Arrange
+        catalog = Catalog("tools", lambda t: t.name)
+        catalog.replace([tool("keep"), tool("edit", "old"), tool("drop")])
+
+        # Act
+        diff = catalog.replace([tool("keep"), tool("edit", "new"), tool("add")])
+
+        # Assert
+        assert [t.name for t in diff.added] == ["add"]
+        assert [t.name for t in diff.removed] == ["drop"]
+        assert diff.changed == [tool("edit", "new")]
+        assert diff.version == 2
+        assert catalog.keys() == ["keep", "edit", "add"]
+        assert catalog.get("edit") == tool("edit", "new")
+
+    def test_version_only_moves_when_something_changed(self):
+        # Arrange
+        catalog = Catalog("tools", lambda t: t.name)
+        catalog.replace([tool("a")])
+
+        # Act
+        diff = catalog.replace([tool("a")])
+
+        # Assert
+        assert diff.empty
+        assert catalog.version == 1
+        assert catalog.loaded
+
+    def test_server_catalogs_index_by_name_and_uri(self):
+        # Arrange
+        catalogs = ServerCatalogs()
+
+        # Act & Assert
+        assert catalogs.get("tools").key(tool("x")) == "x"
+        assert catalogs.get("resource_templates").kind == "resource_templates"
+        with pytest.raises(ValueError):
+            catalogs.get("widgets")
+
+
+class TestFetchAllPages:
+    async def test_follows_cursors_to_the_last_page(self):
+        # Arrange
+        pages = {
+            None: ListToolsResult(tools=[tool("a")], next_cursor="p2"),
+            "p2": ListToolsResult(tools=[tool("b")], next_cursor="p3"),
+            "p3": ListToolsResult(tools=[tool("c")]),
+        }
+        sent = []
+
+        async def send(request):
+            sent.append(request.cursor)
+            return pages[request.cursor]
+
+        # Act
+        items = await fetch_all_pages(send, "tools")
+
+        # Assert
+        assert [t.name for t in items] == ["a", "b", "c"]
+        assert sent == [None, "p2", "p3"]
+
+    async def test_error_on_a_later_page_fails_the_fetch(self):
+        # Arrange
+        error = Error(code=METHOD_NOT_FOUND, message="gone")
+
+        async def send(request):
+            if request.cursor is None:
+                return ListToolsResult(tools=[tool("a")], next_cursor="p2")
+            return error
+
+        # Act
+        result = await fetch_all_pages(send, "tools")
+
+        # Assert
+        assert result is error
+
+    async def test_repeated_cursor_raises(self):
+        # Arrange
+        async def send(request):
+            return ListToolsResult(tools=[tool("a")], next_cursor="again")
+
+        # Act & Assert
+        with pytest.raises(RuntimeError):
+            await fetch_all_pages(send, "tools")
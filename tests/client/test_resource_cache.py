@@ -0,0 +1,203 @@
+import asyncio
+
+import pytest
+
+from conduit.client.resource_cache import ResourceCache
+from conduit.protocol.content import TextResourceContents
+from conduit.protocol.resources import ReadResourceResult
+
+
+async def yield_loop(seconds: float = 0.01) -> None:
+    await asyncio.sleep(seconds)
+
+
+class FakeServer:
+    """Serves resource reads, optionally gated so tests can hold them open."""
+
+    def __init__(self):
+        self.versions: dict[str, int] = {}
+        self.reads: list[str] = []
+        self.gate: asyncio.Event | None = None
+        self.fail = False
+
+    async def fetch(self, server_id: str, uri: str) -> ReadResourceResult:
+        self.reads.append(uri)
+        if self.gate is not None:
+            await self.gate.wait()
+        if self.fail:
+            raise ConnectionError("down")
+        version = self.versions.get(uri, 0)
+        text = f"{uri}@{version}"
+        return ReadResourceResult(contents=[TextResourceContents(uri=uri, text=text)])
+
+
+def text_of(result: ReadResourceResult) -> str:
+    return result.contents[0].text
+
+
+class TestReads:
+    async def test_fetches_lazily_and_serves_hits_from_memory(self):
+        # Arrange
+        server = FakeServer()
+        cache = ResourceCache(server.fetch)
+
+        # Act
+        first = await cache.get("s", "file:///a")
+        second = await cache.get("s", "file:///a")
+
+        # Assert
+        assert text_of(first) == text_of(second) == "file:///a@0"
+        assert server.reads == ["file:///a"]
+        assert cache.stats.hits == 1
+        assert cache.stats.misses == 1
+
+    async def test_concurrent_reads_share_one_fetch(self):
+        # Arrange
+        server = FakeServer()
+        server.gate = asyncio.Event()
+        cache = ResourceCache(server.fetch)
+
+        # Act
+        reads = [asyncio.create_task(cache.get("s", "file:///a")) for _ in range(5)]
+        await yield_loop()
+        server.gate.set()
+        results = await asyncio.gather(*reads)
+
+        # Assert
+        assert server.reads == ["file:///a"]
+        assert len({text_of(r) for r in results}) == 1
+        assert cache.stats.coalesced == 4
+
+    async def test_invalidated_entry_is_refetched_on_next_read(self):
+        # Arrange
+        server = FakeServer()
+        cache = ResourceCache(server.fetch)
+        await cache.get("s", "file:///a")
+        server.versions["file:///a"] = 1
+
+        # Act
+        cache.invalidate("s", "file:///a")
+        result = await cache.get("s", "file:///a")
+
+        # Assert
+        assert text_of(result) == "file:///a@1"
+        assert len(server.reads) == 2
+
+    async def test_burst_of_invalidations_mid_fetch_costs_one_trailing_fetch(self):
+        # Arrange
+        server = FakeServer()
+        cache = ResourceCache(server.fetch)
+        await cache.get("s", "file:///a")
+        server.gate = asyncio.Event()
+        cache.invalidate("s", "file:///a")
+        refresh = cache.refresh("s", "file:///a")
+        await yield_loop()
+
+        # Act
+        for version in range(1, 51):
+            server.versions["file:///a"] = version
+            cache.invalidate("s", "file:///a")
+        server.gate.set()
+        result = await refresh
+
+        # Assert
+        assert text_of(result) == "file:///a@50"
+        assert len(server.reads) == 3
+        assert cache.stats.trailing_fetches == 1
+        assert not cache.is_stale("s", "file:///a")
+
+    async def test_fetch_errors_reach_the_reader(self):
+        # Arrange
+        server = FakeServer()
+        server.fail = True
+        cache = ResourceCache(server.fetch)
+
+        # Act & Assert
+        with pytest.raises(ConnectionError):
+            await cache.get("s", "file:///a")
+        assert ("s", "file:///a") not in cache
+
+
+class TestEviction:
+    async def test_evicts_least_recently_used_over_budget(self):
+        # Arrange
+        server = FakeServer()
+        cache = ResourceCache(server.fetch, max_bytes=30)
+        await cache.get("s", "file:///a")  # 11 bytes each
+        await cache.get("s", "file:///b")
+        await cache.get("s", "file:///a")  # a is now most recently used
+
+        # Act
+        await cache.get("s", "file:///c")
+
+        # Assert
+        assert ("s", "file:///a") in cache
+        assert ("s", "file:///b") not in cache
+        assert ("s", "file:///c") in cache
+        assert cache.bytes_used == 22
+        assert cache.stats.evictions == 1
+
+    async def test_remove_server_drops_its_entries(self):
+        # Arrange
+        server = FakeServer()
+        cache = ResourceCache(server.fetch)
+        await cache.get("s1", "file:///a")
+        await cache.get("s2", "file:///a")
+
+        # Act
+        cache.remove_server("s1")
+
+        # Assert
+        assert ("s1", "file:///a") not in cache
+        assert ("s2", "file:///a") in cache
+        assert cache.bytes_used == 11
+
+
+class TestWatch:
+    async def test_yields_current_contents_then_each_update(self):
+        # Arrange
+        server = FakeServer()
+        cache = ResourceCache(server.fetch)
+        watch = cache.watch("s", "file:///a")
+
+        # Act
+        first = await anext(watch)
+        server.versions["file:///a"] = 1
+        cache.invalidate("s", "file:///a")
+        second = await anext(watch)
+
+        # Assert
+        assert text_of(first) == "file:///a@0"
+        assert text_of(second) == "file:///a@1"
+        assert cache.is_watched("s", "file:///a")
+        await watch.aclose()
+        assert not cache.is_watched("s", "file:///a")
+
+    async def test_ends_when_server_is_removed(self):
+        # Arrange
+        server = FakeServer()
+        cache = ResourceCache(server.fetch)
+        watch = cache.watch("s", "file:///a")
+        await anext(watch)
+
+        # Act
+        cache.remove_server("s")
+
+        # Assert
+        with pytest.raises(StopAsyncIteration):
+            await anext(watch)
+
+    async def test_watched_entries_are_not_evicted(self):
+        # Arrange
+        server = FakeServer()
+        cache = ResourceCache(server.fetch, max_bytes=15)
+        watch = cache.watch("s", "file:///a")
+        await anext(watch)
+
+        # Act
+        await cache.get("s", "file:///b")
+
+        # Assert
+        assert ("s", "file:///a") in cache
+        assert ("s", "file:///b") not in cache
+        await watch.aclose()
@@ -0,0 +1,134 @@
+import time
+from collections import Counter
+
+import pytest
+
+from conduit.client.server_group import EmptyServerGroupError, ServerGroup
+
+
+class TestBalancing:
+    def setup_method(self):
+        self.load: dict[str, int] = {"a": 0, "b": 0, "c": 0}
+
+    def make_group(self, policy, **kwargs) -> ServerGroup:
+        return ServerGroup(
+            "group", ["a", "b", "c"], self.load.__getitem__, policy, **kwargs
+        )
+
+    def test_round_robin_takes_members_in_turn(self):
+        # Arrange
+        group = self.make_group("round_robin")
+
+        # Act
+        picks = [group.choose() for _ in range(6)]
+
+        # Assert
+        assert picks == ["a", "b", "c", "a", "b", "c"]
+
+    def test_least_outstanding_picks_least_loaded_member(self):
+        # Arrange
+        group = self.make_group("least_outstanding")
+        self.load.update(a=5, b=1, c=3)
+
+        # Act & Assert
+        assert {group.choose() for _ in range(6)} == {"b"}
+
+    def test_least_outstanding_spreads_ties(self):
+        # Arrange
+        group = self.make_group("least_outstanding")
+
+        # Act
+        picks = Counter(group.choose() for _ in range(30))
+
+        # Assert
+        assert picks == {"a": 10, "b": 10, "c": 10}
+
+    def test_p2c_never_picks_the_most_loaded_of_three(self):
+        # Arrange
+        group = self.make_group("p2c")
+        self.load.update(a=9, b=1, c=2)
+
+        # Act
+        picks = {group.choose() for _ in range(200)}
+
+        # Assert - "a" loses every pairing it's drawn into
+        assert "a" not in picks
+        assert picks == {"b", "c"}
+
+    def test_rejects_unknown_policy(self):
+        with pytest.raises(ValueError):
+            self.make_group("random")
+
+    def test_empty_group_raises(self):
+        # Arrange
+        group = ServerGroup("group", [], lambda server_id: 0)
+
+        # Act & Assert
+        with pytest.raises(EmptyServerGroupError):
+            group.choose()
+
+
+class TestEjection:
+    def setup_method(self):
+        self.group = ServerGroup(
+            "group",
+            ["a", "b"],
+            lambda server_id: 0,
+            policy="round_robin",
+            min_requests=4,
+            window=10,
+            ejection_time=0.05,
+        )
+
+    def test_ejects_member_whose_failure_rate_reaches_threshold(self):
+        # Act
+        for ok in (True, False, True, False):
+            self.group.record("a", ok)
+
+        # Assert
+        assert self.group.is_ejected("a")
+        assert self.group.healthy_member_ids() == ["b"]
+        assert {self.group.choose() for _ in range(4)} == {"b"}
+
+    def test_needs_min_requests_before_ejecting(self):
+        # Act
+        for _ in range(3):
+            self.group.record("a", False)
+
+        # Assert
+        assert not self.group.is_ejected("a")
+
+    def test_ejected_member_returns_after_cool_off(self):
+        # Arrange
+        for _ in range(4):
+            self.group.record("a", False)
+
+        # Act
+        time.sleep(0.06)
+
+        # Assert
+        assert not self.group.is_ejected("a")
+        assert {self.group.choose() for _ in range(4)} == {"a", "b"}
+
+    def test_repeat_ejections_cool_off_longer(self):
+        # Arrange
+        for _ in range(4):
+            self.group.record("a", False)
+        time.sleep(0.06)
+
+        # Act - fails again straight after coming back
+        for _ in range(4):
+            self.group.record("a", False)
+        time.sleep(0.06)
+
+        # Assert - second cool-off is 0.1s
+        assert self.group.is_ejected("a")
+
+    def test_routes_to_everyone_when_all_are_ejected(self):
+        # Arrange
+        for server_id in ("a", "b"):
+            for _ in range(4):
+                self.group.record(server_id, False)
+
+        # Act & Assert
+        assert {self.group.choose() for _ in range(4)} == {"a", "b"}
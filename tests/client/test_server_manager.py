@@ -204,6 +204,64 @@ class TestOutboundRequestTracking:
         assert isinstance(future.result(), Error)
 
 
+class TestResponseTimes:
+    def test_quantile_of_recorded_response_times(self):
+        # Arrange
+        manager = ServerManager()
+        manager.register_server("server")
+
+        # Act
+        for ms in range(1, 101):
+            manager.record_response_time("server", "ping", ms / 1000)
+
+        # Assert
+        assert manager.response_time_quantile("server", "ping", 0.95) == 0.095
+        assert manager.response_time_quantile("server", "ping", 0.5) == 0.05
+
+    def test_quantile_is_none_below_min_samples(self):
+        # Arrange
+        manager = ServerManager()
+        manager.register_server("server")
+        manager.record_response_time("server", "ping", 0.01)
+
+        # Act & Assert
+        assert (
+            manager.response_time_quantile("server", "ping", 0.95, min_samples=2)
+            is None
+        )
+        assert manager.response_time_quantile("unknown", "ping", 0.95) is None
+
+    def test_window_keeps_only_recent_samples(self):
+        # Arrange
+        manager = ServerManager()
+        state = manager.register_server("server")
+
+        # Act - a slow spell followed by a full window of fast answers
+        for _ in range(10):
+            manager.record_response_time("server", "ping", 5.0)
+        for _ in range(256):
+            manager.record_response_time("server", "ping", 0.01)
+
+        # Assert
+        assert len(state.latency["ping"]) == 256
+        assert manager.response_time_quantile("server", "ping", 1.0) == 0.01
+
+    def test_methods_are_kept_apart(self):
+        # Arrange
+        manager = ServerManager()
+        manager.register_server("server")
+
+        # Act - slow tool calls alongside fast pings
+        for _ in range(50):
+            manager.record_response_time("server", "tools/call", 20.0)
+            manager.record_response_time("server", "ping", 0.01)
+
+        # Assert
+        assert manager.response_time_quantile("server", "ping", 0.95) == 0.01
+        assert manager.response_time_quantile("server", "tools/call", 0.95) == 20.0
+        assert manager.response_time_quantile("server", "prompts/get", 0.95) is None
+
+
 class TestInboundRequestTracking:
     async def test_track_request_validates_server_exists(self):
         # Arrange
@@ -0,0 +1,105 @@
+import pytest
+
+from conduit.client.tool_index import (
+    AmbiguousToolError,
+    ToolIndex,
+    UnknownToolError,
+)
+from conduit.protocol.tools import JSONSchema, Tool
+
+
+def tool(name: str) -> Tool:
+    return Tool(name=name, input_schema=JSONSchema())
+
+
+class TestToolIndex:
+    def test_resolves_bare_and_qualified_names(self):
+        # Arrange
+        index = ToolIndex()
+        index.update_server("files", [tool("read"), tool("write")])
+
+        # Act & Assert
+        assert index.resolve("read") == ("files", tool("read"))
+        assert index.resolve("files__write") == ("files", tool("write"))
+        with pytest.raises(UnknownToolError):
+            index.resolve("delete")
+
+    def test_error_policy_refuses_shared_bare_names(self):
+        # Arrange
+        index = ToolIndex(collision_policy="error")
+        index.update_server("a", [tool("search")])
+        index.update_server("b", [tool("search")])
+
+        # Act & Assert
+        with pytest.raises(AmbiguousToolError) as exc_info:
+            index.resolve("search")
+        assert exc_info.value.server_ids == ["a", "b"]
+        assert index.resolve("b__search") == ("b", tool("search"))
+        assert sorted(t.exposed_name for t in index.tools()) == [
+            "a__search",
+            "b__search",
+        ]
+
+    @pytest.mark.parametrize("policy, owner", [("first", "a"), ("last", "b")])
+    def test_first_and_last_policies_pick_an_owner(self, policy, owner):
+        # Arrange
+        index = ToolIndex(collision_policy=policy)
+        index.update_server("a", [tool("search")])
+        index.update_server("b", [tool("search")])
+
+        # Act
+        server_id, _ = index.resolve("search")
+
+        # Assert
+        assert server_id == owner
+        exposed = {t.server_id: t.exposed_name for t in index.tools()}
+        assert exposed[owner] == "search"
+
+    @pytest.mark.parametrize("policy, owner", [("first", "a"), ("last", "b")])
+    def test_refreshing_a_server_keeps_its_place(self, policy, owner):
+        # Arrange
+        index = ToolIndex(collision_policy=policy)
+        index.update_server("a", [tool("search")])
+        index.update_server("b", [tool("search")])
+
+        # Act
+        index.update_server("a", [tool("search"), tool("fetch")])
+
+        # Assert
+        assert index.resolve("search")[0] == owner
+        assert index.server_ids_for("search") == ["a", "b"]
+
+    def test_offering_a_name_again_moves_the_server_to_the_back(self):
+        # Arrange
+        index = ToolIndex(collision_policy="last")
+        index.update_server("a", [tool("search")])
+        index.update_server("b", [tool("search")])
+
+        # Act
+        index.update_server("a", [])
+        index.update_server("a", [tool("search")])
+
+        # Assert
+        assert index.resolve("search")[0] == "a"
+        assert index.server_ids_for("search") == ["b", "a"]
+
+    def test_updates_and_removals_release_names(self):
+        # Arrange
+        index = ToolIndex()
+        index.update_server("a", [tool("search"), tool("old")])
+        index.update_server("b", [tool("search")])
+
+        # Act
+        index.update_server("a", [tool("new")])
+        index.remove_server("b")
+
+        # Assert
+        assert "old" not in index
+        assert "search" not in index
+        assert index.resolve("new") == ("a", tool("new"))
+        assert len(index) == 1
+
+    def test_rejects_unknown_policy(self):
+        # Act & Assert
+        with pytest.raises(ValueError):
+            ToolIndex(collision_policy="random")
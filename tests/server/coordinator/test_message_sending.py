@@ -169,6 +169,30 @@ class TestRequestSending:
             coordinator.client_manager.get_request_to_client(client_id, "req-1") is None
         )
 
+    async def test_allocates_sequential_integer_request_ids(
+        self, coordinator, mock_transport, yield_loop
+    ):
+        # Arrange
+        client_id = "test_client"
+        await coordinator.start()
+
+        # Act - send two requests and let them time out quickly
+        tasks = [
+            asyncio.create_task(
+                coordinator.send_request(client_id, PingRequest(), timeout=0.02)
+            )
+            for _ in range(2)
+        ]
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+        # Assert
+        sent_ids = [
+            message["id"]
+            for message in mock_transport.sent_messages[client_id]
+            if message.get("method") == "ping"
+        ]
+        assert sent_ids == [1, 2]
+
 
 class TestNotificationSending:
     async def test_send_notification_fails_when_not_running(self, coordinator):
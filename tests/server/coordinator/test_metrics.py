@@ -0,0 +1,102 @@
+import asyncio
+
+from conduit.protocol.base import Error
+from conduit.protocol.common import EmptyResult
+
+
+class TestMessageMetrics:
+    async def test_records_count_and_latency_per_method(
+        self, coordinator, mock_transport, yield_loop
+    ):
+        # Arrange
+        async def handler(context, request):
+            return EmptyResult()
+
+        coordinator.register_request_handler("tools/list", handler)
+        await coordinator.start()
+
+        # Act
+        for request_id in (1, 2):
+            mock_transport.add_client_message(
+                "client-1",
+                {"jsonrpc": "2.0", "id": request_id, "method": "tools/list"},
+            )
+        await yield_loop()
+
+        # Assert
+        metrics = coordinator.metrics
+        assert metrics.requests.value("tools/list") == 2
+        assert metrics.request_duration.count("tools/list") == 2
+        assert metrics.requests_in_flight.value("tools/list") == 0
+        assert metrics.request_errors.value("tools/list") == 0
+        assert metrics.active_clients.value() == 1
+
+    async def test_counts_error_results_and_handler_failures(
+        self, coordinator, mock_transport, yield_loop
+    ):
+        # Arrange
+        async def error_handler(context, request):
+            return Error(code=-32602, message="bad params")
+
+        async def failing_handler(context, request):
+            raise RuntimeError("boom")
+
+        coordinator.register_request_handler("tools/list", error_handler)
+        coordinator.register_request_handler("prompts/list", failing_handler)
+        await coordinator.start()
+
+        # Act
+        mock_transport.add_client_message(
+            "client-1", {"jsonrpc": "2.0", "id": 1, "method": "tools/list"}
+        )
+        mock_transport.add_client_message(
+            "client-1", {"jsonrpc": "2.0", "id": 2, "method": "prompts/list"}
+        )
+        await yield_loop()
+
+        # Assert
+        metrics = coordinator.metrics
+        assert metrics.request_errors.value("tools/list") == 1
+        assert metrics.request_errors.value("prompts/list") == 1
+
+    async def test_counts_notifications_per_method(
+        self, coordinator, mock_transport, yield_loop
+    ):
+        # Arrange
+        await coordinator.start()
+
+        # Act
+        mock_transport.add_client_message(
+            "client-1",
+            {"jsonrpc": "2.0", "method": "notifications/roots/list_changed"},
+        )
+        await yield_loop()
+
+        # Assert
+        metrics = coordinator.metrics
+        assert metrics.notifications.value("notifications/roots/list_changed") == 1
+
+    async def test_reports_live_handler_tasks(
+        self, coordinator, mock_transport, yield_loop
+    ):
+        # Arrange
+        release = asyncio.Event()
+
+        async def blocking_handler(context, request):
+            await release.wait()
+            return EmptyResult()
+
+        coordinator.register_request_handler("tools/list", blocking_handler)
+        await coordinator.start()
+
+        # Act
+        mock_transport.add_client_message(
+            "client-1", {"jsonrpc": "2.0", "id": 1, "method": "tools/list"}
+        )
+        await yield_loop()
+
+        # Assert
+        assert coordinator.metrics.handler_tasks.value() == 1
+        release.set()
+        await yield_loop()
+        assert coordinator.metrics.handler_tasks.value() == 0
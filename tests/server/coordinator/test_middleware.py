@@ -0,0 +1,122 @@
+from conduit.protocol.base import Error
+from conduit.protocol.common import EmptyResult
+
+
+class TestRequestMiddleware:
+    async def test_middleware_wraps_handler_and_sees_outcome(
+        self, coordinator, mock_transport, yield_loop
+    ):
+        # Arrange
+        outcomes = []
+
+        async def handler(context, request):
+            return EmptyResult()
+
+        async def record_outcome(context, request, call_next):
+            result = await call_next(context, request)
+            outcomes.append((context.client_id, request.method, result))
+            return result
+
+        coordinator.register_request_handler("tools/list", handler)
+        coordinator.add_request_middleware(record_outcome)
+        await coordinator.start()
+
+        # Act
+        mock_transport.add_client_message(
+            "client-1", {"jsonrpc": "2.0", "id": 1, "method": "tools/list"}
+        )
+        await yield_loop()
+
+        # Assert
+        assert outcomes == [("client-1", "tools/list", EmptyResult())]
+        assert mock_transport.sent_messages["client-1"][0]["result"] == {}
+
+    async def test_short_circuit_skips_handler(
+        self, coordinator, mock_transport, yield_loop
+    ):
+        # Arrange
+        handled = []
+
+        async def handler(context, request):
+            handled.append(request)
+            return EmptyResult()
+
+        async def rate_limit(context, request, call_next):
+            return Error(code=-32000, message="Rate limited")
+
+        coordinator.register_request_handler("tools/list", handler)
+        coordinator.add_request_middleware(rate_limit)
+        await coordinator.start()
+
+        # Act
+        mock_transport.add_client_message(
+            "client-1", {"jsonrpc": "2.0", "id": 1, "method": "tools/list"}
+        )
+        await yield_loop()
+
+        # Assert
+        assert handled == []
+        response = mock_transport.sent_messages["client-1"][0]
+        assert response["error"]["message"] == "Rate limited"
+
+    async def test_middleware_added_later_applies_to_next_request(
+        self, coordinator, mock_transport, yield_loop
+    ):
+        # Arrange
+        seen = []
+
+        async def handler(context, request):
+            return EmptyResult()
+
+        async def observe(context, request, call_next):
+            seen.append(request.method)
+            return await call_next(context, request)
+
+        coordinator.register_request_handler("tools/list", handler)
+        await coordinator.start()
+        mock_transport.add_client_message(
+            "client-1", {"jsonrpc": "2.0", "id": 1, "method": "tools/list"}
+        )
+        await yield_loop()
+
+        # Act
+        coordinator.add_request_middleware(observe)
+        mock_transport.add_client_message(
+            "client-1", {"jsonrpc": "2.0", "id": 2, "method": "tools/list"}
+        )
+        await yield_loop()
+
+        # Assert
+        assert seen == ["tools/list"]
+
+
+class TestNotificationMiddleware:
+    async def test_middleware_wraps_notification_handler(
+        self, coordinator, mock_transport, yield_loop
+    ):
+        # Arrange
+        calls = []
+
+        async def handler(context, notification):
+            calls.append("handler")
+
+        async def observe(context, notification, call_next):
+            calls.append(notification.method)
+            await call_next(context, notification)
+
+        coordinator.register_notification_handler(
+            "notifications/roots/list_changed", handler
+        )
+        coordinator.add_notification_middleware(observe)
+        coordinator.client_manager.register_client("client-1")
+        await coordinator.start()
+
+        # Act
+        mock_transport.add_client_message(
+            "client-1",
+            {"jsonrpc": "2.0", "method": "notifications/roots/list_changed"},
+        )
+        await yield_loop()
+
+        # Assert
+        assert calls == ["notifications/roots/list_changed", "handler"]
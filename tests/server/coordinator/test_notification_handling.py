@@ -1,7 +1,11 @@
+import asyncio
 from unittest.mock import AsyncMock
 
 from conduit.protocol.common import CancelledNotification
+from conduit.protocol.roots import ListRootsRequest, ListRootsResult
+from conduit.server.coordinator import MessageCoordinator
 from conduit.server.message_context import MessageContext
+from conduit.shared.task_supervisor import TaskSupervisor
 
 
 class TestNotificationHandling:
@@ -72,3 +76,141 @@ class TestNotificationHandling:
         # Assert - should handle gracefully (no exceptions raised)
         # The test passes if we get here without exceptions
         assert True
+
+    async def test_cancellation_runs_before_handle_returns(self, coordinator):
+        """Control-plane notifications are handled inline, not in a task."""
+        # Arrange
+        client_id = "test_client"
+        coordinator.client_manager.register_client(client_id)
+        mock_handler = AsyncMock()
+        coordinator.register_notification_handler(
+            "notifications/cancelled", mock_handler
+        )
+        payload = {
+            "jsonrpc": "2.0",
+            "method": "notifications/cancelled",
+            "params": {"requestId": "test-request-123"},
+        }
+
+        # Act - no yield to the event loop
+        await coordinator._handle_notification(client_id, payload)
+
+        # Assert
+        mock_handler.assert_awaited_once()
+
+    async def test_data_plane_notification_runs_in_background(
+        self, coordinator, yield_loop
+    ):
+        # Arrange
+        client_id = "test_client"
+        coordinator.client_manager.register_client(client_id)
+        mock_handler = AsyncMock()
+        coordinator.register_notification_handler(
+            "notifications/progress", mock_handler
+        )
+        payload = {
+            "jsonrpc": "2.0",
+            "method": "notifications/progress",
+            "params": {"progressToken": "token", "progress": 1},
+        }
+
+        # Act
+        await coordinator._handle_notification(client_id, payload)
+
+        # Assert - handler is scheduled, not awaited inline
+        mock_handler.assert_not_awaited()
+        await yield_loop()
+        mock_handler.assert_awaited_once()
+
+    async def test_notifications_from_one_client_run_in_order(
+        self, coordinator, yield_loop
+    ):
+        # Arrange
+        client_id = "test_client"
+        coordinator.client_manager.register_client(client_id)
+        progress = []
+
+        async def slow_then_fast(context, notification):
+            # Earlier notifications take longer; ordering must still hold.
+            await asyncio.sleep(0.005 * (3 - notification.progress))
+            progress.append(notification.progress)
+
+        coordinator.register_notification_handler(
+            "notifications/progress", slow_then_fast
+        )
+
+        # Act
+        for value in (1, 2, 3):
+            await coordinator._handle_notification(
+                client_id,
+                {
+                    "jsonrpc": "2.0",
+                    "method": "notifications/progress",
+                    "params": {"progressToken": "token", "progress": value},
+                },
+            )
+        await yield_loop(0.05)
+
+        # Assert
+        assert progress == [1, 2, 3]
+        assert coordinator.tasks.live_tasks == 0
+
+
+class TestLaneBackpressure:
+    async def test_flooding_client_does_not_block_responses_to_lane_handlers(
+        self, mock_transport, client_manager, yield_loop
+    ):
+        """A lane handler awaiting the client must get its response even while
+        the same client floods the lane with progress notifications."""
+        # Arrange
+        coordinator = MessageCoordinator(
+            mock_transport, client_manager, tasks=TaskSupervisor(max_lane_backlog=2)
+        )
+        client_id = "flooder"
+        client_manager.register_client(client_id)
+        roots_results = []
+
+        async def on_roots_changed(context, notification):
+            roots_results.append(
+                await coordinator.send_request(context.client_id, ListRootsRequest())
+            )
+
+        coordinator.register_notification_handler(
+            "notifications/roots/list_changed", on_roots_changed
+        )
+        coordinator.register_notification_handler("notifications/progress", AsyncMock())
+        await coordinator.start()
+
+        # Act - the handler's request goes out, then the client floods the lane
+        mock_transport.add_client_message(
+            client_id,
+            {"jsonrpc": "2.0", "method": "notifications/roots/list_changed"},
+        )
+        for _ in range(20):
+            await yield_loop()
+            if mock_transport.sent_messages.get(client_id):
+                break
+        request_id = mock_transport.sent_messages[client_id][0]["id"]
+        for i in range(10):
+            mock_transport.add_client_message(
+                client_id,
+                {
+                    "jsonrpc": "2.0",
+                    "method": "notifications/progress",
+                    "params": {"progressToken": "t", "progress": i},
+                },
+            )
+        mock_transport.add_client_message(
+            client_id, {"jsonrpc": "2.0", "id": request_id, "result": {"roots": []}}
+        )
+        for _ in range(100):
+            if roots_results:
+                break
+            await yield_loop()
+
+        # Assert
+        assert roots_results and isinstance(roots_results[0], ListRootsResult)
+        assert coordinator.tasks.stats().dropped_from_lanes > 0
+
+        # Cleanup
+        await coordinator.stop()
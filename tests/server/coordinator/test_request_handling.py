@@ -1,10 +1,12 @@
 import asyncio
 
-from conduit.protocol.base import INTERNAL_ERROR, METHOD_NOT_FOUND
-from conduit.protocol.common import EmptyResult
+from conduit.protocol.base import INTERNAL_ERROR, METHOD_NOT_FOUND, OVERLOADED
+from conduit.protocol.common import EmptyResult, PingRequest
 from conduit.protocol.jsonrpc import Request
 from conduit.protocol.resources import ReadResourceRequest, ReadResourceResult
+from conduit.protocol.roots import ListRootsRequest
 from conduit.server.message_context import MessageContext
+from conduit.shared.task_supervisor import TaskSupervisor
 
 
 class TestRequestHandling:
@@ -251,3 +253,113 @@ class TestRequestHandling:
 
         error = response["error"]
         assert error["code"] == METHOD_NOT_FOUND
+
+    async def test_ping_is_answered_inline(self, coordinator, mock_transport):
+        """Control-plane requests respond without spawning a handler task."""
+        # Arrange
+        coordinator.register_request_handler("ping", self._empty_handler)
+        payload = {"jsonrpc": "2.0", "id": "ping-1", "method": "ping"}
+
+        # Act - no yield to the event loop
+        await coordinator._handle_request("client-1", payload)
+
+        # Assert
+        responses = mock_transport.sent_messages["client-1"]
+        assert responses == [{"jsonrpc": "2.0", "id": "ping-1", "result": {}}]
+        assert (
+            coordinator.client_manager.get_request_from_client("client-1", "ping-1")
+            is None
+        )
+
+    async def test_refuses_requests_past_the_task_cap(
+        self, coordinator, mock_transport, yield_loop
+    ):
+        # Arrange
+        coordinator.tasks = TaskSupervisor(max_tasks=1)
+        release = asyncio.Event()
+        started = []
+
+        async def blocking_handler(context, request):
+            started.append(request)
+            await release.wait()
+            return EmptyResult()
+
+        coordinator.register_request_handler("tools/list", blocking_handler)
+        await coordinator.start()
+
+        # Act
+        for request_id in (1, 2):
+            mock_transport.add_client_message(
+                "client-1", {"jsonrpc": "2.0", "id": request_id, "method": "tools/list"}
+            )
+        await yield_loop()
+
+        # Assert - the second request is refused straight away, retryably
+        assert len(started) == 1
+        (refusal,) = mock_transport.sent_messages["client-1"]
+        assert refusal["id"] == 2
+        assert refusal["error"]["code"] == OVERLOADED
+        assert refusal["error"]["data"] == {"retryable": True}
+        release.set()
+        await yield_loop()
+        assert mock_transport.sent_messages["client-1"][1]["id"] == 1
+
+    async def test_handlers_at_the_cap_still_get_their_responses(
+        self, coordinator, mock_transport, client_manager, yield_loop
+    ):
+        """Handlers awaiting the client fill the cap; the message loop must keep
+        reading so their responses arrive and they finish."""
+        # Arrange
+        coordinator.tasks = TaskSupervisor(max_tasks=2)
+        client_manager.register_client("client-1")
+
+        async def asks_for_roots(context, request):
+            await coordinator.send_request(context.client_id, ListRootsRequest())
+            return EmptyResult()
+
+        coordinator.register_request_handler("tools/list", asks_for_roots)
+        await coordinator.start()
+
+        # Act - more requests than the cap, then answer the handlers' requests
+        for request_id in (1, 2, 3):
+            mock_transport.add_client_message(
+                "client-1", {"jsonrpc": "2.0", "id": request_id, "method": "tools/list"}
+            )
+        await yield_loop()
+        sent = mock_transport.sent_messages["client-1"]
+        roots_requests = [m for m in sent if m.get("method") == "roots/list"]
+        for roots_request in roots_requests:
+            mock_transport.add_client_message(
+                "client-1",
+                {"jsonrpc": "2.0", "id": roots_request["id"], "result": {"roots": []}},
+            )
+        for _ in range(50):
+            await yield_loop()
+            if sum("result" in m for m in sent) == 2:
+                break
+
+        # Assert - both handlers finished, the third request was refused
+        assert len(roots_requests) == 2
+        answered = {m["id"] for m in sent if "result" in m}
+        refused = {m["id"] for m in sent if "error" in m}
+        assert answered == {1, 2}
+        assert refused == {3}
+
+    async def test_unsendable_response_does_not_escape_the_handler_task(
+        self, coordinator, mock_transport, client_manager
+    ):
+        """The client left and its request stream is gone: the response and the
+        error response both fail to send, and that's logged, not raised."""
+        # Arrange
+        client_manager.register_client("client-1")
+        mock_transport.simulate_error()
+        context = coordinator._build_context("client-1", 1)
+
+        # Act & Assert - doesn't raise
+        await coordinator._execute_request_handler(
+            self._empty_handler, context, 1, PingRequest()
+        )
+
+    @staticmethod
+    async def _empty_handler(context: MessageContext, request: Request) -> EmptyResult:
+        return EmptyResult()
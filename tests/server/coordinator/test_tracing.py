@@ -0,0 +1,109 @@
+import asyncio
+
+from conduit.protocol.common import EmptyResult, PingRequest
+from conduit.shared.tracing import InMemorySpanExporter, SpanContext, Tracer
+
+TRACE_ID = "4bf92f3577b34da6a3ce929d0e0e4736"
+SPAN_ID = "00f067aa0ba902b7"
+
+
+class TestTracing:
+    async def test_request_handling_joins_client_trace(
+        self, coordinator, mock_transport, yield_loop
+    ):
+        # Arrange
+        exporter = InMemorySpanExporter()
+        coordinator.tracer = Tracer(exporter)
+
+        async def handler(context, request):
+            return EmptyResult()
+
+        coordinator.register_request_handler("tools/list", handler)
+        await coordinator.start()
+
+        # Act
+        mock_transport.add_client_message(
+            "client-1",
+            {
+                "jsonrpc": "2.0",
+                "id": 1,
+                "method": "tools/list",
+                "params": {"_meta": {"traceparent": f"00-{TRACE_ID}-{SPAN_ID}-01"}},
+            },
+        )
+        await yield_loop()
+
+        # Assert
+        spans = {span.name: span for span in exporter.spans}
+        assert {
+            "mcp.server.receive",
+            "mcp.parse",
+            "mcp.server.request tools/list",
+            "mcp.handler",
+            "mcp.serialize",
+            "mcp.send",
+        } <= set(spans)
+        assert all(span.context.trace_id == TRACE_ID for span in exporter.spans)
+        assert spans["mcp.server.receive"].parent_span_id == SPAN_ID
+
+        request_span = spans["mcp.server.request tools/list"]
+        assert request_span.attributes["mcp.method"] == "tools/list"
+        for stage in ("mcp.handler", "mcp.serialize", "mcp.send"):
+            assert spans[stage].parent_span_id == request_span.context.span_id
+
+    async def test_nested_request_to_client_carries_trace_context(
+        self, coordinator, mock_transport, yield_loop
+    ):
+        # Arrange
+        exporter = InMemorySpanExporter()
+        coordinator.tracer = Tracer(exporter)
+
+        async def handler(context, request):
+            try:
+                await coordinator.send_request(
+                    context.client_id, PingRequest(), timeout=0.02
+                )
+            except asyncio.TimeoutError:
+                pass
+            return EmptyResult()
+
+        coordinator.register_request_handler("tools/list", handler)
+        await coordinator.start()
+
+        # Act
+        mock_transport.add_client_message(
+            "client-1",
+            {
+                "jsonrpc": "2.0",
+                "id": 1,
+                "method": "tools/list",
+                "params": {"_meta": {"traceparent": f"00-{TRACE_ID}-{SPAN_ID}-01"}},
+            },
+        )
+        await yield_loop(0.05)
+
+        # Assert
+        ping = next(
+            message
+            for message in mock_transport.sent_messages["client-1"]
+            if message.get("method") == "ping"
+        )
+        nested = SpanContext.from_traceparent(ping["params"]["_meta"]["traceparent"])
+        assert nested is not None
+        assert nested.trace_id == TRACE_ID
+
+    async def test_disabled_tracer_leaves_requests_untouched(
+        self, coordinator, mock_transport
+    ):
+        # Arrange
+        await coordinator.start()
+
+        # Act
+        try:
+            await coordinator.send_request("client-1", PingRequest(), timeout=0.02)
+        except asyncio.TimeoutError:
+            pass
+
+        # Assert
+        ping = mock_transport.sent_messages["client-1"][0]
+        assert "params" not in ping
@@ -474,3 +474,25 @@ class TestProtocolHandlers:
         failing_handler.assert_awaited_once_with(self.context, request)
         assert isinstance(result, CallToolResult)
         assert result.is_error is True
+
+    async def test_handle_call_records_tool_metrics(self):
+        # Arrange
+        failing_handler = AsyncMock(side_effect=RuntimeError("Handler failed"))
+        self.manager.add_tool(self.global_tool, self.global_handler)
+        self.manager.add_client_tool(self.client_id, self.client_tool, failing_handler)
+
+        # Act
+        await self.manager.handle_call(
+            self.context, CallToolRequest(name=self.global_tool.name, arguments={})
+        )
+        await self.manager.handle_call(
+            self.context, CallToolRequest(name=self.client_tool.name, arguments={})
+        )
+
+        # Assert
+        metrics = self.manager.metrics
+        assert metrics.tool_calls.value("calculator") == 1
+        assert metrics.tool_errors.value("calculator") == 0
+        assert metrics.tool_calls.value("personal-files") == 1
+        assert metrics.tool_errors.value("personal-files") == 1
+        assert metrics.tool_duration.count("calculator") == 1
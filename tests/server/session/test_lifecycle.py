@@ -1,7 +1,13 @@
+import asyncio
 from unittest.mock import AsyncMock, Mock
 
+from src.conduit.protocol.base import SERVER_DRAINING
+from src.conduit.protocol.common import EmptyResult
 from src.conduit.protocol.initialization import Implementation, ServerCapabilities
 from src.conduit.server.session import ServerConfig, ServerSession
+from tests.server.coordinator.conftest import (
+    MockServerTransport as CoordinatorMockTransport,
+)
 from tests.server.session.conftest import MockServerTransport
 
 
@@ -41,6 +47,21 @@ class TestDisconnect:
         # Assert - verify client manager cleanup (observable state)
         assert client_id not in self.session.client_manager.get_client_ids()
 
+    async def test_transport_disconnect_drops_client_state(self):
+        # Arrange
+        client_id = "test-client"
+        self.session.client_manager.register_client(client_id)
+        self.session.tools.cleanup_client = Mock()
+        self.session.transport.disconnect_client = AsyncMock()
+
+        # Act - the transport dropped the client on its own
+        await self.transport.disconnect_handler(client_id)
+
+        # Assert
+        self.session.tools.cleanup_client.assert_called_once_with(client_id)
+        assert client_id not in self.session.client_manager.get_client_ids()
+        self.session.transport.disconnect_client.assert_not_awaited()
+
     async def test_disconnect_client_is_idempotent(self):
         # Arrange
         client_id = "test-client"
@@ -91,3 +112,67 @@ class TestDisconnect:
 
         # Assert - all clients removed
         assert self.session.client_manager.get_client_ids() == []
+
+
+class TestDrain:
+    def setup_method(self):
+        self.transport = CoordinatorMockTransport()
+        self.session = ServerSession(
+            transport=self.transport,
+            config=ServerConfig(
+                info=Implementation(name="test-server", version="1.0.0"),
+                capabilities=ServerCapabilities(),
+            ),
+        )
+        self.release = asyncio.Event()
+        self.finished = []
+
+        async def slow_handler(context, request):
+            await self.release.wait()
+            self.finished.append(request.method)
+            return EmptyResult()
+
+        self.session._coordinator.register_request_handler("tools/list", slow_handler)
+
+    async def test_drain_finishes_in_flight_work_and_refuses_new_requests(self):
+        # Arrange
+        await self.session._start()
+        self.transport.add_client_message(
+            "client-1", {"jsonrpc": "2.0", "id": 1, "method": "tools/list"}
+        )
+        await asyncio.sleep(0.01)
+
+        # Act
+        drain_task = asyncio.create_task(self.session.drain(timeout=1.0))
+        await asyncio.sleep(0.01)
+        self.transport.add_client_message(
+            "client-1", {"jsonrpc": "2.0", "id": 2, "method": "tools/list"}
+        )
+        await asyncio.sleep(0.02)
+        self.release.set()
+        drained = await drain_task
+
+        # Assert
+        assert drained is True
+        assert self.finished == ["tools/list"]
+        responses = {m["id"]: m for m in self.transport.sent_messages["client-1"]}
+        assert responses[1]["result"] == {}
+        assert responses[2]["error"]["code"] == SERVER_DRAINING
+        assert responses[2]["error"]["data"] == {"retryable": True}
+        assert not self.session._coordinator.running
+
+    async def test_drain_cancels_work_still_running_at_deadline(self):
+        # Arrange
+        await self.session._start()
+        self.transport.add_client_message(
+            "client-1", {"jsonrpc": "2.0", "id": 1, "method": "tools/list"}
+        )
+        await asyncio.sleep(0.01)
+
+        # Act
+        drained = await self.session.drain(timeout=0.05)
+
+        # Assert
+        assert drained is False
+        assert self.finished == []
+        assert not self.session._coordinator.running
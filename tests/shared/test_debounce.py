@@ -0,0 +1,142 @@
+import asyncio
+
+import pytest
+
+from conduit.shared.debounce import Debouncer
+
+
+async def yield_loop(seconds: float = 0.01) -> None:
+    await asyncio.sleep(seconds)
+
+
+class Recorder:
+    """Records debounced runs, optionally gated so tests can hold them open."""
+
+    def __init__(self):
+        self.runs: list[str] = []
+        self.gate: asyncio.Event | None = None
+        self.fail = False
+
+    async def run(self, key: str) -> None:
+        self.runs.append(key)
+        if self.gate is not None:
+            await self.gate.wait()
+        if self.fail:
+            raise ConnectionError("down")
+
+
+class TestTrigger:
+    async def test_burst_collapses_into_one_run(self):
+        # Arrange
+        recorder = Recorder()
+        debouncer = Debouncer(recorder.run, delay=0.02, max_delay=1.0)
+
+        # Act
+        for _ in range(50):
+            debouncer.trigger("tools")
+        await debouncer.wait_idle()
+
+        # Assert
+        assert recorder.runs == ["tools"]
+        stats = debouncer.stats()
+        assert stats.triggers == 50
+        assert stats.runs == 1
+        assert stats.suppressed == 49
+        assert stats.pending_keys == 0
+
+    async def test_keys_are_debounced_independently(self):
+        # Arrange
+        recorder = Recorder()
+        debouncer = Debouncer(recorder.run, delay=0.0)
+
+        # Act
+        debouncer.trigger("tools")
+        debouncer.trigger("prompts")
+        debouncer.trigger("tools")
+        await debouncer.wait_idle()
+
+        # Assert
+        assert sorted(recorder.runs) == ["prompts", "tools"]
+
+    async def test_triggers_during_a_run_cause_exactly_one_trailing_run(self):
+        # Arrange
+        recorder = Recorder()
+        recorder.gate = asyncio.Event()
+        debouncer = Debouncer(recorder.run, delay=0.0)
+        debouncer.trigger("tools")
+        await yield_loop()
+        assert recorder.runs == ["tools"]
+
+        # Act
+        for _ in range(10):
+            debouncer.trigger("tools")
+        recorder.gate.set()
+        await debouncer.wait_idle()
+
+        # Assert
+        assert recorder.runs == ["tools", "tools"]
+        assert debouncer.stats().suppressed == 9
+
+    async def test_max_delay_caps_how_long_a_burst_postpones_the_run(self):
+        # Arrange
+        recorder = Recorder()
+        debouncer = Debouncer(recorder.run, delay=0.05, max_delay=0.1)
+
+        # Act - keep triggering well past max_delay
+        for _ in range(10):
+            debouncer.trigger("tools")
+            await yield_loop(0.02)
+
+        # Assert - a run started before the burst ended
+        assert recorder.runs
+        await debouncer.wait_idle()
+
+    async def test_failed_run_is_logged_and_clears_the_key(self):
+        # Arrange
+        recorder = Recorder()
+        recorder.fail = True
+        debouncer = Debouncer(recorder.run, delay=0.0)
+
+        # Act
+        debouncer.trigger("tools")
+        await debouncer.wait_idle()
+
+        # Assert
+        assert recorder.runs == ["tools"]
+        assert debouncer.stats().pending_keys == 0
+
+    def test_rejects_max_delay_below_delay(self):
+        with pytest.raises(ValueError):
+            Debouncer(Recorder().run, delay=1.0, max_delay=0.5)
+
+
+class TestCancel:
+    async def test_cancel_drops_a_pending_run(self):
+        # Arrange
+        recorder = Recorder()
+        debouncer = Debouncer(recorder.run, delay=0.02)
+        debouncer.trigger("tools")
+
+        # Act
+        debouncer.cancel("tools")
+        await yield_loop(0.05)
+
+        # Assert
+        assert recorder.runs == []
+        assert debouncer.stats().pending_keys == 0
+
+    async def test_cancel_all_stops_in_flight_runs(self):
+        # Arrange
+        recorder = Recorder()
+        recorder.gate = asyncio.Event()
+        debouncer = Debouncer(recorder.run, delay=0.0)
+        debouncer.trigger("tools")
+        debouncer.trigger("prompts")
+        await yield_loop()
+
+        # Act
+        debouncer.cancel_all()
+        await asyncio.wait_for(debouncer.wait_idle(), timeout=1.0)
+
+        # Assert
+        assert debouncer.stats().pending_keys == 0
@@ -0,0 +1,155 @@
+import math
+
+import pytest
+
+from conduit.shared.metrics import MetricsRegistry
+
+
+class TestCounter:
+    def test_counts_per_label_values(self):
+        # Arrange
+        registry = MetricsRegistry()
+        counter = registry.counter("requests_total", "Requests.", ("method",))
+
+        # Act
+        counter.inc("ping")
+        counter.inc("ping")
+        counter.inc("tools/call", amount=3)
+
+        # Assert
+        assert counter.value("ping") == 2
+        assert counter.value("tools/call") == 3
+        assert counter.value("never") == 0
+
+    def test_rejects_negative_increment(self):
+        # Arrange
+        counter = MetricsRegistry().counter("requests_total", "Requests.")
+
+        # Act & Assert
+        with pytest.raises(ValueError):
+            counter.inc(amount=-1)
+
+
+class TestGauge:
+    def test_inc_dec_and_set(self):
+        # Arrange
+        gauge = MetricsRegistry().gauge("in_flight", "In flight.", ("method",))
+
+        # Act
+        gauge.inc("ping")
+        gauge.inc("ping")
+        gauge.dec("ping")
+        gauge.set("tools/call", value=7)
+
+        # Assert
+        assert gauge.value("ping") == 1
+        assert gauge.value("tools/call") == 7
+
+    def test_remove_drops_one_series(self):
+        # Arrange
+        gauge = MetricsRegistry().gauge("rss", "RSS.", ("server",))
+        gauge.set("a", value=1)
+        gauge.set("b", value=2)
+
+        # Act
+        gauge.remove("a")
+
+        # Assert
+        assert gauge.render() == ['rss{server="b"} 2']
+
+    def test_function_backed_gauge_reads_at_call_time(self):
+        # Arrange
+        items = [1, 2]
+        gauge = MetricsRegistry().gauge("items", "Items.")
+        gauge.set_function(lambda: len(items))
+
+        # Act
+        items.append(3)
+
+        # Assert
+        assert gauge.value() == 3
+
+    def test_function_backed_gauge_requires_no_labels(self):
+        # Arrange
+        gauge = MetricsRegistry().gauge("in_flight", "In flight.", ("method",))
+
+        # Act & Assert
+        with pytest.raises(ValueError):
+            gauge.set_function(lambda: 1)
+
+
+class TestHistogram:
+    def test_tracks_count_sum_and_quantiles(self):
+        # Arrange
+        histogram = MetricsRegistry().histogram(
+            "latency", "Latency.", ("method",), buckets=(0.1, 1.0)
+        )
+
+        # Act
+        for value in (0.05, 0.05, 0.5, 5.0):
+            histogram.observe("ping", value=value)
+
+        # Assert
+        assert histogram.count("ping") == 4
+        assert histogram.sum("ping") == pytest.approx(5.6)
+        assert histogram.quantile(0.5, "ping") == 0.1
+        assert histogram.quantile(0.75, "ping") == 1.0
+        assert histogram.quantile(1.0, "ping") == math.inf
+        assert histogram.quantile(0.5, "other") is None
+
+
+class TestRegistry:
+    def test_returns_existing_metric_for_same_name(self):
+        # Arrange
+        registry = MetricsRegistry()
+
+        # Act
+        first = registry.counter("requests_total", "Requests.")
+        second = registry.counter("requests_total", "Requests.")
+
+        # Assert
+        assert first is second
+
+    def test_rejects_name_registered_as_other_type(self):
+        # Arrange
+        registry = MetricsRegistry()
+        registry.counter("requests_total", "Requests.")
+
+        # Act & Assert
+        with pytest.raises(ValueError):
+            registry.gauge("requests_total", "Requests.")
+
+    def test_renders_prometheus_text_format(self):
+        # Arrange
+        registry = MetricsRegistry()
+        registry.counter("requests_total", "Requests.", ("method",)).inc("ping")
+        registry.histogram("latency_seconds", "Latency.", buckets=(0.5,)).observe(
+            value=0.25
+        )
+
+        # Act
+        text = registry.render_prometheus()
+
+        # Assert
+        assert text.splitlines() == [
+            "# HELP requests_total Requests.",
+            "# TYPE requests_total counter",
+            'requests_total{method="ping"} 1',
+            "# HELP latency_seconds Latency.",
+            "# TYPE latency_seconds histogram",
+            'latency_seconds_bucket{le="0.5"} 1',
+            'latency_seconds_bucket{le="+Inf"} 1',
+            "latency_seconds_sum 0.25",
+            "latency_seconds_count 1",
+        ]
+
+    def test_escapes_label_values(self):
+        # Arrange
+        registry = MetricsRegistry()
+        registry.counter("calls_total", "Calls.", ("tool",)).inc('say "hi"')
+
+        # Act
+        text = registry.render_prometheus()
+
+        # Assert
+        assert 'calls_total{tool="say \\"hi\\""} 1' in text
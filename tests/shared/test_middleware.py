@@ -0,0 +1,64 @@
+from conduit.shared.middleware import chain_middleware
+
+
+class TestChainMiddleware:
+    def test_returns_handler_when_chain_is_empty(self):
+        # Arrange
+        async def handler(context, message):
+            return "handled"
+
+        # Act & Assert
+        assert chain_middleware(handler, []) is handler
+
+    async def test_runs_middleware_in_order_around_handler(self):
+        # Arrange
+        calls = []
+
+        async def handler(context, message):
+            calls.append("handler")
+            return message
+
+        def make_middleware(name):
+            async def middleware(context, message, call_next):
+                calls.append(f"{name} before")
+                result = await call_next(context, message)
+                calls.append(f"{name} after")
+                return result
+
+            return middleware
+
+        chained = chain_middleware(
+            handler, [make_middleware("outer"), make_middleware("inner")]
+        )
+
+        # Act
+        result = await chained("ctx", "message")
+
+        # Assert
+        assert result == "message"
+        assert calls == [
+            "outer before",
+            "inner before",
+            "handler",
+            "inner after",
+            "outer after",
+        ]
+
+    async def test_middleware_can_short_circuit_and_rewrite(self):
+        # Arrange
+        async def handler(context, message):
+            return f"handled {message}"
+
+        async def rewrite(context, message, call_next):
+            return await call_next(context, message.upper())
+
+        async def cache(context, message, call_next):
+            if message == "cached":
+                return "from cache"
+            return await call_next(context, message)
+
+        chained = chain_middleware(handler, [cache, rewrite])
+
+        # Act & Assert
+        assert await chained("ctx", "cached") == "from cache"
+        assert await chained("ctx", "fresh") == "handled FRESH"
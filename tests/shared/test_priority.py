@@ -0,0 +1,31 @@
+from conduit.shared.priority import MessagePriority, priority_for_method
+
+
+class TestPriorityForMethod:
+    def test_responses_are_control_plane(self):
+        # Act
+        priority = priority_for_method(None)
+
+        # Assert
+        assert priority is MessagePriority.CONTROL
+
+    def test_control_methods_are_control_plane(self):
+        # Arrange
+        control_methods = [
+            "ping",
+            "initialize",
+            "notifications/cancelled",
+            "notifications/initialized",
+        ]
+
+        # Act & Assert
+        for method in control_methods:
+            assert priority_for_method(method) is MessagePriority.CONTROL
+
+    def test_other_methods_are_data_plane(self):
+        # Arrange
+        data_methods = ["tools/call", "resources/read", "notifications/progress"]
+
+        # Act & Assert
+        for method in data_methods:
+            assert priority_for_method(method) is MessagePriority.DATA
@@ -425,3 +425,27 @@ class TestRequestTracker:
 
         # Verify still empty
         assert len(self.tracker.get_peer_ids()) == 0
+
+    def test_next_request_id_is_monotonic(self):
+        # Act
+        first = self.tracker.next_request_id()
+        second = self.tracker.next_request_id()
+        third = self.tracker.next_request_id()
+
+        # Assert
+        assert (first, second, third) == (1, 2, 3)
+
+    async def test_stale_response_after_cleanup_does_not_resolve_new_request(self):
+        # Arrange - a request to the old connection, then a reset
+        old_id = self.tracker.next_request_id()
+        self.tracker.cleanup_peer("peer-a")
+        new_id = self.tracker.next_request_id()
+        future = asyncio.get_running_loop().create_future()
+        self.tracker.track_outbound_request("peer-a", new_id, PingRequest(), future)
+
+        # Act - the old connection's late response arrives
+        self.tracker.resolve_outbound_request("peer-a", old_id, EmptyResult())
+
+        # Assert
+        assert new_id != old_id
+        assert not future.done()
@@ -0,0 +1,233 @@
+import asyncio
+
+import pytest
+
+from conduit.shared.task_supervisor import TaskSupervisor
+
+
+async def yield_loop(seconds: float = 0.01) -> None:
+    await asyncio.sleep(seconds)
+
+
+class TestSpawn:
+    async def test_try_spawn_refuses_work_at_task_cap(self):
+        # Arrange
+        supervisor = TaskSupervisor(max_tasks=2)
+        release = asyncio.Event()
+        supervisor.try_spawn(release.wait())
+        supervisor.try_spawn(release.wait())
+        ran = []
+
+        async def work():
+            ran.append(True)
+
+        # Act - returns straight away instead of waiting for a slot
+        task = supervisor.try_spawn(work())
+
+        # Assert - refused, and the coroutine closed without running
+        assert task is None
+        release.set()
+        await asyncio.wait_for(supervisor.wait_idle(), timeout=1.0)
+        assert ran == []
+        stats = supervisor.stats()
+        assert stats.rejected_tasks == 1
+        assert stats.peak_tasks == 2
+
+    async def test_try_spawn_accepts_work_once_a_slot_frees(self):
+        # Arrange
+        supervisor = TaskSupervisor(max_tasks=1)
+        release = asyncio.Event()
+        supervisor.try_spawn(release.wait())
+
+        # Act
+        release.set()
+        await yield_loop()
+        task = supervisor.try_spawn(asyncio.sleep(0))
+
+        # Assert
+        assert task is not None
+        await task
+
+    async def test_spawn_runs_past_the_cap_as_overflow(self):
+        # Arrange
+        supervisor = TaskSupervisor(max_tasks=1)
+        release = asyncio.Event()
+        supervisor.spawn(release.wait())
+
+        # Act
+        task = supervisor.spawn(release.wait())
+
+        # Assert
+        assert supervisor.live_tasks == 2
+        assert supervisor.stats().overflow_tasks == 1
+        release.set()
+        await task
+
+    async def test_cancel_all_cancels_live_tasks(self):
+        # Arrange
+        supervisor = TaskSupervisor()
+        task = supervisor.spawn(asyncio.Event().wait())
+
+        # Act
+        supervisor.cancel_all()
+        await yield_loop()
+
+        # Assert
+        assert task.cancelled()
+        assert supervisor.live_tasks == 0
+
+    def test_rejects_invalid_caps(self):
+        # Act & Assert
+        with pytest.raises(ValueError):
+            TaskSupervisor(max_tasks=0)
+        with pytest.raises(ValueError):
+            TaskSupervisor(max_lane_backlog=0)
+
+
+class TestOrderedLanes:
+    async def test_runs_lane_items_in_order_with_one_worker(self):
+        # Arrange
+        supervisor = TaskSupervisor()
+        order = []
+
+        async def record(value):
+            await asyncio.sleep(0)
+            order.append(value)
+
+        # Act
+        for value in range(5):
+            supervisor.submit_ordered("peer-1", record(value))
+
+        # Assert - one worker drains the whole lane
+        assert supervisor.live_tasks == 1
+        await yield_loop()
+        assert order == [0, 1, 2, 3, 4]
+        assert supervisor.live_tasks == 0
+        assert supervisor.stats().lanes == 0
+
+    async def test_lanes_for_different_peers_run_concurrently(self):
+        # Arrange
+        supervisor = TaskSupervisor()
+        release = asyncio.Event()
+        done = []
+
+        async def blocked():
+            await release.wait()
+            done.append("blocked")
+
+        async def quick():
+            done.append("quick")
+
+        # Act
+        supervisor.submit_ordered("peer-1", blocked())
+        supervisor.submit_ordered("peer-2", quick())
+        await yield_loop()
+
+        # Assert
+        assert done == ["quick"]
+        release.set()
+        await yield_loop()
+        assert done == ["quick", "blocked"]
+
+    async def test_failure_does_not_stop_lane(self):
+        # Arrange
+        supervisor = TaskSupervisor()
+        done = []
+
+        async def fail():
+            raise RuntimeError("boom")
+
+        async def succeed():
+            done.append(True)
+
+        # Act
+        supervisor.submit_ordered("peer-1", fail())
+        supervisor.submit_ordered("peer-1", succeed())
+        await yield_loop()
+
+        # Assert
+        assert done == [True]
+
+    async def test_drops_droppable_items_when_lane_is_full(self):
+        # Arrange
+        supervisor = TaskSupervisor(max_lane_backlog=2)
+        release = asyncio.Event()
+        supervisor.submit_ordered("peer-1", release.wait())
+        await yield_loop()  # worker picks up the first item
+        supervisor.submit_ordered("peer-1", asyncio.sleep(0))
+        supervisor.submit_ordered("peer-1", asyncio.sleep(0))
+
+        # Act - returns straight away instead of waiting for room
+        queued = supervisor.submit_ordered("peer-1", asyncio.sleep(0), droppable=True)
+
+        # Assert
+        assert queued is False
+        stats = supervisor.stats()
+        assert stats.queued_in_lanes == 2
+        assert stats.dropped_from_lanes == 1
+
+        release.set()
+        await asyncio.wait_for(supervisor.wait_idle(), timeout=1.0)
+
+    async def test_queues_other_items_past_a_full_lane(self):
+        # Arrange
+        supervisor = TaskSupervisor(max_lane_backlog=1)
+        release = asyncio.Event()
+        done = []
+
+        async def record(name: str) -> None:
+            done.append(name)
+
+        supervisor.submit_ordered("peer-1", release.wait())
+        await yield_loop()
+        supervisor.submit_ordered("peer-1", record("first"))
+
+        # Act
+        queued = supervisor.submit_ordered("peer-1", record("second"))
+
+        # Assert - kept, in order, without blocking the caller
+        assert queued is True
+        release.set()
+        await asyncio.wait_for(supervisor.wait_idle(), timeout=1.0)
+        assert done == ["first", "second"]
+        assert supervisor.stats().dropped_from_lanes == 0
+
+    async def test_wait_idle_returns_after_tasks_and_lanes_finish(self):
+        # Arrange
+        supervisor = TaskSupervisor()
+        release = asyncio.Event()
+        supervisor.spawn(release.wait())
+        supervisor.submit_ordered("peer-1", release.wait())
+
+        # Act
+        waiter = asyncio.create_task(supervisor.wait_idle())
+        await yield_loop()
+
+        # Assert
+        assert not waiter.done()
+        release.set()
+        await asyncio.wait_for(waiter, timeout=1.0)
+        assert supervisor.live_tasks == 0
+
+
+class TestLanesAtTaskCap:
+    async def test_new_lane_starts_past_the_task_cap(self):
+        # Arrange
+        supervisor = TaskSupervisor(max_tasks=1)
+        release = asyncio.Event()
+        done = []
+
+        async def record():
+            done.append(True)
+
+        supervisor.spawn(release.wait())
+
+        # Act
+        supervisor.submit_ordered("peer-1", record())
+        await yield_loop()
+
+        # Assert - ran without waiting for the blocked task
+        assert done == [True]
+        assert supervisor.stats().overflow_tasks == 1
+        release.set()
+        await asyncio.wait_for(supervisor.wait_idle(), timeout=1.0)
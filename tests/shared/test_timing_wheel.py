@@ -0,0 +1,150 @@
+import asyncio
+
+import pytest
+
+from conduit.shared.timing_wheel import TimingWheel
+
+
+class TestTimingWheel:
+    async def test_fires_callback_after_delay(self):
+        # Arrange
+        wheel = TimingWheel(tick=0.005)
+        fired = asyncio.Event()
+
+        # Act
+        wheel.schedule(0.02, fired.set)
+
+        # Assert
+        assert not fired.is_set()
+        await asyncio.wait_for(fired.wait(), timeout=1.0)
+        assert len(wheel) == 0
+
+    async def test_does_not_fire_early(self):
+        # Arrange
+        wheel = TimingWheel(tick=0.005)
+        loop = asyncio.get_running_loop()
+        fired_at: list[float] = []
+        start = loop.time()
+
+        # Act
+        wheel.schedule(0.05, lambda: fired_at.append(loop.time()))
+        await asyncio.sleep(0.1)
+
+        # Assert
+        assert len(fired_at) == 1
+        assert fired_at[0] - start >= 0.05 - 0.005
+
+    async def test_cancelled_timer_does_not_fire(self):
+        # Arrange
+        wheel = TimingWheel(tick=0.005)
+        fired = []
+        timer_id = wheel.schedule(0.01, lambda: fired.append(True))
+
+        # Act
+        cancelled = wheel.cancel(timer_id)
+        await asyncio.sleep(0.03)
+
+        # Assert
+        assert cancelled
+        assert fired == []
+        assert wheel.cancel(timer_id) is False
+
+    async def test_expires_many_timers_in_one_pass(self):
+        # Arrange
+        wheel = TimingWheel(tick=0.005)
+        fired = []
+
+        # Act
+        for i in range(1000):
+            wheel.schedule(0.01, lambda i=i: fired.append(i))
+        await asyncio.sleep(0.05)
+
+        # Assert
+        assert sorted(fired) == list(range(1000))
+        assert len(wheel) == 0
+
+    async def test_timers_beyond_one_rotation_wait_their_turn(self):
+        # Arrange - 4 slots of 5ms means the ring wraps every 20ms
+        wheel = TimingWheel(tick=0.005, slots=4)
+        fired = []
+
+        # Act
+        wheel.schedule(0.005, lambda: fired.append("short"))
+        wheel.schedule(0.06, lambda: fired.append("long"))
+        await asyncio.sleep(0.03)
+
+        # Assert
+        assert fired == ["short"]
+        await asyncio.sleep(0.06)
+        assert fired == ["short", "long"]
+
+    async def test_failing_callback_does_not_stop_the_wheel(self):
+        # Arrange
+        wheel = TimingWheel(tick=0.005)
+        fired = []
+
+        def boom() -> None:
+            raise RuntimeError("boom")
+
+        # Act
+        wheel.schedule(0.01, boom)
+        wheel.schedule(0.01, lambda: fired.append(True))
+        await asyncio.sleep(0.04)
+
+        # Assert
+        assert fired == [True]
+
+    async def test_skips_ticks_with_nothing_due(self):
+        # Arrange
+        wheel = TimingWheel(tick=0.001)
+        advance = wheel._advance
+        wakeups = []
+
+        def counting_advance(loop):
+            wakeups.append(loop.time())
+            advance(loop)
+
+        wheel._advance = counting_advance
+        fired = asyncio.Event()
+
+        # Act - 100 ticks away
+        wheel.schedule(0.1, fired.set)
+        await asyncio.wait_for(fired.wait(), timeout=1.0)
+
+        # Assert - one wakeup for the deadline, not one per tick
+        assert len(wakeups) == 1
+
+    async def test_earlier_timer_scheduled_later_fires_first(self):
+        # Arrange
+        wheel = TimingWheel(tick=0.005)
+        fired = []
+        wheel.schedule(0.5, lambda: fired.append("late"))
+
+        # Act
+        wheel.schedule(0.01, lambda: fired.append("early"))
+        await asyncio.sleep(0.05)
+
+        # Assert
+        assert fired == ["early"]
+        assert len(wheel) == 1
+
+    async def test_cancelling_the_earliest_timer_keeps_later_ones(self):
+        # Arrange
+        wheel = TimingWheel(tick=0.005)
+        fired = []
+        first = wheel.schedule(0.01, lambda: fired.append("first"))
+        wheel.schedule(0.03, lambda: fired.append("second"))
+
+        # Act
+        wheel.cancel(first)
+        await asyncio.sleep(0.06)
+
+        # Assert
+        assert fired == ["second"]
+        assert len(wheel) == 0
+
+    def test_rejects_invalid_configuration(self):
+        with pytest.raises(ValueError):
+            TimingWheel(tick=0)
+        with pytest.raises(ValueError):
+            TimingWheel(slots=0)
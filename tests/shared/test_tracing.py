@@ -0,0 +1,174 @@
+from conduit.protocol.common import PingRequest
+from conduit.shared.tracing import (
+    NOOP_SPAN,
+    InMemorySpanExporter,
+    SpanContext,
+    SpanExporter,
+    Tracer,
+    current_span,
+    extract_trace_context,
+    inject_trace_context,
+)
+
+TRACE_ID = "4bf92f3577b34da6a3ce929d0e0e4736"
+SPAN_ID = "00f067aa0ba902b7"
+
+
+class TestSpanContext:
+    def test_round_trips_traceparent(self):
+        # Arrange
+        traceparent = f"00-{TRACE_ID}-{SPAN_ID}-01"
+
+        # Act
+        context = SpanContext.from_traceparent(traceparent)
+
+        # Assert
+        assert context == SpanContext(TRACE_ID, SPAN_ID, sampled=True)
+        assert context.to_traceparent() == traceparent
+
+    def test_rejects_malformed_traceparent(self):
+        # Arrange
+        invalid_values = [
+            None,
+            42,
+            "",
+            "00-abc-def-01",
+            f"00-{TRACE_ID}-{SPAN_ID}",
+            f"00-{'0' * 32}-{SPAN_ID}-01",
+            f"00-{TRACE_ID}-{'z' * 16}-01",
+        ]
+
+        # Act & Assert
+        for value in invalid_values:
+            assert SpanContext.from_traceparent(value) is None
+
+
+class TestTracer:
+    def test_disabled_tracer_hands_out_noop_span(self):
+        # Arrange
+        tracer = Tracer()
+
+        # Act
+        with tracer.start_span("work") as span:
+            span.set_attribute("key", "value")
+
+        # Assert
+        assert not tracer.enabled
+        assert span is NOOP_SPAN
+        assert NOOP_SPAN.attributes == {}
+        assert current_span() is None
+
+    def test_nested_spans_share_trace_and_link_to_parent(self):
+        # Arrange
+        exporter = InMemorySpanExporter()
+        tracer = Tracer(exporter)
+
+        # Act
+        with tracer.start_span("outer") as outer:
+            with tracer.start_span("inner") as inner:
+                assert current_span() is inner
+            assert current_span() is outer
+
+        # Assert
+        assert [span.name for span in exporter.spans] == ["inner", "outer"]
+        assert inner.context.trace_id == outer.context.trace_id
+        assert inner.parent_span_id == outer.context.span_id
+        assert outer.parent_span_id is None
+        assert inner.duration is not None
+
+    def test_remote_parent_continues_trace(self):
+        # Arrange
+        exporter = InMemorySpanExporter()
+        tracer = Tracer(exporter)
+        remote = SpanContext(TRACE_ID, SPAN_ID)
+
+        # Act
+        with tracer.start_span("handle", parent=remote):
+            pass
+
+        # Assert
+        span = exporter.spans[0]
+        assert span.context.trace_id == TRACE_ID
+        assert span.parent_span_id == SPAN_ID
+
+    def test_records_exception_and_reraises(self):
+        # Arrange
+        exporter = InMemorySpanExporter()
+        tracer = Tracer(exporter)
+
+        # Act
+        try:
+            with tracer.start_span("work"):
+                raise RuntimeError("boom")
+        except RuntimeError:
+            pass
+
+        # Assert
+        assert "boom" in exporter.spans[0].error
+
+    def test_unsampled_spans_are_not_exported(self):
+        # Arrange
+        exporter = InMemorySpanExporter()
+        tracer = Tracer(exporter)
+        remote = SpanContext(TRACE_ID, SPAN_ID, sampled=False)
+
+        # Act
+        with tracer.start_span("handle", parent=remote):
+            pass
+
+        # Assert
+        assert exporter.spans == []
+
+    def test_exporter_failure_does_not_propagate(self):
+        # Arrange
+        class FailingExporter(SpanExporter):
+            def export(self, span):
+                raise RuntimeError("exporter down")
+
+        tracer = Tracer(FailingExporter())
+
+        # Act & Assert - no exception escapes
+        with tracer.start_span("work"):
+            pass
+
+
+class TestPropagation:
+    def test_inject_copies_request_with_traceparent(self):
+        # Arrange
+        tracer = Tracer(InMemorySpanExporter())
+        request = PingRequest(metadata={"custom": "value"})
+
+        # Act
+        with tracer.start_span("send") as span:
+            traced = inject_trace_context(request, span)
+
+        # Assert
+        assert request.metadata == {"custom": "value"}
+        assert traced.metadata["custom"] == "value"
+        assert traced.metadata["traceparent"] == span.context.to_traceparent()
+
+    def test_inject_is_a_no_op_when_tracing_disabled(self):
+        # Arrange
+        request = PingRequest()
+
+        # Act
+        traced = inject_trace_context(request, NOOP_SPAN)
+
+        # Assert
+        assert traced is request
+
+    def test_extract_reads_meta_from_wire_payload(self):
+        # Arrange
+        payload = {
+            "jsonrpc": "2.0",
+            "id": 1,
+            "method": "tools/list",
+            "params": {"_meta": {"traceparent": f"00-{TRACE_ID}-{SPAN_ID}-01"}},
+        }
+
+        # Act
+        context = extract_trace_context(payload)
+
+        # Assert
+        assert context == SpanContext(TRACE_ID, SPAN_ID)
+        assert extract_trace_context({"jsonrpc": "2.0", "id": 1}) is None
@@ -0,0 +1,192 @@
+import asyncio
+
+import pytest
+
+from conduit.client.session import ClientConfig, ClientSession
+from conduit.protocol.common import EmptyResult, PingRequest
+from conduit.protocol.initialization import (
+    ClientCapabilities,
+    Implementation,
+    ServerCapabilities,
+)
+from conduit.server.session import ServerConfig, ServerSession
+from conduit.transport.memory import MemoryClientTransport, MemoryServerTransport
+
+
+async def next_message(iterator):
+    return await asyncio.wait_for(anext(iterator), timeout=1.0)
+
+
+class TestMessagePassing:
+    async def test_client_message_reaches_server_as_same_object(self):
+        # Arrange
+        server = MemoryServerTransport()
+        client = MemoryClientTransport()
+        await client.add_server("server-1", {"server": server})
+        message = {"jsonrpc": "2.0", "id": 1, "method": "ping"}
+
+        # Act
+        await client.send("server-1", message)
+        received = await next_message(server.client_messages())
+
+        # Assert
+        assert received.payload is message
+        assert received.client_id.startswith("memory-client-")
+
+    async def test_server_reply_reaches_the_sending_client(self):
+        # Arrange
+        server = MemoryServerTransport()
+        client = MemoryClientTransport()
+        await client.add_server("server-1", {"server": server})
+        await client.send("server-1", {"jsonrpc": "2.0", "id": 1, "method": "ping"})
+        received = await next_message(server.client_messages())
+
+        # Act
+        await server.send(received.client_id, {"jsonrpc": "2.0", "id": 1, "result": {}})
+        reply = await next_message(client.server_messages())
+
+        # Assert
+        assert reply.server_id == "server-1"
+        assert reply.payload == {"jsonrpc": "2.0", "id": 1, "result": {}}
+
+    async def test_each_client_gets_its_own_client_id(self):
+        # Arrange
+        server = MemoryServerTransport()
+        first, second = MemoryClientTransport(), MemoryClientTransport()
+        await first.add_server("server-1", {"server": server})
+        await second.add_server("server-1", {"server": server})
+
+        # Act
+        await first.send("server-1", {"jsonrpc": "2.0", "method": "a"})
+        await second.send("server-1", {"jsonrpc": "2.0", "method": "b"})
+        messages = server.client_messages()
+        a, b = await next_message(messages), await next_message(messages)
+
+        # Assert
+        assert a.client_id != b.client_id
+
+    async def test_serialize_mode_hands_over_a_json_copy(self):
+        # Arrange
+        server = MemoryServerTransport()
+        client = MemoryClientTransport(serialize=True)
+        await client.add_server("server-1", {"server": server})
+        message = {"jsonrpc": "2.0", "id": 1, "method": "x", "params": {"t": (1, 2)}}
+
+        # Act
+        await client.send("server-1", message)
+        received = await next_message(server.client_messages())
+
+        # Assert
+        assert received.payload is not message
+        assert received.payload["params"] == {"t": [1, 2]}
+
+    async def test_serialize_mode_rejects_non_json_payloads(self):
+        # Arrange
+        server = MemoryServerTransport()
+        client = MemoryClientTransport(serialize=True)
+        await client.add_server("server-1", {"server": server})
+
+        # Act & Assert
+        with pytest.raises(ValueError):
+            await client.send("server-1", {"jsonrpc": "2.0", "method": object()})
+
+
+class TestConnectionLifecycle:
+    async def test_add_server_requires_a_memory_server(self):
+        # Arrange
+        client = MemoryClientTransport()
+
+        # Act & Assert
+        with pytest.raises(ValueError):
+            await client.add_server("server-1", {"command": ["python"]})
+
+    async def test_send_to_unregistered_server_raises_value_error(self):
+        # Arrange
+        client = MemoryClientTransport()
+
+        # Act & Assert
+        with pytest.raises(ValueError):
+            await client.send("missing", {"jsonrpc": "2.0", "method": "ping"})
+
+    async def test_send_to_unknown_client_raises_value_error(self):
+        # Arrange
+        server = MemoryServerTransport()
+
+        # Act & Assert
+        with pytest.raises(ValueError):
+            await server.send("missing", {"jsonrpc": "2.0", "method": "ping"})
+
+    async def test_client_dropped_by_server_gets_connection_error(self):
+        # Arrange
+        server = MemoryServerTransport()
+        client = MemoryClientTransport()
+        await client.add_server("server-1", {"server": server})
+        await client.send("server-1", {"jsonrpc": "2.0", "method": "a"})
+        received = await next_message(server.client_messages())
+
+        # Act
+        await server.disconnect_client(received.client_id)
+
+        # Assert
+        with pytest.raises(ConnectionError):
+            await client.send("server-1", {"jsonrpc": "2.0", "method": "b"})
+
+    async def test_disconnect_server_detaches_from_server(self):
+        # Arrange
+        server = MemoryServerTransport()
+        client = MemoryClientTransport()
+        await client.add_server("server-1", {"server": server})
+        await client.send("server-1", {"jsonrpc": "2.0", "method": "a"})
+
+        # Act
+        await client.disconnect_server("server-1")
+        await client.disconnect_server("server-1")
+
+        # Assert
+        assert server._clients == {}
+
+    async def test_close_ends_the_client_message_stream(self):
+        # Arrange
+        server = MemoryServerTransport()
+        messages = server.client_messages()
+
+        # Act
+        await server.close()
+
+        # Assert
+        with pytest.raises(StopAsyncIteration):
+            await next_message(messages)
+
+
+class TestSessions:
+    @pytest.mark.parametrize("serialize", [False, True])
+    async def test_client_session_talks_to_server_session(self, serialize):
+        # Arrange
+        server_transport = MemoryServerTransport(serialize=serialize)
+        server = ServerSession(
+            server_transport,
+            ServerConfig(
+                info=Implementation(name="memory-server", version="1.0.0"),
+                capabilities=ServerCapabilities(),
+            ),
+        )
+        client = ClientSession(
+            MemoryClientTransport(serialize=serialize),
+            ClientConfig(
+                client_info=Implementation(name="memory-client", version="1.0.0"),
+                capabilities=ClientCapabilities(),
+            ),
+        )
+        await server._start()
+
+        # Act
+        await client.connect_server("server-1", {"server": server_transport}, 1.0)
+        result = await client.send_request("server-1", PingRequest(), 1.0)
+
+        # Assert
+        assert isinstance(result, EmptyResult)
+        assert client.server_manager.is_protocol_initialized("server-1")
+
+        await client.disconnect_all_servers()
+        await server_transport.close()
+        await server._stop()
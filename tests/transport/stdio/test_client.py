@@ -1,8 +1,10 @@
 import asyncio
+import contextlib
 
 import pytest
 
 from conduit.transport.stdio.client import StdioClientTransport
+from conduit.transport.stdio.resources import ResourceLimits, ServerAtLimitError
 
 
 class TestAddServer:
@@ -103,6 +105,40 @@ for line in sys.stdin:
         await transport.disconnect_server(server_id)
         await process.wait()
 
+    async def test_receives_messages_larger_than_the_stream_limit(self):
+        """A multi-megabyte message arrives intact instead of killing the reader."""
+        # Arrange
+        transport = StdioClientTransport()
+        server_id = "big-server"
+        connection_info = {
+            "command": [
+                "python",
+                "-c",
+                """
+import json, sys
+sys.stdin.readline()
+print(json.dumps({"jsonrpc": "2.0", "id": 1, "result": {"text": "x" * 8_000_000}}),
+      flush=True)
+sys.stdin.readline()
+""",
+            ]
+        }
+        await transport.add_server(server_id, connection_info)
+
+        # Act
+        await transport.send(server_id, {"jsonrpc": "2.0", "method": "go"})
+        received = await asyncio.wait_for(
+            transport.server_messages().__anext__(), timeout=5.0
+        )
+
+        # Assert
+        assert len(received.payload["result"]["text"]) == 8_000_000
+
+        # Cleanup
+        process = transport._servers[server_id].process
+        await transport.disconnect_server(server_id)
+        await process.wait()
+
     async def test_raises_value_error_if_server_is_not_registered(self):
         # Arrange
         transport = StdioClientTransport()
@@ -236,6 +272,306 @@ for line in sys.stdin:
         await transport.disconnect_server(server_id)
         await process.wait()
 
+    async def test_stops_reading_a_server_that_floods_us(self):
+        """A flood of notifications stays bounded until we consume it."""
+        # Arrange
+        transport = StdioClientTransport(max_queued_per_server=8)
+        server_id = "flood-server"
+        connection_info = {
+            "command": [
+                "python",
+                "-c",
+                """
+import json, sys
+sys.stdin.readline()
+for i in range(2000):
+    print(json.dumps({"jsonrpc": "2.0", "method": "notifications/cancelled",
+                      "params": {"requestId": i}}), flush=True)
+print(json.dumps({"jsonrpc": "2.0", "id": 1, "result": {}}), flush=True)
+sys.stdin.readline()
+""",
+            ]
+        }
+        await transport.add_server(server_id, connection_info)
+
+        # Act
+        await transport.send(server_id, {"jsonrpc": "2.0", "method": "go"})
+        await asyncio.sleep(0.3)
+
+        # Assert - only a queue's worth was read; the rest waits in the pipe
+        assert transport._inbox.qsize(server_id) == 8
+        assert transport.inbox_stats().blocked_puts >= 1
+
+        messages = transport.server_messages()
+        for _ in range(2000):
+            await asyncio.wait_for(messages.__anext__(), timeout=1.0)
+        final = await asyncio.wait_for(messages.__anext__(), timeout=1.0)
+        assert final.payload == {"jsonrpc": "2.0", "id": 1, "result": {}}
+
+        # Cleanup
+        process = transport._servers[server_id].process
+        await transport.disconnect_server(server_id)
+        await process.wait()
+
+
+class TestSupervision:
+    async def test_restarts_crashed_server_and_calls_restart_handler(self):
+        # Arrange - server that crashes after reading one message
+        transport = StdioClientTransport(restart_backoff=0.01)
+        restarted = asyncio.Event()
+
+        async def on_restart(server_id: str) -> None:
+            restarted.set()
+
+        transport.restart_handler = on_restart
+        connection_info = {
+            "command": ["sh", "-c", "read line; exit 1"],
+            "restart": True,
+        }
+        await transport.add_server("crashy", connection_info)
+
+        # Act
+        await transport.send("crashy", {"jsonrpc": "2.0", "method": "go"})
+        await asyncio.wait_for(restarted.wait(), timeout=5.0)
+
+        # Assert - running again without another send
+        server_process = transport._servers["crashy"]
+        assert server_process.is_running
+        assert server_process.restarts == 1
+
+        # Cleanup
+        await transport.close()
+
+    async def test_gives_up_on_a_crash_looping_server(self):
+        # Arrange
+        transport = StdioClientTransport(restart_backoff=0.01, max_restarts=2)
+        await transport.add_server(
+            "doomed", {"command": ["sh", "-c", "exit 1"], "restart": True}
+        )
+        server_process = transport._servers["doomed"]
+
+        # Act - the first send may or may not beat the exit
+        with contextlib.suppress(ConnectionError):
+            await transport.send("doomed", {"jsonrpc": "2.0", "method": "go"})
+        for _ in range(100):
+            if server_process.crash_looping:
+                break
+            await asyncio.sleep(0.02)
+
+        # Assert - two restarts, then it stays down
+        assert server_process.crash_looping
+        assert server_process.restarts == 2
+        with pytest.raises(ConnectionError, match="keeps crashing"):
+            await transport.send("doomed", {"jsonrpc": "2.0", "method": "go"})
+
+        # Cleanup
+        await transport.close()
+
+    async def test_disconnect_does_not_trigger_a_restart(self):
+        # Arrange
+        transport = StdioClientTransport(restart_backoff=0.01)
+        await transport.add_server("server", {"command": ["cat"], "restart": True})
+        await transport.send("server", {"jsonrpc": "2.0", "method": "go"})
+        server_process = transport._servers["server"]
+
+        # Act
+        await transport.disconnect_server("server")
+        await asyncio.sleep(0.05)
+
+        # Assert
+        assert server_process.restart_task is None
+        assert server_process.restarts == 0
+
+    async def test_late_reader_callback_leaves_the_restarted_server_alone(self):
+        """The old reader's completion is handled a loop iteration or more after
+        it finished; by then a restart may have started a new process."""
+        # Arrange
+        transport = StdioClientTransport()
+        await transport.add_server("server", {"command": ["cat"]})
+        await transport.send("server", {"jsonrpc": "2.0", "method": "go"})
+        server_process = transport._servers["server"]
+        old_process = server_process.process
+        old_reader = transport._reader_tasks["server"]
+
+        server_process.stopping = True
+        await transport._stop_server("server", server_process)
+        server_process.stopping = False
+        await transport._start_server("server", server_process)
+        new_process = server_process.process
+        new_reader = transport._reader_tasks["server"]
+
+        # Act - the old reader's completion is handled only now
+        await transport._on_reader_done(
+            "server", server_process, old_process, old_reader
+        )
+
+        # Assert
+        assert server_process.process is new_process
+        assert server_process.is_running
+        assert transport._reader_tasks["server"] is new_reader
+        assert not new_reader.done()
+
+        # Cleanup
+        await transport.close()
+
+    async def test_server_takes_a_prewarmed_process(self):
+        # Arrange
+        transport = StdioClientTransport()
+        transport.prewarm(["cat"], count=1)
+        for _ in range(100):
+            if transport.warm_pool_stats().ready == 1:
+                break
+            await asyncio.sleep(0.01)
+        await transport.add_server("server", {"command": ["cat"]})
+
+        # Act
+        await transport.send("server", {"jsonrpc": "2.0", "method": "echo"})
+        received = await asyncio.wait_for(
+            transport.server_messages().__anext__(), timeout=2.0
+        )
+
+        # Assert
+        assert received.payload == {"jsonrpc": "2.0", "method": "echo"}
+        assert transport.warm_pool_stats().hits == 1
+
+        # Cleanup
+        await transport.close()
+
+
+class TestResourceAccounting:
+    async def test_sampling_records_usage_in_metrics(self):
+        # Arrange
+        transport = StdioClientTransport(sample_interval=None)
+        await transport.add_server("server", {"command": ["cat"]})
+        await transport.send("server", {"jsonrpc": "2.0", "method": "go"})
+
+        # Act
+        transport.sample_resources()
+
+        # Assert
+        usage = transport.resource_usage("server")
+        assert usage is not None
+        assert usage.rss_bytes > 0
+        assert usage.open_fds >= 3
+        assert transport.metrics.get("mcp_stdio_server_rss_bytes").value(
+            "server"
+        ) == float(usage.rss_bytes)
+
+        # Cleanup
+        await transport.close()
+
+    async def test_refuse_limit_fails_requests_but_not_notifications(self):
+        # Arrange
+        limits = ResourceLimits(max_rss_bytes=1, action="refuse")
+        transport = StdioClientTransport(sample_interval=None, limits=limits)
+        await transport.add_server("server", {"command": ["cat"]})
+        await transport.send("server", {"jsonrpc": "2.0", "method": "go"})
+
+        # Act
+        transport.sample_resources()
+
+        # Assert
+        with pytest.raises(ServerAtLimitError, match="RSS"):
+            await transport.send(
+                "server", {"jsonrpc": "2.0", "id": 1, "method": "tools/list"}
+            )
+        await transport.send("server", {"jsonrpc": "2.0", "method": "go"})
+        await transport.send("server", {"jsonrpc": "2.0", "id": 7, "result": {}})
+        counter = transport.metrics.get("mcp_stdio_server_limit_actions_total")
+        assert counter.value("server", "refuse") == 1
+
+        # Cleanup
+        await transport.close()
+
+    async def test_refusal_lifts_once_back_under_limits(self):
+        # Arrange
+        transport = StdioClientTransport(sample_interval=None)
+        limits = ResourceLimits(max_rss_bytes=1)
+        await transport.add_server("server", {"command": ["cat"], "limits": limits})
+        await transport.send("server", {"jsonrpc": "2.0", "method": "go"})
+        transport.sample_resources()
+
+        # Act
+        limits.max_rss_bytes = None
+        transport.sample_resources()
+
+        # Assert
+        await transport.send(
+            "server", {"jsonrpc": "2.0", "id": 1, "method": "tools/list"}
+        )
+
+        # Cleanup
+        await transport.close()
+
+    async def test_restart_limit_replaces_the_process(self):
+        # Arrange
+        limits = ResourceLimits(max_open_fds=0, action="restart")
+        transport = StdioClientTransport(sample_interval=None, limits=limits)
+        restarted = asyncio.Event()
+
+        async def on_restart(server_id: str) -> None:
+            restarted.set()
+
+        transport.restart_handler = on_restart
+        await transport.add_server("server", {"command": ["cat"]})
+        await transport.send("server", {"jsonrpc": "2.0", "method": "go"})
+        old_pid = transport._servers["server"].process.pid
+
+        # Act
+        transport.sample_resources()
+        await asyncio.wait_for(restarted.wait(), timeout=5.0)
+
+        # Assert
+        server_process = transport._servers["server"]
+        assert server_process.is_running
+        assert server_process.process.pid != old_pid
+        assert server_process.restarts == 1
+        assert server_process.over_limit is None
+
+        # Cleanup
+        await transport.close()
+
+    async def test_sampler_runs_on_an_interval(self):
+        # Arrange
+        transport = StdioClientTransport(sample_interval=0.01)
+        await transport.add_server("server", {"command": ["cat"]})
+
+        # Act
+        await transport.send("server", {"jsonrpc": "2.0", "method": "go"})
+        for _ in range(100):
+            if transport.resource_usage("server") is not None:
+                break
+            await asyncio.sleep(0.01)
+
+        # Assert
+        assert transport.resource_usage("server") is not None
+
+        # Cleanup
+        await transport.close()
+
+    async def test_disconnect_removes_metric_series(self):
+        # Arrange
+        transport = StdioClientTransport(sample_interval=None)
+        await transport.add_server("server", {"command": ["cat"]})
+        await transport.send("server", {"jsonrpc": "2.0", "method": "go"})
+        transport.sample_resources()
+
+        # Act
+        await transport.disconnect_server("server")
+
+        # Assert
+        assert 'server="server"' not in transport.metrics.render_prometheus()
+
+    async def test_rejects_bad_limits(self):
+        # Arrange
+        transport = StdioClientTransport()
+
+        # Act & Assert
+        with pytest.raises(ValueError, match="limits"):
+            await transport.add_server(
+                "server", {"command": ["cat"], "limits": {"max_rss_bytes": 1}}
+            )
+
 
 class TestDisconnectServer:
     async def test_disconnects_server(self):
@@ -0,0 +1,112 @@
+import asyncio
+
+import pytest
+
+from conduit.transport.stdio.pool import WarmPool
+
+COMMAND = ["cat"]
+
+
+async def spawn(command: list[str]) -> asyncio.subprocess.Process:
+    return await asyncio.create_subprocess_exec(
+        *command, stdin=asyncio.subprocess.PIPE, stdout=asyncio.subprocess.PIPE
+    )
+
+
+async def wait_for_ready(pool: WarmPool, count: int) -> None:
+    for _ in range(200):
+        if pool.stats().ready == count:
+            return
+        await asyncio.sleep(0.01)
+    raise AssertionError(f"pool never reached {count} spares")
+
+
+class TestWarmPool:
+    async def test_keeps_the_target_number_of_spares(self):
+        # Arrange
+        pool = WarmPool(spawn)
+
+        # Act
+        pool.set_target(COMMAND, 2)
+        await wait_for_ready(pool, 2)
+
+        # Assert
+        assert pool.stats().spawned == 2
+
+        await pool.close()
+
+    async def test_take_hands_out_a_spare_and_replaces_it(self):
+        # Arrange
+        pool = WarmPool(spawn)
+        pool.set_target(COMMAND, 1)
+        await wait_for_ready(pool, 1)
+
+        # Act
+        process = pool.take(COMMAND)
+
+        # Assert
+        assert process is not None and process.returncode is None
+        await wait_for_ready(pool, 1)
+        assert pool.stats().hits == 1
+        assert pool.stats().spawned == 2
+
+        process.stdin.close()
+        await process.wait()
+        await pool.close()
+
+    async def test_take_misses_when_no_spare_is_ready(self):
+        # Arrange
+        pool = WarmPool(spawn)
+        pool.set_target(COMMAND, 1)
+
+        # Act - before the filler had a chance to run
+        process = pool.take(COMMAND)
+
+        # Assert
+        assert process is None
+        assert pool.stats().misses == 1
+
+        await pool.close()
+
+    async def test_commands_without_a_target_are_not_pooled(self):
+        pool = WarmPool(spawn)
+
+        assert pool.take(COMMAND) is None
+        assert pool.stats().misses == 0
+
+    async def test_lowering_the_target_stops_extra_spares(self):
+        # Arrange
+        pool = WarmPool(spawn)
+        pool.set_target(COMMAND, 2)
+        await wait_for_ready(pool, 2)
+        spares = list(pool._spares[tuple(COMMAND)])
+
+        # Act
+        pool.set_target(COMMAND, 0)
+        await asyncio.wait_for(
+            asyncio.gather(*(spare.wait() for spare in spares)), timeout=5.0
+        )
+
+        # Assert
+        assert pool.stats().ready == 0
+        assert pool.take(COMMAND) is None
+
+        await pool.close()
+
+    async def test_close_stops_every_spare(self):
+        # Arrange
+        pool = WarmPool(spawn)
+        pool.set_target(COMMAND, 2)
+        await wait_for_ready(pool, 2)
+        spares = list(pool._spares[tuple(COMMAND)])
+
+        # Act
+        await pool.close()
+
+        # Assert
+        assert all(spare.returncode is not None for spare in spares)
+        assert pool.stats().ready == 0
+
+    def test_rejects_negative_target(self):
+        with pytest.raises(ValueError):
+            WarmPool(spawn).set_target(COMMAND, -1)
@@ -0,0 +1,62 @@
+import os
+
+import pytest
+
+from conduit.transport.stdio.resources import (
+    ProcessUsage,
+    ResourceLimits,
+    read_process_usage,
+)
+
+
+class TestReadProcessUsage:
+    def test_reads_own_process(self):
+        # Act
+        usage = read_process_usage(os.getpid())
+
+        # Assert
+        assert usage is not None
+        assert usage.pid == os.getpid()
+        assert usage.rss_bytes > 0
+        assert usage.cpu_seconds > 0
+        assert usage.open_fds >= 3
+
+    def test_returns_none_for_missing_process(self):
+        # Arrange - pids never reach this high
+        pid = 2**31 - 1
+
+        # Act & Assert
+        assert read_process_usage(pid) is None
+
+
+class TestResourceLimits:
+    def test_reports_first_limit_exceeded(self):
+        # Arrange
+        limits = ResourceLimits(max_rss_bytes=1000, max_open_fds=10)
+        usage = ProcessUsage(pid=1, rss_bytes=500, cpu_seconds=0.0, open_fds=11)
+
+        # Act
+        reason = limits.exceeded(usage)
+
+        # Assert
+        assert reason == "open fds 11 over limit 10"
+
+    def test_unset_limits_are_not_checked(self):
+        # Arrange
+        limits = ResourceLimits()
+        usage = ProcessUsage(
+            pid=1,
+            rss_bytes=10**12,
+            cpu_seconds=1e6,
+            open_fds=10**6,
+            cpu_percent=400.0,
+            stdin_backlog_bytes=10**9,
+        )
+
+        # Act & Assert
+        assert limits.exceeded(usage) is None
+
+    def test_rejects_unknown_action(self):
+        # Act & Assert
+        with pytest.raises(ValueError, match="Unknown limit action"):
+            ResourceLimits(action="kill")  # type: ignore[arg-type]
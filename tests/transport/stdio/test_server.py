@@ -1,26 +1,58 @@
-import sys
+import io
+import json
+import os
+import socket
 from unittest.mock import patch
 
 import pytest
 
-from conduit.transport.stdio.server import StdioServerTransport
+from conduit.transport.stdio.server import StdioServerTransport, _is_pipe
+
+
+def fake_stdout() -> io.TextIOWrapper:
+    """A stdout that isn't a pipe, so the transport falls back to blocking writes."""
+    return io.TextIOWrapper(io.BytesIO(), encoding="utf-8")
 
 
 class TestSend:
-    @patch("builtins.print")
-    async def test_send_writes_message_to_stdout(self, mock_print):
+    async def test_send_writes_message_to_stdout(self):
         """Test that send writes JSON message to stdout."""
         # Arrange
         transport = StdioServerTransport()
         message = {"jsonrpc": "2.0", "method": "test", "id": 1}
 
         # Act
-        await transport.send("any-client-id", message)
+        with patch("sys.stdout", fake_stdout()) as stdout:
+            await transport.send("any-client-id", message)
+            await transport._writer.flush()
+
+            # Assert
+            assert (
+                stdout.buffer.getvalue()
+                == b'{"jsonrpc":"2.0","method":"test","id":1}\n'
+            )
+
+    async def test_concurrent_sends_share_one_write(self):
+        """A burst of notifications reaches stdout in a single write."""
+        # Arrange
+        transport = StdioServerTransport()
+        messages = [
+            {"jsonrpc": "2.0", "method": "notifications/progress", "params": {"n": i}}
+            for i in range(100)
+        ]
 
-        # Assert
-        mock_print.assert_called_once_with(
-            '{"jsonrpc":"2.0","method":"test","id":1}', file=sys.stdout, flush=True
-        )
+        # Act
+        with patch("sys.stdout", fake_stdout()) as stdout:
+            for message in messages:
+                await transport.send("c", message)
+            await transport._writer.flush()
+
+            # Assert
+            lines = stdout.buffer.getvalue().splitlines()
+        assert [json.loads(line)["params"]["n"] for line in lines] == list(range(100))
+        stats = transport.writer_stats()
+        assert stats.frames == 100
+        assert stats.writes == 1
 
     async def test_send_raises_value_error_for_invalid_message(self):
         """Test that send raises ValueError for unserializable messages."""
@@ -33,6 +65,66 @@ class TestSend:
             await transport.send("client-id", bad_message)
 
 
+class TestIsPipe:
+    def test_accepts_fifo(self):
+        # Arrange
+        read_fd, write_fd = os.pipe()
+
+        # Act
+        with open(write_fd, "wb") as stream:
+            result = _is_pipe(stream)
+        os.close(read_fd)
+
+        # Assert
+        assert result is True
+
+    def test_accepts_socket(self):
+        # Arrange
+        left, right = socket.socketpair()
+
+        # Act
+        with left, right:
+            result = _is_pipe(left)
+
+        # Assert
+        assert result is True
+
+    def test_rejects_tty(self):
+        """A terminal gets blocking writes, so stderr on it stays blocking."""
+        # Arrange
+        controller_fd, tty_fd = os.openpty()
+
+        # Act
+        with open(tty_fd, "wb") as stream:
+            result = _is_pipe(stream)
+        os.close(controller_fd)
+
+        # Assert
+        assert result is False
+
+    def test_rejects_other_character_devices(self):
+        # Act
+        with open(os.devnull, "wb") as stream:
+            result = _is_pipe(stream)
+
+        # Assert
+        assert result is False
+
+    async def test_tty_stdout_falls_back_to_blocking_writes(self):
+        # Arrange
+        transport = StdioServerTransport()
+        controller_fd, tty_fd = os.openpty()
+
+        # Act
+        with open(tty_fd, "w") as tty, patch("sys.stdout", tty):
+            await transport._setup_stdout_writer()
+            blocking = os.get_blocking(tty_fd)
+        os.close(controller_fd)
+
+        # Assert
+        assert blocking is True
+
+
 class TestClientMessages:
     async def test_client_messages_basic_flow(self):
         """Test that client_messages can be instantiated and is an async iterator."""
@@ -1,6 +1,22 @@
+import asyncio
+
 import pytest
 
-from conduit.transport.stdio.shared import parse_json_message, serialize_message
+from conduit.transport.stdio.shared import (
+    FrameWriter,
+    LineFramer,
+    MessageTooLargeError,
+    parse_json_message,
+    serialize_message,
+)
+
+
+def make_reader(*chunks: bytes) -> asyncio.StreamReader:
+    reader = asyncio.StreamReader()
+    for chunk in chunks:
+        reader.feed_data(chunk)
+    reader.feed_eof()
+    return reader
 
 
 class TestParseJsonMessage:
@@ -82,3 +98,174 @@ class TestSerializeMessage:
         # Act/Assert
         with pytest.raises(ValueError):
             serialize_message(message)
+
+
+class TestLineFramer:
+    async def test_splits_messages_on_newlines(self):
+        # Arrange
+        framer = LineFramer(make_reader(b'{"a":1}\n{"b":2}\n'))
+
+        # Act & Assert
+        assert await framer.read_message() == b'{"a":1}'
+        assert await framer.read_message() == b'{"b":2}'
+        assert await framer.read_message() is None
+
+    async def test_joins_messages_split_across_chunks(self):
+        # Arrange
+        framer = LineFramer(make_reader(b'{"a":', b"1}\n{", b'"b":2}\n'))
+
+        # Act & Assert
+        assert await framer.read_message() == b'{"a":1}'
+        assert await framer.read_message() == b'{"b":2}'
+
+    async def test_reads_messages_far_beyond_the_stream_limit(self):
+        # Arrange - the StreamReader's default line limit is 64 KiB
+        payload = b'{"text":"' + b"x" * 5_000_000 + b'"}'
+        framer = LineFramer(make_reader(payload + b"\n"))
+
+        # Act
+        message = await framer.read_message()
+
+        # Assert
+        assert message == payload
+        assert parse_json_message(message)["text"] == "x" * 5_000_000
+
+    async def test_returns_unterminated_final_message_at_eof(self):
+        # Arrange
+        framer = LineFramer(make_reader(b'{"a":1}'))
+
+        # Act & Assert
+        assert await framer.read_message() == b'{"a":1}'
+        assert await framer.read_message() is None
+
+    async def test_skips_oversized_message_and_resumes_after_it(self):
+        # Arrange
+        oversized = b"x" * 2_000_000
+        framer = LineFramer(
+            make_reader(oversized + b"\n", b'{"ok":true}\n'), max_message_size=1000
+        )
+
+        # Act & Assert
+        with pytest.raises(MessageTooLargeError) as exc_info:
+            await framer.read_message()
+        assert exc_info.value.size == 2_000_000
+        assert await framer.read_message() == b'{"ok":true}'
+
+    async def test_rejects_oversized_message_within_one_chunk(self):
+        # Arrange
+        framer = LineFramer(make_reader(b"x" * 50 + b"\n{}\n"), max_message_size=10)
+
+        # Act & Assert
+        with pytest.raises(MessageTooLargeError):
+            await framer.read_message()
+        assert await framer.read_message() == b"{}"
+
+    def test_parse_accepts_bytes_and_rejects_bad_utf8(self):
+        assert parse_json_message(b'{"a":1}') == {"a": 1}
+        assert parse_json_message(b'{"a":"\xff"}') is None
+
+
+class FakePipe:
+    """Records writes; drain() can be held open to simulate a full pipe."""
+
+    def __init__(self):
+        self.writes: list[bytes] = []
+        self.room = asyncio.Event()
+        self.room.set()
+        self.broken = False
+
+    def write(self, data: bytes) -> None:
+        if self.broken:
+            raise BrokenPipeError("pipe closed")
+        self.writes.append(data)
+
+    async def drain(self) -> None:
+        await self.room.wait()
+
+
+class TestFrameWriter:
+    async def test_frames_from_one_iteration_share_a_write(self):
+        # Arrange
+        pipe = FakePipe()
+        writer = FrameWriter(pipe.write, pipe.drain)
+
+        # Act
+        for i in range(50):
+            await writer.write(b"%d\n" % i)
+        await writer.flush()
+
+        # Assert
+        assert pipe.writes == [b"".join(b"%d\n" % i for i in range(50))]
+        stats = writer.stats()
+        assert (stats.frames, stats.writes) == (50, 1)
+
+    async def test_frames_queued_during_drain_go_out_together(self):
+        # Arrange
+        pipe = FakePipe()
+        pipe.room.clear()
+        writer = FrameWriter(pipe.write, pipe.drain)
+        await writer.write(b"a\n")
+        await asyncio.sleep(0.01)
+
+        # Act - queue more while the first write waits on drain
+        for i in range(10):
+            await writer.write(b"%d\n" % i)
+        pipe.room.set()
+        await writer.flush()
+
+        # Assert
+        assert len(pipe.writes) == 2
+        assert pipe.writes[1] == b"".join(b"%d\n" % i for i in range(10))
+
+    async def test_write_waits_once_too_much_is_queued(self):
+        # Arrange
+        pipe = FakePipe()
+        pipe.room.clear()
+        writer = FrameWriter(pipe.write, pipe.drain, max_buffered=10)
+        await writer.write(b"first\n")
+        await asyncio.sleep(0.01)  # Writer task now stuck in drain
+
+        # Act
+        await writer.write(b"12345\n")
+        blocked = asyncio.create_task(writer.write(b"67890\n"))
+        await asyncio.sleep(0.01)
+
+        # Assert
+        assert not blocked.done()
+        pipe.room.set()
+        await asyncio.wait_for(blocked, timeout=1.0)
+        await writer.flush()
+        assert b"".join(pipe.writes) == b"first\n12345\n67890\n"
+        assert writer.stats().blocked_writes == 1
+
+    async def test_write_failure_is_reported_by_the_next_call(self):
+        # Arrange
+        pipe = FakePipe()
+        pipe.broken = True
+        writer = FrameWriter(pipe.write, pipe.drain)
+        await writer.write(b"a\n")
+
+        # Act & Assert
+        with pytest.raises(ConnectionError):
+            await writer.flush()
+        with pytest.raises(ConnectionError):
+            await writer.write(b"b\n")
+
+    async def test_close_releases_blocked_writers(self):
+        # Arrange
+        pipe = FakePipe()
+        pipe.room.clear()
+        writer = FrameWriter(pipe.write, pipe.drain, max_buffered=1)
+        await writer.write(b"a\n")
+        await asyncio.sleep(0.01)
+        blocked = asyncio.create_task(writer.write(b"b\n"))
+        await asyncio.sleep(0.01)
+
+        # Act
+        writer.close()
+
+        # Assert
+        with pytest.raises(ConnectionError):
+            await blocked
+        with pytest.raises(ConnectionError):
+            await writer.write(b"c\n")
@@ -51,8 +51,8 @@ class TestServerMessages:
             timestamp=asyncio.get_event_loop().time(),
         )
 
-        await transport._message_queue.put(message1)
-        await transport._message_queue.put(message2)
+        await transport._inbox.put(message1)
+        await transport._inbox.put(message2)
 
         # Act - Get messages from iterator
         message_iterator = transport.server_messages()
@@ -242,5 +242,5 @@ class TestSend:
         # Assert
         mock_post.assert_awaited_once()
         transport._stream_manager.start_stream_listener.assert_awaited_once_with(
-            server_id, mock_response, message_queue=transport._message_queue
+            server_id, mock_response, message_queue=transport._inbox
         )
@@ -49,7 +49,7 @@ class TestStartServerStream:
 
         # Verify stream manager was called
         self.transport._stream_manager.start_stream_listener.assert_awaited_once_with(
-            server_id, mock_response, message_queue=self.transport._message_queue
+            server_id, mock_response, message_queue=self.transport._inbox
         )
 
     @patch("httpx.AsyncClient.get")
@@ -0,0 +1,163 @@
+"""Tests for HttpServerTransport draining."""
+
+import asyncio
+from unittest.mock import AsyncMock, Mock
+
+import pytest
+from starlette.requests import ClientDisconnect, Request
+from starlette.responses import Response
+
+from conduit.protocol.base import PROTOCOL_VERSION
+from conduit.transport.streamable_http.server.transport import (
+    DRAIN_RETRY_AFTER,
+    HttpServerTransport,
+)
+
+
+def _post(message_data: dict, session_id: str) -> Mock:
+    request = Mock(spec=Request)
+    request.headers = {
+        "MCP-Protocol-Version": PROTOCOL_VERSION,
+        "Accept": "text/event-stream, application/json",
+        "Origin": "https://example.com",
+        "Mcp-Session-Id": session_id,
+    }
+    request.json = AsyncMock(return_value=message_data)
+    return request
+
+
+async def _serve(response: Response, send=None) -> list[dict]:
+    """Run a response the way Starlette does, returning what it sent."""
+    sent: list[dict] = []
+
+    async def receive() -> dict:
+        await asyncio.Event().wait()
+        return {"type": "http.disconnect"}
+
+    async def collect(message: dict) -> None:
+        sent.append(message)
+
+    scope = {"type": "http", "asgi": {"spec_version": "2.4"}}
+    await response(scope, receive, send or collect)
+    return sent
+
+
+async def _answer(transport: HttpServerTransport, client_id: str, request_id) -> None:
+    await transport._stream_manager.send_to_existing_stream(
+        client_id, {"jsonrpc": "2.0", "id": request_id, "result": {}}, request_id
+    )
+
+
+class TestDrain:
+    async def test_requests_are_refused_with_retry_after_while_draining(self):
+        # Arrange
+        transport = HttpServerTransport()
+        _, session_id = transport._session_manager.create_session()
+        await transport.start_draining()
+        request = _post({"jsonrpc": "2.0", "method": "tools/list", "id": 1}, session_id)
+
+        # Act
+        response = await transport._handle_post_request(request)
+
+        # Assert
+        assert response.status_code == 503
+        assert response.headers["Retry-After"] == str(DRAIN_RETRY_AFTER)
+        assert transport._message_queue.empty()
+
+    async def test_notifications_are_still_accepted_while_draining(self):
+        # Arrange
+        transport = HttpServerTransport()
+        _, session_id = transport._session_manager.create_session()
+        await transport.start_draining()
+        request = _post(
+            {"jsonrpc": "2.0", "method": "notifications/cancelled", "params": {}},
+            session_id,
+        )
+
+        # Act
+        response = await transport._handle_post_request(request)
+
+        # Assert
+        assert response.status_code == 202
+
+    async def test_ping_is_still_answered_while_draining(self):
+        # Arrange
+        transport = HttpServerTransport()
+        _, session_id = transport._session_manager.create_session()
+        await transport.start_draining()
+        request = _post({"jsonrpc": "2.0", "method": "ping", "id": 1}, session_id)
+
+        # Act
+        response = await transport._handle_post_request(request)
+
+        # Assert
+        assert response.status_code == 200
+        assert not transport._message_queue.empty()
+
+    async def test_flush_waits_for_open_request_streams(self):
+        # Arrange
+        transport = HttpServerTransport()
+        client_id, _ = transport._session_manager.create_session()
+        response = await transport._create_request_stream(client_id, 1, {})
+        serving = asyncio.create_task(_serve(response))
+        await asyncio.sleep(0)
+
+        # Act
+        flush = asyncio.create_task(transport.flush())
+        await asyncio.sleep(0)
+
+        # Assert
+        assert not flush.done()
+        await _answer(transport, client_id, 1)
+        await asyncio.wait_for(flush, timeout=1.0)
+        assert b'"result"' in b"".join(
+            message.get("body", b"") for message in await serving
+        )
+
+    async def test_flush_waits_for_streams_not_yet_served(self):
+        # Arrange - a POST accepted, its response not yet being written
+        transport = HttpServerTransport()
+        client_id, _ = transport._session_manager.create_session()
+        response = await transport._create_request_stream(client_id, 1, {})
+
+        # Act
+        await transport.start_draining()
+        flush = asyncio.create_task(transport.flush())
+        await asyncio.sleep(0.01)
+
+        # Assert
+        assert not flush.done()
+        serving = asyncio.create_task(_serve(response))
+        await asyncio.sleep(0)
+        await _answer(transport, client_id, 1)
+        await asyncio.wait_for(flush, timeout=1.0)
+        await serving
+
+    async def test_flush_returns_when_client_leaves_before_the_body(self):
+        # Arrange
+        transport = HttpServerTransport()
+        client_id, _ = transport._session_manager.create_session()
+        response = await transport._create_request_stream(client_id, 1, {})
+
+        async def disconnected(message: dict) -> None:
+            raise OSError("client went away")
+
+        # Act - the body is never iterated
+        with pytest.raises(ClientDisconnect):
+            await _serve(response, disconnected)
+
+        # Assert
+        await asyncio.wait_for(transport.flush(), timeout=1.0)
+        assert not transport._stream_manager.has_streams(client_id)
+
+    async def test_flush_returns_for_answered_streams_never_served(self):
+        # Arrange
+        transport = HttpServerTransport()
+        client_id, _ = transport._session_manager.create_session()
+        await transport._create_request_stream(client_id, 1, {})
+
+        # Act - answered, but the response is never served or iterated
+        await _answer(transport, client_id, 1)
+
+        # Assert
+        await asyncio.wait_for(transport.flush(), timeout=1.0)
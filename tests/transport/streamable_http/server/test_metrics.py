@@ -0,0 +1,94 @@
+"""Tests for HttpServerTransport metrics."""
+
+from unittest.mock import AsyncMock, Mock
+
+from starlette.requests import Request
+
+from conduit.protocol.base import PROTOCOL_VERSION
+from conduit.shared.metrics import MetricsRegistry
+from conduit.transport.streamable_http.server.transport import HttpServerTransport
+
+
+class TestTransportMetrics:
+    async def test_reports_sessions_streams_and_queue_depth(self):
+        # Arrange
+        transport = HttpServerTransport()
+        client_id, _ = transport._session_manager.create_session()
+
+        # Act
+        await transport._stream_manager.create_stream(client_id)
+        await transport._stream_manager.create_stream(client_id, "req-1")
+
+        # Assert
+        metrics = transport.metrics
+        assert metrics.get("mcp_http_active_sessions").value() == 1
+        assert metrics.get("mcp_http_active_streams").value() == 2
+        assert metrics.get("mcp_http_inbound_queue_depth").value() == 0
+
+    async def test_counts_request_bytes_from_content_length(self):
+        # Arrange
+        transport = HttpServerTransport()
+        _, session_id = transport._session_manager.create_session()
+        request = Mock(spec=Request)
+        request.headers = {
+            "MCP-Protocol-Version": PROTOCOL_VERSION,
+            "Accept": "text/event-stream, application/json",
+            "Mcp-Session-Id": session_id,
+            "content-length": "64",
+        }
+        request.json = AsyncMock(
+            return_value={"jsonrpc": "2.0", "method": "notifications/initialized"}
+        )
+
+        # Act
+        response = await transport._handle_post_request(request)
+
+        # Assert
+        assert response.status_code == 202
+        assert transport.metrics.get("mcp_http_received_bytes_total").value() == 64
+        assert transport.metrics.get("mcp_http_inbound_queue_depth").value() == 1
+
+    async def test_counts_sent_sse_bytes(self):
+        # Arrange
+        transport = HttpServerTransport()
+
+        async def events():
+            yield b"data: {}\n\n"
+            yield b'data: {"id": 1}\n\n'
+
+        # Act
+        sent = [event async for event in transport._stream_events(events())]
+
+        # Assert
+        assert len(sent) == 2
+        expected = len("data: {}\n\n") + len('data: {"id": 1}\n\n')
+        assert transport.metrics.get("mcp_http_sent_bytes_total").value() == expected
+
+    async def test_metrics_route_serves_prometheus_text(self):
+        # Arrange
+        registry = MetricsRegistry()
+        registry.counter("mcp_server_requests_total", "Requests.", ("method",)).inc(
+            "ping"
+        )
+        transport = HttpServerTransport(metrics=registry, metrics_path="/metrics")
+
+        # Act
+        response = await transport._handle_metrics_endpoint(Mock(spec=Request))
+
+        # Assert
+        assert "/metrics" in [route.path for route in transport._app.routes]
+        assert response.status_code == 200
+        assert response.media_type.startswith("text/plain")
+        body = response.body.decode()
+        assert 'mcp_server_requests_total{method="ping"} 1' in body
+        assert "mcp_http_active_sessions 0" in body
+
+    def test_metrics_route_is_off_by_default(self):
+        # Arrange
+        transport = HttpServerTransport()
+
+        # Act
+        paths = [route.path for route in transport._app.routes]
+
+        # Assert
+        assert paths == ["/mcp"]
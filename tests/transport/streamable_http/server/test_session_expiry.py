@@ -0,0 +1,175 @@
+"""Tests for HttpServerTransport session expiry and eviction."""
+
+from unittest.mock import AsyncMock, Mock
+
+import pytest
+from starlette.requests import ClientDisconnect, Request
+
+from conduit.protocol.base import PROTOCOL_VERSION
+from conduit.transport.streamable_http.server import session_manager
+from conduit.transport.streamable_http.server.transport import HttpServerTransport
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(session_manager.time, "monotonic", lambda: now[0])
+    return now
+
+
+class TestEndingSessions:
+    async def test_delete_closes_streams_and_notifies_session_layer(self):
+        # Arrange
+        transport = HttpServerTransport()
+        transport.disconnect_handler = AsyncMock()
+        client_id, session_id = transport._session_manager.create_session()
+        await transport._stream_manager.create_stream(client_id)
+        await transport._stream_manager.create_stream(client_id, "req-1")
+        request = Mock(spec=Request)
+        request.headers = {"Mcp-Session-Id": session_id}
+
+        # Act
+        response = await transport._handle_delete_request(request)
+
+        # Assert
+        assert response.status_code == 200
+        assert transport._stream_manager.stream_count() == 0
+        transport.disconnect_handler.assert_awaited_once_with(client_id)
+        counter = transport.metrics.get("mcp_http_sessions_expired_total")
+        assert counter.value("idle") == 0
+
+    async def test_disconnect_client_closes_streams_without_notifying(self):
+        # Arrange
+        transport = HttpServerTransport()
+        transport.disconnect_handler = AsyncMock()
+        client_id, _ = transport._session_manager.create_session()
+        await transport._stream_manager.create_stream(client_id)
+
+        # Act
+        await transport.disconnect_client(client_id)
+
+        # Assert
+        assert transport._session_manager.session_count() == 0
+        assert transport._stream_manager.stream_count() == 0
+        transport.disconnect_handler.assert_not_awaited()
+
+    async def test_failing_handler_does_not_stop_cleanup(self):
+        # Arrange
+        transport = HttpServerTransport()
+        transport.disconnect_handler = AsyncMock(side_effect=RuntimeError("boom"))
+        _, session_id = transport._session_manager.create_session()
+        request = Mock(spec=Request)
+        request.headers = {"Mcp-Session-Id": session_id}
+
+        # Act
+        response = await transport._handle_delete_request(request)
+
+        # Assert
+        assert response.status_code == 200
+        assert transport._session_manager.session_count() == 0
+
+
+class TestIdleExpiry:
+    async def test_ends_idle_sessions_only(self, clock):
+        # Arrange
+        transport = HttpServerTransport(session_idle_timeout=10.0)
+        transport.disconnect_handler = AsyncMock()
+        idle_client, _ = transport._session_manager.create_session()
+        clock[0] += 8
+        _, active_session = transport._session_manager.create_session()
+
+        # Act
+        clock[0] += 5
+        expired = await transport.expire_idle_sessions()
+
+        # Assert
+        assert expired == 1
+        assert transport._session_manager.session_exists(active_session)
+        transport.disconnect_handler.assert_awaited_once_with(idle_client)
+        counter = transport.metrics.get("mcp_http_sessions_expired_total")
+        assert counter.value("idle") == 1
+
+    async def test_open_stream_keeps_session_alive(self, clock):
+        # Arrange
+        transport = HttpServerTransport(session_idle_timeout=10.0)
+        client_id, session_id = transport._session_manager.create_session()
+        await transport._stream_manager.create_stream(client_id)
+
+        # Act
+        clock[0] += 11
+        expired = await transport.expire_idle_sessions()
+
+        # Assert
+        assert expired == 0
+        assert transport._session_manager.session_exists(session_id)
+
+    async def test_ended_server_stream_is_forgotten(self):
+        # Arrange
+        transport = HttpServerTransport()
+        client_id, session_id = transport._session_manager.create_session()
+        request = Mock(spec=Request)
+        request.headers = {
+            "MCP-Protocol-Version": PROTOCOL_VERSION,
+            "Accept": "text/event-stream, application/json",
+            "Mcp-Session-Id": session_id,
+        }
+        response = await transport._handle_get_request(request)
+
+        async def disconnected(message: dict) -> None:
+            raise OSError("client went away")
+
+        # Act - the client hangs up
+        with pytest.raises(ClientDisconnect):
+            await response(
+                {"type": "http", "asgi": {"spec_version": "2.4"}}, None, disconnected
+            )
+
+        # Assert
+        assert not transport._stream_manager.has_streams(client_id)
+
+    async def test_request_stream_never_served_does_not_keep_session(self, clock):
+        # Arrange - a POST whose client left before its body started
+        transport = HttpServerTransport(session_idle_timeout=10.0)
+        client_id, session_id = transport._session_manager.create_session()
+        response = await transport._create_request_stream(client_id, 1, {})
+
+        async def disconnected(message: dict) -> None:
+            raise OSError("client went away")
+
+        with pytest.raises(ClientDisconnect):
+            await response(
+                {"type": "http", "asgi": {"spec_version": "2.4"}}, None, disconnected
+            )
+
+        # Act
+        clock[0] += 11
+        expired = await transport.expire_idle_sessions()
+
+        # Assert
+        assert expired == 1
+        assert not transport._session_manager.session_exists(session_id)
+
+
+class TestCapacity:
+    async def test_initialize_evicts_least_recently_used_session(self, clock):
+        # Arrange
+        transport = HttpServerTransport(max_sessions=2)
+        transport.disconnect_handler = AsyncMock()
+        old_client, old_session = transport._session_manager.create_session()
+        clock[0] += 1
+        _, recent_session = transport._session_manager.create_session()
+        clock[0] += 1
+        transport._session_manager.touch(old_session)
+        request = Mock(spec=Request)
+        request.headers = {}
+        initialize = {"jsonrpc": "2.0", "id": 1, "method": "initialize"}
+
+        # Act
+        await transport._get_or_create_client(request, initialize)
+
+        # Assert
+        assert transport._session_manager.session_count() == 2
+        assert transport._session_manager.session_exists(old_session)
+        assert not transport._session_manager.session_exists(recent_session)
+        counter = transport.metrics.get("mcp_http_sessions_expired_total")
+        assert counter.value("capacity") == 1
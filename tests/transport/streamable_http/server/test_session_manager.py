@@ -1,5 +1,8 @@
 import uuid
 
+import pytest
+
+from conduit.transport.streamable_http.server import session_manager
 from conduit.transport.streamable_http.server.session_manager import SessionManager
 
 
@@ -174,3 +177,77 @@ class TestSessionManager:
         assert manager.get_session_id(client_id1) is None
         assert manager.get_session_id(client_id2) is None
         assert manager.get_session_id(client_id3) is None
+
+
+class TestSessionExpiry:
+    def test_touch_makes_session_most_recently_used(self):
+        # Arrange
+        manager = SessionManager()
+        _, first = manager.create_session()
+        _, second = manager.create_session()
+
+        # Act
+        manager.touch(first)
+
+        # Assert
+        assert manager.least_recently_used() == second
+
+    def test_idle_sessions_are_listed_oldest_first(self, monkeypatch):
+        # Arrange
+        now = [1000.0]
+        monkeypatch.setattr(session_manager.time, "monotonic", lambda: now[0])
+        manager = SessionManager(idle_timeout=10.0)
+        _, old = manager.create_session()
+        now[0] += 5
+        _, newer = manager.create_session()
+        now[0] += 5
+        _, active = manager.create_session()
+
+        # Act
+        now[0] += 6
+        idle = manager.idle_sessions()
+
+        # Assert
+        assert idle == [old, newer]
+
+    def test_touched_session_is_not_idle(self, monkeypatch):
+        # Arrange
+        now = [1000.0]
+        monkeypatch.setattr(session_manager.time, "monotonic", lambda: now[0])
+        manager = SessionManager(idle_timeout=10.0)
+        _, session_id = manager.create_session()
+
+        # Act
+        now[0] += 9
+        manager.touch(session_id)
+        now[0] += 9
+
+        # Assert
+        assert manager.idle_sessions() == []
+
+    def test_no_idle_timeout_means_never_idle(self):
+        # Arrange
+        manager = SessionManager()
+        manager.create_session()
+
+        # Act & Assert
+        assert manager.idle_sessions() == []
+
+    def test_is_full_at_max_sessions(self):
+        # Arrange
+        manager = SessionManager(max_sessions=2)
+        _, first = manager.create_session()
+
+        # Act & Assert
+        assert not manager.is_full()
+        manager.create_session()
+        assert manager.is_full()
+        manager.terminate_session(first)
+        assert not manager.is_full()
+
+    def test_rejects_bad_limits(self):
+        # Act & Assert
+        with pytest.raises(ValueError, match="idle_timeout"):
+            SessionManager(idle_timeout=0)
+        with pytest.raises(ValueError, match="max_sessions"):
+            SessionManager(max_sessions=0)
@@ -2,7 +2,16 @@ import json
 
 import pytest
 
-from conduit.transport.streamable_http.server.sse_stream import SSEStream
+from conduit.transport.streamable_http.server.sse_stream import (
+    HEARTBEAT_FRAME,
+    SSEStream,
+)
+
+
+def parse_event(event: bytes) -> tuple[str, dict]:
+    """Split an SSE event into its id and decoded data."""
+    id_line, data_line = event.decode().removesuffix("\n\n").split("\n")
+    return id_line.removeprefix("id: "), json.loads(data_line.removeprefix("data: "))
 
 
 class TestSSEStream:
@@ -19,14 +28,12 @@ class TestSSEStream:
         event = await event_gen.__anext__()
 
         # Assert
-        assert event is not None
-        assert isinstance(event, str)
-        assert event.startswith("data: ")
-        assert event.endswith("\n\n")
-
-        # Verify the JSON content
-        event_data = event[6:-2]  # Strip "data: " and "\n\n"
-        parsed_message = json.loads(event_data)
+        assert isinstance(event, bytes)
+        assert event.endswith(b"\n\n")
+
+        # Verify the id and JSON content
+        event_id, parsed_message = parse_event(event)
+        assert event_id == "test-stream:1"
         assert parsed_message == test_message
 
         # Verify stream properties
@@ -50,8 +57,7 @@ class TestSSEStream:
         event = await event_gen.__anext__()
 
         # Assert first event is our message
-        event_data = event[6:-2]  # Strip "data: " and "\n\n"
-        parsed_message = json.loads(event_data)
+        _, parsed_message = parse_event(event)
         assert parsed_message == test_message
 
         # Generator should stop after close sentinel
@@ -72,8 +78,7 @@ class TestSSEStream:
         event = await event_gen.__anext__()
 
         # Assert response was sent
-        event_data = event[6:-2]
-        parsed_message = json.loads(event_data)
+        _, parsed_message = parse_event(event)
         assert parsed_message == response_message
 
         # Generator should auto-close after response
@@ -103,3 +108,53 @@ class TestSSEStream:
         )  # Both result and error
         assert stream.is_response({"result": {"data": "test"}}) is False  # Missing id
         assert stream.is_response({"id": True, "result": {}}) is False  # Boolean id
+
+    async def test_event_ids_increase_per_stream(self):
+        # Arrange
+        stream = SSEStream("test-stream", "client-123", "GET")
+        notification = {"jsonrpc": "2.0", "method": "notifications/progress"}
+
+        # Act
+        await stream.send_message(notification)
+        await stream.send_message(notification)
+        event_gen = stream.event_generator()
+        first = await event_gen.__anext__()
+        second = await event_gen.__anext__()
+
+        # Assert
+        assert parse_event(first)[0] == "test-stream:1"
+        assert parse_event(second)[0] == "test-stream:2"
+
+    async def test_encodes_messages_compactly(self):
+        # Arrange
+        stream = SSEStream("test-stream", "client-123", "GET")
+        message = {"jsonrpc": "2.0", "method": "notifications/progress"}
+
+        # Act
+        await stream.send_message(message)
+        event = await stream.event_generator().__anext__()
+
+        # Assert
+        assert event == (
+            b"id: test-stream:1\n"
+            b'data: {"jsonrpc":"2.0","method":"notifications/progress"}\n\n'
+        )
+
+    async def test_idle_stream_sends_heartbeats(self):
+        # Arrange
+        stream = SSEStream("test-stream", "client-123", "GET", heartbeat_interval=0.01)
+        event_gen = stream.event_generator()
+
+        # Act
+        first = await event_gen.__anext__()
+        await stream.send_message({"jsonrpc": "2.0", "method": "notifications/x"})
+        second = await event_gen.__anext__()
+
+        # Assert
+        assert first == HEARTBEAT_FRAME
+        assert parse_event(second)[1]["method"] == "notifications/x"
+
+        # Cleanup
+        await stream.close()
+        with pytest.raises(StopAsyncIteration):
+            await event_gen.__anext__()
@@ -31,12 +31,12 @@ class TestStreamManager:
         event_gen = stream.event_generator()
         event = await event_gen.__anext__()
 
-        assert event.startswith("data: ")
-        assert event.endswith("\n\n")
+        assert event.startswith(f"id: {stream.stream_id}:1\n".encode())
+        assert event.endswith(b"\n\n")
 
         # Verify the JSON content
-        event_data = event[6:-2]  # Strip "data: " and "\n\n"
-        parsed_message = json.loads(event_data)
+        data_line = event.decode().split("\n")[1]
+        parsed_message = json.loads(data_line.removeprefix("data: "))
         assert parsed_message == test_message
 
     async def test_cleanup_client_streams(self):
@@ -126,3 +126,36 @@ class TestStreamManager:
         # Client has no streams for fallback case
         result = await manager.send_to_existing_stream("nonexistent-client", message)
         assert result is False
+
+    async def test_routes_by_request_id_including_zero(self):
+        """Test a request ID of 0 routes to its own stream, not the GET stream."""
+        # Arrange
+        manager = StreamManager()
+        get_stream = await manager.create_stream("client-1")
+        request_stream = await manager.create_stream("client-1", 0)
+        message = {"jsonrpc": "2.0", "id": 0, "result": {}}
+
+        # Act
+        result = await manager.send_to_existing_stream("client-1", message, 0)
+
+        # Assert
+        assert result is True
+        assert request_stream.request_id == 0
+        assert get_stream.request_id == "GET"
+        event = await request_stream.event_generator().__anext__()
+        assert json.loads(event.decode().split("\n")[1][6:]) == message
+
+    async def test_response_removes_stream_from_indexes(self):
+        """Test a stream answered with its response can no longer be found."""
+        # Arrange
+        manager = StreamManager()
+        stream = await manager.create_stream("client-1", "req-1")
+        response = {"jsonrpc": "2.0", "id": "req-1", "result": {}}
+
+        # Act
+        await manager.send_to_existing_stream("client-1", response, "req-1")
+
+        # Assert
+        assert manager.get_stream_by_id(stream.stream_id) is None
+        assert manager.stream_count() == 0
+        assert not await manager.send_to_existing_stream("client-1", response, "req-1")
@@ -0,0 +1,146 @@
+import asyncio
+
+from conduit.transport.client import ServerMessage
+from conduit.transport.inbox import ServerInbox
+
+
+async def yield_loop(seconds: float = 0.01) -> None:
+    await asyncio.sleep(seconds)
+
+
+def notification(server_id: str, method: str = "notifications/message"):
+    return ServerMessage(server_id, {"jsonrpc": "2.0", "method": method}, 0.0)
+
+
+def response(server_id: str, request_id: int = 1):
+    return ServerMessage(server_id, {"jsonrpc": "2.0", "id": request_id}, 0.0)
+
+
+def request(server_id: str, request_id: int = 1):
+    return ServerMessage(
+        server_id, {"jsonrpc": "2.0", "id": request_id, "method": "ping"}, 0.0
+    )
+
+
+class TestFairness:
+    async def test_servers_take_turns(self):
+        # Arrange
+        inbox = ServerInbox()
+        for i in range(3):
+            await inbox.put(response("noisy", i))
+        await inbox.put(response("quiet"))
+
+        # Act
+        order = [(await inbox.get()).server_id for _ in range(4)]
+
+        # Assert
+        assert order == ["noisy", "quiet", "noisy", "noisy"]
+
+    async def test_keeps_each_servers_messages_in_order(self):
+        # Arrange
+        inbox = ServerInbox()
+        for i in range(5):
+            await inbox.put(response("server", i))
+
+        # Act
+        ids = [(await inbox.get()).payload["id"] for _ in range(5)]
+
+        # Assert
+        assert ids == [0, 1, 2, 3, 4]
+
+    async def test_get_waits_for_a_message(self):
+        # Arrange
+        inbox = ServerInbox()
+        getter = asyncio.create_task(inbox.get())
+        await yield_loop()
+        assert not getter.done()
+
+        # Act
+        await inbox.put(response("server"))
+
+        # Assert
+        assert (await asyncio.wait_for(getter, 1.0)).server_id == "server"
+
+
+class TestBackpressure:
+    async def test_drops_log_and_progress_notifications_past_high_water(self):
+        # Arrange
+        inbox = ServerInbox(max_messages_per_server=4, high_water=2)
+
+        # Act
+        for _ in range(5):
+            await inbox.put(notification("server"))
+        await inbox.put(notification("server", "notifications/progress"))
+
+        # Assert
+        assert inbox.qsize("server") == 2
+        assert inbox.dropped("server") == 4
+        assert inbox.stats().dropped_notifications == 4
+
+    async def test_keeps_other_notifications_past_high_water(self):
+        # Arrange
+        inbox = ServerInbox(max_messages_per_server=4, high_water=2)
+
+        # Act
+        for _ in range(4):
+            await inbox.put(notification("server", "notifications/cancelled"))
+
+        # Assert
+        assert inbox.qsize("server") == 4
+        assert inbox.stats().dropped_notifications == 0
+
+    async def test_full_queue_blocks_put_until_consumed(self):
+        # Arrange
+        inbox = ServerInbox(max_messages_per_server=2)
+        await inbox.put(request("server", 1))
+        await inbox.put(request("server", 2))
+
+        # Act
+        blocked = asyncio.create_task(inbox.put(request("server", 3)))
+        await yield_loop()
+
+        # Assert
+        assert not blocked.done()
+        assert inbox.stats().blocked_puts == 1
+        await inbox.get()
+        await asyncio.wait_for(blocked, 1.0)
+        assert inbox.qsize("server") == 2
+
+    async def test_full_queue_does_not_block_other_servers(self):
+        # Arrange
+        inbox = ServerInbox(max_messages_per_server=1)
+        await inbox.put(request("noisy", 1))
+        blocked = asyncio.create_task(inbox.put(request("noisy", 2)))
+        await yield_loop()
+
+        # Act
+        await asyncio.wait_for(inbox.put(request("quiet")), 1.0)
+
+        # Assert
+        assert not blocked.done()
+        blocked.cancel()
+
+    async def test_responses_are_always_accepted(self):
+        # Arrange
+        inbox = ServerInbox(max_messages_per_server=1)
+        await inbox.put(request("server"))
+
+        # Act
+        await asyncio.wait_for(inbox.put(response("server")), 1.0)
+
+        # Assert
+        assert inbox.qsize("server") == 2
+
+    async def test_remove_server_releases_blocked_puts(self):
+        # Arrange
+        inbox = ServerInbox(max_messages_per_server=1)
+        await inbox.put(request("server", 1))
+        blocked = asyncio.create_task(inbox.put(request("server", 2)))
+        await yield_loop()
+
+        # Act
+        inbox.remove_server("server")
+        await asyncio.wait_for(blocked, 1.0)
+
+        # Assert
+        assert inbox.empty()